@@ -4,6 +4,7 @@ This module provides:
 - Query base class for read operations
 - QueryBus for dispatching queries to handlers
 - Caching support for query results
+- Optional coalescing of concurrent identical queries
 
 **Feature: python-api-base-2025-state-of-art**
 **Validates: Requirements 2.2**
@@ -98,6 +99,7 @@ class QueryBus:
         """Initialize query bus."""
         self._handlers: dict[type, QueryHandlerFunc] = {}
         self._cache: Any = None
+        self._single_flight: Any = None
 
     def register(
         self,
@@ -147,6 +149,22 @@ class QueryBus:
             operation=_LOG_OP_CACHE,
         )
 
+    def set_single_flight(self, single_flight: Any) -> None:
+        """Set a single-flight group to coalesce concurrent identical queries.
+
+        Queries with a cache key that are dispatched while an identical one
+        is still running await its result instead of calling the handler.
+
+        Args:
+            single_flight: Group implementing ``async do(key, fn)``, such as
+                ``infrastructure.cache.SingleFlight``.
+        """
+        self._single_flight = single_flight
+        logger.debug(
+            "Single-flight configured",
+            operation=_LOG_OP_CACHE,
+        )
+
     async def dispatch[T](self, query: Query[T]) -> T:
         """Dispatch a query to its registered handler.
 
@@ -165,8 +183,33 @@ class QueryBus:
         if handler is None:
             raise HandlerNotFoundError(query_type)
 
-        # Check cache if available
         cache_key = self._get_cache_key(query)
+        if self._single_flight is not None and cache_key:
+            return await self._single_flight.do(
+                f"{query_type.__qualname__}:{cache_key}",
+                lambda: self._execute(query, handler, cache_key),
+            )
+        return await self._execute(query, handler, cache_key)
+
+    async def _execute[T](
+        self,
+        query: Query[T],
+        handler: QueryHandlerFunc,
+        cache_key: str | None,
+    ) -> T:
+        """Serve a query from cache or run its handler and cache the result.
+
+        Args:
+            query: The query to execute.
+            handler: Handler registered for the query type.
+            cache_key: Cache key for the query, or None if not cacheable.
+
+        Returns:
+            Query result from cache or the handler.
+        """
+        query_type = type(query)
+
+        # Check cache if available
         if self._cache is not None and cache_key:
             cached = await self._cache.get(cache_key)
             if cached is not None:
@@ -1,7 +1,8 @@
 """Generic DTOs for API communication.
 
 Organized into subpackages by responsibility:
-- responses/: API response wrappers (ApiResponse, PaginatedResponse, ProblemDetail)
+- responses/: API response wrappers (ApiResponse, PaginatedResponse,
+  CursorPaginatedResponse, ProblemDetail)
 - requests/: API request models (BulkDeleteRequest, BulkDeleteResponse)
 
 **Feature: application-layer-improvements-2025**
@@ -13,6 +14,7 @@ from application.common.dto.requests import (
 )
 from application.common.dto.responses import (
     ApiResponse,
+    CursorPaginatedResponse,
     PaginatedResponse,
     ProblemDetail,
 )
@@ -21,6 +23,7 @@ __all__ = [
     "ApiResponse",
     "BulkDeleteRequest",
     "BulkDeleteResponse",
+    "CursorPaginatedResponse",
     "PaginatedResponse",
     "ProblemDetail",
 ]
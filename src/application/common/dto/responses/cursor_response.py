@@ -0,0 +1,51 @@
+"""Cursor-paginated response DTO.
+
+Wraps a keyset-paginated page for API responses.
+
+**Feature: application-layer-improvements-2025**
+"""
+
+from pydantic import BaseModel, Field
+
+from core.base.patterns.pagination import CursorPage
+
+
+class CursorPaginatedResponse[T](BaseModel):
+    """Generic cursor-paginated response.
+
+    Unlike ``PaginatedResponse``, pages are addressed by an opaque cursor and
+    the total is optional, since counting can be skipped for large tables.
+
+    Type Parameters:
+        T: The type of items in the page.
+
+    Example:
+        >>> response = CursorPaginatedResponse.from_page(page)
+        >>> response.next_cursor  # pass back as ?cursor= for the next page
+    """
+
+    items: list[T] = Field(description="List of items for current page")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page, if any")
+    prev_cursor: str | None = Field(default=None, description="Cursor for the previous page, if known")
+    has_more: bool = Field(description="Whether more items follow this page")
+    total: int | None = Field(default=None, ge=0, description="Total matching items, if counted")
+
+    @classmethod
+    def from_page(cls, page: CursorPage[T, str]) -> "CursorPaginatedResponse[T]":
+        """Build a response from a repository ``CursorPage``.
+
+        Args:
+            page: Page returned by a repository or use case.
+
+        Returns:
+            Response DTO with the same items and cursors.
+        """
+        return cls(
+            items=list(page.items),
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+            has_more=page.has_more,
+            total=page.total,
+        )
+
+    model_config = {"from_attributes": True}
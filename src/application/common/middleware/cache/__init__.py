@@ -20,6 +20,7 @@ from application.common.middleware.cache.query_cache import (
     QueryCache,
     QueryCacheConfig,
     QueryCacheMiddleware,
+    TaggedQueryCache,
 )
 
 __all__ = [
@@ -34,6 +35,7 @@ __all__ = [
     "QueryCache",
     "QueryCacheConfig",
     "QueryCacheMiddleware",
+    "TaggedQueryCache",
     "UserCacheInvalidationStrategy",
     "create_entity_specific_pattern",
     "create_query_type_pattern",
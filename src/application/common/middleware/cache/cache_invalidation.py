@@ -28,14 +28,14 @@ Example:
 """
 
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
 # Re-use QueryCache protocol from query_cache module (Single Source of Truth)
-from application.common.middleware.cache.query_cache import QueryCache
+from application.common.middleware.cache.query_cache import QueryCache, TaggedQueryCache
 
 logger = structlog.get_logger(__name__)
 
@@ -55,11 +55,15 @@ class InvalidationRule:
         event_type: The domain event type that triggers invalidation.
         patterns: List of cache key patterns to clear (supports * wildcard).
         log_invalidation: Whether to log cache invalidation.
+        tags: Builds entity tags to clear from the event (e.g.
+            ``lambda e: [f"user:{e.user_id}"]``). Only used when the cache
+            is a ``TaggedQueryCache``.
     """
 
     event_type: type
     patterns: list[str]
     log_invalidation: bool = True
+    tags: Callable[[Any], Iterable[str]] | None = None
 
 
 class CacheInvalidationStrategy(ABC):
@@ -114,6 +118,20 @@ class CacheInvalidationStrategy(ABC):
         rule = self._rules[event_type]
 
         total_cleared = 0
+        if rule.tags is not None and isinstance(self._cache, TaggedQueryCache):
+            tags = list(rule.tags(event))
+            cleared = await self._cache.invalidate_tags(tags)
+            total_cleared += cleared
+
+            if rule.log_invalidation and cleared > 0:
+                logger.info(
+                    "cache_invalidated",
+                    event_type=event_type.__name__,
+                    tags=tags,
+                    keys_cleared=cleared,
+                    operation="CACHE_INVALIDATION",
+                )
+
         for pattern in rule.patterns:
             cleared = await self._cache.clear_pattern(pattern)
             total_cleared += cleared
@@ -145,11 +163,11 @@ class CacheInvalidationStrategy(ABC):
 class UserCacheInvalidationStrategy(CacheInvalidationStrategy):
     """Cache invalidation strategy for User domain events.
 
-    Automatically invalidates user-related query cache when:
-    - User is created (invalidate user lists)
-    - User is updated (invalidate specific user + lists)
-    - User is deleted (invalidate specific user + lists)
-    - User email is changed (invalidate specific user + email lookup)
+    Single-user lookups are cleared by entity tag: ``GetUserByIdQuery``
+    results are tagged ``user:<id>`` and ``GetUserByEmailQuery`` results
+    ``user:email:<email>``, so an event only clears that user's entries on a
+    ``TaggedQueryCache``. User lists and counts are cleared by pattern, as
+    are email lookups when the event does not carry the email.
 
     Example:
         >>> from domain.users.events import UserRegisteredEvent, UserEmailChangedEvent
@@ -175,66 +193,67 @@ class UserCacheInvalidationStrategy(CacheInvalidationStrategy):
         # Import domain events (lazy to avoid circular imports)
         try:
             from domain.users.events import (
-                UserActivatedEvent,
                 UserDeactivatedEvent,
-                UserDeletedEvent,
                 UserEmailChangedEvent,
+                UserEmailVerifiedEvent,
+                UserProfileUpdatedEvent,
+                UserReactivatedEvent,
                 UserRegisteredEvent,
             )
-
-            # User created - invalidate lists
-            self.add_rule(
-                InvalidationRule(
-                    event_type=UserRegisteredEvent,
-                    patterns=[
-                        "query_cache:ListUsersQuery:*",
-                        "query_cache:GetActiveUsersQuery:*",
-                    ],
-                )
+        except ImportError:
+            logger.warning(
+                "Failed to import User domain events for cache invalidation. "
+                "Cache invalidation will not work for User events."
             )
+            return
 
-            # User updated - invalidate specific user + lists
-            self.add_rule(
-                InvalidationRule(
-                    event_type=UserEmailChangedEvent,
-                    patterns=[
-                        "query_cache:GetUserQuery:*",
-                        "query_cache:GetUserByEmailQuery:*",
-                        "query_cache:ListUsersQuery:*",
-                    ],
-                )
-            )
+        lists = create_query_type_pattern("ListUsersQuery")
+        counts = create_query_type_pattern("CountUsersQuery")
+        by_email = create_query_type_pattern("GetUserByEmailQuery")
 
-            # User activated/deactivated - invalidate specific user + active lists
-            for event_type in [UserActivatedEvent, UserDeactivatedEvent]:
-                self.add_rule(
-                    InvalidationRule(
-                        event_type=event_type,
-                        patterns=[
-                            "query_cache:GetUserQuery:*",
-                            "query_cache:GetActiveUsersQuery:*",
-                            "query_cache:ListUsersQuery:*",
-                        ],
-                    )
-                )
+        # User created - clear cached misses for the user + lists
+        self.add_rule(
+            InvalidationRule(
+                event_type=UserRegisteredEvent,
+                patterns=[lists, counts],
+                tags=lambda e: [f"user:{e.user_id}", f"user:email:{e.email}"],
+            )
+        )
+
+        # Email changed - the user under both emails + lists
+        self.add_rule(
+            InvalidationRule(
+                event_type=UserEmailChangedEvent,
+                patterns=[lists],
+                tags=lambda e: [f"user:{e.user_id}", f"user:email:{e.old_email}", f"user:email:{e.new_email}"],
+            )
+        )
 
-            # User deleted - invalidate specific user + lists
+        self.add_rule(
+            InvalidationRule(
+                event_type=UserEmailVerifiedEvent,
+                patterns=[lists],
+                tags=lambda e: [f"user:{e.user_id}", f"user:email:{e.email}"],
+            )
+        )
+
+        # Events without the email - the user + every email lookup + lists
+        self.add_rule(
+            InvalidationRule(
+                event_type=UserProfileUpdatedEvent,
+                patterns=[by_email, lists],
+                tags=lambda e: [f"user:{e.user_id}"],
+            )
+        )
+        for event_type in (UserDeactivatedEvent, UserReactivatedEvent):
             self.add_rule(
                 InvalidationRule(
-                    event_type=UserDeletedEvent,
-                    patterns=[
-                        "query_cache:GetUserQuery:*",
-                        "query_cache:ListUsersQuery:*",
-                    ],
+                    event_type=event_type,
+                    patterns=[by_email, lists, counts],
+                    tags=lambda e: [f"user:{e.user_id}"],
                 )
             )
 
-        except ImportError:
-            logger.warning(
-                "Failed to import User domain events for cache invalidation. "
-                "Cache invalidation will not work for User events."
-            )
-
     async def on_user_registered(self, event: Any) -> None:
         """Handle user registered event.
 
@@ -7,9 +7,10 @@ and cache invalidation strategies.
 **Validates: Requirements 13.1, 13.2**
 """
 
+import fnmatch
 import hashlib
 import json
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol, runtime_checkable
@@ -55,15 +56,114 @@ class QueryCache(Protocol):
         ...
 
 
+@runtime_checkable
+class TaggedQueryCache(QueryCache, Protocol):
+    """Query cache that can also index entries by entity tags.
+
+    Tags let event-driven invalidation remove exactly the entries that
+    depend on an entity (e.g. ``"user:123"``) without matching key patterns.
+    """
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        """Set cached result with TTL in seconds and optional entity tags."""
+        ...
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete every cached result carrying any of the given tags.
+
+        Returns:
+            Number of keys cleared.
+        """
+        ...
+
+
+_KEY_SEPARATOR = ":"
+_WILDCARDS = "*?["
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Get the part of a glob pattern before its first wildcard."""
+    end = len(pattern)
+    for char in _WILDCARDS:
+        index = pattern.find(char)
+        if index != -1:
+            end = min(end, index)
+    return pattern[:end]
+
+
+class _KeyTrie:
+    """Prefix trie over ``:``-separated cache key segments."""
+
+    __slots__ = ("children", "key")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _KeyTrie] = {}
+        self.key: str | None = None
+
+    def add(self, key: str) -> None:
+        """Index a key."""
+        node = self
+        for segment in key.split(_KEY_SEPARATOR):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _KeyTrie()
+            node = child
+        node.key = key
+
+    def remove(self, key: str) -> None:
+        """Remove a key and prune nodes left empty."""
+        path: list[tuple[_KeyTrie, str]] = []
+        node = self
+        for segment in key.split(_KEY_SEPARATOR):
+            child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+        node.key = None
+        for parent, segment in reversed(path):
+            child = parent.children[segment]
+            if child.key is not None or child.children:
+                break
+            del parent.children[segment]
+
+    def with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield every indexed key starting with ``prefix``."""
+        *segments, partial = prefix.split(_KEY_SEPARATOR)
+        node = self
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                return
+            node = child
+        for segment, child in node.children.items():
+            if segment.startswith(partial):
+                yield from child._subtree()
+
+    def _subtree(self) -> Iterator[str]:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.key is not None:
+                yield node.key
+            stack.extend(node.children.values())
+
+
 class InMemoryQueryCache:
     """In-memory query cache for development/testing.
 
+    Keys are indexed in a prefix trie and by entity tag, so pattern and
+    tag invalidation cost O(matches) instead of O(cache size).
+
     Note: In production, use Redis or another distributed cache
     to ensure cache consistency across multiple instances.
     """
 
     def __init__(self) -> None:
         self._cache: dict[str, tuple[Any, datetime]] = {}
+        self._trie = _KeyTrie()
+        self._tag_index: dict[str, set[str]] = {}
+        self._key_tags: dict[str, tuple[str, ...]] = {}
 
     async def get(self, key: str) -> Any | None:
         """Get cached result."""
@@ -72,30 +172,44 @@ class InMemoryQueryCache:
 
         value, expires_at = self._cache[key]
         if datetime.now(UTC) > expires_at:
-            del self._cache[key]
+            self._remove(key)
             return None
 
         return value
 
-    async def set(self, key: str, value: Any, ttl: int) -> None:
-        """Set cached result."""
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        """Set cached result, optionally tagged with entity tags."""
         expires_at = datetime.now(UTC) + timedelta(seconds=ttl)
+        if key in self._cache:
+            self._untag(key)
+        else:
+            self._trie.add(key)
         self._cache[key] = (value, expires_at)
 
+        key_tags = tuple(tags)
+        if key_tags:
+            self._key_tags[key] = key_tags
+            for tag in key_tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+
     async def delete(self, key: str) -> None:
         """Delete cached result."""
-        self._cache.pop(key, None)
+        if key in self._cache:
+            self._remove(key)
 
     async def clear(self) -> None:
         """Clear all cached results."""
         self._cache.clear()
+        self._trie = _KeyTrie()
+        self._tag_index.clear()
+        self._key_tags.clear()
 
     def cleanup(self) -> int:
         """Remove expired entries. Returns count of removed entries."""
         now = datetime.now(UTC)
         expired = [k for k, (_, exp) in self._cache.items() if now > exp]
         for k in expired:
-            del self._cache[k]
+            self._remove(k)
         return len(expired)
 
     def size(self) -> int:
@@ -105,16 +219,16 @@ class InMemoryQueryCache:
     async def clear_pattern(self, pattern: str) -> int:
         """Clear cached results matching pattern.
 
-        Supports * wildcard for pattern matching.
-        Optimized for common prefix patterns (e.g., "prefix:*").
+        Supports * wildcard for pattern matching. Candidates are taken from
+        the prefix trie using the literal text before the first wildcard.
 
         **Feature: application-layer-code-review-fixes**
         **Validates: Requirements F-05**
 
         Performance Characteristics:
-            - Prefix patterns ("prefix:*"): O(n) with fast startswith
-            - Complex patterns ("*mid*"): O(n*m) with fnmatch where m is pattern length
-            - For caches >10k keys, consider using Redis SCAN for production
+            - Prefix patterns ("prefix:*"): O(matches) via the prefix trie
+            - Complex patterns ("prefix:*mid*"): fnmatch over keys under the prefix
+            - Leading wildcard patterns ("*mid*"): fnmatch over every key
 
         Args:
             pattern: Pattern to match keys (e.g., "query_cache:GetUserQuery:*").
@@ -126,21 +240,52 @@ class InMemoryQueryCache:
             >>> await cache.clear_pattern("query_cache:GetUserQuery:*")
             >>> await cache.clear_pattern("*user:123*")
         """
-        # Optimization: if pattern ends with * and has no other wildcards,
-        # use prefix matching (O(n) but faster than fnmatch)
-        if pattern.endswith("*") and "*" not in pattern[:-1] and "?" not in pattern:
-            prefix = pattern[:-1]
-            matching_keys = [key for key in self._cache if key.startswith(prefix)]
+        prefix = _literal_prefix(pattern)
+        if prefix == pattern:
+            matching_keys = [pattern] if pattern in self._cache else []
+        elif pattern == prefix + "*":
+            matching_keys = list(self._trie.with_prefix(prefix))
         else:
-            import fnmatch
+            matching_keys = [key for key in self._trie.with_prefix(prefix) if fnmatch.fnmatch(key, pattern)]
+
+        for key in matching_keys:
+            self._remove(key)
+
+        return len(matching_keys)
 
-            matching_keys = [key for key in self._cache if fnmatch.fnmatch(key, pattern)]
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Clear cached results carrying any of the given tags.
+
+        Args:
+            tags: Entity tags (e.g., "user:123").
+
+        Returns:
+            Number of keys cleared.
+        """
+        matching_keys: set[str] = set()
+        for tag in tags:
+            matching_keys |= self._tag_index.get(tag, set())
 
         for key in matching_keys:
-            del self._cache[key]
+            self._remove(key)
 
         return len(matching_keys)
 
+    def _remove(self, key: str) -> None:
+        """Drop a key from the cache and its indexes."""
+        del self._cache[key]
+        self._trie.remove(key)
+        self._untag(key)
+
+    def _untag(self, key: str) -> None:
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_index.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tag_index[tag]
+
 
 @dataclass(frozen=True, slots=True)
 class QueryCacheConfig:
@@ -165,6 +310,10 @@ class QueryCacheMiddleware:
     - `get_cache_key()` method on the query
     - Or cache all queries if `cache_all_queries=True`
 
+    Queries can also supply entity tags through a `cache_tags` attribute or
+    `get_cache_tags()` method; a `TaggedQueryCache` indexes the entry under
+    them so invalidation can target it by tag.
+
     Example:
         >>> cache = InMemoryQueryCache()
         >>> cache_mw = QueryCacheMiddleware(cache, QueryCacheConfig(ttl_seconds=300))
@@ -176,6 +325,9 @@ class QueryCacheMiddleware:
         ...
         ...     def get_cache_key(self) -> str:
         ...         return f"user:{self.user_id}"
+        ...
+        ...     def get_cache_tags(self) -> list[str]:
+        ...         return [f"user:{self.user_id}"]
     """
 
     def __init__(
@@ -217,6 +369,22 @@ class QueryCacheMiddleware:
 
         return None
 
+    def _get_query_cache_tags(self, query: Any) -> tuple[str, ...]:
+        """Extract entity tags from query.
+
+        Args:
+            query: The query to extract tags from.
+
+        Returns:
+            Tags for the cached result (empty if none).
+        """
+        tags = getattr(query, "cache_tags", None)
+        if tags is None:
+            get_tags = getattr(query, "get_cache_tags", None)
+            if callable(get_tags):
+                tags = get_tags()
+        return tuple(str(tag) for tag in tags or ())
+
     def _generate_cache_key(self, query: Any) -> str:
         """Generate cache key from query data.
 
@@ -308,7 +476,11 @@ class QueryCacheMiddleware:
         result = await next_handler(query)
 
         # Cache result
-        await self._cache.set(cache_key, result, self._config.ttl_seconds)
+        tags = self._get_query_cache_tags(query)
+        if tags and isinstance(self._cache, TaggedQueryCache):
+            await self._cache.set(cache_key, result, self._config.ttl_seconds, tags=tags)
+        else:
+            await self._cache.set(cache_key, result, self._config.ttl_seconds)
 
         logger.debug(
             "Cached result",
@@ -22,6 +22,7 @@ from application.examples.item import (
     ExportFormat,
     ExportMetadata,
     ExportResult,
+    ExportStream,
     GetItemQuery,
     GetItemQueryHandler,
     ImportResult,
@@ -107,6 +108,7 @@ __all__ = [
     "ExportFormat",
     "ExportMetadata",
     "ExportResult",
+    "ExportStream",
     # Item Queries
     "GetItemQuery",
     "GetItemQueryHandler",
@@ -32,6 +32,7 @@ from application.examples.item.export import (
     ExportFormat,
     ExportMetadata,
     ExportResult,
+    ExportStream,
     ImportResult,
     ItemExampleExportService,
     ItemExampleImportService,
@@ -65,6 +66,7 @@ __all__ = [
     "ExportFormat",
     "ExportMetadata",
     "ExportResult",
+    "ExportStream",
     # Queries
     "GetItemQuery",
     "GetItemQueryHandler",
@@ -11,11 +11,13 @@ from application.examples.item.export.export import (
     ItemExampleExportService,
     ItemExampleImportService,
 )
+from application.examples.item.export.streaming import ExportStream
 
 __all__ = [
     "ExportFormat",
     "ExportMetadata",
     "ExportResult",
+    "ExportStream",
     "ImportResult",
     "ItemExampleExportService",
     "ItemExampleImportService",
@@ -8,35 +8,24 @@ import csv
 import hashlib
 import io
 import json
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from enum import Enum
 from typing import Any
 
 from application.examples.item.dtos import ItemExampleResponse
+from application.examples.item.export.formats import (
+    CSV_FIELDNAMES,
+    ExportFormat,
+    ExportMetadata,
+    dto_to_csv_row,
+    dto_to_record,
+)
+from application.examples.item.export.streaming import ExportStream
 from application.examples.item.mappers import ItemExampleMapper
 from domain.examples.item.entity import ItemExample
 
 
-class ExportFormat(str, Enum):
-    """Supported export formats."""
-
-    JSON = "json"
-    CSV = "csv"
-    JSONL = "jsonl"
-
-
-@dataclass(slots=True)
-class ExportMetadata:
-    """Metadata for export operations."""
-
-    format: str
-    record_count: int
-    export_timestamp: datetime
-    checksum: str
-    version: str = "1.0"
-
-
 @dataclass(slots=True)
 class ExportResult:
     """Result of an export operation."""
@@ -88,10 +77,11 @@ class ItemExampleExportService:
 
         dtos = [self._mapper.to_dto(item) for item in items]
         data_list = [self._dto_to_dict(dto) for dto in dtos]
+        timestamp = datetime.now(UTC)
 
         export_data = {
             "version": "1.0",
-            "export_timestamp": datetime.now(UTC).isoformat(),
+            "export_timestamp": timestamp.isoformat(),
             "record_count": len(data_list),
             "data": data_list,
         }
@@ -104,7 +94,7 @@ class ItemExampleExportService:
             metadata=ExportMetadata(
                 format=ExportFormat.JSON.value,
                 record_count=len(data_list),
-                export_timestamp=datetime.now(UTC),
+                export_timestamp=timestamp,
                 checksum=checksum,
             ),
             content_type="application/json",
@@ -131,42 +121,9 @@ class ItemExampleExportService:
 
         output = io.StringIO()
         if dtos:
-            fieldnames = [
-                "id",
-                "name",
-                "description",
-                "sku",
-                "price_amount",
-                "price_currency",
-                "quantity",
-                "status",
-                "category",
-                "tags",
-                "is_available",
-                "created_at",
-                "updated_at",
-            ]
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
+            writer = csv.DictWriter(output, fieldnames=CSV_FIELDNAMES)
             writer.writeheader()
-
-            for dto in dtos:
-                writer.writerow(
-                    {
-                        "id": dto.id,
-                        "name": dto.name,
-                        "description": dto.description,
-                        "sku": dto.sku,
-                        "price_amount": str(dto.price.amount),
-                        "price_currency": dto.price.currency,
-                        "quantity": dto.quantity,
-                        "status": dto.status,
-                        "category": dto.category,
-                        "tags": ",".join(dto.tags),
-                        "is_available": dto.is_available,
-                        "created_at": dto.created_at.isoformat() if dto.created_at else "",
-                        "updated_at": dto.updated_at.isoformat() if dto.updated_at else "",
-                    }
-                )
+            writer.writerows(dto_to_csv_row(dto) for dto in dtos)
 
         csv_str = output.getvalue()
         checksum = self._compute_checksum(csv_str)
@@ -240,24 +197,41 @@ class ItemExampleExportService:
             return await self.export_to_jsonl(items, **filters)
         raise ValueError(f"Unsupported export format: {format}")
 
+    def stream(
+        self,
+        format: ExportFormat,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> ExportStream:
+        """Stream all matching items in the specified format.
+
+        Items are read in keyset-paginated chunks of ``chunk_size`` and
+        encoded as they arrive, so memory use stays constant regardless of
+        the number of rows.
+
+        Args:
+            format: Export format (JSON, CSV, JSONL).
+            chunk_size: Items read from the repository per query.
+            **filters: Filters passed to the repository (category, status).
+
+        Returns:
+            ExportStream yielding encoded bytes; its metadata is set when exhausted.
+        """
+        return ExportStream(format, self._read_chunks(chunk_size, **filters))
+
+    async def _read_chunks(self, chunk_size: int, **filters: Any) -> AsyncIterator[list[ItemExampleResponse]]:
+        """Read DTO chunks page by page, following the keyset cursor."""
+        cursor = None
+        while True:
+            page = await self._repo.get_page(cursor=cursor, page_size=chunk_size, **filters)
+            yield [self._mapper.to_dto(item) for item in page.items]
+            if not page.has_more:
+                return
+            cursor = page.next_cursor
+
     def _dto_to_dict(self, dto: ItemExampleResponse) -> dict[str, Any]:
         """Convert DTO to dictionary for serialization."""
-        return {
-            "id": dto.id,
-            "name": dto.name,
-            "description": dto.description,
-            "sku": dto.sku,
-            "price": {"amount": str(dto.price.amount), "currency": dto.price.currency},
-            "quantity": dto.quantity,
-            "status": dto.status,
-            "category": dto.category,
-            "tags": dto.tags,
-            "is_available": dto.is_available,
-            "created_at": dto.created_at.isoformat() if dto.created_at else None,
-            "updated_at": dto.updated_at.isoformat() if dto.updated_at else None,
-            "created_by": dto.created_by,
-            "updated_by": dto.updated_by,
-        }
+        return dto_to_record(dto)
 
     def _compute_checksum(self, data: str) -> str:
         """Compute SHA-256 checksum (first 16 hex chars)."""
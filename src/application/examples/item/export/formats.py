@@ -0,0 +1,93 @@
+"""Export formats, metadata and row mapping shared by ItemExample exports.
+
+**Feature: application-common-integration**
+**Validates: Requirements 7.1, 7.2, 7.3, 7.4, 7.5**
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from application.examples.item.dtos import ItemExampleResponse
+
+
+class ExportFormat(str, Enum):
+    """Supported export formats."""
+
+    JSON = "json"
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+@dataclass(slots=True)
+class ExportMetadata:
+    """Metadata for export operations."""
+
+    format: str
+    record_count: int
+    export_timestamp: datetime
+    checksum: str
+    version: str = "1.0"
+
+
+CSV_FIELDNAMES = [
+    "id",
+    "name",
+    "description",
+    "sku",
+    "price_amount",
+    "price_currency",
+    "quantity",
+    "status",
+    "category",
+    "tags",
+    "is_available",
+    "created_at",
+    "updated_at",
+]
+
+CONTENT_TYPES = {
+    ExportFormat.JSON: "application/json",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSONL: "application/x-ndjson",
+}
+
+
+def dto_to_record(dto: ItemExampleResponse) -> dict[str, Any]:
+    """Convert DTO to dictionary for JSON serialization."""
+    return {
+        "id": dto.id,
+        "name": dto.name,
+        "description": dto.description,
+        "sku": dto.sku,
+        "price": {"amount": str(dto.price.amount), "currency": dto.price.currency},
+        "quantity": dto.quantity,
+        "status": dto.status,
+        "category": dto.category,
+        "tags": dto.tags,
+        "is_available": dto.is_available,
+        "created_at": dto.created_at.isoformat() if dto.created_at else None,
+        "updated_at": dto.updated_at.isoformat() if dto.updated_at else None,
+        "created_by": dto.created_by,
+        "updated_by": dto.updated_by,
+    }
+
+
+def dto_to_csv_row(dto: ItemExampleResponse) -> dict[str, Any]:
+    """Convert DTO to a CSV row keyed by ``CSV_FIELDNAMES``."""
+    return {
+        "id": dto.id,
+        "name": dto.name,
+        "description": dto.description,
+        "sku": dto.sku,
+        "price_amount": str(dto.price.amount),
+        "price_currency": dto.price.currency,
+        "quantity": dto.quantity,
+        "status": dto.status,
+        "category": dto.category,
+        "tags": ",".join(dto.tags),
+        "is_available": dto.is_available,
+        "created_at": dto.created_at.isoformat() if dto.created_at else "",
+        "updated_at": dto.updated_at.isoformat() if dto.updated_at else "",
+    }
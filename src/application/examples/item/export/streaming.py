@@ -0,0 +1,156 @@
+"""Streaming export encoding for ItemExample.
+
+``ExportStream`` encodes items chunk by chunk as they are read from the
+repository, so memory use depends on the chunk size, not on the number of
+rows. The SHA-256 checksum is updated with every chunk and is available
+in ``ExportStream.metadata`` once the stream is exhausted.
+
+CSV and JSON Lines output is byte-for-byte what the buffered exports
+produce; JSON is written compactly.
+
+**Feature: application-common-integration**
+**Validates: Requirements 7.1, 7.2, 7.3**
+"""
+
+import csv
+import hashlib
+import io
+import json
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime
+from typing import Protocol
+
+from application.examples.item.dtos import ItemExampleResponse
+from application.examples.item.export.formats import (
+    CONTENT_TYPES,
+    CSV_FIELDNAMES,
+    ExportFormat,
+    ExportMetadata,
+    dto_to_csv_row,
+    dto_to_record,
+)
+
+
+class _Encoder(Protocol):
+    """Produces the text of one export format, piece by piece."""
+
+    def start(self, timestamp: datetime) -> str: ...
+
+    def encode(self, dtos: list[ItemExampleResponse], first: bool) -> str: ...
+
+    def finish(self, record_count: int) -> str: ...
+
+
+class _JsonEncoder:
+    """Encodes ``{"version", "export_timestamp", "data": [...], "record_count"}``."""
+
+    def start(self, timestamp: datetime) -> str:
+        return f'{{"version": "1.0", "export_timestamp": "{timestamp.isoformat()}", "data": ['
+
+    def encode(self, dtos: list[ItemExampleResponse], first: bool) -> str:
+        body = ", ".join(json.dumps(dto_to_record(dto), default=str) for dto in dtos)
+        return body if first else ", " + body
+
+    def finish(self, record_count: int) -> str:
+        return f'], "record_count": {record_count}}}'
+
+
+class _JsonLinesEncoder:
+    """Encodes one JSON object per line, without a trailing newline."""
+
+    def start(self, timestamp: datetime) -> str:
+        return ""
+
+    def encode(self, dtos: list[ItemExampleResponse], first: bool) -> str:
+        body = "\n".join(json.dumps(dto_to_record(dto), default=str) for dto in dtos)
+        return body if first else "\n" + body
+
+    def finish(self, record_count: int) -> str:
+        return ""
+
+
+class _CsvEncoder:
+    """Encodes a header and one row per item, reusing one buffer."""
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(self._buffer, fieldnames=CSV_FIELDNAMES)
+
+    def start(self, timestamp: datetime) -> str:
+        return ""
+
+    def encode(self, dtos: list[ItemExampleResponse], first: bool) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        if first:
+            self._writer.writeheader()
+        self._writer.writerows(dto_to_csv_row(dto) for dto in dtos)
+        return self._buffer.getvalue()
+
+    def finish(self, record_count: int) -> str:
+        return ""
+
+
+_ENCODERS: dict[ExportFormat, Callable[[], _Encoder]] = {
+    ExportFormat.JSON: _JsonEncoder,
+    ExportFormat.CSV: _CsvEncoder,
+    ExportFormat.JSONL: _JsonLinesEncoder,
+}
+
+
+class ExportStream:
+    """Export body produced while iterating.
+
+    Iterating yields one encoded ``bytes`` chunk per repository chunk. It can
+    be iterated once; ``metadata`` is None until the iteration completes.
+    The export timestamp is taken when the stream is created, and is the
+    same in the JSON body and in ``metadata``.
+
+    Example:
+        >>> stream = service.stream(ExportFormat.JSONL)
+        >>> async for chunk in stream:
+        ...     await sink.write(chunk)
+        >>> stream.metadata.checksum
+    """
+
+    def __init__(self, format: ExportFormat, chunks: AsyncIterator[list[ItemExampleResponse]]) -> None:
+        """Initialize export stream.
+
+        Args:
+            format: Export format.
+            chunks: DTO chunks to encode, in export order.
+        """
+        self.format = format
+        self.content_type = CONTENT_TYPES[format]
+        self.metadata: ExportMetadata | None = None
+        self._chunks = chunks
+        self._timestamp = datetime.now(UTC)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._encode()
+
+    async def _encode(self) -> AsyncIterator[bytes]:
+        encoder = _ENCODERS[self.format]()
+        digest = hashlib.sha256()
+        record_count = 0
+
+        def emit(text: str) -> bytes:
+            data = text.encode()
+            digest.update(data)
+            return data
+
+        if head := encoder.start(self._timestamp):
+            yield emit(head)
+        async for dtos in self._chunks:
+            if dtos:
+                yield emit(encoder.encode(dtos, first=record_count == 0))
+                record_count += len(dtos)
+        if tail := encoder.finish(record_count):
+            yield emit(tail)
+
+        self.metadata = ExportMetadata(
+            format=self.format.value,
+            record_count=record_count,
+            export_timestamp=self._timestamp,
+            checksum=digest.hexdigest()[:16],
+        )
@@ -32,6 +32,7 @@ from application.examples.shared.errors import (
     UseCaseError,
     ValidationError,
 )
+from core.base.patterns.pagination import CountMode, CursorPage
 from core.base.patterns.result import Err, Ok, Result
 from domain.examples.item.entity import ItemExample, Money
 
@@ -249,3 +250,32 @@ class ItemExampleUseCase(EventPublishingMixin):
             status=status,
         )
         return Ok(ItemExampleMapper.to_response_list(items))
+
+    async def list_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 20,
+        category: str | None = None,
+        status: str | None = None,
+        count: CountMode = CountMode.NONE,
+    ) -> Result[CursorPage[ItemExampleResponse, str], UseCaseError]:
+        """List items with keyset (cursor) pagination."""
+        try:
+            page = await self._repo.get_page(
+                cursor=cursor,
+                page_size=page_size,
+                category=category,
+                status=status,
+                count=count,
+            )
+        except ValueError as e:
+            return Err(ValidationError(str(e), "cursor"))
+        return Ok(
+            CursorPage(
+                items=ItemExampleMapper.to_response_list(list(page.items)),
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                has_more=page.has_more,
+                total=page.total,
+            )
+        )
@@ -22,6 +22,9 @@ class GetUserByIdQuery(BaseQuery[dict[str, Any] | None]):
     def get_cache_key(self) -> str:
         return f"user:{self.user_id}"
 
+    def get_cache_tags(self) -> list[str]:
+        return [f"user:{self.user_id}"]
+
 
 @dataclass(frozen=True, kw_only=True)
 class GetUserByEmailQuery(BaseQuery[dict[str, Any] | None]):
@@ -32,6 +35,9 @@ class GetUserByEmailQuery(BaseQuery[dict[str, Any] | None]):
     def get_cache_key(self) -> str:
         return f"user:email:{self.email}"
 
+    def get_cache_tags(self) -> list[str]:
+        return [f"user:email:{self.email}"]
+
 
 class GetUserByIdHandler(QueryHandler[GetUserByIdQuery, dict[str, Any] | None]):
     """Handler for GetUserByIdQuery."""
@@ -50,6 +50,7 @@ from core.base.patterns import (
     CompositeSpecification,
     CompositeValidator,
     # Pagination
+    CountMode,
     CursorPage,
     CursorPagination,
     Err,
@@ -108,6 +109,7 @@ __all__ = [
     "CompositeSpecification",
     "CompositeValidator",
     # Pagination
+    "CountMode",
     "CursorPage",
     "CursorPagination",
     # Events
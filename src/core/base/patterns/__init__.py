@@ -3,7 +3,7 @@
 **Feature: architecture-restructuring-2025**
 """
 
-from core.base.patterns.pagination import CursorPage, CursorPagination
+from core.base.patterns.pagination import CountMode, CursorPage, CursorPagination
 from core.base.patterns.result import (
     Err,
     Ok,
@@ -52,6 +52,7 @@ __all__ = [
     "CompositeSpecification",
     "CompositeValidator",
     # Pagination
+    "CountMode",
     "CursorPage",
     "CursorPagination",
     "Err",
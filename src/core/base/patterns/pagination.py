@@ -10,12 +10,59 @@ import base64
 import json
 from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum, StrEnum
+from typing import Any
+from uuid import UUID
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
+class CountMode(StrEnum):
+    """How a paginated query computes its total count.
+
+    EXACT runs ``SELECT count(*)``, ESTIMATED uses planner statistics where
+    the backend offers them (falling back to EXACT), and NONE skips counting.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+# Type tags used to round-trip keyset values through JSON cursors.
+_KEYSET_ENCODERS: tuple[tuple[type, str], ...] = (
+    (datetime, "dt"),
+    (date, "d"),
+    (Decimal, "dec"),
+    (UUID, "uuid"),
+)
+_KEYSET_DECODERS: dict[str, Any] = {
+    "dt": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "dec": Decimal,
+    "uuid": UUID,
+}
+
+
+def _encode_keyset_value(value: Any) -> Any:
+    for value_type, tag in _KEYSET_ENCODERS:
+        if isinstance(value, value_type):
+            return {"$t": tag, "v": str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_keyset_value(value: Any) -> Any:
+    if isinstance(value, dict) and "$t" in value:
+        return _KEYSET_DECODERS[value["$t"]](value["v"])
+    return value
+
+
 @dataclass(frozen=True, slots=True)
 class CursorPage[T, CursorT]:
     """Result of cursor-based pagination.
@@ -32,6 +79,7 @@ class CursorPage[T, CursorT]:
     next_cursor: CursorT | None
     prev_cursor: CursorT | None
     has_more: bool
+    total: int | None = None
 
 
 class CursorPagination[T, CursorT]:
@@ -103,3 +151,50 @@ class CursorPagination[T, CursorT]:
                 operation="CURSOR_DECODE",
             )
             return {}  # type: ignore
+
+    def encode_keyset(self, entity: T, *, sort_order: str = "asc") -> str:
+        """Encode a keyset cursor positioned after ``entity``.
+
+        Unlike :meth:`encode_cursor`, values keep their types (datetimes,
+        decimals, UUIDs) so they can be compared against columns directly,
+        and the cursor records the fields and order it was built for.
+
+        Args:
+            entity: Last entity of the current page.
+            sort_order: Sort direction the page was read with.
+
+        Returns:
+            Base64-encoded cursor string.
+        """
+        payload = {
+            "f": self._cursor_fields,
+            "o": sort_order.lower(),
+            "v": [_encode_keyset_value(getattr(entity, field, None)) for field in self._cursor_fields],
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    def decode_keyset(self, cursor: str, *, sort_order: str = "asc") -> list[Any] | None:
+        """Decode a keyset cursor produced by :meth:`encode_keyset`.
+
+        Args:
+            cursor: Base64-encoded cursor string.
+            sort_order: Sort direction the next page is being read with.
+
+        Returns:
+            Keyset values in ``cursor_fields`` order, or None if the cursor is
+            malformed or was built for different fields or sort order.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if payload["f"] != self._cursor_fields or payload["o"] != sort_order.lower():
+                return None
+            values = [_decode_keyset_value(value) for value in payload["v"]]
+        except (ValueError, TypeError, KeyError, ArithmeticError) as e:
+            # ArithmeticError covers decimal.InvalidOperation from crafted "dec" values.
+            logger.warning(
+                "Invalid keyset cursor decode",
+                operation="CURSOR_DECODE",
+                error_type=type(e).__name__,
+            )
+            return None
+        return values if len(values) == len(self._cursor_fields) else None
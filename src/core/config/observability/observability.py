@@ -54,6 +54,18 @@ class ObservabilitySettings(BaseSettings):
     )
     enable_tracing: bool = Field(default=True, description="Enable distributed tracing")
     enable_metrics: bool = Field(default=True, description="Enable metrics collection")
+    request_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests written to the access log (errors are always logged)",
+    )
+    request_metrics_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests recorded in HTTP metrics",
+    )
 
     # Elasticsearch
     elasticsearch_enabled: bool = Field(default=False)
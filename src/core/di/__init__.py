@@ -28,8 +28,10 @@ from core.di.lifecycle import Lifetime, Registration
 from core.di.observability import ContainerHooks, ContainerStats, MetricsTracker
 from core.di.resolution import (
     CircularDependencyError,
+    ContainerFrozenError,
     DependencyResolutionError,
     InvalidFactoryError,
+    ResolutionPlan,
     Resolver,
     ServiceNotRegisteredError,
 )
@@ -38,6 +40,7 @@ __all__ = [
     "CircularDependencyError",
     # Container
     "Container",
+    "ContainerFrozenError",
     "ContainerHooks",
     # Metrics
     "ContainerStats",
@@ -49,6 +52,7 @@ __all__ = [
     "MetricsTracker",
     "Registration",
     # Resolution
+    "ResolutionPlan",
     "Resolver",
     "Scope",
     "ServiceNotRegisteredError",
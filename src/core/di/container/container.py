@@ -15,12 +15,17 @@ This file now contains the main Container class only.
 
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, NoReturn
 
 from core.di.container.scopes import Scope
 from core.di.lifecycle import Lifetime, Registration
 from core.di.observability import ContainerHooks, ContainerStats, MetricsTracker
-from core.di.resolution import CircularDependencyError, Resolver, ServiceNotRegisteredError
+from core.di.resolution import (
+    CircularDependencyError,
+    ContainerFrozenError,
+    Resolver,
+    ServiceNotRegisteredError,
+)
 
 # Re-export for backward compatibility
 __all__ = [
@@ -40,6 +45,8 @@ class Container:
         - Circular dependency detection
         - Type-safe with PEP 695 generics
         - Scoped containers for request-scoped dependencies
+        - Compiled resolution plans; ``freeze()`` validates the whole
+          graph up front and drops per-resolution cycle tracking
 
     **Feature: generics-100-percent-fixes**
     **Validates: Requirements 28.1, 28.2, 28.3, 4.1, 4.2, 4.3, 4.4, 4.5**
@@ -58,6 +65,32 @@ class Container:
         self._resolution_stack: list[type] = []
         self._resolver = Resolver(self._registrations, self.resolve)
         self._metrics_tracker = MetricsTracker()
+        self._frozen = False
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether registrations are locked by ``freeze()``."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Validate the dependency graph and lock registrations.
+
+        Call once at startup, after all services are registered. Every
+        registration is compiled into its resolution plan, and missing
+        dependencies and cycles are reported here instead of on first
+        resolution. Resolutions then skip cycle detection.
+
+        Raises:
+            DependencyResolutionError: If a required dependency is not registered.
+            CircularDependencyError: If the dependency graph has a cycle.
+        """
+        self._resolver.validate_graph()
+        self._frozen = True
+
+    def _check_not_frozen(self, service_type: type) -> None:
+        """Raise if registrations are locked."""
+        if self._frozen:
+            raise ContainerFrozenError(service_type)
 
     def register[T](
         self,
@@ -74,7 +107,9 @@ class Container:
 
         Raises:
             InvalidFactoryError: If factory is not callable or has invalid signature.
+            ContainerFrozenError: If the container is frozen.
         """
+        self._check_not_frozen(service_type)
         if factory is None:
             factory = service_type
 
@@ -116,6 +151,7 @@ class Container:
         instance: T,
     ) -> None:
         """Register an existing instance as singleton."""
+        self._check_not_frozen(service_type)
         self._registrations[service_type] = Registration(
             service_type=service_type,
             factory=lambda: instance,
@@ -141,89 +177,65 @@ class Container:
             CircularDependencyError: If circular dependency detected.
             DependencyResolutionError: If dependency cannot be resolved.
         """
-        try:
-            if service_type not in self._registrations:
-                raise ServiceNotRegisteredError(service_type)
+        registration = self._registrations.get(service_type)
+        if registration is None:
+            self._raise_resolution_error(service_type, ServiceNotRegisteredError(service_type))
+        if not self._frozen and service_type in self._resolution_stack:
+            chain = [*self._resolution_stack, service_type]
+            self._raise_resolution_error(service_type, CircularDependencyError(chain))
 
-            if service_type in self._resolution_stack:
-                chain = [*self._resolution_stack, service_type]
-                raise CircularDependencyError(chain)
-        except Exception as e:
-            self._metrics_tracker.trigger_hook(
-                "on_resolution_error",
-                service_type=service_type,
-                error=e,
-                resolution_stack=self._resolution_stack.copy(),
-            )
-            raise
-
-        registration = self._registrations[service_type]
         self._metrics_tracker.record_resolution(service_type)
 
         if registration.lifetime == Lifetime.SINGLETON:
-            return self._resolve_singleton(service_type, registration)
-
-        return self._resolve_transient(service_type, registration)
+            if service_type in self._singletons:
+                instance = self._singletons[service_type]
+                self._resolved(service_type, instance, is_cached=True)
+                return instance
+            instance = self._create(service_type, registration)
+            self._singletons[service_type] = instance
+            self._metrics_tracker.record_singleton_created(service_type)
+        else:
+            instance = self._create(service_type, registration)
+
+        self._resolved(service_type, instance, is_cached=False)
+        return instance
 
-    def _resolve_singleton[T](self, service_type: type[T], registration: Registration[T]) -> T:
-        """Resolve singleton service."""
-        if service_type in self._singletons:
-            instance = self._singletons[service_type]
-            self._metrics_tracker.trigger_hook(
-                "on_service_resolved",
-                service_type=service_type,
-                instance=instance,
-                is_cached=True,
-            )
-            return instance
+    def _create[T](self, service_type: type[T], registration: Registration[T]) -> T:
+        """Create an instance from its plan, tracking the resolution chain."""
+        if self._frozen:
+            try:
+                return self._resolver.create_instance(registration)
+            except Exception as e:
+                self._raise_resolution_error(service_type, e)
 
         self._resolution_stack.append(service_type)
         try:
-            instance = self._resolver.create_instance(registration)
+            return self._resolver.create_instance(registration)
         except Exception as e:
-            self._metrics_tracker.trigger_hook(
-                "on_resolution_error",
-                service_type=service_type,
-                error=e,
-                resolution_stack=self._resolution_stack.copy(),
-            )
-            raise
+            self._raise_resolution_error(service_type, e)
         finally:
             self._resolution_stack.pop()
 
-        self._singletons[service_type] = instance
-        self._metrics_tracker.record_singleton_created(service_type)
-        self._metrics_tracker.trigger_hook(
-            "on_service_resolved",
-            service_type=service_type,
-            instance=instance,
-            is_cached=False,
-        )
-
-        return instance
-
-    def _resolve_transient[T](self, service_type: type[T], registration: Registration[T]) -> T:
-        """Resolve transient/scoped service."""
-        self._resolution_stack.append(service_type)
-        try:
-            instance = self._resolver.create_instance(registration)
+    def _resolved(self, service_type: type, instance: Any, *, is_cached: bool) -> None:
+        """Notify hooks of a resolved service."""
+        if self._metrics_tracker.has_hooks:
             self._metrics_tracker.trigger_hook(
                 "on_service_resolved",
                 service_type=service_type,
                 instance=instance,
-                is_cached=False,
+                is_cached=is_cached,
             )
-            return instance
-        except Exception as e:
+
+    def _raise_resolution_error(self, service_type: type, error: Exception) -> NoReturn:
+        """Notify hooks of a resolution error and raise it."""
+        if self._metrics_tracker.has_hooks:
             self._metrics_tracker.trigger_hook(
                 "on_resolution_error",
                 service_type=service_type,
-                error=e,
+                error=error,
                 resolution_stack=self._resolution_stack.copy(),
             )
-            raise
-        finally:
-            self._resolution_stack.pop()
+        raise error
 
     def is_registered(self, service_type: type) -> bool:
         """Check if a service is registered."""
@@ -93,6 +93,11 @@ class MetricsTracker:
             resolutions_by_type=self._metrics.resolutions_by_type.copy(),
         )
 
+    @property
+    def has_hooks(self) -> bool:
+        """Whether any observability hooks are registered."""
+        return bool(self._hooks)
+
     def add_hooks(self, hooks: ContainerHooks) -> None:
         """Add observability hooks."""
         self._hooks.append(hooks)
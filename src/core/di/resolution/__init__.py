@@ -7,16 +7,20 @@ Contains resolver logic and DI-specific exceptions.
 
 from core.di.resolution.exceptions import (
     CircularDependencyError,
+    ContainerFrozenError,
     DependencyResolutionError,
     InvalidFactoryError,
     ServiceNotRegisteredError,
 )
-from core.di.resolution.resolver import Resolver
+from core.di.resolution.resolver import Dependency, ResolutionPlan, Resolver
 
 __all__ = [
     "CircularDependencyError",
+    "ContainerFrozenError",
+    "Dependency",
     "DependencyResolutionError",
     "InvalidFactoryError",
+    "ResolutionPlan",
     "Resolver",
     "ServiceNotRegisteredError",
 ]
@@ -97,3 +97,20 @@ class ServiceNotRegisteredError(Exception):
         """
         self.service_type = service_type
         super().__init__(f"Service '{service_type.__name__}' is not registered")
+
+
+class ContainerFrozenError(Exception):
+    """Raised when registering a service in a frozen container.
+
+    **Feature: generics-100-percent-fixes**
+    **Validates: Requirements 4.2**
+    """
+
+    def __init__(self, service_type: type) -> None:
+        """Initialize container frozen error.
+
+        Args:
+            service_type: The service type that was being registered.
+        """
+        self.service_type = service_type
+        super().__init__(f"Cannot register '{service_type.__name__}': container is frozen")
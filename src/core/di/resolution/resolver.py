@@ -1,16 +1,56 @@
 """Dependency resolution logic.
 
+Each registration is compiled once into a ``ResolutionPlan``, the flat
+list of constructor dependencies read from its type hints, so resolving
+a service does no reflection.
+
 **Feature: generics-100-percent-fixes**
-**Validates: Requirements 4.1, 4.3, 4.4, 4.5**
+**Validates: Requirements 4.1, 4.2, 4.3, 4.4, 4.5**
 """
 
 import inspect
 import types
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, Union, get_args, get_origin, get_type_hints
 
 from core.di.lifecycle import Registration
-from core.di.resolution.exceptions import DependencyResolutionError, InvalidFactoryError
+from core.di.resolution.exceptions import (
+    CircularDependencyError,
+    DependencyResolutionError,
+    InvalidFactoryError,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Dependency:
+    """Constructor parameter to auto-wire.
+
+    Attributes:
+        name: Parameter name.
+        service_type: Type to resolve, with ``Optional`` unwrapped.
+        optional: Whether None is passed when the type is not registered.
+    """
+
+    name: str
+    service_type: type
+    optional: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ResolutionPlan:
+    """Compiled recipe for creating one registered service.
+
+    Attributes:
+        factory: Factory the plan was compiled for.
+        dependencies: Parameters to resolve, in declaration order.
+        hints_error: Error reading type hints; the factory is then called
+            without arguments.
+    """
+
+    factory: Callable[..., Any]
+    dependencies: tuple[Dependency, ...] = ()
+    hints_error: Exception | None = None
 
 
 class Resolver:
@@ -33,6 +73,7 @@ class Resolver:
         """
         self._registrations = registrations
         self._resolve = resolve_callback
+        self._plans: dict[type, ResolutionPlan] = {}
 
     def validate_factory(
         self,
@@ -67,6 +108,88 @@ class Resolver:
             except (ValueError, TypeError) as e:
                 raise InvalidFactoryError(factory, f"Cannot inspect signature: {e}") from e
 
+    def plan_for(self, registration: Registration[Any]) -> ResolutionPlan:
+        """Get the resolution plan of a registration, compiling it once.
+
+        A plan is recompiled only when the registration's factory changes.
+
+        Args:
+            registration: The registration entry for the service.
+
+        Returns:
+            Cached resolution plan.
+        """
+        plan = self._plans.get(registration.service_type)
+        if plan is None or plan.factory is not registration.factory:
+            plan = self._compile_plan(registration.factory)
+            self._plans[registration.service_type] = plan
+        return plan
+
+    def invalidate(self, service_type: type | None = None) -> None:
+        """Drop the cached plan of one service, or of all services."""
+        if service_type is None:
+            self._plans.clear()
+        else:
+            self._plans.pop(service_type, None)
+
+    def _compile_plan(self, factory: Callable[..., Any]) -> ResolutionPlan:
+        """Read a factory's type hints into a resolution plan."""
+        try:
+            hints = get_type_hints(factory.__init__) if inspect.isclass(factory) else get_type_hints(factory)
+        except Exception as e:
+            return ResolutionPlan(factory=factory, hints_error=e)
+
+        hints.pop("return", None)
+        return ResolutionPlan(
+            factory=factory,
+            dependencies=tuple(
+                Dependency(
+                    name=param_name,
+                    service_type=self._unwrap_optional(param_type),
+                    optional=self._is_optional(param_type),
+                )
+                for param_name, param_type in hints.items()
+            ),
+        )
+
+    def validate_graph(self) -> None:
+        """Check every registration can be resolved.
+
+        **Feature: generics-100-percent-fixes**
+        **Validates: Requirements 4.2, 4.4**
+
+        Compiles all plans and walks the dependency graph.
+
+        Raises:
+            DependencyResolutionError: If a required dependency is not registered.
+            CircularDependencyError: If the graph has a cycle.
+        """
+        done: set[type] = set()
+        for service_type in list(self._registrations):
+            self._visit(service_type, [], done)
+
+    def _visit(self, service_type: type, path: list[type], done: set[type]) -> None:
+        """Depth-first walk of one service's dependencies."""
+        if service_type in done:
+            return
+        if service_type in path:
+            raise CircularDependencyError([*path[path.index(service_type) :], service_type])
+
+        path.append(service_type)
+        plan = self.plan_for(self._registrations[service_type])
+        for dependency in plan.dependencies:
+            if dependency.service_type in self._registrations:
+                self._visit(dependency.service_type, path, done)
+            elif not dependency.optional:
+                raise DependencyResolutionError(
+                    service_type=service_type,
+                    param_name=dependency.name,
+                    expected_type=dependency.service_type,
+                    reason="Service not registered",
+                )
+        path.pop()
+        done.add(service_type)
+
     def create_instance[T](self, registration: Registration[T]) -> T:
         """Create an instance using the factory with auto-wiring.
 
@@ -82,13 +205,11 @@ class Resolver:
         Raises:
             DependencyResolutionError: If dependency cannot be resolved.
         """
+        plan = self.plan_for(registration)
         factory = registration.factory
         service_type = registration.service_type
 
-        # Get type hints for auto-wiring
-        try:
-            hints = get_type_hints(factory.__init__) if inspect.isclass(factory) else get_type_hints(factory)
-        except Exception as e:
+        if plan.hints_error is not None:
             # If we can't get hints, try to call without args
             try:
                 return factory()
@@ -97,22 +218,26 @@ class Resolver:
                     service_type=service_type,
                     param_name="<unknown>",
                     expected_type=type(None),
-                    reason=f"Cannot get type hints: {e}",
+                    reason=f"Cannot get type hints: {plan.hints_error}",
                 ) from factory_err
 
-        # Remove 'return' from hints
-        hints.pop("return", None)
-
         # Resolve dependencies
         kwargs: dict[str, Any] = {}
-        for param_name, param_type in hints.items():
-            resolved = self._resolve_parameter(
-                service_type=service_type,
-                param_name=param_name,
-                param_type=param_type,
-            )
-            if resolved is not None or self._is_optional(param_type):
-                kwargs[param_name] = resolved
+        registrations = self._registrations
+        for dependency in plan.dependencies:
+            if dependency.service_type in registrations:
+                resolved = self._resolve(dependency.service_type)
+            elif dependency.optional:
+                resolved = None
+            else:
+                raise DependencyResolutionError(
+                    service_type=service_type,
+                    param_name=dependency.name,
+                    expected_type=dependency.service_type,
+                    reason="Service not registered",
+                )
+            if resolved is not None or dependency.optional:
+                kwargs[dependency.name] = resolved
 
         try:
             return factory(**kwargs)
@@ -124,45 +249,6 @@ class Resolver:
                 reason=f"Factory call failed: {e}",
             ) from e
 
-    def _resolve_parameter(
-        self,
-        service_type: type,
-        param_name: str,
-        param_type: type,
-    ) -> Any:
-        """Resolve a single parameter.
-
-        **Feature: generics-100-percent-fixes**
-        **Validates: Requirements 4.1, 4.4**
-
-        Args:
-            service_type: The service type being created.
-            param_name: The parameter name to resolve.
-            param_type: The parameter type to resolve.
-
-        Returns:
-            Resolved value or None for optional parameters.
-
-        Raises:
-            DependencyResolutionError: If required parameter cannot be resolved.
-        """
-        # Handle Optional[T] / T | None
-        actual_type = self._unwrap_optional(param_type)
-        is_optional = self._is_optional(param_type)
-
-        if actual_type in self._registrations:
-            return self._resolve(actual_type)
-
-        if is_optional:
-            return None
-
-        raise DependencyResolutionError(
-            service_type=service_type,
-            param_name=param_name,
-            expected_type=actual_type,
-            reason="Service not registered",
-        )
-
     def _is_optional(self, param_type: type) -> bool:
         """Check if type is Optional[T] or T | None.
 
@@ -28,11 +28,13 @@ from core.shared.logging.redaction import (
     PII_PATTERNS,
     RedactionProcessor,
 )
+from core.shared.logging.redaction_engine import RedactionEngine
 
 __all__ = [
     "PII_PATTERNS",
     "LogLevel",
     # Redaction
+    "RedactionEngine",
     "RedactionProcessor",
     "bind_contextvars",
     "clear_contextvars",
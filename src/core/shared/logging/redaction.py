@@ -28,15 +28,23 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
+from core.shared.logging.redaction_engine import RedactionEngine
+
 
 @dataclass(slots=True)
 class PIIPattern:
-    """Pattern for detecting and redacting PII."""
+    """Pattern for detecting and redacting PII.
+
+    ``hints`` are case-insensitive literals, one of which occurs in every
+    match; when all patterns have hints, strings containing none of them
+    are skipped without running any pattern.
+    """
 
     name: str
     pattern: re.Pattern[str]
     replacement: str | None = None
     mask_func: Any = None
+    hints: tuple[str, ...] = ()
 
     def redact(self, text: str) -> str:
         """Redact matches in text."""
@@ -80,6 +88,8 @@ def _mask_ssn_cpf(match: re.Match[str]) -> str:
     return "***-**-****"
 
 
+_DIGITS = tuple("0123456789")
+
 # Default PII patterns
 PII_PATTERNS: dict[str, PIIPattern] = {
     "email": PIIPattern(
@@ -89,6 +99,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             re.IGNORECASE,
         ),
         mask_func=_mask_email,
+        hints=("@",),
     ),
     "password_json": PIIPattern(
         name="password_json",
@@ -97,6 +108,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             re.IGNORECASE,
         ),
         replacement=r'\1: "***"',
+        hints=("password",),
     ),
     "password_field": PIIPattern(
         name="password_field",
@@ -105,6 +117,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             re.IGNORECASE,
         ),
         replacement=r"\1***",
+        hints=("password=",),
     ),
     "credit_card": PIIPattern(
         name="credit_card",
@@ -112,6 +125,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
         ),
         mask_func=_mask_credit_card,
+        hints=_DIGITS,
     ),
     "ssn": PIIPattern(
         name="ssn",
@@ -119,6 +133,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             r"\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b",
         ),
         mask_func=_mask_ssn_cpf,
+        hints=_DIGITS,
     ),
     "cpf": PIIPattern(
         name="cpf",
@@ -126,6 +141,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             r"\b\d{3}\.?\d{3}\.?\d{3}[-.]?\d{2}\b",
         ),
         mask_func=_mask_ssn_cpf,
+        hints=_DIGITS,
     ),
     "phone": PIIPattern(
         name="phone",
@@ -133,6 +149,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
         ),
         mask_func=_mask_phone,
+        hints=_DIGITS,
     ),
     "bearer_token": PIIPattern(
         name="bearer_token",
@@ -141,6 +158,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             re.IGNORECASE,
         ),
         replacement=r"\1***",
+        hints=("bearer",),
     ),
     "api_key": PIIPattern(
         name="api_key",
@@ -149,6 +167,7 @@ PII_PATTERNS: dict[str, PIIPattern] = {
             re.IGNORECASE,
         ),
         replacement=r"\1***",
+        hints=("api",),
     ),
 }
 
@@ -157,6 +176,10 @@ PII_PATTERNS: dict[str, PIIPattern] = {
 class RedactionProcessor:
     """Structlog processor that redacts PII from log events.
 
+    Patterns and field names are compiled into a ``RedactionEngine`` on
+    first use and recompiled whenever ``patterns`` or ``fields_to_redact``
+    change. Events without PII are returned unchanged, not copied.
+
     Attributes:
         patterns: Dictionary of PII patterns to apply
         fields_to_redact: Set of field names to completely redact
@@ -188,6 +211,7 @@ class RedactionProcessor:
         }
     )
     enabled: bool = True
+    _engine: RedactionEngine | None = field(default=None, init=False, repr=False, compare=False)
 
     # Fields that should never be redacted
     SAFE_FIELDS: ClassVar[set[str]] = {
@@ -224,56 +248,15 @@ class RedactionProcessor:
         if not self.enabled:
             return event_dict
 
-        return self._redact_dict(event_dict)
-
-    def _redact_dict(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Recursively redact PII from dictionary."""
-        result = {}
-
-        for key, value in data.items():
-            # Skip safe fields
-            if key in self.SAFE_FIELDS:
-                result[key] = value
-                continue
-
-            # Completely redact sensitive field names
-            if key.lower() in self.fields_to_redact:
-                result[key] = "***"
-                continue
-
-            # Recursively process nested structures
-            if isinstance(value, dict):
-                result[key] = self._redact_dict(value)
-            elif isinstance(value, list):
-                result[key] = self._redact_list(value)
-            elif isinstance(value, str):
-                result[key] = self._redact_string(value)
-            else:
-                result[key] = value
-
-        return result
-
-    def _redact_list(self, data: list[Any]) -> list[Any]:
-        """Recursively redact PII from list."""
-        result = []
-
-        for item in data:
-            if isinstance(item, dict):
-                result.append(self._redact_dict(item))
-            elif isinstance(item, list):
-                result.append(self._redact_list(item))
-            elif isinstance(item, str):
-                result.append(self._redact_string(item))
-            else:
-                result.append(item)
-
-        return result
-
-    def _redact_string(self, text: str) -> str:
-        """Apply all PII patterns to string."""
-        for pattern in self.patterns.values():
-            text = pattern.redact(text)
-        return text
+        return self.engine.redact(event_dict)
+
+    @property
+    def engine(self) -> RedactionEngine:
+        """Compiled redaction engine, rebuilt when patterns or fields change."""
+        engine = self._engine
+        if engine is None or engine.patterns != self.patterns or engine.fields_to_redact != self.fields_to_redact:
+            engine = self._engine = RedactionEngine(self.patterns, self.fields_to_redact, self.SAFE_FIELDS)
+        return engine
 
     def add_pattern(self, name: str, pattern: PIIPattern) -> None:
         """Add a custom PII pattern.
@@ -0,0 +1,214 @@
+"""Compiled PII redaction engine.
+
+Compiles a set of PII patterns and sensitive field names once so that
+redacting a log event costs one pass over its values:
+
+- All patterns are joined into one alternation regex with a named group
+  per pattern, so each string is scanned once instead of once per pattern
+- A character-class pre-check built from the pattern hints skips strings
+  that cannot match any pattern
+- Field names are case-folded and classified once per distinct key
+- Traversal is copy-on-write: containers are copied only when one of
+  their values changes, and unchanged events are returned as is
+- Redaction results of short strings are memoized in an LRU cache
+
+Overlapping matches are resolved leftmost first, ties going to the
+pattern registered first, and replaced text is not scanned again.
+
+**Feature: observability-infrastructure**
+**Requirement: R1 - Structured Logging Infrastructure (AC5: PII redaction)**
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from core.shared.logging.redaction import PIIPattern
+
+REDACTED = "***"
+
+# Field classification
+_KEEP = 0
+_REDACT = 1
+_SCAN = 2
+
+# Flags that can be scoped to a single alternative with (?flags:...)
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class RedactionEngine:
+    """Single-pass redaction of log event values.
+
+    Instances are immutable snapshots of the patterns and field names they
+    were built from; build a new engine when either changes.
+
+    Example:
+        >>> engine = RedactionEngine(PII_PATTERNS, {"password"}, set())
+        >>> engine.redact({"event": "Mail admin@example.com", "password": "x"})
+        {'event': 'Mail ad***@example.com', 'password': '***'}
+    """
+
+    def __init__(
+        self,
+        patterns: Mapping[str, PIIPattern],
+        fields_to_redact: Iterable[str],
+        safe_fields: Iterable[str],
+        cache_size: int = 4096,
+        max_cached_length: int = 512,
+        max_keys: int = 4096,
+    ) -> None:
+        """Compile redaction engine.
+
+        Args:
+            patterns: PII patterns by name, applied in order.
+            fields_to_redact: Field names whose values are fully redacted.
+            safe_fields: Field names never redacted.
+            cache_size: Redacted strings kept in the LRU cache.
+            max_cached_length: Longest string that is cached.
+            max_keys: Classified field names kept before the table is reset.
+        """
+        self.patterns = dict(patterns)
+        self.fields_to_redact = frozenset(fields_to_redact)
+        self._folded_fields = frozenset(name.casefold() for name in self.fields_to_redact)
+        self._safe_fields = frozenset(safe_fields)
+        self._actions: dict[Any, int] = {}
+        self._max_keys = max_keys
+        self._max_cached_length = max_cached_length
+
+        self._ordered = list(self.patterns.values())
+        self._combined = self._compile_combined(self._ordered)
+        self._screen = self._compile_screen(self._ordered)
+        self._cached_text = functools.lru_cache(maxsize=cache_size)(self._redact_text)
+
+    def redact(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Redact a log event, returning it unchanged if nothing matched."""
+        return self._redact_dict(data)
+
+    def redact_string(self, text: str) -> str:
+        """Redact PII in a string, returning it unchanged if nothing matched."""
+        if len(text) <= self._max_cached_length:
+            return self._cached_text(text)
+        return self._redact_text(text)
+
+    def _redact_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Redact dictionary values, copying it only on the first change."""
+        result: dict[str, Any] | None = None
+        actions = self._actions
+        for key, value in data.items():
+            action = actions.get(key)
+            if action is None:
+                action = self._classify(key)
+            if action == _KEEP:
+                continue
+            redacted = REDACTED if action == _REDACT else self._redact_value(value)
+            if redacted is not value:
+                if result is None:
+                    result = dict(data)
+                result[key] = redacted
+        return data if result is None else result
+
+    def _redact_list(self, data: list[Any]) -> list[Any]:
+        """Redact list items, copying it only on the first change."""
+        result: list[Any] | None = None
+        for i, item in enumerate(data):
+            redacted = self._redact_value(item)
+            if redacted is not item:
+                if result is None:
+                    result = list(data)
+                result[i] = redacted
+        return data if result is None else result
+
+    def _redact_value(self, value: Any) -> Any:
+        """Redact a value of any type."""
+        if isinstance(value, str):
+            return self.redact_string(value)
+        if isinstance(value, dict):
+            return self._redact_dict(value)
+        if isinstance(value, list):
+            return self._redact_list(value)
+        return value
+
+    def _redact_text(self, text: str) -> str:
+        """Scan a string for PII."""
+        if self._screen is not None and self._screen.search(text) is None:
+            return text
+        if self._combined is not None:
+            return self._combined.sub(self._replace, text)
+        for pattern in self._ordered:
+            text = pattern.redact(text)
+        return text
+
+    def _replace(self, match: re.Match[str]) -> str:
+        """Replacement for a match of the combined pattern."""
+        pattern = self._ordered[int(match.lastgroup[1:])]  # type: ignore[index]
+        # Rematch with the pattern alone so its own group numbers apply.
+        own = pattern.pattern.match(match.string, match.start())
+        if own is None:
+            return match.group(0)
+        if pattern.mask_func:
+            return pattern.mask_func(own)
+        if pattern.replacement:
+            return own.expand(pattern.replacement)
+        return match.group(0)
+
+    def _classify(self, key: Any) -> int:
+        """Classify a field name and remember the result."""
+        if key in self._safe_fields:
+            action = _KEEP
+        elif key.casefold() in self._folded_fields:
+            action = _REDACT
+        else:
+            action = _SCAN
+        if len(self._actions) >= self._max_keys:
+            self._actions.clear()
+        self._actions[key] = action
+        return action
+
+    @staticmethod
+    def _compile_combined(patterns: list[PIIPattern]) -> re.Pattern[str] | None:
+        """Join patterns into one alternation, or None if they cannot be joined.
+
+        Patterns with backreferences or named groups would be renumbered
+        or clash inside the alternation; they are applied one by one.
+        """
+        if not patterns:
+            return None
+        alternatives: list[str] = []
+        for i, pattern in enumerate(patterns):
+            compiled = pattern.pattern
+            flags = compiled.flags & ~re.UNICODE
+            if (
+                compiled.groupindex
+                or _BACKREFERENCE.search(compiled.pattern)
+                or flags & ~sum(_SCOPED_FLAGS)
+                or not isinstance(compiled.pattern, str)
+            ):
+                return None
+            scoped = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag)
+            source = f"(?{scoped}:{compiled.pattern})" if scoped else f"(?:{compiled.pattern})"
+            alternatives.append(f"(?P<p{i}>{source})")
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            return None
+
+    @staticmethod
+    def _compile_screen(patterns: list[PIIPattern]) -> re.Pattern[str] | None:
+        """Build the pre-check from pattern hints, or None if any pattern has none."""
+        chars: set[str] = set()
+        words: set[str] = set()
+        for pattern in patterns:
+            if not pattern.hints:
+                return None
+            for hint in pattern.hints:
+                (chars if len(hint) == 1 else words).add(hint)
+        alternatives = sorted(re.escape(word) for word in words)
+        if chars:
+            alternatives.insert(0, "[" + "".join(re.escape(c) for c in sorted(chars)) + "]")
+        return re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
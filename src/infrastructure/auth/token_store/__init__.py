@@ -9,6 +9,12 @@ from infrastructure.auth.token_store.protocols import (
     RefreshTokenStore,
     TokenStoreProtocol,
 )
+from infrastructure.auth.token_store.revocation_filter import (
+    BloomFilter,
+    RevocationBlacklist,
+    RevocationFilter,
+    RevocationFilterStats,
+)
 from infrastructure.auth.token_store.stores import (
     InMemoryTokenStore,
     RedisTokenStore,
@@ -16,9 +22,13 @@ from infrastructure.auth.token_store.stores import (
 )
 
 __all__ = [
+    "BloomFilter",
     "InMemoryTokenStore",
     "RedisTokenStore",
     "RefreshTokenStore",
+    "RevocationBlacklist",
+    "RevocationFilter",
+    "RevocationFilterStats",
     "StoredToken",
     "TokenStoreProtocol",
     "get_token_store_sync",
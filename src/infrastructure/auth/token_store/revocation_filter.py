@@ -0,0 +1,362 @@
+"""Bloom-filter fast path for token revocation checks.
+
+**Feature: infrastructure-generics-review-2025**
+**Validates: Requirements 8.2, 8.3, 8.5**
+
+Almost every revocation check answers "not revoked". ``RevocationFilter``
+keeps a local Bloom filter of revoked JTIs so those checks skip the
+authoritative store: a JTI absent from the filter is certainly not revoked,
+and only filter positives are confirmed with the store. The filter is
+kept current by the JTIs the store publishes on a Redis pub/sub channel
+with every blacklist write, and rebuilt from the store on a schedule to
+drop expired JTIs and pick up anything a worker missed. Whenever it may be
+stale (not yet built, or the channel listener is down) every check goes to
+the store, so the fail-closed behavior of
+``JWTValidator.validate_with_revocation`` is unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Protocol
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_REVOCATION_CHANNEL = "auth:revoked"
+
+
+class RevocationBlacklist(Protocol):
+    """Authoritative revocation store wrapped by ``RevocationFilter``.
+
+    Implemented by ``RedisTokenStore``. ``add_to_blacklist`` must publish
+    the JTI on the revocation channel, so every worker's filter learns of
+    the revocation whichever code path made it.
+    """
+
+    async def is_revoked(self, jti: str) -> bool: ...
+    async def add_to_blacklist(self, jti: str, ttl: int) -> None: ...
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of strings.
+
+    Sized for ``capacity`` items at ``false_positive_rate``, but never larger
+    than ``max_bytes``; a smaller budget raises the real false-positive rate,
+    reported by ``expected_false_positive_rate``.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = 0.001,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Initialize Bloom filter.
+
+        Args:
+            capacity: Number of items the filter is sized for.
+            false_positive_rate: Target false-positive rate at capacity.
+            max_bytes: Upper bound on the bit array size.
+
+        Raises:
+            ValueError: If capacity, rate or budget is out of range.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        if max_bytes is not None:
+            bits = min(bits, max_bytes * 8)
+        self._bit_count = max(bits, 8)
+        self._hash_count = max(1, round(self._bit_count / capacity * math.log(2)))
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self._capacity = capacity
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    @property
+    def hash_count(self) -> int:
+        """Number of bit positions per item."""
+        return self._hash_count
+
+    @property
+    def capacity(self) -> int:
+        """Number of items the filter is sized for."""
+        return self._capacity
+
+    @property
+    def expected_false_positive_rate(self) -> float:
+        """False-positive rate expected at the current item count."""
+        return (1 - math.exp(-self._hash_count * self._count / self._bit_count)) ** self._hash_count
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def _positions(self, item: str) -> list[int]:
+        """Bit positions of an item, by double hashing one digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._bit_count for i in range(self._hash_count)]
+
+
+@dataclass(slots=True)
+class RevocationFilterStats:
+    """Revocation filter counters.
+
+    Attributes:
+        hits: Checks where the JTI was in the filter and the store was asked.
+        misses: Checks answered "not revoked" by the filter alone.
+        false_positives: Filter hits the store reported as not revoked.
+        bypassed: Checks sent to the store because the filter was not ready.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    false_positives: int = 0
+    bypassed: int = 0
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Observed false positives per filter lookup."""
+        total = self.hits + self.misses
+        return self.false_positives / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Convert to dictionary for export."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "false_positives": self.false_positives,
+            "bypassed": self.bypassed,
+            "false_positive_rate": self.false_positive_rate,
+        }
+
+
+class RevocationFilter:
+    """Token revocation store with a local Bloom-filter fast path.
+
+    Wraps an authoritative ``RevocationBlacklist`` and implements the
+    ``TokenRevocationStore`` protocol, so it can be passed to
+    ``JWTValidator`` as its revocation store. Store errors propagate
+    unchanged.
+
+    Call ``start()`` to build the filter, subscribe to the revocation
+    channel and schedule rebuilds every ``rebuild_interval`` seconds. Until
+    it is built, and whenever the listener is not running, all checks go to
+    the store. Blacklist writes made through the store directly reach the
+    filter through the channel; ``revoke()`` and ``add_to_blacklist()`` also
+    add the JTI to this instance's filter at once. Without ``redis_client``
+    the filter only learns of revocations made through this instance and at
+    rebuild, so it is then only suitable for a single process.
+
+    Example:
+        >>> revocations = RevocationFilter(
+        ...     store,
+        ...     load_revoked=store.revoked_jtis,
+        ...     redis_client=redis,
+        ...     capacity=100_000,
+        ... )
+        >>> await revocations.start()
+        >>> validator = JWTValidator(public_key, revocation_store=revocations)
+    """
+
+    def __init__(
+        self,
+        store: RevocationBlacklist,
+        load_revoked: Callable[[], AsyncIterable[str]],
+        *,
+        capacity: int = 100_000,
+        false_positive_rate: float = 0.001,
+        max_bytes: int | None = None,
+        redis_client: Any = None,
+        channel: str = DEFAULT_REVOCATION_CHANNEL,
+        rebuild_interval: float | None = 300.0,
+    ) -> None:
+        """Initialize revocation filter.
+
+        Args:
+            store: Authoritative revocation store.
+            load_revoked: Returns every currently revoked JTI, for rebuilds.
+            capacity: Revoked JTIs the filter is sized for.
+            false_positive_rate: Target false-positive rate at capacity.
+            max_bytes: Memory budget for the filter.
+            redis_client: Redis client for the revocation channel.
+            channel: Redis pub/sub channel carrying revoked JTIs.
+            rebuild_interval: Seconds between scheduled rebuilds, None to
+                rebuild only on ``start()`` and explicit calls.
+
+        Raises:
+            ValueError: If rebuild_interval is not positive.
+        """
+        if rebuild_interval is not None and rebuild_interval <= 0:
+            raise ValueError("rebuild_interval must be > 0")
+        self._store = store
+        self._load_revoked = load_revoked
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._max_bytes = max_bytes
+        self._redis_client = redis_client
+        self._channel = channel
+        self._filter: BloomFilter | None = None
+        self._building: BloomFilter | None = None
+        self._stats = RevocationFilterStats()
+        self._pubsub: Any = None
+        self._listener: asyncio.Task[None] | None = None
+        self._rebuild_interval = rebuild_interval
+        self._rebuilder: asyncio.Task[None] | None = None
+
+    @property
+    def filter(self) -> BloomFilter | None:
+        """Current filter, or None before the first rebuild."""
+        return self._filter
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether the revocation listener task is running."""
+        return self._listener is not None and not self._listener.done()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether filter negatives can be trusted."""
+        return self._filter is not None and (self._redis_client is None or self.is_listening)
+
+    def get_stats(self) -> RevocationFilterStats:
+        """Get filter counters."""
+        return self._stats
+
+    async def start(self) -> None:
+        """Subscribe to the revocation channel, build the filter and schedule rebuilds."""
+        if self._redis_client is not None and not self.is_listening:
+            self._pubsub = self._redis_client.pubsub()
+            await self._pubsub.subscribe(self._channel)
+            self._listener = asyncio.create_task(self._listen(), name=f"revocation_filter:{self._channel}")
+        await self.rebuild()
+        if self._rebuild_interval is not None and (self._rebuilder is None or self._rebuilder.done()):
+            self._rebuilder = asyncio.create_task(
+                self._rebuild_periodically(self._rebuild_interval),
+                name=f"revocation_filter_rebuild:{self._channel}",
+            )
+
+    async def stop(self) -> None:
+        """Cancel scheduled rebuilds and unsubscribe from the revocation channel."""
+        for task in (self._rebuilder, self._listener):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._rebuilder = None
+        self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self._channel)
+                await self._pubsub.aclose()
+            except Exception:
+                logger.warning("Failed to close revocation subscription", exc_info=True)
+            self._pubsub = None
+
+    async def rebuild(self) -> None:
+        """Rebuild the filter from the store.
+
+        Revocations received while loading are added to the new filter too.
+        On failure the previous filter, if any, is kept.
+        """
+        building = BloomFilter(self._capacity, self._false_positive_rate, self._max_bytes)
+        self._building = building
+        try:
+            async for jti in self._load_revoked():
+                building.add(jti)
+        except Exception:
+            logger.warning("Revocation filter rebuild failed", exc_info=True)
+            return
+        finally:
+            self._building = None
+        self._filter = building
+        if len(building) > building.capacity:
+            logger.warning(
+                "Revocation filter over capacity",
+                revoked=len(building),
+                capacity=building.capacity,
+                expected_false_positive_rate=building.expected_false_positive_rate,
+            )
+
+    async def is_revoked(self, jti: str) -> bool:
+        """Check if a token is revoked, asking the store only when needed."""
+        bloom = self._filter
+        if bloom is None or not self.is_ready:
+            self._stats.bypassed += 1
+            return await self._store.is_revoked(jti)
+        if jti not in bloom:
+            self._stats.misses += 1
+            return False
+        self._stats.hits += 1
+        revoked = await self._store.is_revoked(jti)
+        if not revoked:
+            self._stats.false_positives += 1
+        return revoked
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Blacklist a token until it expires.
+
+        Implements ``TokenRevocationStore.revoke`` on top of
+        ``add_to_blacklist``.
+        """
+        ttl = math.ceil((expires_at - datetime.now(UTC)).total_seconds())
+        await self.add_to_blacklist(jti, max(ttl, 1))
+
+    async def add_to_blacklist(self, jti: str, ttl: int) -> None:
+        """Blacklist a JTI in the store, which broadcasts it to other workers.
+
+        Store and publish errors propagate; blacklisting again is safe.
+        """
+        self._add(jti)
+        await self._store.add_to_blacklist(jti, ttl)
+
+    def _add(self, jti: str) -> None:
+        """Add a revoked JTI to the current and in-progress filters."""
+        for bloom in (self._filter, self._building):
+            if bloom is not None:
+                bloom.add(jti)
+
+    async def _rebuild_periodically(self, interval: float) -> None:
+        """Rebuild the filter every ``interval`` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.rebuild()
+
+    async def _listen(self) -> None:
+        """Apply revocations published by other workers."""
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            data = message["data"]
+            self._add(data.decode() if isinstance(data, bytes) else data)
@@ -10,6 +10,7 @@ Provides:
 
 import json
 import threading
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
@@ -17,6 +18,7 @@ import structlog
 
 from infrastructure.auth.token_store.models import StoredToken
 from infrastructure.auth.token_store.protocols import RefreshTokenStore
+from infrastructure.auth.token_store.revocation_filter import DEFAULT_REVOCATION_CHANNEL
 
 logger = structlog.get_logger(__name__)
 
@@ -131,15 +133,34 @@ class RedisTokenStore(RefreshTokenStore):
     USER_TOKENS_PREFIX = "user_tokens:"
     REVOKED_PREFIX = "revoked:"
 
-    def __init__(self, redis_client: Any, default_ttl: int = 604800) -> None:
+    def __init__(
+        self,
+        redis_client: Any,
+        default_ttl: int = 604800,
+        revocation_channel: str | None = DEFAULT_REVOCATION_CHANNEL,
+    ) -> None:
         self._redis = redis_client
         self._default_ttl = default_ttl
+        self._revocation_channel = revocation_channel
 
     async def is_revoked(self, jti: str) -> bool:
         return await self._redis.exists(f"{self.REVOKED_PREFIX}{jti}") > 0
 
     async def add_to_blacklist(self, jti: str, ttl: int) -> None:
+        """Blacklist a JTI and publish it to every ``RevocationFilter``.
+
+        Raises if the publish fails, as the filters would not see the
+        revocation; blacklisting again is safe.
+        """
         await self._redis.setex(f"{self.REVOKED_PREFIX}{jti}", ttl, "1")
+        if self._revocation_channel is not None:
+            await self._redis.publish(self._revocation_channel, jti)
+
+    async def revoked_jtis(self) -> AsyncIterator[str]:
+        """Yield every blacklisted JTI, e.g. to rebuild a ``RevocationFilter``."""
+        prefix_length = len(self.REVOKED_PREFIX)
+        async for key in self._redis.scan_iter(match=f"{self.REVOKED_PREFIX}*", count=1000):
+            yield (key.decode() if isinstance(key, bytes) else key)[prefix_length:]
 
     def _token_key(self, jti: str) -> str:
         return f"{self.KEY_PREFIX}{jti}"
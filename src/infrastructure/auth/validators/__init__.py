@@ -5,10 +5,15 @@ Contains JWT validation and provider logic.
 **Feature: infrastructure-restructuring-2025**
 """
 
-from infrastructure.auth.validators.jwt_providers import get_jwt_provider
+from infrastructure.auth.validators.jwt_keys import KeyResolver
+from infrastructure.auth.validators.jwt_providers import create_jwt_provider
 from infrastructure.auth.validators.jwt_validator import JWTValidator
+from infrastructure.auth.validators.token_cache import RevocationCache, VerifiedTokenCache
 
 __all__ = [
     "JWTValidator",
-    "get_jwt_provider",
+    "KeyResolver",
+    "RevocationCache",
+    "VerifiedTokenCache",
+    "create_jwt_provider",
 ]
@@ -0,0 +1,85 @@
+"""Pre-parsed JWT verification keys.
+
+**Feature: api-best-practices-review-2025**
+**Validates: Requirements 20.4**
+
+Asymmetric PEM keys are parsed into key objects once, instead of on every
+``jwt.decode`` call. With a ``JWKSService``, keys are resolved and parsed
+once per ``kid``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from jose import jwk
+from jose.exceptions import JWKError
+
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+    from infrastructure.auth.jwt.jwks import JWKSService
+
+ASYMMETRIC_ALGORITHMS = frozenset(["RS256", "ES256"])
+
+
+class KeyResolver:
+    """Resolve the verification key for a token.
+
+    Without a JWKS service every token is verified with the configured key.
+    With one, tokens must name the ``kid`` of an active key of the expected
+    algorithm; revoked or expired keys are rejected even when their parsed
+    form is cached.
+    """
+
+    def __init__(
+        self,
+        key_data: str,
+        algorithm: str,
+        jwks_service: JWKSService | None = None,
+    ) -> None:
+        """Initialize key resolver.
+
+        Args:
+            key_data: Secret or PEM key used when there is no JWKS service.
+            algorithm: Expected token algorithm.
+            jwks_service: Optional source of keys by ``kid``.
+        """
+        self._algorithm = algorithm
+        self._jwks_service = jwks_service
+        self._default_key = self._load(key_data)
+        self._keys_by_kid: dict[str, Key | str] = {}
+
+    def _load(self, key_data: str) -> Key | str:
+        """Parse asymmetric key material; other keys are used as given."""
+        if self._algorithm not in ASYMMETRIC_ALGORITHMS:
+            return key_data
+        try:
+            return jwk.construct(key_data, self._algorithm)
+        except JWKError:
+            return key_data
+
+    def is_active(self, kid: str | None) -> bool:
+        """Check that a key a token was verified with may still be used."""
+        if self._jwks_service is None:
+            return True
+        return kid is not None and self._jwks_service.validate_kid(kid)
+
+    def resolve(self, kid: str | None) -> Key | str | None:
+        """Get the verification key for a token's ``kid``.
+
+        Returns:
+            Key to verify with, or None if the ``kid`` is unknown, revoked,
+            expired or for another algorithm.
+        """
+        if self._jwks_service is None:
+            return self._default_key
+        if kid is None or not self.is_active(kid):
+            return None
+        key = self._keys_by_kid.get(kid)
+        if key is None:
+            entry = self._jwks_service.get_key(kid)
+            if entry is None or entry.algorithm != self._algorithm:
+                return None
+            key = self._keys_by_kid[kid] = self._load(entry.public_key_pem)
+        return key
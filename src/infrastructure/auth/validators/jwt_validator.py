@@ -10,17 +10,25 @@ Security features:
 - Tamper detection
 - Asymmetric key support (RS256, ES256)
 - Production mode warning for HS256
+- Verified-token and revocation caches, pre-parsed keys per ``kid``
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 import structlog
 from jose import JWTError, jwt
 
-from core.exceptions import AuthenticationError
+from core.errors import AuthenticationError
+from infrastructure.auth.validators.jwt_keys import KeyResolver
+from infrastructure.auth.validators.token_cache import RevocationCache, VerifiedTokenCache
+
+if TYPE_CHECKING:
+    from infrastructure.auth.jwt.jwks import JWKSService
 
 logger = structlog.get_logger(__name__)
 
@@ -118,6 +126,10 @@ class JWTValidator:
         revocation_store: TokenRevocationStore | None = None,
         require_secure_algorithm: bool = True,
         production_mode: bool = False,
+        jwks_service: JWKSService | None = None,
+        cache_size: int = 1024,
+        cache_ttl_seconds: float = 300.0,
+        revocation_cache_ttl_seconds: float = 5.0,
     ) -> None:
         """Initialize JWT validator.
 
@@ -134,6 +146,11 @@ class JWTValidator:
             revocation_store: Optional token revocation store.
             require_secure_algorithm: If True, reject HS256. Defaults to True.
             production_mode: If True and using HS256, logs security warning.
+            jwks_service: If set, tokens must carry a ``kid`` of an active key
+                in this service, which is used instead of ``secret_or_key``.
+            cache_size: Maximum verified tokens cached; 0 disables the cache.
+            cache_ttl_seconds: Maximum time a verified token is cached.
+            revocation_cache_ttl_seconds: Reuse of "not revoked" results; 0 disables.
         """
         self._secret_or_key = secret_or_key
         self._algorithm = algorithm
@@ -148,6 +165,22 @@ class JWTValidator:
         self._validate_algorithm(algorithm)
         self._warn_insecure_algorithm()
 
+        self._decode_options = {
+            "verify_exp": True,
+            "verify_iat": True,
+            "verify_nbf": True,
+            "require_exp": True,
+            "require_iat": True,
+            "require_sub": True,
+            "require_jti": True,
+            "leeway": clock_skew_seconds,
+        }
+        self._keys = KeyResolver(secret_or_key, algorithm, jwks_service)
+        # Public so their ``metrics`` (hits, misses, evictions) can be exported
+        self.token_cache = VerifiedTokenCache(cache_size, cache_ttl_seconds) if cache_size > 0 else None
+        revocation_ttl = revocation_cache_ttl_seconds
+        self.revocation_cache = RevocationCache(revocation_ttl) if revocation_ttl > 0 else None
+
     def _detect_key_type(self, algorithm: str) -> KeyType:
         """Detect key type based on algorithm.
 
@@ -224,6 +257,12 @@ class JWTValidator:
         Raises:
             InvalidTokenError: If validation fails.
         """
+        if self.token_cache is not None and (cached := self.token_cache.get(token)) is not None:
+            validated, kid = cached
+            if self._keys.is_active(kid):
+                return self._check_token_type(validated, expected_type)
+            self.token_cache.discard(token)
+
         # Check algorithm before full decode
         header = self._get_unverified_header(token)
         token_alg = header.get("alg", "")
@@ -242,28 +281,20 @@ class JWTValidator:
                 f"Algorithm mismatch: expected {self._algorithm}, got {token_alg}",
             )
 
+        kid = header.get("kid")
+        key = self._keys.resolve(kid)
+        if key is None:
+            raise InvalidTokenError("Unknown or revoked signing key")
+
         # Full validation
         try:
-            options = {
-                "verify_exp": True,
-                "verify_iat": True,
-                "verify_nbf": True,
-                "require": ["exp", "iat", "sub", "jti"],
-            }
-
-            if self._issuer:
-                options["verify_iss"] = True
-            if self._audience:
-                options["verify_aud"] = True
-
             claims = jwt.decode(
                 token,
-                self._secret_or_key,
+                key,
                 algorithms=[self._algorithm],
                 issuer=self._issuer,
                 audience=self._audience,
-                options=options,
-                leeway=self._clock_skew,
+                options=self._decode_options,
             )
         except JWTError as e:
             error_msg = str(e).lower()
@@ -274,20 +305,25 @@ class JWTValidator:
                 raise InvalidTokenError("Token signature is invalid") from e
             raise InvalidTokenError("Token validation failed") from e
 
-        # Validate token type
-        token_type = claims.get("token_type", "access")
-        if expected_type and token_type != expected_type:
-            raise InvalidTokenError(f"Expected {expected_type} token, got {token_type}")
-
-        return ValidatedToken(
+        validated = ValidatedToken(
             sub=claims["sub"],
             jti=claims["jti"],
             exp=datetime.fromtimestamp(claims["exp"], tz=UTC),
             iat=datetime.fromtimestamp(claims["iat"], tz=UTC),
             scopes=tuple(claims.get("scopes", [])),
-            token_type=token_type,
+            token_type=claims.get("token_type", "access"),
             raw_claims=claims,
         )
+        if self.token_cache is not None:
+            self.token_cache.put(token, validated, kid)
+        return self._check_token_type(validated, expected_type)
+
+    @staticmethod
+    def _check_token_type(validated: ValidatedToken, expected_type: str | None) -> ValidatedToken:
+        """Validate token type."""
+        if expected_type and validated.token_type != expected_type:
+            raise InvalidTokenError(f"Expected {expected_type} token, got {validated.token_type}")
+        return validated
 
     async def validate_with_revocation(
         self,
@@ -313,7 +349,11 @@ class JWTValidator:
 
         if self._revocation_store:
             try:
-                if await self._revocation_store.is_revoked(validated.jti):
+                if self.revocation_cache is not None:
+                    revoked = await self.revocation_cache.is_revoked(self._revocation_store, validated)
+                else:
+                    revoked = await self._revocation_store.is_revoked(validated.jti)
+                if revoked:
                     logger.warning(
                         "Rejected revoked token",
                         jti=validated.jti,
@@ -347,6 +387,8 @@ class JWTValidator:
 
         validated = self.validate(token)
         await self._revocation_store.revoke(validated.jti, validated.exp)
+        if self.revocation_cache is not None:
+            self.revocation_cache.put(validated.jti, True, validated.exp.timestamp())
 
         logger.info(
             "Token revoked",
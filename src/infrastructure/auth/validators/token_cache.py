@@ -0,0 +1,206 @@
+"""Caches for JWT validation results.
+
+**Feature: api-best-practices-review-2025**
+**Validates: Requirements 20.4**
+
+- VerifiedTokenCache: bounded LRU of verified tokens keyed by SHA-256
+  digest, each entry living no longer than the token's ``exp``
+- RevocationCache: short-lived revocation lookups keyed by ``jti``
+
+Hit, miss and eviction counts are kept in ``CacheMetrics`` for export
+with ``CacheMetricsExporter``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from infrastructure.observability.metrics import CacheMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from infrastructure.auth.validators.jwt_validator import TokenRevocationStore, ValidatedToken
+
+
+def token_digest(token: str) -> bytes:
+    """Get the cache key of a raw token."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of verified tokens.
+
+    Only tokens whose signature and claims were fully verified are stored.
+    An entry expires at the token's ``exp`` or after ``max_ttl_seconds``,
+    whichever comes first.
+
+    Example:
+        >>> cache = VerifiedTokenCache(max_size=1024)
+        >>> cache.put(token, validated, kid="key-1")
+        >>> cache.get(token)
+        (ValidatedToken(...), 'key-1')
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        max_ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize verified token cache.
+
+        Args:
+            max_size: Maximum number of cached tokens.
+            max_ttl_seconds: Maximum lifetime of an entry.
+            clock: Source of the current Unix time.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._max_ttl = max_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[ValidatedToken, str | None, float]] = OrderedDict()
+        self.metrics = CacheMetrics()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> tuple[ValidatedToken, str | None] | None:
+        """Get a verified token and the ``kid`` it was verified with.
+
+        Args:
+            token: Raw JWT.
+
+        Returns:
+            Validated token and key ID, or None if not cached or expired.
+        """
+        key = token_digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.metrics.record_miss()
+            return None
+        validated, kid, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.metrics.record_miss()
+            return None
+        self._entries.move_to_end(key)
+        self.metrics.record_hit()
+        return validated, kid
+
+    def put(self, token: str, validated: ValidatedToken, kid: str | None = None) -> None:
+        """Cache a verified token until its expiry.
+
+        Args:
+            token: Raw JWT.
+            validated: Result of full verification.
+            kid: Key ID the signature was verified with.
+        """
+        now = self._clock()
+        expires_at = min(validated.exp.timestamp(), now + self._max_ttl)
+        if expires_at <= now:
+            return
+        key = token_digest(token)
+        self._entries[key] = (validated, kid, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.metrics.record_eviction()
+
+    def discard(self, token: str) -> None:
+        """Remove a token from the cache."""
+        self._entries.pop(token_digest(token), None)
+
+    def clear(self) -> None:
+        """Remove all tokens."""
+        self._entries.clear()
+
+
+class RevocationCache:
+    """Short-lived cache of revocation lookups.
+
+    A token found revoked stays revoked until it expires; a token found
+    valid is re-checked after ``ttl_seconds``, which bounds how long a
+    revocation made elsewhere can go unnoticed.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 5.0,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize revocation cache.
+
+        Args:
+            ttl_seconds: Lifetime of a "not revoked" result.
+            max_size: Maximum number of cached lookups.
+            clock: Source of the current Unix time.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self.metrics = CacheMetrics()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, jti: str) -> bool | None:
+        """Get the cached revocation status of a token.
+
+        Returns:
+            True if revoked, False if not, None if unknown.
+        """
+        entry = self._entries.get(jti)
+        if entry is None or entry[1] <= self._clock():
+            if entry is not None:
+                del self._entries[jti]
+            self.metrics.record_miss()
+            return None
+        self.metrics.record_hit()
+        return entry[0]
+
+    async def is_revoked(self, store: TokenRevocationStore, validated: ValidatedToken) -> bool:
+        """Check revocation status, asking the store only on a cache miss.
+
+        Args:
+            store: Revocation store.
+            validated: Verified token.
+
+        Returns:
+            True if the token is revoked.
+        """
+        revoked = self.get(validated.jti)
+        if revoked is None:
+            revoked = await store.is_revoked(validated.jti)
+            self.put(validated.jti, revoked, validated.exp.timestamp())
+        return revoked
+
+    def put(self, jti: str, revoked: bool, token_expires_at: float) -> None:
+        """Cache the revocation status of a token.
+
+        Args:
+            jti: Token ID.
+            revoked: Whether the token is revoked.
+            token_expires_at: Unix time the token expires.
+        """
+        now = self._clock()
+        expires_at = token_expires_at if revoked else min(token_expires_at, now + self._ttl)
+        if expires_at <= now:
+            return
+        self._entries[jti] = (revoked, expires_at)
+        self._entries.move_to_end(jti)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.metrics.record_eviction()
+
+    def clear(self) -> None:
+        """Remove all lookups."""
+        self._entries.clear()
@@ -22,11 +22,14 @@ from infrastructure.cache.decorators import (
 from infrastructure.cache.providers.local import LRUCache
 from infrastructure.cache.providers.memory import InMemoryCacheProvider
 from infrastructure.cache.providers.redis import RedisCacheProvider
+from infrastructure.cache.providers.sharded import ShardedMemoryCacheProvider
+from infrastructure.cache.providers.two_tier import TwoTierCacheProvider
 from infrastructure.cache.repository import (
     RepositoryCacheConfig,
     cached_repository,
     invalidate_repository_cache,
 )
+from infrastructure.cache.single_flight import SingleFlight, SingleFlightStats
 
 __all__ = [
     "CacheEntry",
@@ -38,6 +41,10 @@ __all__ = [
     "LRUCache",
     "RedisCacheProvider",
     "RepositoryCacheConfig",
+    "ShardedMemoryCacheProvider",
+    "SingleFlight",
+    "SingleFlightStats",
+    "TwoTierCacheProvider",
     # Decorators
     "cached",
     "cached_repository",
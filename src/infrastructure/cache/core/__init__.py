@@ -9,7 +9,20 @@ Contains cache configuration, models, protocols, policies, and serializers.
 from infrastructure.cache.core.config import CacheConfig
 from infrastructure.cache.core.models import CacheEntry, CacheKey, CacheStats
 from infrastructure.cache.core.protocols import CacheProvider
-from infrastructure.cache.core.serializers import JsonSerializer, Serializer
+from infrastructure.cache.core.serializers import (
+    CompressedSerializer,
+    JsonSerializer,
+    MsgpackSerializer,
+    OrjsonSerializer,
+    PickleSerializer,
+    Serializer,
+    available_serializers,
+    get_serializer,
+    register_model,
+    register_serializer,
+    registered_models,
+    serializer_from_config,
+)
 
 __all__ = [
     "CacheConfig",
@@ -17,6 +30,16 @@ __all__ = [
     "CacheKey",
     "CacheProvider",
     "CacheStats",
+    "CompressedSerializer",
     "JsonSerializer",
+    "MsgpackSerializer",
+    "OrjsonSerializer",
+    "PickleSerializer",
     "Serializer",
+    "available_serializers",
+    "get_serializer",
+    "register_model",
+    "register_serializer",
+    "registered_models",
+    "serializer_from_config",
 ]
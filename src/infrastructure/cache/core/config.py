@@ -17,7 +17,9 @@ class CacheConfig:
         max_size: Maximum number of entries.
         prefix: Key prefix for namespacing.
         key_prefix: Alias for prefix.
-        serializer: Serializer type to use.
+        serializer: Serializer name (json, orjson, msgpack, pickle).
+        compression: Compression applied above the threshold (zlib, lz4 or None).
+        compression_threshold: Minimum payload size in bytes to compress.
     """
 
     default_ttl: int = 3600
@@ -25,6 +27,8 @@ class CacheConfig:
     prefix: str = ""
     key_prefix: str = ""
     serializer: str = "json"
+    compression: str | None = None
+    compression_threshold: int = 1024
 
     # Redis-specific settings
     redis_url: str | None = None
@@ -2,10 +2,44 @@
 
 **Feature: python-api-base-2025-state-of-art**
 **Refactored: 2025 - Extracted from providers.py for SRP compliance**
+
+Serializers are selected by name through ``CacheConfig.serializer``:
+
+- ``json``: stdlib JSON (default, no extra dependencies)
+- ``orjson``: orjson, requires the ``orjson`` package
+- ``msgpack``: MessagePack, requires the ``msgpack`` package
+- ``pickle``: pickle protocol 5; only for caches no untrusted party can write to
+
+The JSON and MessagePack serializers tag Pydantic models registered with
+``register_model`` so they decode back into the same model class instead of
+a plain dict. Tags are resolved only against that registry; unregistered
+models are stored as plain data.
+Any serializer can be wrapped in ``CompressedSerializer`` to compress
+payloads above a size threshold with zlib or lz4.
 """
 
+from __future__ import annotations
+
 import json
-from typing import Protocol, runtime_checkable
+import pickle
+import zlib
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from infrastructure.cache.core.config import CacheConfig
+
+_MODEL_TAG = "__pydantic_model__"
+_MODEL_DATA = "data"
+# The tag key as it appears in JSON text
+_MODEL_TAG_JSON = json.dumps(_MODEL_TAG).encode()
+
+# One-byte frame header written by CompressedSerializer
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+_LZ4 = b"\x02"
 
 
 @runtime_checkable
@@ -21,13 +55,325 @@ class Serializer[T](Protocol):
         ...
 
 
+# =============================================================================
+# Pydantic model tagging
+# =============================================================================
+
+
+_MODELS: dict[str, type[BaseModel]] = {}
+
+
+def _model_name(cls: type[BaseModel]) -> str:
+    """Get the ``module:QualName`` tag of a model class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def register_model[M: BaseModel](model: type[M]) -> type[M]:
+    """Allow a Pydantic model to be rebuilt from cached payloads.
+
+    Usable as a class decorator. Only registered models are tagged on
+    encode and rebuilt on decode; the tag is looked up in this registry and
+    never imported, so a payload cannot make the process load a module.
+
+    Args:
+        model: Pydantic model class.
+
+    Returns:
+        The model class, unchanged.
+    """
+    _MODELS[_model_name(model)] = model
+    return model
+
+
+def registered_models() -> list[type[BaseModel]]:
+    """Get all models registered for cache decoding."""
+    return list(_MODELS.values())
+
+
+def _encode_model(obj: BaseModel) -> Any:
+    """Encode a registered Pydantic model as a tagged mapping, others as data."""
+    data = obj.model_dump(mode="json")
+    name = _model_name(type(obj))
+    if _MODELS.get(name) is not type(obj):
+        return data
+    return {_MODEL_TAG: name, _MODEL_DATA: data}
+
+
+def _model_hook(obj: dict[str, Any]) -> Any:
+    """Rebuild a tagged mapping into its registered Pydantic model.
+
+    Raises:
+        ValueError: If the tag names a model that is not registered.
+    """
+    name = obj.get(_MODEL_TAG)
+    if name is None or len(obj) != 2:
+        return obj
+    model = _MODELS.get(name)
+    if model is None:
+        raise ValueError(f"{name} is not a registered cache model")
+    return model.model_validate(obj[_MODEL_DATA])
+
+
+def _decode_models(value: Any) -> Any:
+    """Rebuild tagged models nested anywhere inside a decoded value."""
+    if isinstance(value, dict):
+        if _MODEL_TAG in value:
+            return _model_hook(value)
+        return {k: _decode_models(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_models(item) for item in value]
+    return value
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder: tag Pydantic models, stringify anything else."""
+    if isinstance(obj, BaseModel):
+        return _encode_model(obj)
+    return str(obj)
+
+
+# =============================================================================
+# Serializers
+# =============================================================================
+
+
 class JsonSerializer[T]:
     """JSON serializer implementation."""
 
+    def __init__(self, models: Iterable[type[BaseModel]] = ()) -> None:
+        """Initialize JSON serializer.
+
+        Args:
+            models: Pydantic models to register for decoding.
+        """
+        for model in models:
+            register_model(model)
+
     def serialize(self, value: T) -> bytes:
         """Serialize value to JSON bytes."""
-        return json.dumps(value, default=str).encode("utf-8")
+        return json.dumps(value, default=_default).encode("utf-8")
 
     def deserialize(self, data: bytes) -> T:
         """Deserialize JSON bytes to value."""
-        return json.loads(data.decode("utf-8"))
+        return json.loads(data.decode("utf-8"), object_hook=_model_hook)
+
+
+class OrjsonSerializer[T]:
+    """orjson serializer.
+
+    Encodes datetimes, UUIDs and dataclasses natively and is several times
+    faster than the stdlib encoder on large payloads.
+    """
+
+    def __init__(self, models: Iterable[type[BaseModel]] = ()) -> None:
+        """Initialize orjson serializer.
+
+        Args:
+            models: Pydantic models to register for decoding.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        import orjson
+
+        for model in models:
+            register_model(model)
+
+        self._orjson = orjson
+
+    def serialize(self, value: T) -> bytes:
+        """Serialize value to JSON bytes."""
+        return self._orjson.dumps(value, default=_default, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def deserialize(self, data: bytes) -> T:
+        """Deserialize JSON bytes to value.
+
+        The decoded value is only walked for tagged models when the payload
+        contains the tag key, so plain payloads stay on orjson's fast path.
+        """
+        value = self._orjson.loads(data)
+        return _decode_models(value) if _MODEL_TAG_JSON in data else value
+
+
+class MsgpackSerializer[T]:
+    """MessagePack serializer producing compact binary payloads."""
+
+    def __init__(self, models: Iterable[type[BaseModel]] = ()) -> None:
+        """Initialize MessagePack serializer.
+
+        Args:
+            models: Pydantic models to register for decoding.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        import msgpack
+
+        for model in models:
+            register_model(model)
+
+        self._msgpack = msgpack
+
+    def serialize(self, value: T) -> bytes:
+        """Serialize value to MessagePack bytes."""
+        return self._msgpack.packb(value, default=_default, use_bin_type=True)
+
+    def deserialize(self, data: bytes) -> T:
+        """Deserialize MessagePack bytes to value."""
+        return self._msgpack.unpackb(data, object_hook=_model_hook, raw=False, strict_map_key=False)
+
+
+class PickleSerializer[T]:
+    """Pickle protocol 5 serializer.
+
+    Preserves arbitrary Python types exactly. Unpickling executes code chosen
+    by whoever wrote the payload, so use it only for trusted caches.
+    """
+
+    def serialize(self, value: T) -> bytes:
+        """Serialize value with pickle protocol 5."""
+        return pickle.dumps(value, protocol=5)
+
+    def deserialize(self, data: bytes) -> T:
+        """Deserialize pickled bytes to value."""
+        return pickle.loads(data)  # noqa: S301
+
+
+class CompressedSerializer[T]:
+    """Compresses another serializer's output above a size threshold.
+
+    Every payload starts with a one-byte header naming the codec, so the
+    threshold and algorithm can change without invalidating stored values.
+    """
+
+    def __init__(
+        self,
+        inner: Serializer[T],
+        algorithm: str = "zlib",
+        threshold: int = 1024,
+        level: int | None = None,
+    ) -> None:
+        """Initialize compressing serializer.
+
+        Args:
+            inner: Serializer producing the uncompressed bytes.
+            algorithm: ``zlib`` or ``lz4`` (requires the ``lz4`` package).
+            threshold: Minimum payload size in bytes to compress.
+            level: Compression level; codec default if not provided.
+
+        Raises:
+            ValueError: If the algorithm is unknown or threshold is negative.
+            ImportError: If lz4 is selected but not installed.
+        """
+        if threshold < 0:
+            raise ValueError("threshold must be >= 0")
+        if algorithm == "zlib":
+            self._header = _ZLIB
+            zlib_level = -1 if level is None else level
+            self._compress: Callable[[bytes], bytes] = lambda data: zlib.compress(data, zlib_level)
+        elif algorithm == "lz4":
+            import lz4.frame
+
+            self._header = _LZ4
+            lz4_level = 0 if level is None else level
+            self._compress = lambda data: lz4.frame.compress(data, compression_level=lz4_level)
+        else:
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+        self._inner = inner
+        self._algorithm = algorithm
+        self._threshold = threshold
+
+    @property
+    def algorithm(self) -> str:
+        """Get the compression algorithm name."""
+        return self._algorithm
+
+    @property
+    def threshold(self) -> int:
+        """Get the minimum payload size that is compressed."""
+        return self._threshold
+
+    def serialize(self, value: T) -> bytes:
+        """Serialize value, compressing it if it exceeds the threshold."""
+        data = self._inner.serialize(value)
+        if len(data) < self._threshold:
+            return _RAW + data
+        return self._header + self._compress(data)
+
+    def deserialize(self, data: bytes) -> T:
+        """Decompress if needed and deserialize value."""
+        header, payload = data[:1], data[1:]
+        if header == _ZLIB:
+            payload = zlib.decompress(payload)
+        elif header == _LZ4:
+            import lz4.frame
+
+            payload = lz4.frame.decompress(payload)
+        elif header != _RAW:
+            raise ValueError("Unknown compression header")
+        return self._inner.deserialize(payload)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+_SERIALIZERS: dict[str, Callable[[], Serializer[Any]]] = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+    "pickle": PickleSerializer,
+}
+
+
+def register_serializer(name: str, factory: Callable[[], Serializer[Any]]) -> None:
+    """Register a serializer factory under a name usable in ``CacheConfig``.
+
+    Args:
+        name: Serializer name.
+        factory: Zero-argument callable returning a serializer.
+    """
+    _SERIALIZERS[name] = factory
+
+
+def available_serializers() -> list[str]:
+    """Get the names of all registered serializers."""
+    return sorted(_SERIALIZERS)
+
+
+def get_serializer(
+    name: str = "json",
+    *,
+    compression: str | None = None,
+    compression_threshold: int = 1024,
+) -> Serializer[Any]:
+    """Create a registered serializer, optionally wrapped with compression.
+
+    Args:
+        name: Registered serializer name.
+        compression: ``zlib``, ``lz4`` or None for no compression.
+        compression_threshold: Minimum payload size in bytes to compress.
+
+    Returns:
+        Serializer instance.
+
+    Raises:
+        ValueError: If the serializer or compression name is unknown.
+        ImportError: If the selected backend is not installed.
+    """
+    factory = _SERIALIZERS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown serializer: {name}. Available: {', '.join(available_serializers())}")
+    serializer = factory()
+    if compression is None:
+        return serializer
+    return CompressedSerializer(serializer, compression, compression_threshold)
+
+
+def serializer_from_config(config: CacheConfig) -> Serializer[Any]:
+    """Create the serializer selected by a cache configuration."""
+    return get_serializer(
+        config.serializer,
+        compression=config.compression,
+        compression_threshold=config.compression_threshold,
+    )
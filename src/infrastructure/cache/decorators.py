@@ -18,6 +18,8 @@ import structlog
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from infrastructure.cache.single_flight import SingleFlight
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -28,6 +30,7 @@ def cached(
     key_prefix: str,
     ttl: int = 3600,
     key_builder: Callable[..., str] | None = None,
+    single_flight: SingleFlight[Any] | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Cache decorator for use case methods.
 
@@ -38,13 +41,15 @@ def cached(
         key_prefix: Prefix for cache keys
         ttl: Time to live in seconds (default: 1 hour)
         key_builder: Optional function to build cache key from args
+        single_flight: Optional group that coalesces concurrent misses for
+            the same key into one lookup and function call
 
     Returns:
         Decorated function with caching
 
     Example:
         >>> class ItemUseCase:
-        ...     @cached("item", ttl=300)
+        ...     @cached("item", ttl=300, single_flight=SingleFlight())
         ...     async def get(self, item_id: str) -> Item:
         ...         return await self.repo.get(item_id)
     """
@@ -71,27 +76,32 @@ def cached(
                 key_hash = hashlib.sha256(key_data.encode()).hexdigest()[:16]
                 cache_key = f"{key_prefix}:{key_hash}"
 
-            # Try to get from cache
-            try:
-                cached_value = await redis.get(cache_key)
-                if cached_value is not None:
-                    logger.debug("Cache hit", key=cache_key)
-                    return cached_value
-            except Exception:
-                logger.exception("Cache get failed", key=cache_key)
-
-            # Cache miss - execute function
-            logger.debug("Cache miss", key=cache_key)
-            result = await func(self, *args, **kwargs)
+            async def load() -> T:
+                # Try to get from cache
+                try:
+                    cached_value = await redis.get(cache_key)
+                    if cached_value is not None:
+                        logger.debug("Cache hit", key=cache_key)
+                        return cached_value
+                except Exception:
+                    logger.exception("Cache get failed", key=cache_key)
+
+                # Cache miss - execute function
+                logger.debug("Cache miss", key=cache_key)
+                result = await func(self, *args, **kwargs)
+
+                # Store in cache
+                try:
+                    await redis.set(cache_key, result, ttl)
+                    logger.debug("Cache set", key=cache_key, ttl=ttl)
+                except Exception:
+                    logger.exception("Cache set failed", key=cache_key)
 
-            # Store in cache
-            try:
-                await redis.set(cache_key, result, ttl)
-                logger.debug("Cache set", key=cache_key, ttl=ttl)
-            except Exception:
-                logger.exception("Cache set failed", key=cache_key)
+                return result
 
-            return result
+            if single_flight is None:
+                return await load()
+            return await single_flight.do(cache_key, load)
 
         return wrapper
 
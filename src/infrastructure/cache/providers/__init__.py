@@ -8,18 +8,25 @@ Provides cache backends:
 - LRUCache: Generic LRU cache
 - RedisCache: Simple Redis cache
 - RedisCacheWithJitter: Redis cache with TTL jitter and stampede prevention
+- RedisQueryCache: Redis query cache with prefix/tag index sets
+- ShardedMemoryCacheProvider: Lock-free sharded in-memory cache with TTL reaper
+- TwoTierCacheProvider: In-process L1 in front of Redis L2 with pub/sub invalidation
 """
 
 from infrastructure.cache.providers.cache_models import (
     CacheStats,
     JitterConfig,
     TTLPattern,
+    TwoTierCacheStats,
 )
 from infrastructure.cache.providers.local import LRUCache
 from infrastructure.cache.providers.memory import InMemoryCacheProvider
 from infrastructure.cache.providers.redis import RedisCacheProvider
 from infrastructure.cache.providers.redis_cache import RedisCache, RedisConfig
 from infrastructure.cache.providers.redis_jitter import RedisCacheWithJitter
+from infrastructure.cache.providers.redis_query_cache import RedisQueryCache
+from infrastructure.cache.providers.sharded import ShardedMemoryCacheProvider
+from infrastructure.cache.providers.two_tier import TwoTierCacheProvider
 
 __all__ = [
     "CacheStats",
@@ -31,5 +38,9 @@ __all__ = [
     # Jitter-enabled cache
     "RedisCacheWithJitter",
     "RedisConfig",
+    "RedisQueryCache",
+    "ShardedMemoryCacheProvider",
     "TTLPattern",
+    "TwoTierCacheProvider",
+    "TwoTierCacheStats",
 ]
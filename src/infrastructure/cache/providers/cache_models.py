@@ -64,6 +64,7 @@ class CacheStats:
         stampede_prevented: Number of cache stampedes prevented.
         early_recomputes: Number of early recomputation triggers.
         jittered_sets: Number of sets with jitter applied.
+        coalesced_waiters: Misses that awaited another in-process computation.
     """
 
     hits: int = 0
@@ -71,6 +72,7 @@ class CacheStats:
     stampede_prevented: int = 0
     early_recomputes: int = 0
     jittered_sets: int = 0
+    coalesced_waiters: int = 0
 
     @property
     def hit_ratio(self) -> float:
@@ -86,3 +88,50 @@ class CacheStats:
     def total_requests(self) -> int:
         """Get total number of cache requests."""
         return self.hits + self.misses
+
+
+@dataclass(slots=True)
+class TwoTierCacheStats:
+    """Statistics for a two-tier (L1 in-process, L2 Redis) cache.
+
+    L1 counters cover every lookup; L2 counters only cover lookups that
+    missed L1 and fell through to Redis.
+
+    Attributes:
+        l1_hits: Lookups served from the in-process cache.
+        l1_misses: Lookups that fell through to Redis.
+        l2_hits: Fall-through lookups found in Redis.
+        l2_misses: Fall-through lookups missing from Redis.
+        invalidations_published: Invalidation messages sent to other workers.
+        invalidations_received: Invalidation messages applied from other workers.
+    """
+
+    l1_hits: int = 0
+    l1_misses: int = 0
+    l2_hits: int = 0
+    l2_misses: int = 0
+    invalidations_published: int = 0
+    invalidations_received: int = 0
+
+    @property
+    def l1_hit_ratio(self) -> float:
+        """Calculate the L1 hit ratio over all lookups."""
+        total = self.l1_hits + self.l1_misses
+        return self.l1_hits / total if total > 0 else 0.0
+
+    @property
+    def l2_hit_ratio(self) -> float:
+        """Calculate the L2 hit ratio over lookups that missed L1."""
+        total = self.l2_hits + self.l2_misses
+        return self.l2_hits / total if total > 0 else 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Calculate the combined hit ratio across both tiers."""
+        total = self.l1_hits + self.l1_misses
+        return (self.l1_hits + self.l2_hits) / total if total > 0 else 0.0
+
+    @property
+    def total_requests(self) -> int:
+        """Get total number of cache lookups."""
+        return self.l1_hits + self.l1_misses
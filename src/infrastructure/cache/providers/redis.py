@@ -6,12 +6,12 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from infrastructure.cache.config import CacheConfig
+from infrastructure.cache.core.serializers import serializer_from_config
 from infrastructure.cache.models import CacheStats
 
 if TYPE_CHECKING:
@@ -21,10 +21,11 @@ logger = structlog.get_logger(__name__)
 
 
 class RedisCacheProvider[T]:
-    """Redis-based cache with JSON serialization and fallback.
+    """Redis-based cache with pluggable serialization and fallback.
 
     Features:
-        - JSON serialization for complex types
+        - Serializer selected by ``CacheConfig.serializer`` (JSON by default)
+        - Optional compression above ``CacheConfig.compression_threshold``
         - Automatic fallback to in-memory cache on connection failure
         - TTL support
         - Pattern-based key deletion
@@ -40,6 +41,7 @@ class RedisCacheProvider[T]:
         """Initialize Redis cache provider with optional fallback."""
         self._redis_url = redis_url
         self._config = config or CacheConfig()
+        self._serializer = serializer_from_config(self._config)
         self._redis: Any = None
         self._connected = False
         self._fallback = fallback_provider
@@ -54,11 +56,7 @@ class RedisCacheProvider[T]:
         try:
             import redis.asyncio as redis
 
-            self._redis = redis.from_url(
-                self._redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            self._redis = redis.from_url(self._redis_url)
             await self._redis.ping()
             self._connected = True
             return self._redis
@@ -81,17 +79,20 @@ class RedisCacheProvider[T]:
             return f"{self._config.key_prefix}:{key}"
         return key
 
-    def _serialize(self, value: T) -> str:
-        """Serialize value to JSON string."""
-        return json.dumps(value, default=str)
+    def _serialize(self, value: T) -> bytes:
+        """Serialize value with the configured serializer."""
+        return self._serializer.serialize(value)
 
-    def _deserialize(self, data: str | None) -> T | None:
-        """Deserialize JSON string to value."""
+    def _deserialize(self, data: bytes | str | None) -> T | None:
+        """Deserialize stored bytes, returning None for unreadable values."""
         if data is None:
             return None
+        if isinstance(data, str):
+            data = data.encode("utf-8")
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return self._serializer.deserialize(data)
+        except Exception:
+            logger.warning("Cache value could not be deserialized", operation="REDIS_GET", exc_info=True)
             return None
 
     async def get(self, key: str) -> T | None:
@@ -6,23 +6,25 @@
 Implements:
 - TTL jitter to prevent thundering herd (5-15% random variation)
 - Distributed locking for cache stampede prevention
+- In-process request coalescing (single-flight) for concurrent misses
 - Probabilistic early expiration (stale-while-revalidate pattern)
 - Pattern-based TTL configuration
 """
 
 import asyncio
-import json
 import random
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 import structlog
 
+from infrastructure.cache.core.serializers import JsonSerializer, Serializer
 from infrastructure.cache.providers.cache_models import (
     CacheStats,
     JitterConfig,
     TTLPattern,
 )
+from infrastructure.cache.single_flight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
@@ -38,6 +40,7 @@ class RedisCacheWithJitter[T]:
     Features:
         - Random TTL jitter (5-15%) to prevent thundering herd
         - Distributed locking for cache stampede prevention
+        - In-process coalescing of concurrent misses for the same key
         - Probabilistic early expiration for graceful refresh
         - Pattern-based TTL configuration
 
@@ -54,6 +57,7 @@ class RedisCacheWithJitter[T]:
         config: JitterConfig | None = None,
         key_prefix: str = "",
         default_ttl: int = 300,
+        serializer: Serializer[T] | None = None,
     ) -> None:
         """Initialize Redis cache with jitter.
 
@@ -63,6 +67,9 @@ class RedisCacheWithJitter[T]:
             config: Jitter configuration.
             key_prefix: Prefix for all cache keys.
             default_ttl: Default TTL in seconds.
+            serializer: Value serializer (JSON if not provided), e.g. from
+                ``serializer_from_config``. Binary serializers need a
+                client created without ``decode_responses``.
 
         Note:
             Either redis_url or redis_client must be provided.
@@ -73,10 +80,12 @@ class RedisCacheWithJitter[T]:
         self._config = config or JitterConfig()
         self._key_prefix = key_prefix
         self._default_ttl = default_ttl
+        self._serializer: Serializer[T] = serializer or JsonSerializer()
         self._redis: Any = None
         self._connected = False
         self._stats = CacheStats()
         self._ttl_patterns: list[TTLPattern] = []
+        self._single_flight: SingleFlight[T] = SingleFlight()
 
     async def _get_client(self) -> Any | None:
         """Get or create Redis client."""
@@ -95,11 +104,7 @@ class RedisCacheWithJitter[T]:
         try:
             import redis.asyncio as redis
 
-            self._redis = redis.from_url(
-                self._redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            self._redis = redis.from_url(self._redis_url)
             await self._redis.ping()
             self._connected = True
             return self._redis
@@ -141,17 +146,20 @@ class RedisCacheWithJitter[T]:
         jitter = int(base_ttl * jitter_percent)
         return base_ttl + jitter
 
-    def _serialize(self, value: T) -> str:
-        """Serialize value to JSON string."""
-        return json.dumps(value, default=str)
+    def _serialize(self, value: T) -> bytes:
+        """Serialize value with the configured serializer."""
+        return self._serializer.serialize(value)
 
-    def _deserialize(self, data: str | None) -> T | None:
-        """Deserialize JSON string to value."""
+    def _deserialize(self, data: bytes | str | None) -> T | None:
+        """Deserialize stored bytes, returning None for unreadable values."""
         if data is None:
             return None
+        if isinstance(data, str):
+            data = data.encode("utf-8")
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return self._serializer.deserialize(data)
+        except Exception:
+            logger.warning("Cache value could not be deserialized", exc_info=True)
             return None
 
     def configure_ttl_pattern(self, pattern: TTLPattern) -> None:
@@ -275,7 +283,8 @@ class RedisCacheWithJitter[T]:
         **Validates: Requirements 22.3**
 
         Uses distributed locking to prevent cache stampede:
-        - Only one caller computes on cache miss
+        - Concurrent misses in this process share one computation
+        - Only one process computes on cache miss
         - Other callers wait for the result
         - Automatically handles lock timeout and retry
 
@@ -303,7 +312,27 @@ class RedisCacheWithJitter[T]:
                 self._stats.early_recomputes += 1
             return cached
 
-        # Cache miss - acquire lock to prevent stampede
+        # Cache miss - coalesce concurrent callers in this process
+        if self._single_flight.is_in_flight(key):
+            self._stats.coalesced_waiters += 1
+        return await self._single_flight.do(
+            key,
+            lambda: self._compute_with_lock(key, compute, ttl, apply_jitter),
+        )
+
+    async def _compute_with_lock(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        ttl: int | None,
+        apply_jitter: bool,
+    ) -> T:
+        """Compute and cache a missing value under the distributed lock.
+
+        **Feature: api-best-practices-review-2025**
+        **Validates: Requirements 22.3**
+        """
+        # Acquire lock to prevent stampede across processes
         client = await self._get_client()
         if client is None:
             # Fallback: compute without locking
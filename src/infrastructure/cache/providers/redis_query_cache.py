@@ -0,0 +1,244 @@
+"""Redis-backed query cache with prefix and tag index sets.
+
+**Feature: application-layer-code-review-fixes**
+**Validates: Requirements F-05**
+
+Implements the application ``TaggedQueryCache`` protocol. Every key is added
+to one Redis set per leading ``:``-separated prefix, up to ``prefix_depth``
+segments, and one set per entity tag, so pattern and tag invalidation read
+the matching keys from a set instead of walking the keyspace. Patterns that
+start with a wildcard have no indexed prefix and fall back to SCAN.
+
+Index expiry uses ``EXPIRE ... NX`` and ``GT``, which require Redis 7.0+.
+"""
+
+import fnmatch
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+import structlog
+
+from infrastructure.cache.core.serializers import JsonSerializer, Serializer
+
+logger = structlog.get_logger(__name__)
+
+_KEY_SEPARATOR = ":"
+_WILDCARDS = "*?["
+
+
+def _segment_prefixes(key: str, depth: int) -> list[str]:
+    """Get the first ``depth`` ``:``-aligned proper prefixes of a key."""
+    prefixes: list[str] = []
+    end = key.find(_KEY_SEPARATOR)
+    while end != -1 and len(prefixes) < depth:
+        prefixes.append(key[: end + 1])
+        end = key.find(_KEY_SEPARATOR, end + 1)
+    return prefixes
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Get the part of a glob pattern before its first wildcard."""
+    end = len(pattern)
+    for char in _WILDCARDS:
+        index = pattern.find(char)
+        if index != -1:
+            end = min(end, index)
+    return pattern[:end]
+
+
+def _to_str(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class RedisQueryCache:
+    """Query cache storing results in Redis with indexed invalidation.
+
+    Index sets expire no earlier than the newest key they hold. Deleting a
+    key removes it from its prefix sets and, through a per-key record of its
+    tags, from its tag sets. Members whose key has expired are dropped
+    lazily whenever a set is read for invalidation. Keys with no ``:`` and
+    no tags are not indexed and are only reachable through SCAN.
+
+    Example:
+        >>> cache = RedisQueryCache(redis_client)
+        >>> await cache.set("query_cache:GetUserByIdQuery:user:1", dto, 300, tags=["user:1"])
+        >>> await cache.invalidate_tags(["user:1"])
+        >>> await cache.clear_pattern("query_cache:ListUsersQuery:*")
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        *,
+        index_prefix: str = "query_cache_index",
+        prefix_depth: int = 2,
+        scan_count: int = 500,
+        serializer: Serializer[Any] | None = None,
+    ) -> None:
+        """Initialize Redis query cache.
+
+        Args:
+            redis_client: Async Redis client.
+            index_prefix: Prefix for the index set keys.
+            prefix_depth: Leading key segments that get a prefix index set.
+            scan_count: COUNT hint for SSCAN and SCAN calls.
+            serializer: Value serializer (JSON if not provided).
+
+        Raises:
+            ValueError: If prefix_depth or scan_count is less than 1.
+        """
+        if prefix_depth < 1:
+            raise ValueError("prefix_depth must be at least 1")
+        if scan_count < 1:
+            raise ValueError("scan_count must be at least 1")
+        self._redis = redis_client
+        self._index_prefix = index_prefix
+        self._prefix_depth = prefix_depth
+        self._scan_count = scan_count
+        self._serializer: Serializer[Any] = serializer or JsonSerializer()
+
+    def _prefix_index(self, prefix: str) -> str:
+        return f"{self._index_prefix}:prefix:{prefix}"
+
+    def _tag_index(self, tag: str) -> str:
+        return f"{self._index_prefix}:tag:{tag}"
+
+    def _key_tags(self, key: str) -> str:
+        return f"{self._index_prefix}:keytags:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        """Get cached result."""
+        data = await self._redis.get(key)
+        if data is None:
+            return None
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return self._serializer.deserialize(data)
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        """Set cached result and add it to its prefix and tag index sets."""
+        tags = list(tags)
+        indexes = [self._prefix_index(prefix) for prefix in _segment_prefixes(key, self._prefix_depth)]
+        indexes.extend(self._tag_index(tag) for tag in tags)
+
+        pipe = self._redis.pipeline()
+        pipe.set(key, self._serializer.serialize(value), ex=ttl)
+        if tags:
+            pipe.sadd(self._key_tags(key), *tags)
+            pipe.expire(self._key_tags(key), ttl)
+        for index in indexes:
+            pipe.sadd(index, key)
+            pipe.expire(index, ttl, nx=True)
+            pipe.expire(index, ttl, gt=True)
+        await pipe.execute()
+
+    async def delete(self, key: str) -> None:
+        """Delete cached result."""
+        await self._delete([key])
+
+    async def clear(self) -> None:
+        """Clear all indexed cached results and index sets."""
+        index_keys = [_to_str(key) async for key in self._redis.scan_iter(match=f"{self._index_prefix}:*")]
+        keys: dict[str, None] = {}
+        for index in index_keys:
+            if not index.startswith(self._key_tags("")):
+                keys.update(dict.fromkeys([member async for member in self._scan_members(index)]))
+        await self._delete(list(keys))
+        if index_keys:
+            await self._redis.delete(*index_keys)
+
+    async def clear_pattern(self, pattern: str) -> int:
+        """Clear cached results matching pattern.
+
+        Candidates are read from the deepest indexed ``:``-aligned prefix
+        before the first wildcard and filtered with fnmatch. Patterns without
+        such a prefix are matched with SCAN.
+
+        Args:
+            pattern: Pattern to match keys (e.g., "query_cache:GetUserQuery:*").
+
+        Returns:
+            Number of keys cleared.
+        """
+        literal = _literal_prefix(pattern)
+        if literal == pattern:
+            return await self._delete([pattern])
+
+        prefixes = _segment_prefixes(literal, self._prefix_depth)
+        if not prefixes:
+            return await self._delete(await self._scan_keys(pattern))
+
+        prefix = prefixes[-1]
+        candidates = await self._live_members(self._prefix_index(prefix))
+        if pattern == prefix + "*":
+            matching_keys = candidates
+        else:
+            matching_keys = [key for key in candidates if fnmatch.fnmatch(key, pattern)]
+        return await self._delete(matching_keys)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Clear cached results carrying any of the given tags.
+
+        Args:
+            tags: Entity tags (e.g., "user:123").
+
+        Returns:
+            Number of keys cleared.
+        """
+        indexes = [self._tag_index(tag) for tag in tags]
+        if not indexes:
+            return 0
+        keys: dict[str, None] = {}
+        for index in indexes:
+            keys.update(dict.fromkeys(await self._live_members(index)))
+        cleared = await self._delete(list(keys))
+        await self._redis.delete(*indexes)
+        return cleared
+
+    async def _scan_members(self, index: str) -> AsyncIterator[str]:
+        """Iterate an index set with SSCAN; members may repeat."""
+        async for member in self._redis.sscan_iter(index, count=self._scan_count):
+            yield _to_str(member)
+
+    async def _scan_keys(self, pattern: str) -> list[str]:
+        """Find cached keys matching a pattern with SCAN, skipping index keys."""
+        index_namespace = f"{self._index_prefix}:"
+        keys = [_to_str(key) async for key in self._redis.scan_iter(match=pattern, count=self._scan_count)]
+        return [key for key in dict.fromkeys(keys) if not key.startswith(index_namespace)]
+
+    async def _live_members(self, index: str) -> list[str]:
+        """Read an index set, dropping members whose key no longer exists."""
+        members = list(dict.fromkeys([member async for member in self._scan_members(index)]))
+        if not members:
+            return []
+        pipe = self._redis.pipeline()
+        for member in members:
+            pipe.exists(member)
+        found = await pipe.execute()
+        stale = [member for member, exists in zip(members, found, strict=True) if not exists]
+        if stale:
+            await self._redis.srem(index, *stale)
+        return [member for member, exists in zip(members, found, strict=True) if exists]
+
+    async def _delete(self, keys: list[str]) -> int:
+        """Delete keys and remove them from their prefix and tag index sets."""
+        if not keys:
+            return 0
+        pipe = self._redis.pipeline()
+        for key in keys:
+            pipe.smembers(self._key_tags(key))
+        key_tags = await pipe.execute()
+
+        pipe = self._redis.pipeline()
+        for key in keys:
+            pipe.delete(key)
+        for key, tags in zip(keys, key_tags, strict=True):
+            for prefix in _segment_prefixes(key, self._prefix_depth):
+                pipe.srem(self._prefix_index(prefix), key)
+            for tag in tags:
+                pipe.srem(self._tag_index(_to_str(tag)), key)
+            pipe.delete(self._key_tags(key))
+        results = await pipe.execute()
+        cleared = sum(results[: len(keys)])
+        logger.debug("query_cache_keys_deleted", count=cleared, operation="QUERY_CACHE_DELETE")
+        return cleared
@@ -0,0 +1,462 @@
+"""Sharded in-memory cache provider with a background TTL reaper.
+
+**Feature: python-api-base-2025-state-of-art**
+**Validates: CacheProvider protocol (get/set/delete/exists/clear_pattern/clear)**
+
+The key space is split across a power-of-two number of shards, each an
+independent ``OrderedDict`` with its own LRU order and capacity. Every
+single-key operation is a synchronous critical section on the event loop
+(no ``await`` between reading and mutating a shard), so the hot path takes
+no lock at all. Expiry uses ``time.monotonic()`` floats instead of tz-aware
+datetimes, and a background reaper pops expired entries from per-shard
+expiry heaps in bounded batches, yielding to the loop between batches.
+Entry sizes are only measured when a ``max_memory_bytes`` budget is set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fnmatch
+import heapq
+import math
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from infrastructure.cache.config import CacheConfig
+from infrastructure.cache.models import CacheStats
+
+logger = structlog.get_logger(__name__)
+
+_NEVER = math.inf
+
+
+def _estimate_size(value: Any) -> int:
+    """Cheap size estimate: the length of strings and bytes, else the shallow ``sys.getsizeof``."""
+    if isinstance(value, str | bytes | bytearray):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+@dataclass(slots=True)
+class _Entry[T]:
+    """Cached value with a monotonic expiry deadline."""
+
+    value: T
+    expires_at: float
+    size: int
+
+
+@dataclass(slots=True)
+class _Shard[T]:
+    """One LRU segment of the sharded cache."""
+
+    capacity: int
+    memory_limit: int | None = None
+    entries: OrderedDict[str, _Entry[T]] = field(default_factory=OrderedDict)
+    expiry_heap: list[tuple[float, str]] = field(default_factory=list)
+    memory_bytes: int = 0
+
+
+class ShardedMemoryCacheProvider[T]:
+    """In-memory cache split into independently evicted LRU shards.
+
+    Implements the same ``CacheProvider`` protocol and tag API as
+    ``InMemoryCacheProvider``. LRU order is maintained per shard, so eviction
+    approximates global LRU; ``max_size`` is distributed across shards and
+    the total entry count never exceeds it. ``max_memory_bytes`` is split
+    the same way; when set, each entry is measured with ``sizer`` and shards
+    evict LRU entries to stay within their share.
+
+    The provider is bound to a single event loop, like ``InMemoryCacheProvider``.
+    Call ``start()`` to run the background reaper; without it expired entries
+    are still dropped lazily on read and by ``cleanup_expired()``.
+
+    Example:
+        >>> cache = ShardedMemoryCacheProvider[dict](CacheConfig(max_size=100_000))
+        >>> await cache.start()
+        >>> await cache.set("user:1", {"name": "Ada"}, ttl=60)
+        >>> await cache.stop()
+    """
+
+    def __init__(
+        self,
+        config: CacheConfig | None = None,
+        *,
+        shard_count: int = 16,
+        reap_interval: float = 1.0,
+        reap_batch_size: int = 1000,
+        clock: Callable[[], float] | None = None,
+        max_memory_bytes: int | None = None,
+        sizer: Callable[[T], int] | None = None,
+    ) -> None:
+        """Initialize sharded cache.
+
+        Args:
+            config: Cache configuration (max_size, default_ttl, key_prefix).
+            shard_count: Number of shards, rounded up to a power of two and
+                capped at ``max_size``. Default 16.
+            reap_interval: Seconds between reaper passes. Default 1.0.
+            reap_batch_size: Maximum entries removed per shard before the
+                reaper yields to the event loop. Default 1000.
+            clock: Monotonic clock returning seconds. Defaults to
+                ``time.monotonic``; injectable for tests.
+            max_memory_bytes: Byte budget for keys and values. Sizes are
+                not measured when omitted (default).
+            sizer: Size of a value in bytes. Defaults to ``len()`` for
+                strings and bytes and the shallow ``sys.getsizeof`` otherwise.
+
+        Raises:
+            ValueError: If shard_count, reap_interval, reap_batch_size or
+                max_memory_bytes is not positive.
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be >= 1")
+        if reap_interval <= 0:
+            raise ValueError("reap_interval must be > 0")
+        if reap_batch_size < 1:
+            raise ValueError("reap_batch_size must be >= 1")
+        if max_memory_bytes is not None and max_memory_bytes < 1:
+            raise ValueError("max_memory_bytes must be >= 1")
+
+        self._config = config or CacheConfig()
+        max_size = max(1, self._config.max_size)
+        count = 1 << (min(shard_count, max_size) - 1).bit_length()
+        while count > max_size:
+            count >>= 1
+        base, extra = divmod(max_size, count)
+        self._shards: list[_Shard[T]] = [_Shard(capacity=base + (1 if i < extra else 0)) for i in range(count)]
+        if max_memory_bytes is not None:
+            for shard in self._shards:
+                shard.memory_limit = max(1, max_memory_bytes // count)
+        self._sizer: Callable[[T], int] | None = None if max_memory_bytes is None else sizer or _estimate_size
+        self._mask = count - 1
+        self._reap_interval = reap_interval
+        self._reap_batch_size = reap_batch_size
+        self._clock = clock or time.monotonic
+        self._reaper: asyncio.Task[None] | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._tag_index: dict[str, set[str]] = {}
+        self._key_tags: dict[str, set[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    @property
+    def shard_count(self) -> int:
+        """Get the effective number of shards."""
+        return len(self._shards)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get current cache hit rate."""
+        total = self._hits + self._misses
+        return self._hits / total if total > 0 else 0.0
+
+    @property
+    def hits(self) -> int:
+        """Get total number of cache hits."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get total number of cache misses."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Get total number of LRU evictions."""
+        return self._evictions
+
+    @property
+    def expirations(self) -> int:
+        """Get total number of entries removed because their TTL elapsed."""
+        return self._expirations
+
+    @property
+    def memory_usage_bytes(self) -> int:
+        """Get the estimated memory retained by cached keys and values.
+
+        Always 0 unless ``max_memory_bytes`` is set.
+        """
+        return sum(shard.memory_bytes for shard in self._shards)
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/eviction/expiration counters to zero."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get_metrics(self) -> CacheStats:
+        """Get cache metrics for OpenTelemetry export."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            hit_rate=self.hit_rate,
+            memory_usage_bytes=self.memory_usage_bytes,
+            entry_count=self._entry_count(),
+        )
+
+    async def get_stats(self) -> CacheStats:
+        """Get cache statistics."""
+        return self.get_metrics()
+
+    # ------------------------------------------------------------------
+    # Reaper lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def is_reaping(self) -> bool:
+        """Whether the background reaper task is running."""
+        return self._reaper is not None and not self._reaper.done()
+
+    async def start(self) -> None:
+        """Start the background TTL reaper."""
+        if self.is_reaping:
+            return
+        self._reaper = asyncio.create_task(self._reap_loop())
+        logger.info("Sharded cache reaper started", shards=len(self._shards))
+
+    async def stop(self) -> None:
+        """Stop the background TTL reaper."""
+        if self._reaper is None:
+            return
+        self._reaper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._reaper
+        self._reaper = None
+        logger.info("Sharded cache reaper stopped")
+
+    async def _reap_loop(self) -> None:
+        """Periodically remove expired entries."""
+        while True:
+            await asyncio.sleep(self._reap_interval)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    logger.debug("Reaped expired cache entries", count=removed)
+            except Exception:
+                logger.exception("Error in sharded cache reaper")
+
+    async def cleanup_expired(self) -> int:
+        """Remove all expired entries, yielding between bounded batches.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for shard in self._shards:
+            while True:
+                batch = self._reap_shard(shard, self._clock(), self._reap_batch_size)
+                removed += batch
+                if batch < self._reap_batch_size:
+                    break
+                await asyncio.sleep(0)
+        return removed
+
+    def _reap_shard(self, shard: _Shard[T], now: float, limit: int) -> int:
+        """Pop up to ``limit`` expired entries from a shard's expiry heap."""
+        heap = shard.expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now and removed < limit:
+            expires_at, key = heapq.heappop(heap)
+            entry = shard.entries.get(key)
+            # Heap items for overwritten or deleted keys are stale; skip them.
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(shard, key)
+                self._expirations += 1
+                removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # CacheProvider protocol
+    # ------------------------------------------------------------------
+
+    def _make_key(self, key: str) -> str:
+        """Create full cache key with prefix."""
+        if self._config.key_prefix:
+            return f"{self._config.key_prefix}:{key}"
+        return key
+
+    def _shard_for(self, full_key: str) -> _Shard[T]:
+        """Select the shard owning a key."""
+        return self._shards[hash(full_key) & self._mask]
+
+    async def get(self, key: str) -> T | None:
+        """Retrieve a value from the cache."""
+        full_key = self._make_key(key)
+        shard = self._shard_for(full_key)
+        entry = shard.entries.get(full_key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            self._remove(shard, full_key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        shard.entries.move_to_end(full_key)
+        return entry.value
+
+    async def set(self, key: str, value: T, ttl: int | None = None) -> None:
+        """Store a value in the cache."""
+        full_key = self._make_key(key)
+        shard = self._shard_for(full_key)
+        effective_ttl = ttl if ttl is not None else self._config.default_ttl
+        expires_at = self._clock() + effective_ttl if effective_ttl else _NEVER
+        entry = _Entry(
+            value=value,
+            expires_at=expires_at,
+            size=0 if self._sizer is None else len(full_key) + self._sizer(value),
+        )
+
+        previous = shard.entries.get(full_key)
+        if previous is not None:
+            shard.memory_bytes -= previous.size
+        elif len(shard.entries) >= shard.capacity:
+            evicted_key, _ = next(iter(shard.entries.items()))
+            self._remove(shard, evicted_key)
+            self._evictions += 1
+
+        shard.entries[full_key] = entry
+        shard.entries.move_to_end(full_key)
+        shard.memory_bytes += entry.size
+        if shard.memory_limit is not None:
+            while shard.memory_bytes > shard.memory_limit and len(shard.entries) > 1:
+                self._remove(shard, next(iter(shard.entries)))
+                self._evictions += 1
+        if expires_at != _NEVER:
+            heapq.heappush(shard.expiry_heap, (expires_at, full_key))
+            self._compact_heap(shard)
+
+    async def delete(self, key: str) -> bool:
+        """Remove a value from the cache."""
+        full_key = self._make_key(key)
+        shard = self._shard_for(full_key)
+        if full_key not in shard.entries:
+            return False
+        self._remove(shard, full_key)
+        return True
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists in the cache."""
+        full_key = self._make_key(key)
+        shard = self._shard_for(full_key)
+        entry = shard.entries.get(full_key)
+        if entry is None:
+            return False
+        if entry.expires_at <= self._clock():
+            self._remove(shard, full_key)
+            self._expirations += 1
+            return False
+        return True
+
+    async def clear_pattern(self, pattern: str) -> int:
+        """Clear all keys matching pattern, one shard at a time."""
+        full_pattern = self._make_key(pattern)
+        deleted = 0
+        for shard in self._shards:
+            keys_to_delete = [k for k in shard.entries if fnmatch.fnmatchcase(k, full_pattern)]
+            for key in keys_to_delete:
+                self._remove(shard, key)
+            deleted += len(keys_to_delete)
+            await asyncio.sleep(0)
+        return deleted
+
+    async def clear(self) -> None:
+        """Clear all values from the cache."""
+        for shard in self._shards:
+            shard.entries.clear()
+            shard.expiry_heap.clear()
+            shard.memory_bytes = 0
+        self._tag_index.clear()
+        self._key_tags.clear()
+
+    async def size(self) -> int:
+        """Get current cache size."""
+        return self._entry_count()
+
+    # ------------------------------------------------------------------
+    # Tags
+    # ------------------------------------------------------------------
+
+    async def set_with_tags(
+        self,
+        key: str,
+        value: T,
+        tags: list[str],
+        ttl: int | None = None,
+    ) -> None:
+        """Store a value with associated tags for group invalidation."""
+        await self.set(key, value, ttl)
+
+        full_key = self._make_key(key)
+        key_tags = self._key_tags.setdefault(full_key, set())
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(full_key)
+            key_tags.add(tag)
+
+    async def invalidate_by_tag(self, tag: str) -> int:
+        """Invalidate all cache entries with the given tag."""
+        deleted_count = 0
+        for full_key in self._tag_index.pop(tag, set()):
+            shard = self._shard_for(full_key)
+            if full_key in shard.entries:
+                self._remove(shard, full_key)
+                deleted_count += 1
+            else:
+                self._untag(full_key)
+        return deleted_count
+
+    async def get_tags_for_key(self, key: str) -> list[str]:
+        """Get all tags associated with a cache key."""
+        return sorted(self._key_tags.get(self._make_key(key), ()))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entry_count(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def _remove(self, shard: _Shard[T], full_key: str) -> None:
+        """Drop a key from its shard and the tag indexes."""
+        entry = shard.entries.pop(full_key)
+        shard.memory_bytes -= entry.size
+        if full_key in self._key_tags:
+            self._untag(full_key)
+
+    def _untag(self, full_key: str) -> None:
+        for tag in self._key_tags.pop(full_key, ()):
+            keys = self._tag_index.get(tag)
+            if keys is None:
+                continue
+            keys.discard(full_key)
+            if not keys:
+                del self._tag_index[tag]
+
+    @staticmethod
+    def _compact_heap(shard: _Shard[T]) -> None:
+        """Rebuild the expiry heap when stale items outnumber live entries."""
+        heap = shard.expiry_heap
+        if len(heap) <= 2 * len(shard.entries) + 64:
+            return
+        shard.expiry_heap = [
+            (entry.expires_at, key) for key, entry in shard.entries.items() if entry.expires_at != _NEVER
+        ]
+        heapq.heapify(shard.expiry_heap)
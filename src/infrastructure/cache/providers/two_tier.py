@@ -0,0 +1,271 @@
+"""Two-tier near cache: in-process LRU (L1) in front of Redis (L2).
+
+**Feature: python-api-base-2025-state-of-art**
+**Validates: CacheProvider protocol (get/set/delete/clear_pattern)**
+
+L1 is a per-process ``LRUCache`` holding already deserialized values with a
+short TTL, so hot keys skip both the Redis round trip and ``json.loads``.
+L2 is a ``RedisCacheWithJitter`` shared by all workers. Writes and deletes
+are broadcast on a Redis pub/sub channel so every other worker drops its
+stale L1 copy; the short L1 TTL bounds staleness if a message is lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fnmatch
+import json
+import uuid
+from typing import Any
+
+import structlog
+
+from infrastructure.cache.providers.cache_models import TwoTierCacheStats
+from infrastructure.cache.providers.local import LRUCache
+from infrastructure.cache.providers.redis_jitter import RedisCacheWithJitter
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class TwoTierCacheProvider[T]:
+    """Near cache combining a local LRU (L1) with Redis (L2).
+
+    Values returned from L1 are the same objects handed to ``set`` or
+    decoded from Redis; callers must treat them as read-only.
+
+    Call ``start()`` to subscribe to the invalidation channel. Without it the
+    provider still works, but L1 entries written by other workers are only
+    refreshed when their L1 TTL elapses.
+
+    Example:
+        >>> l2 = RedisCacheWithJitter[dict](redis_client=redis)
+        >>> cache = TwoTierCacheProvider[dict](l2, l1_ttl=5)
+        >>> await cache.start()
+        >>> await cache.set("user:123", user_data, ttl=300)
+        >>> user = await cache.get("user:123")  # served from L1
+        >>> await cache.stop()
+    """
+
+    def __init__(
+        self,
+        l2: RedisCacheWithJitter[T],
+        *,
+        l1: LRUCache[str, T] | None = None,
+        l1_max_size: int = 10_000,
+        l1_ttl: int = 5,
+        channel: str = DEFAULT_INVALIDATION_CHANNEL,
+        redis_client: Any = None,
+    ) -> None:
+        """Initialize two-tier cache.
+
+        Args:
+            l2: Shared Redis cache.
+            l1: Local cache to use; created with ``l1_max_size`` if omitted.
+            l1_max_size: Maximum entries in the default L1 cache.
+            l1_ttl: L1 TTL in seconds, capped by the TTL passed to ``set``.
+            channel: Redis pub/sub channel for invalidation messages.
+            redis_client: Redis client for pub/sub. Defaults to the L2 client.
+
+        Raises:
+            ValueError: If l1_ttl is not positive.
+        """
+        if l1_ttl <= 0:
+            raise ValueError("l1_ttl must be > 0")
+
+        self._l1: LRUCache[str, T] = l1 if l1 is not None else LRUCache(max_size=l1_max_size)
+        self._l2 = l2
+        self._l1_ttl = l1_ttl
+        self._channel = channel
+        self._redis_client = redis_client
+        self._origin = uuid.uuid4().hex
+        self._stats = TwoTierCacheStats()
+        self._pubsub: Any = None
+        self._listener: asyncio.Task[None] | None = None
+
+    @property
+    def l1(self) -> LRUCache[str, T]:
+        """Get the local (L1) cache."""
+        return self._l1
+
+    @property
+    def l2(self) -> RedisCacheWithJitter[T]:
+        """Get the shared Redis (L2) cache."""
+        return self._l2
+
+    # ------------------------------------------------------------------
+    # Invalidation channel lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether the invalidation listener task is running."""
+        return self._listener is not None and not self._listener.done()
+
+    async def _get_client(self) -> Any | None:
+        """Get the Redis client used for pub/sub."""
+        if self._redis_client is not None:
+            return self._redis_client
+        return await self._l2._get_client()
+
+    async def start(self) -> None:
+        """Subscribe to the invalidation channel."""
+        if self.is_listening:
+            return
+        client = await self._get_client()
+        if client is None:
+            logger.warning("Two-tier cache running without invalidation channel")
+            return
+        self._pubsub = client.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._listener = asyncio.create_task(self._listen(), name=f"cache_invalidation:{self._channel}")
+        logger.info("Two-tier cache invalidation listener started", channel=self._channel)
+
+    async def stop(self) -> None:
+        """Unsubscribe from the invalidation channel."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self._channel)
+                await self._pubsub.aclose()
+            except Exception:
+                logger.warning("Failed to close invalidation subscription", exc_info=True)
+            self._pubsub = None
+            logger.info("Two-tier cache invalidation listener stopped", channel=self._channel)
+
+    async def _listen(self) -> None:
+        """Apply invalidation messages published by other workers."""
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                self._apply_invalidation(message["data"])
+            except Exception:
+                logger.warning("Invalid cache invalidation message", exc_info=True)
+
+    def _apply_invalidation(self, data: str | bytes) -> None:
+        """Drop L1 entries named by an invalidation message."""
+        payload = json.loads(data)
+        if payload.get("origin") == self._origin:
+            return
+        for key in payload.get("keys", ()):
+            self._l1.delete(key)
+        pattern = payload.get("pattern")
+        if pattern is not None:
+            self._evict_l1_pattern(pattern)
+        self._stats.invalidations_received += 1
+
+    async def _publish(self, *, keys: list[str] | None = None, pattern: str | None = None) -> None:
+        """Broadcast an invalidation message to other workers."""
+        client = await self._get_client()
+        if client is None:
+            return
+        payload: dict[str, Any] = {"origin": self._origin}
+        if keys:
+            payload["keys"] = keys
+        if pattern is not None:
+            payload["pattern"] = pattern
+        try:
+            await client.publish(self._channel, json.dumps(payload))
+            self._stats.invalidations_published += 1
+        except Exception:
+            logger.warning("Cache invalidation publish failed", exc_info=True)
+
+    def _evict_l1_pattern(self, pattern: str) -> int:
+        """Drop L1 keys matching a glob pattern."""
+        keys = [k for k in self._l1.keys() if fnmatch.fnmatchcase(k, pattern)]
+        for key in keys:
+            self._l1.delete(key)
+        return len(keys)
+
+    # ------------------------------------------------------------------
+    # CacheProvider protocol
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> T | None:
+        """Get value from L1, falling back to L2 on a miss.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None if not found in either tier.
+        """
+        value = self._l1.get(key)
+        if value is not None:
+            self._stats.l1_hits += 1
+            return value
+
+        self._stats.l1_misses += 1
+        value = await self._l2.get(key)
+        if value is None:
+            self._stats.l2_misses += 1
+            return None
+
+        self._stats.l2_hits += 1
+        self._l1.set(key, value, ttl=self._l1_ttl)
+        return value
+
+    async def set(self, key: str, value: T, ttl: int | None = None) -> None:
+        """Store a value in both tiers and invalidate other workers' L1.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: L2 TTL in seconds (L2 default if not provided).
+        """
+        await self._l2.set(key, value, ttl)
+        l1_ttl = min(ttl, self._l1_ttl) if ttl else self._l1_ttl
+        self._l1.set(key, value, ttl=l1_ttl)
+        await self._publish(keys=[key])
+
+    async def delete(self, key: str) -> bool:
+        """Delete a value from both tiers and invalidate other workers' L1.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            True if the key existed in either tier.
+        """
+        in_l1 = self._l1.delete(key)
+        in_l2 = await self._l2.delete(key)
+        await self._publish(keys=[key])
+        return in_l1 or in_l2
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists in either tier."""
+        return await self.get(key) is not None
+
+    async def clear_pattern(self, pattern: str) -> int:
+        """Clear keys matching pattern in both tiers.
+
+        Args:
+            pattern: Key pattern (glob style).
+
+        Returns:
+            Number of keys deleted from L2.
+        """
+        self._evict_l1_pattern(pattern)
+        deleted = await self._l2.clear_pattern(pattern)
+        await self._publish(pattern=pattern)
+        return deleted
+
+    def get_stats(self) -> TwoTierCacheStats:
+        """Get per-tier cache statistics."""
+        return self._stats
+
+    def reset_stats(self) -> None:
+        """Reset cache statistics."""
+        self._stats = TwoTierCacheStats()
+
+    async def close(self) -> None:
+        """Stop the listener and close the L2 connection."""
+        await self.stop()
+        await self._l2.close()
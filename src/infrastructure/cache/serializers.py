@@ -6,9 +6,32 @@
 Re-exports cache serializers from core submodule for backward compatibility.
 """
 
-from infrastructure.cache.core.serializers import JsonSerializer, Serializer
+from infrastructure.cache.core.serializers import (
+    CompressedSerializer,
+    JsonSerializer,
+    MsgpackSerializer,
+    OrjsonSerializer,
+    PickleSerializer,
+    Serializer,
+    available_serializers,
+    get_serializer,
+    register_model,
+    register_serializer,
+    registered_models,
+    serializer_from_config,
+)
 
 __all__ = [
+    "CompressedSerializer",
     "JsonSerializer",
+    "MsgpackSerializer",
+    "OrjsonSerializer",
+    "PickleSerializer",
     "Serializer",
+    "available_serializers",
+    "get_serializer",
+    "register_model",
+    "register_serializer",
+    "registered_models",
+    "serializer_from_config",
 ]
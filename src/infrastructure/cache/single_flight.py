@@ -0,0 +1,102 @@
+"""In-process request coalescing (single-flight).
+
+**Feature: python-api-base-2025-state-of-art**
+
+Concurrent callers asking for the same key share one in-flight computation:
+the first caller starts it and every later caller awaits the same task until
+it finishes. Complements distributed locking, which only coordinates across
+processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    """Statistics for coalesced calls.
+
+    Attributes:
+        executions: Calls that started a new computation.
+        coalesced: Calls that awaited a computation already in flight.
+    """
+
+    executions: int = 0
+    coalesced: int = 0
+
+    @property
+    def total_calls(self) -> int:
+        """Get total number of calls."""
+        return self.executions + self.coalesced
+
+    @property
+    def coalesce_ratio(self) -> float:
+        """Calculate the fraction of calls served by another caller's computation."""
+        total = self.total_calls
+        return self.coalesced / total if total > 0 else 0.0
+
+
+class SingleFlight[T]:
+    """Deduplicates concurrent async computations by key.
+
+    The shared computation runs in its own task, so cancelling one waiter
+    does not cancel it for the others. Exceptions are raised to every
+    waiter. Results are not cached: once the computation finishes, the next
+    call for the key starts a new one.
+
+    Example:
+        >>> flight = SingleFlight[User]()
+        >>> user = await flight.do(f"user:{user_id}", lambda: repo.get(user_id))
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Deduplication key.
+            fn: Factory returning the awaitable to run on a miss.
+
+        Returns:
+            Result of the shared computation.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self._stats.executions += 1
+        else:
+            self._stats.coalesced += 1
+        return await asyncio.shield(future)
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        """Check whether a computation for ``key`` is running."""
+        return key in self._in_flight
+
+    @property
+    def in_flight(self) -> int:
+        """Get number of computations currently running."""
+        return len(self._in_flight)
+
+    def get_stats(self) -> SingleFlightStats:
+        """Get coalescing statistics."""
+        return self._stats
+
+    def reset_stats(self) -> None:
+        """Reset coalescing statistics."""
+        self._stats = SingleFlightStats()
+
+    def _forget(self, key: Hashable, future: asyncio.Future[T]) -> None:
+        """Drop a finished computation and mark its exception as retrieved."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()
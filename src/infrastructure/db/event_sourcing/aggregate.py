@@ -73,7 +73,7 @@ class Aggregate[AggregateIdT: (str, int)](ABC):
         """Create a new event instance with the correct version."""
         from dataclasses import fields
 
-        base_fields = {"event_id", "aggregate_id", "version", "timestamp", "metadata"}
+        base_fields = {"event_id", "aggregate_id", "version", "timestamp", "metadata", "position"}
         extra_kwargs = {}
 
         for f in fields(event):
@@ -16,6 +16,10 @@ class SourcedEvent:
 
     All events in an event-sourced system should inherit from this class.
     Events are immutable records of state changes.
+
+    ``version`` orders events within their aggregate stream; ``position``
+    is assigned by the event store and orders events across all streams
+    (0 until the event is stored).
     """
 
     event_id: str = field(default_factory=lambda: str(uuid4()))
@@ -23,6 +27,7 @@ class SourcedEvent:
     version: int = 0
     timestamp: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
     metadata: dict[str, Any] = field(default_factory=dict)
+    position: int = 0
 
     @property
     def event_type(self) -> str:
@@ -4,7 +4,11 @@
 **Validates: Requirements 2.2**
 """
 
+import asyncio
+import dataclasses
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterator
 from typing import Any
 
 from infrastructure.db.event_sourcing.aggregate import Aggregate
@@ -13,6 +17,10 @@ from infrastructure.db.event_sourcing.exceptions import ConcurrencyError
 from infrastructure.db.event_sourcing.snapshots import Snapshot
 
 
+def _version(event: SourcedEvent) -> int:
+    return event.version
+
+
 class EventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](ABC):
     """Abstract event store interface.
 
@@ -95,12 +103,48 @@ class EventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](ABC):
         """
         ...
 
+    async def stream_all(
+        self,
+        from_position: int = 0,
+        batch_size: int = 100,
+    ) -> AsyncIterator[EventT]:
+        """Iterate over all events after a global position.
+
+        Lets projections catch up without materializing the whole log.
+        Events appended while iterating are yielded as well; iteration
+        ends once the consumer reaches the end of the log.
+
+        Args:
+            from_position: Global position to start after (0 for the beginning).
+            batch_size: Events fetched per ``get_all_events`` call.
+
+        Yields:
+            Events in global order.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        while True:
+            batch = await self.get_all_events(from_position, batch_size)
+            if not batch:
+                return
+            for event in batch:
+                yield event
+            from_position += len(batch)
+
 
 class InMemoryEventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](EventStore[AggregateT, EventT]):
     """In-memory event store implementation.
 
     Useful for testing and development. Not suitable for production
     as events are lost on restart.
+
+    Streams are kept in version order and sliced with bisect, so loading
+    after a snapshot and version-range reads cost O(log n + k). Stored
+    events carry their 1-based global ``position``; ``get_all_events`` and
+    ``stream_all`` return events after the given position.
     """
 
     def __init__(self) -> None:
@@ -137,8 +181,9 @@ class InMemoryEventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](Event
             )
 
         for event in events:
-            stream.append(event)
-            self._all_events.append(event)  # type: ignore[arg-type]
+            positioned = dataclasses.replace(event, position=len(self._all_events) + 1)
+            stream.append(positioned)
+            self._all_events.append(positioned)  # type: ignore[arg-type]
 
         aggregate.clear_uncommitted_events()
 
@@ -161,8 +206,8 @@ class InMemoryEventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](Event
             aggregate.load_from_snapshot(snapshot)
             from_version = snapshot.version
 
-        events_to_replay = [e for e in stream.events if e.version > from_version]
-        aggregate.load_from_history(events_to_replay)
+        start = bisect_right(stream.events, from_version, key=_version)
+        aggregate.load_from_history(stream.events[start:])
 
         return aggregate
 
@@ -178,12 +223,10 @@ class InMemoryEventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](Event
             return []
 
         events = stream.events
-        if from_version > 0:
-            events = [e for e in events if e.version >= from_version]
-        if to_version is not None:
-            events = [e for e in events if e.version <= to_version]
+        start = bisect_left(events, from_version, key=_version)
+        end = len(events) if to_version is None else bisect_right(events, to_version, key=_version)
 
-        return events  # type: ignore[return-value]
+        return events[start:end]  # type: ignore[return-value]
 
     async def get_all_events(
         self,
@@ -193,6 +236,28 @@ class InMemoryEventStore[AggregateT: Aggregate[Any], EventT: SourcedEvent](Event
         """Get all events across all aggregates."""
         return self._all_events[from_position : from_position + limit]
 
+    async def stream_all(
+        self,
+        from_position: int = 0,
+        batch_size: int = 100,
+    ) -> AsyncIterator[EventT]:
+        """Iterate over all events after a global position without copying.
+
+        Yields control to the event loop after every ``batch_size`` events so
+        a long catch-up does not starve other tasks.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        position = from_position
+        while position < len(self._all_events):
+            yield self._all_events[position]
+            position += 1
+            if (position - from_position) % batch_size == 0:
+                await asyncio.sleep(0)
+
     async def save_snapshot(self, aggregate: AggregateT) -> None:
         """Save a snapshot of the aggregate state.
 
@@ -5,10 +5,12 @@
 
 Provides:
 - SQLModelRepository: Generic repository for SQLModel/FastAPI projects
+- OnConflict: Upsert policy for SQLModelRepository.create_many
 - SQLAlchemyUserRepository: Concrete user repository implementation
 """
 
 from infrastructure.db.repositories.sqlmodel_repository import (
+    OnConflict,
     SQLModelRepository,
 )
 from infrastructure.db.repositories.user_repository import (
@@ -16,6 +18,7 @@ from infrastructure.db.repositories.user_repository import (
 )
 
 __all__ = [
+    "OnConflict",
     # Concrete implementations
     "SQLAlchemyUserRepository",
     # Generic repository
@@ -11,11 +11,13 @@ Demonstrates:
 """
 
 import structlog
-from sqlalchemy import and_, false, select
+from sqlalchemy import ColumnElement, and_, false, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.base.patterns.pagination import CountMode, CursorPage, CursorPagination
 from domain.examples.item.entity import ItemExample, ItemExampleStatus, Money
 from infrastructure.db.models.examples import ItemExampleModel
+from infrastructure.db.repositories.pagination import apply_keyset, count_rows
 
 logger = structlog.get_logger(__name__)
 
@@ -151,6 +153,16 @@ class ItemExampleRepository:
             return True
         return False
 
+    def _list_conditions(self, category: str | None, status: str | None) -> list[ColumnElement[bool]]:
+        """Build list filters, always excluding soft-deleted items."""
+        conditions = [ItemExampleModel.is_deleted.is_(false())]
+
+        if category:
+            conditions.append(ItemExampleModel.category == category)
+        if status:
+            conditions.append(ItemExampleModel.status == status)
+        return conditions
+
     async def get_all(
         self,
         page: int = 1,
@@ -159,12 +171,7 @@ class ItemExampleRepository:
         status: str | None = None,
     ) -> list[ItemExample]:
         """Get all items with pagination and filtering."""
-        conditions = [ItemExampleModel.is_deleted.is_(false())]
-
-        if category:
-            conditions.append(ItemExampleModel.category == category)
-        if status:
-            conditions.append(ItemExampleModel.status == status)
+        conditions = self._list_conditions(category, status)
 
         stmt = (
             select(ItemExampleModel)
@@ -177,3 +184,52 @@ class ItemExampleRepository:
         result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [self._to_entity(m) for m in models]
+
+    async def get_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 20,
+        category: str | None = None,
+        status: str | None = None,
+        count: CountMode = CountMode.NONE,
+    ) -> CursorPage[ItemExample, str]:
+        """Get items newest first using keyset pagination on (created_at, id).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        pagination = CursorPagination[ItemExampleModel, str](cursor_fields=["created_at", "id"])
+        after = None
+        if cursor:
+            after = pagination.decode_keyset(cursor, sort_order="desc")
+            if after is None:
+                raise ValueError("Invalid pagination cursor")
+
+        base = select(ItemExampleModel).where(and_(*self._list_conditions(category, status)))
+        total = await count_rows(
+            self._session,
+            base,
+            mode=count,
+            table_name=ItemExampleModel.__tablename__,
+            filtered=bool(category or status),
+        )
+        stmt = apply_keyset(
+            base,
+            [ItemExampleModel.created_at, ItemExampleModel.id],
+            after=after,
+            descending=True,
+            limit=page_size,
+        )
+
+        result = await self._session.execute(stmt)
+        models = list(result.scalars().all())
+        has_more = len(models) > page_size
+        models = models[:page_size]
+
+        return CursorPage(
+            items=[self._to_entity(m) for m in models],
+            next_cursor=pagination.encode_keyset(models[-1], sort_order="desc") if has_more else None,
+            prev_cursor=None,
+            has_more=has_more,
+            total=total,
+        )
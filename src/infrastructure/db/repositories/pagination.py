@@ -0,0 +1,87 @@
+"""Keyset pagination and count helpers for SQLAlchemy repositories.
+
+Keyset (seek) pagination filters on the last seen ``(sort column, id)`` pair
+instead of using ``OFFSET``, so every page costs an index range scan no matter
+how deep it is.
+
+**Feature: python-api-base-2025-review**
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.base.patterns.pagination import CountMode
+
+
+def apply_keyset(
+    statement: Select[Any],
+    columns: Sequence[Any],
+    *,
+    after: Sequence[Any] | None,
+    descending: bool,
+    limit: int,
+) -> Select[Any]:
+    """Order a query by ``columns`` and seek past the ``after`` values.
+
+    Fetches ``limit + 1`` rows so callers can tell whether another page exists.
+    The key columns must be non-nullable and end with a unique column (the ID).
+
+    Args:
+        statement: Base SELECT with filters applied.
+        columns: Key columns, e.g. ``[Model.created_at, Model.id]``.
+        after: Key values of the last row of the previous page.
+        descending: Sort direction for every key column.
+        limit: Page size.
+
+    Returns:
+        Statement with keyset predicate, ordering and limit.
+    """
+    if after is not None:
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        bound = tuple_(*after) if len(after) > 1 else after[0]
+        statement = statement.where(key < bound if descending else key > bound)
+    order = [column.desc() if descending else column.asc() for column in columns]
+    return statement.order_by(*order).limit(limit + 1)
+
+
+async def count_rows(
+    session: AsyncSession,
+    statement: Select[Any],
+    *,
+    mode: CountMode,
+    table_name: str,
+    filtered: bool,
+) -> int | None:
+    """Count the rows a query would return according to ``mode``.
+
+    ``CountMode.ESTIMATED`` reads planner statistics on PostgreSQL for
+    unfiltered queries (which include soft-deleted rows) and falls back to an
+    exact count elsewhere or when the table has never been analyzed.
+
+    Args:
+        session: Session to run the count on.
+        statement: Filtered SELECT without ordering or limits.
+        mode: Counting strategy.
+        table_name: Table backing the query, used for estimates.
+        filtered: Whether caller-supplied filters are applied.
+
+    Returns:
+        Row count, or None for ``CountMode.NONE``.
+    """
+    if mode is CountMode.NONE:
+        return None
+
+    if mode is CountMode.ESTIMATED and not filtered and session.get_bind().dialect.name == "postgresql":
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": table_name},
+        )
+        estimate = result.scalar()
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    result = await session.execute(select(func.count()).select_from(statement.order_by(None).subquery()))
+    return result.scalar() or 0
@@ -6,16 +6,50 @@ Uses PEP 695 type parameter syntax (Python 3.12+) for cleaner generic definition
 **Validates: Requirements 1.1, 14.2**
 """
 
-from collections.abc import Sequence
+import asyncio
+from collections.abc import Hashable, Iterator, Sequence
+from enum import StrEnum
+from functools import lru_cache
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, ValidationError
-from sqlalchemy import false, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+from sqlalchemy import Select, delete, false, func, insert, inspect as sa_inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel
 
+from core.base.patterns.pagination import CountMode, CursorPage, CursorPagination
 from core.base.repository import IRepository
 from core.errors import ValidationError as AppValidationError
+from infrastructure.db.repositories.pagination import apply_keyset, count_rows
+from infrastructure.errors import DatabaseError
+
+
+class OnConflict(StrEnum):
+    """Conflict policy for bulk inserts (``INSERT ... ON CONFLICT``)."""
+
+    NOTHING = "nothing"
+    UPDATE = "update"
+
+
+# Dialects whose ``insert()`` construct supports ``on_conflict_do_*``.
+_UPSERT_INSERTS: dict[str, Any] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+@lru_cache(maxsize=128)
+def _row_adapter(model_class: type[SQLModel]) -> TypeAdapter[list[Any]]:
+    """Build a batch validator for the columns of a SQLModel table class.
+
+    Table models skip validation when constructed directly, so the fields are
+    mirrored onto a plain Pydantic model that validates a whole list of rows
+    (including ``default_factory`` values) in a single call.
+    """
+    fields: dict[str, Any] = {name: (field.annotation, field) for name, field in model_class.model_fields.items()}
+    row_model = create_model(f"{model_class.__name__}Row", **fields)
+    return TypeAdapter(list[row_model])  # type: ignore[valid-type]
 
 
 class SQLModelRepository[
@@ -41,19 +75,29 @@ class SQLModelRepository[
     # Subclasses MUST override this to enable filtering
     _allowed_filter_fields: ClassVar[set[str]] = set()
 
+    # Maximum number of IDs bound into a single ``IN (...)`` clause by the
+    # set-based bulk operations. Keeps statements below driver parameter limits.
+    _bulk_chunk_size: ClassVar[int] = 500
+
     def __init__(
         self,
         session: AsyncSession,
         model_class: type[T],
+        *,
+        count_session_factory: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         """Initialize SQLModel repository.
 
         Args:
             session: Async database session.
             model_class: SQLModel class for this repository.
+            count_session_factory: Optional factory for a second session. When
+                set, total counts run on their own session concurrently with
+                the page query instead of before it.
         """
         self._session = session
         self._model_class = model_class
+        self._count_session_factory = count_session_factory
 
     async def get_by_id(self, id: IdType) -> T | None:
         """Get entity by ID.
@@ -78,7 +122,8 @@ class SQLModelRepository[
         filters: dict[str, Any] | None = None,
         sort_by: str | None = None,
         sort_order: str = "asc",
-    ) -> tuple[Sequence[T], int]:
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[T], int | None]:
         """Get paginated list of entities.
 
         Args:
@@ -87,10 +132,97 @@ class SQLModelRepository[
             filters: Optional field filters.
             sort_by: Field to sort by.
             sort_order: Sort direction ('asc' or 'desc').
+            count: How to compute the total. ``CountMode.NONE`` skips it.
 
         Returns:
-            Tuple of (entities list, total count).
+            Tuple of (entities list, total count). The total is None when
+            ``count`` is ``CountMode.NONE``.
         """
+        base_query = self._filtered_query(filters)
+        page_query = base_query
+
+        # Apply sorting
+        if sort_by and hasattr(self._model_class, sort_by):
+            order_column = getattr(self._model_class, sort_by)
+            if sort_order.lower() == "desc":
+                order_column = order_column.desc()
+            page_query = page_query.order_by(order_column)
+
+        # Apply pagination
+        page_query = page_query.offset(skip).limit(limit)
+
+        entities, total = await self._fetch_with_total(page_query, base_query, count, bool(filters))
+        return entities, total
+
+    async def get_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+        *,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        count: CountMode = CountMode.NONE,
+    ) -> CursorPage[T, str]:
+        """Get a page of entities using keyset (cursor) pagination.
+
+        Pages are addressed by an opaque cursor holding the ``sort_by`` value
+        and ID of the last row returned, so deep pages cost the same as the
+        first one. The sort column should be non-nullable.
+
+        Args:
+            cursor: Cursor from a previous page's ``next_cursor``.
+            limit: Maximum items per page.
+            filters: Optional field filters.
+            sort_by: Field to sort by. Defaults to the ID.
+            sort_order: Sort direction ('asc' or 'desc').
+            count: How to compute ``CursorPage.total``. Skipped by default.
+
+        Returns:
+            CursorPage with items, the next-page cursor and optional total.
+            ``prev_cursor`` is not computed and is always None.
+
+        Raises:
+            AppValidationError: If the cursor is malformed or was built for a
+                different sort.
+        """
+        key_fields = ["id"]
+        if sort_by and sort_by != "id" and hasattr(self._model_class, sort_by):
+            key_fields = [sort_by, "id"]
+        pagination = CursorPagination[T, str](cursor_fields=key_fields, default_limit=limit)
+
+        after = None
+        if cursor:
+            after = pagination.decode_keyset(cursor, sort_order=sort_order)
+            if after is None:
+                raise AppValidationError(
+                    errors=[{"field": "cursor", "message": "Invalid or mismatched pagination cursor"}],
+                    message="Invalid pagination cursor",
+                )
+
+        base_query = self._filtered_query(filters)
+        page_query = apply_keyset(
+            base_query,
+            [getattr(self._model_class, field) for field in key_fields],
+            after=after,
+            descending=sort_order.lower() == "desc",
+            limit=limit,
+        )
+
+        entities, total = await self._fetch_with_total(page_query, base_query, count, bool(filters))
+        has_more = len(entities) > limit
+        items = entities[:limit]
+
+        return CursorPage(
+            items=items,
+            next_cursor=pagination.encode_keyset(items[-1], sort_order=sort_order) if has_more else None,
+            prev_cursor=None,
+            has_more=has_more,
+            total=total,
+        )
+
+    def _filtered_query(self, filters: dict[str, Any] | None) -> Select[Any]:
+        """Build the base SELECT excluding soft-deleted rows and applying filters."""
         # Base query excluding soft-deleted
         base_query = select(self._model_class)
         if hasattr(self._model_class, "is_deleted"):
@@ -112,25 +244,37 @@ class SQLModelRepository[
                 if hasattr(self._model_class, field):
                     base_query = base_query.where(getattr(self._model_class, field) == value)
 
-        # Count total
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total_result = await self._session.execute(count_query)
-        total = total_result.scalar() or 0
+        return base_query
 
-        # Apply sorting
-        if sort_by and hasattr(self._model_class, sort_by):
-            order_column = getattr(self._model_class, sort_by)
-            if sort_order.lower() == "desc":
-                order_column = order_column.desc()
-            base_query = base_query.order_by(order_column)
+    async def _fetch_with_total(
+        self,
+        page_query: Select[Any],
+        base_query: Select[Any],
+        mode: CountMode,
+        filtered: bool,
+    ) -> tuple[list[T], int | None]:
+        """Run the page query and the count, concurrently when possible."""
+        table_name = self._model_class.__tablename__  # type: ignore[attr-defined]
 
-        # Apply pagination
-        base_query = base_query.offset(skip).limit(limit)
+        async def fetch_page() -> list[T]:
+            result = await self._session.execute(page_query)
+            return list(result.scalars().all())
+
+        async def fetch_count(session: AsyncSession) -> int | None:
+            return await count_rows(session, base_query, mode=mode, table_name=table_name, filtered=filtered)
+
+        if mode is CountMode.NONE:
+            return await fetch_page(), None
 
-        # Execute
-        result = await self._session.execute(base_query)
-        entities = list(result.scalars().all())
+        if self._count_session_factory is None:
+            total = await fetch_count(self._session)
+            return await fetch_page(), total
 
+        async def fetch_count_isolated() -> int | None:
+            async with self._count_session_factory() as count_session:  # type: ignore[misc]
+                return await fetch_count(count_session)
+
+        entities, total = await asyncio.gather(fetch_page(), fetch_count_isolated())
         return entities, total
 
     async def create(self, data: CreateT) -> T:
@@ -190,8 +334,82 @@ class SQLModelRepository[
         await self._session.flush()
         return True
 
-    async def create_many(self, data: Sequence[CreateT]) -> Sequence[T]:
-        """Bulk create entities."""
+    async def create_many(
+        self,
+        data: Sequence[CreateT],
+        *,
+        chunk_size: int | None = None,
+        on_conflict: OnConflict | None = None,
+        conflict_columns: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+    ) -> Sequence[T]:
+        """Bulk create entities.
+
+        Rows are validated once per chunk and written with one multi-row
+        ``INSERT ... RETURNING`` per chunk, so created entities come back
+        without a refresh query per row. Dialects without ``INSERT ... RETURNING``
+        fall back to adding entities to the session and refreshing them.
+
+        Args:
+            data: DTOs with entity data.
+            chunk_size: Rows per INSERT statement. Defaults to ``_bulk_chunk_size``.
+            on_conflict: Optional upsert policy (PostgreSQL and SQLite only).
+            conflict_columns: Conflict target columns. Defaults to the primary key.
+            update_columns: Columns overwritten on conflict with ``OnConflict.UPDATE``.
+                Defaults to every column not in the conflict target.
+
+        Returns:
+            Created (or upserted) entities. With ``OnConflict.NOTHING``, rows that
+            hit a conflict are not returned.
+
+        Raises:
+            AppValidationError: If data validation fails.
+            DatabaseError: If ``on_conflict`` is not supported by the dialect or
+                the dialect cannot return inserted rows.
+        """
+        if not data:
+            return []
+
+        dialect = self._session.get_bind().dialect
+        if on_conflict is not None and dialect.name not in _UPSERT_INSERTS:
+            raise DatabaseError(
+                "ON CONFLICT upserts are not supported by this dialect",
+                details={"dialect": dialect.name},
+            )
+        if not getattr(dialect, "insert_returning", False):
+            if on_conflict is not None:
+                raise DatabaseError(
+                    "ON CONFLICT upserts require INSERT ... RETURNING support",
+                    details={"dialect": dialect.name},
+                )
+            return await self._create_many_per_row(data)
+
+        adapter = _row_adapter(self._model_class)
+        size = max(chunk_size or self._bulk_chunk_size, 1)
+        entities: list[T] = []
+
+        for start in range(0, len(data), size):
+            raw_rows = [item.model_dump() for item in data[start : start + size]]
+            try:
+                rows = adapter.dump_python(adapter.validate_python(raw_rows))
+            except ValidationError as e:
+                raise AppValidationError(
+                    errors=e.errors(include_url=False),
+                    message="Entity validation failed",
+                ) from e
+            self._drop_generated_columns(rows)
+
+            statement = self._build_insert(rows, dialect.name, on_conflict, conflict_columns, update_columns)
+            result = await self._session.execute(
+                statement.returning(self._model_class),
+                execution_options={"populate_existing": True},
+            )
+            entities.extend(result.scalars().all())
+
+        return entities
+
+    async def _create_many_per_row(self, data: Sequence[CreateT]) -> Sequence[T]:
+        """Create entities through the unit of work, refreshing each one."""
         entities = []
         for item in data:
             entity_data = item.model_dump()
@@ -205,6 +423,40 @@ class SQLModelRepository[
 
         return entities
 
+    def _drop_generated_columns(self, rows: list[dict[str, Any]]) -> None:
+        """Omit key/server-default columns left as None so the database generates them."""
+        table = self._model_class.__table__  # type: ignore[attr-defined]
+        for column in table.columns:
+            generated = column.primary_key or column.server_default is not None
+            if generated and column.key in rows[0] and all(row[column.key] is None for row in rows):
+                for row in rows:
+                    del row[column.key]
+
+    def _build_insert(
+        self,
+        rows: list[dict[str, Any]],
+        dialect_name: str,
+        on_conflict: OnConflict | None,
+        conflict_columns: Sequence[str] | None,
+        update_columns: Sequence[str] | None,
+    ) -> Any:
+        """Build a multi-row INSERT, optionally with an ON CONFLICT clause."""
+        if on_conflict is None:
+            return insert(self._model_class).values(rows)
+
+        statement = _UPSERT_INSERTS[dialect_name](self._model_class).values(rows)
+        mapper = sa_inspect(self._model_class)
+        target = list(conflict_columns or [column.key for column in mapper.primary_key])
+
+        if on_conflict is OnConflict.NOTHING:
+            return statement.on_conflict_do_nothing(index_elements=target)
+
+        columns = update_columns or [key for key in rows[0] if key not in target]
+        return statement.on_conflict_do_update(
+            index_elements=target,
+            set_={column: statement.excluded[column] for column in columns},
+        )
+
     async def exists(self, id: IdType) -> bool:
         """Check if entity exists."""
         entity = await self.get_by_id(id)
@@ -213,51 +465,89 @@ class SQLModelRepository[
     async def bulk_update(
         self,
         updates: Sequence[tuple[IdType, UpdateT]],
+        *,
+        set_based: bool = True,
     ) -> Sequence[T]:
         """Bulk update entities.
 
+        In set-based mode, updates for the same ID are merged in order and IDs
+        sharing an identical patch are written with one grouped
+        ``UPDATE ... WHERE id IN (...) RETURNING`` per chunk, so the number of
+        round trips depends on the number of distinct patches rather than the
+        number of rows. Dialects without ``UPDATE ... RETURNING`` fall back to
+        one chunked ``SELECT ... WHERE id IN (...)`` after the updates.
+
         Args:
             updates: Sequence of (id, update_data) tuples.
+            set_based: If False, load, update and refresh each row individually.
 
         Returns:
-            Sequence of updated entities.
+            Sequence of updated entities, in the order their IDs first appear.
 
         **Feature: python-api-base-2025-review**
         **Validates: Requirements 1.4**
         """
-        updated_entities: list[T] = []
+        if not set_based:
+            return await self._bulk_update_per_row(updates)
 
+        patches: dict[IdType, dict[str, Any]] = {}
         for entity_id, data in updates:
-            entity = await self.get_by_id(entity_id)
-            if entity is None:
+            patches.setdefault(entity_id, {}).update(self._build_patch(data))
+        if not patches:
+            return []
+
+        groups: dict[Hashable, tuple[dict[str, Any], list[IdType]]] = {}
+        for entity_id, patch in patches.items():
+            key = self._patch_key(patch, entity_id)
+            groups.setdefault(key, (patch, []))[1].append(entity_id)
+
+        use_returning = self._supports_update_returning()
+        found: dict[Any, T] = {}
+        pending_select: list[IdType] = []
+
+        for patch, ids in groups.values():
+            if not patch or not use_returning:
+                if patch:
+                    for chunk in self._chunked(ids):
+                        await self._session.execute(
+                            self._where_active(update(self._model_class), chunk).values(**patch)
+                        )
+                pending_select.extend(ids)
                 continue
 
-            update_data = data.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                if value is not None and hasattr(entity, field):
-                    setattr(entity, field, value)
-
-            self._session.add(entity)
-            updated_entities.append(entity)
-
-        await self._session.flush()
+            for chunk in self._chunked(ids):
+                statement = (
+                    self._where_active(update(self._model_class), chunk).values(**patch).returning(self._model_class)
+                )
+                result = await self._session.execute(statement)
+                for entity in result.scalars().all():
+                    found[entity.id] = entity
 
-        for entity in updated_entities:
-            await self._session.refresh(entity)
+        for chunk in self._chunked(pending_select):
+            statement = self._where_active(select(self._model_class), chunk).execution_options(populate_existing=True)
+            result = await self._session.execute(statement)
+            for entity in result.scalars().all():
+                found[entity.id] = entity
 
-        return updated_entities
+        return [found[entity_id] for entity_id in patches if entity_id in found]
 
     async def bulk_delete(
         self,
         ids: Sequence[IdType],
         *,
         soft: bool = True,
+        set_based: bool = True,
     ) -> int:
         """Bulk delete entities.
 
+        In set-based mode a single ``UPDATE ... SET is_deleted = true`` (soft)
+        or ``DELETE`` (hard) is issued per chunk of IDs, and the affected row
+        count is taken from the statement result.
+
         Args:
             ids: Sequence of entity IDs to delete.
             soft: If True, soft delete; otherwise hard delete.
+            set_based: If False, load and delete each row individually.
 
         Returns:
             Number of entities deleted.
@@ -265,6 +555,52 @@ class SQLModelRepository[
         **Feature: python-api-base-2025-review**
         **Validates: Requirements 1.4**
         """
+        if not set_based:
+            return await self._bulk_delete_per_row(ids, soft=soft)
+
+        unique_ids = list(dict.fromkeys(ids))
+        soft_delete = soft and hasattr(self._model_class, "is_deleted")
+        deleted_count = 0
+
+        for chunk in self._chunked(unique_ids):
+            if soft_delete:
+                statement = self._where_active(update(self._model_class), chunk).values(is_deleted=True)
+            else:
+                statement = self._where_active(delete(self._model_class), chunk)
+            result = await self._session.execute(statement)
+            deleted_count += max(result.rowcount or 0, 0)
+
+        return deleted_count
+
+    async def _bulk_update_per_row(
+        self,
+        updates: Sequence[tuple[IdType, UpdateT]],
+    ) -> Sequence[T]:
+        """Update entities one at a time (one SELECT and one refresh per row)."""
+        updated_entities: list[T] = []
+
+        for entity_id, data in updates:
+            entity = await self.get_by_id(entity_id)
+            if entity is None:
+                continue
+
+            update_data = data.model_dump(exclude_unset=True)
+            for field, value in update_data.items():
+                if value is not None and hasattr(entity, field):
+                    setattr(entity, field, value)
+
+            self._session.add(entity)
+            updated_entities.append(entity)
+
+        await self._session.flush()
+
+        for entity in updated_entities:
+            await self._session.refresh(entity)
+
+        return updated_entities
+
+    async def _bulk_delete_per_row(self, ids: Sequence[IdType], *, soft: bool) -> int:
+        """Delete entities one at a time (one SELECT per row)."""
         deleted_count = 0
 
         for entity_id in ids:
@@ -283,6 +619,45 @@ class SQLModelRepository[
         await self._session.flush()
         return deleted_count
 
+    def _build_patch(self, data: UpdateT) -> dict[str, Any]:
+        """Extract the column values an update DTO actually sets."""
+        return {
+            field: value
+            for field, value in data.model_dump(exclude_unset=True).items()
+            if value is not None and hasattr(self._model_class, field)
+        }
+
+    @staticmethod
+    def _patch_key(patch: dict[str, Any], entity_id: Any) -> Hashable:
+        """Build a grouping key for a patch; unhashable patches are not grouped."""
+        try:
+            key = tuple(sorted(patch.items()))
+            hash(key)
+        except TypeError:
+            return ("__ungrouped__", entity_id)
+        return key
+
+    def _chunked(self, ids: Sequence[IdType]) -> Iterator[Sequence[IdType]]:
+        """Split IDs into chunks of at most ``_bulk_chunk_size``."""
+        size = max(self._bulk_chunk_size, 1)
+        for start in range(0, len(ids), size):
+            yield ids[start : start + size]
+
+    def _where_active(self, statement: Any, ids: Sequence[IdType]) -> Any:
+        """Restrict a statement to the given IDs, excluding soft-deleted rows."""
+        statement = statement.where(self._model_class.id.in_(ids))
+        if hasattr(self._model_class, "is_deleted"):
+            statement = statement.where(self._model_class.is_deleted.is_(false()))
+        return statement
+
+    def _supports_update_returning(self) -> bool:
+        """Check whether the bound dialect supports ``UPDATE ... RETURNING``."""
+        try:
+            dialect = self._session.get_bind().dialect
+        except Exception:
+            return False
+        return bool(getattr(dialect, "update_returning", False))
+
     async def count(
         self,
         filters: dict[str, Any] | None = None,
@@ -7,18 +7,22 @@ Provides:
 - IdempotencyHandler: Core idempotency logic with Redis storage
 - IdempotencyMiddleware: FastAPI middleware for automatic handling
 - IdempotencyKeyConflictError: Error for key reuse with different body
+- IdempotencyRequestInProgressError: Error for a duplicate still running after the wait timeout
 """
 
 from infrastructure.idempotency.errors import (
     IdempotencyKeyConflictError,
     IdempotencyKeyMissingError,
+    IdempotencyRequestInProgressError,
 )
-from infrastructure.idempotency.handler import (
+from infrastructure.idempotency.handler import IdempotencyHandler
+from infrastructure.idempotency.middleware import IdempotencyMiddleware
+from infrastructure.idempotency.models import (
     IdempotencyConfig,
-    IdempotencyHandler,
     IdempotencyRecord,
+    Reservation,
+    ReservationStatus,
 )
-from infrastructure.idempotency.middleware import IdempotencyMiddleware
 
 __all__ = [
     "IdempotencyConfig",
@@ -27,4 +31,7 @@ __all__ = [
     "IdempotencyKeyMissingError",
     "IdempotencyMiddleware",
     "IdempotencyRecord",
+    "IdempotencyRequestInProgressError",
+    "Reservation",
+    "ReservationStatus",
 ]
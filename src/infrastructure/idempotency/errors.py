@@ -27,3 +27,15 @@ class IdempotencyKeyMissingError(Exception):
     def __init__(self, endpoint: str) -> None:
         self.endpoint = endpoint
         super().__init__(f"Idempotency-Key header is required for endpoint: {endpoint}")
+
+
+class IdempotencyRequestInProgressError(Exception):
+    """Raised when a request with the same key is still being processed.
+
+    **Feature: api-best-practices-review-2025**
+    **Validates: Requirements 23.3**
+    """
+
+    def __init__(self, idempotency_key: str) -> None:
+        self.idempotency_key = idempotency_key
+        super().__init__(f"A request with idempotency key '{idempotency_key}' is still in progress")
@@ -8,114 +8,37 @@ Implements:
 - Redis-based storage with configurable TTL (24-48 hours)
 - Request body hash comparison for conflict detection
 - Cached response return for duplicate requests
+- Atomic key reservation, with duplicates waiting for the first result
 """
 
+import asyncio
 import contextlib
-import hashlib
-import json
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import Any, Self
+import secrets
+from typing import Any
 
 import structlog
 
-from infrastructure.idempotency.errors import IdempotencyKeyConflictError
+from infrastructure.idempotency.errors import (
+    IdempotencyKeyConflictError,
+    IdempotencyRequestInProgressError,
+)
+from infrastructure.idempotency.models import (
+    HeaderList,
+    IdempotencyConfig,
+    IdempotencyRecord,
+    Reservation,
+    ReservationStatus,
+    compute_request_hash,
+)
 
 logger = structlog.get_logger(__name__)
 
-
-@dataclass(frozen=True, slots=True)
-class IdempotencyRecord:
-    """Record of an idempotent operation.
-
-    **Feature: api-best-practices-review-2025**
-    **Validates: Requirements 23.2**
-
-    Stores:
-    - Request hash for conflict detection
-    - Response body and status for replay
-    - Timestamps for TTL and debugging
-    """
-
-    idempotency_key: str
-    request_hash: str
-    response_body: str
-    status_code: int
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON storage."""
-        return {
-            "idempotency_key": self.idempotency_key,
-            "request_hash": self.request_hash,
-            "response_body": self.response_body,
-            "status_code": self.status_code,
-            "created_at": self.created_at.isoformat(),
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        """Create from dictionary."""
-        return cls(
-            idempotency_key=data["idempotency_key"],
-            request_hash=data["request_hash"],
-            response_body=data["response_body"],
-            status_code=data["status_code"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-        )
-
-
-@dataclass(slots=True)
-class IdempotencyConfig:
-    """Configuration for idempotency handling.
-
-    **Feature: api-best-practices-review-2025**
-    **Validates: Requirements 23.2**
-    """
-
-    # TTL for idempotency records (24-48 hours recommended)
-    ttl_hours: int = 24
-
-    # Redis key prefix
-    key_prefix: str = "idempotency"
-
-    # Header name for idempotency key
-    header_name: str = "Idempotency-Key"
-
-    # Endpoints that require idempotency key
-    required_endpoints: set[str] = field(default_factory=set)
-
-    # Response header for replayed requests
-    replay_header: str = "X-Idempotent-Replayed"
-
-
-def compute_request_hash(
-    method: str,
-    path: str,
-    body: bytes,
-    content_type: str | None = None,
-) -> str:
-    """Compute hash of request for comparison.
-
-    **Feature: api-best-practices-review-2025**
-    **Validates: Requirements 23.4**
-
-    Args:
-        method: HTTP method.
-        path: Request path.
-        body: Request body bytes.
-        content_type: Content-Type header.
-
-    Returns:
-        SHA-256 hash of request.
-    """
-    hasher = hashlib.sha256()
-    hasher.update(method.encode())
-    hasher.update(path.encode())
-    hasher.update(body)
-    if content_type:
-        hasher.update(content_type.encode())
-    return hasher.hexdigest()
+# Delete or overwrite a key only while it still holds the caller's reservation marker
+_RELEASE_SCRIPT = "if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) end return 0"
+_STORE_SCRIPT = (
+    "if redis.call('GET', KEYS[1]) == ARGV[1] then "
+    "redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3]) return 1 end return 0"
+)
 
 
 class IdempotencyHandler:
@@ -125,21 +48,15 @@ class IdempotencyHandler:
     **Validates: Requirements 23.1, 23.2, 23.3, 23.4**
 
     Ensures that POST/PATCH operations with the same Idempotency-Key
-    return the same response without re-executing the operation.
+    return the same response without re-executing the operation, even
+    when duplicates arrive while the first request is still running.
 
     Example:
-        >>> handler = IdempotencyHandler(redis_client)
-        >>> # Check if request is duplicate
-        >>> record = await handler.get_record(idempotency_key)
-        >>> if record:
-        ...     if record.request_hash != current_hash:
-        ...         raise IdempotencyKeyConflictError(idempotency_key)
-        ...     return record.response_body, record.status_code, True
-        >>> # Execute operation and store result
-        >>> response = await execute_operation()
-        >>> await handler.store_record(
-        ...     idempotency_key, request_hash, response.body, response.status_code
-        ... )
+        >>> handler = IdempotencyHandler(redis_url)
+        >>> reservation = await handler.reserve(idempotency_key, request_hash)
+        >>> if reservation.status is ReservationStatus.ACQUIRED:
+        ...     response = await execute_operation()
+        ...     await handler.store_record(idempotency_key, request_hash, response.body, response.status_code)
     """
 
     def __init__(
@@ -158,6 +75,8 @@ class IdempotencyHandler:
         self._redis: Any = None
         self._connected = False
         self._ttl_seconds = self._config.ttl_hours * 3600
+        # Key -> (request hash, result future, reservation marker)
+        self._in_flight: dict[str, tuple[str, asyncio.Future[IdempotencyRecord | None], bytes]] = {}
 
     async def connect(self) -> bool:
         """Connect to Redis.
@@ -184,11 +103,7 @@ class IdempotencyHandler:
         try:
             import redis.asyncio as redis
 
-            self._redis = redis.from_url(
-                self._redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            self._redis = redis.from_url(self._redis_url, decode_responses=False)
             await self._redis.ping()
             self._connected = True
             return self._redis
@@ -208,6 +123,125 @@ class IdempotencyHandler:
         """Create full Redis key."""
         return f"{self._config.key_prefix}:{idempotency_key}"
 
+    async def _load(self, client: Any, idempotency_key: str) -> Reservation | None:
+        """Read the state of a key, or None if it is free."""
+        data = await client.get(self._make_key(idempotency_key))
+        return None if data is None else Reservation.from_stored(data)
+
+    async def reserve(self, idempotency_key: str, request_hash: str) -> Reservation:
+        """Atomically reserve a key for executing a request.
+
+        **Feature: api-best-practices-review-2025**
+        **Validates: Requirements 23.3**
+
+        While a request with the same hash holds the key, waits for its
+        result instead of returning; requests in this process are awaited
+        directly, others are polled in Redis. An ACQUIRED reservation must
+        end with ``store_record()`` or ``release()``, or it expires after
+        ``lock_timeout_seconds``.
+
+        Args:
+            idempotency_key: The Idempotency-Key header value.
+            request_hash: Hash of the request for conflict detection.
+
+        Returns:
+            ACQUIRED, COMPLETED with the stored record, IN_PROGRESS if a
+            different request holds the key, or UNAVAILABLE.
+
+        Raises:
+            IdempotencyRequestInProgressError: If the duplicate still runs
+                after ``wait_timeout_seconds``.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._config.wait_timeout_seconds
+        while True:
+            reservation = await self._try_reserve(idempotency_key, request_hash)
+            if reservation.status is not ReservationStatus.IN_PROGRESS or reservation.request_hash != request_hash:
+                return reservation
+            record = await self._wait_for_record(idempotency_key, deadline - loop.time())
+            if record is not None:
+                return Reservation(ReservationStatus.COMPLETED, request_hash=record.request_hash, record=record)
+
+    async def _try_reserve(self, idempotency_key: str, request_hash: str) -> Reservation:
+        """Reserve a key with SET NX, or report who holds it."""
+        in_flight = self._in_flight.get(idempotency_key)
+        if in_flight is not None:
+            return Reservation(ReservationStatus.IN_PROGRESS, request_hash=in_flight[0])
+
+        client = await self._get_client()
+        if client is None:
+            return Reservation(ReservationStatus.UNAVAILABLE)
+
+        marker = Reservation.marker(request_hash, secrets.token_hex(16))
+        try:
+            while True:
+                if await client.set(
+                    self._make_key(idempotency_key), marker, nx=True, ex=self._config.lock_timeout_seconds
+                ):
+                    future = asyncio.get_running_loop().create_future()
+                    self._in_flight[idempotency_key] = (request_hash, future, marker)
+                    return Reservation(ReservationStatus.ACQUIRED, request_hash=request_hash)
+                reservation = await self._load(client, idempotency_key)
+                if reservation is not None:
+                    return reservation
+        except Exception:
+            logger.warning(
+                "Failed to reserve idempotency key",
+                key=idempotency_key,
+                operation="IDEMPOTENCY_RESERVE",
+            )
+            return Reservation(ReservationStatus.UNAVAILABLE)
+
+    async def _wait_for_record(self, idempotency_key: str, timeout: float) -> IdempotencyRecord | None:
+        """Wait for the holder of a key; None if it released the key."""
+        in_flight = self._in_flight.get(idempotency_key)
+        if in_flight is not None:
+            try:
+                return await asyncio.wait_for(asyncio.shield(in_flight[1]), max(timeout, 0))
+            except TimeoutError:
+                raise IdempotencyRequestInProgressError(idempotency_key) from None
+
+        client = await self._get_client()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while client is not None and loop.time() < deadline:
+            await asyncio.sleep(self._config.wait_interval_seconds)
+            reservation = await self._load(client, idempotency_key)
+            if reservation is None or reservation.status is ReservationStatus.COMPLETED:
+                return reservation.record if reservation else None
+        raise IdempotencyRequestInProgressError(idempotency_key)
+
+    async def release(self, idempotency_key: str) -> bool:
+        """End a reservation without storing a response.
+
+        Waiting duplicates wake up and may reserve the key again. The key
+        is only deleted while it still holds this reservation's marker, so
+        a reservation that expired and was taken by another request, or
+        replaced by a stored record, is left alone.
+
+        Returns:
+            True if this handler held the reservation.
+        """
+        in_flight = self._in_flight.pop(idempotency_key, None)
+        if in_flight is None:
+            return False
+        _, future, marker = in_flight
+        if not future.done():
+            future.set_result(None)
+
+        client = await self._get_client()
+        if client is None:
+            return True
+        try:
+            await client.eval(_RELEASE_SCRIPT, 1, self._make_key(idempotency_key), marker)
+        except Exception:
+            logger.warning(
+                "Failed to release idempotency key",
+                key=idempotency_key,
+                operation="IDEMPOTENCY_RELEASE",
+            )
+        return True
+
     async def get_record(self, idempotency_key: str) -> IdempotencyRecord | None:
         """Get existing idempotency record.
 
@@ -225,13 +259,8 @@ class IdempotencyHandler:
             return None
 
         try:
-            full_key = self._make_key(idempotency_key)
-            data = await client.get(full_key)
-
-            if data is None:
-                return None
-
-            return IdempotencyRecord.from_dict(json.loads(data))
+            reservation = await self._load(client, idempotency_key)
+            return reservation.record if reservation else None
         except Exception:
             logger.warning(
                 "Failed to get idempotency record",
@@ -244,41 +273,56 @@ class IdempotencyHandler:
         self,
         idempotency_key: str,
         request_hash: str,
-        response_body: str,
+        response_body: str | bytes,
         status_code: int,
+        headers: HeaderList = (),
     ) -> bool:
         """Store idempotency record.
 
         **Feature: api-best-practices-review-2025**
         **Validates: Requirements 23.2**
 
+        Ends a reservation held for the key and hands the record to
+        requests waiting in this process. If this handler reserved the key,
+        the record is only written while the key still holds its marker, so
+        a reservation that expired cannot overwrite the next holder's entry.
+
         Args:
             idempotency_key: The Idempotency-Key header value.
             request_hash: Hash of the request for conflict detection.
             response_body: Response body to store.
             status_code: HTTP status code.
+            headers: Response headers to replay.
 
         Returns:
             True if stored successfully.
         """
+        record = IdempotencyRecord(
+            idempotency_key=idempotency_key,
+            request_hash=request_hash,
+            response_body=response_body,
+            status_code=status_code,
+            headers=headers,
+        )
+        in_flight = self._in_flight.pop(idempotency_key, None)
+        if in_flight is not None and not in_flight[1].done():
+            in_flight[1].set_result(record)
+
         client = await self._get_client()
         if client is None:
             return False
 
         try:
-            record = IdempotencyRecord(
-                idempotency_key=idempotency_key,
-                request_hash=request_hash,
-                response_body=response_body,
-                status_code=status_code,
-            )
-
             full_key = self._make_key(idempotency_key)
-            await client.setex(
-                full_key,
-                self._ttl_seconds,
-                json.dumps(record.to_dict()),
-            )
+            if in_flight is None:
+                await client.setex(full_key, self._ttl_seconds, record.to_bytes())
+            elif not await client.eval(_STORE_SCRIPT, 1, full_key, in_flight[2], record.to_bytes(), self._ttl_seconds):
+                logger.warning(
+                    "Idempotency reservation lost before the record was stored",
+                    key=idempotency_key,
+                    operation="IDEMPOTENCY_STORE",
+                )
+                return False
 
             logger.debug(
                 "Stored idempotency record",
@@ -299,7 +343,7 @@ class IdempotencyHandler:
         idempotency_key: str,
         request_hash: str,
         operation: Any,
-    ) -> tuple[str, int, bool]:
+    ) -> tuple[str | bytes, int, bool]:
         """Execute operation with idempotency.
 
         **Feature: api-best-practices-review-2025**
@@ -315,37 +359,28 @@ class IdempotencyHandler:
 
         Raises:
             IdempotencyKeyConflictError: If key is reused with different body.
+            IdempotencyRequestInProgressError: If a duplicate is still running.
         """
-        # Check for existing record
-        record = await self.get_record(idempotency_key)
-
-        if record is not None:
-            # Check for conflict
-            if record.request_hash != request_hash:
-                logger.warning(
-                    "Idempotency key conflict",
-                    key=idempotency_key,
-                )
-                raise IdempotencyKeyConflictError(idempotency_key)
+        reservation = await self.reserve(idempotency_key, request_hash)
+        if reservation.request_hash not in (None, request_hash):
+            logger.warning("Idempotency key conflict", key=idempotency_key)
+            raise IdempotencyKeyConflictError(idempotency_key)
 
-            # Return cached response
+        if reservation.record is not None:
             logger.info(
                 "Replaying idempotent response",
                 key=idempotency_key,
-                status=record.status_code,
+                status=reservation.record.status_code,
             )
-            return record.response_body, record.status_code, True
+            return reservation.record.response_body, reservation.record.status_code, True
 
-        # Execute operation
-        response_body, status_code = await operation()
+        try:
+            response_body, status_code = await operation()
+        except BaseException:
+            await self.release(idempotency_key)
+            raise
 
-        # Store result
-        await self.store_record(
-            idempotency_key,
-            request_hash,
-            response_body,
-            status_code,
-        )
+        await self.store_record(idempotency_key, request_hash, response_body, status_code)
 
         return response_body, status_code, False
 
@@ -382,3 +417,12 @@ class IdempotencyHandler:
             await self._redis.close()
             self._redis = None
             self._connected = False
+
+
+# Re-exports for backward compatibility
+__all__ = [
+    "IdempotencyConfig",
+    "IdempotencyHandler",
+    "IdempotencyRecord",
+    "compute_request_hash",
+]
@@ -6,25 +6,24 @@
 Provides automatic idempotency handling for POST/PATCH requests.
 """
 
-from collections.abc import Callable
-from typing import Any
-
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from infrastructure.idempotency.errors import IdempotencyKeyConflictError
-from infrastructure.idempotency.handler import (
+from infrastructure.idempotency.errors import IdempotencyRequestInProgressError
+from infrastructure.idempotency.handler import IdempotencyHandler
+from infrastructure.idempotency.models import (
     IdempotencyConfig,
-    IdempotencyHandler,
+    IdempotencyRecord,
+    ReservationStatus,
     compute_request_hash,
 )
 
 logger = structlog.get_logger(__name__)
 
 
-class IdempotencyMiddleware(BaseHTTPMiddleware):
+class IdempotencyMiddleware:
     """FastAPI middleware for idempotent request handling.
 
     **Feature: api-best-practices-review-2025**
@@ -32,6 +31,7 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
 
     Automatically handles Idempotency-Key header for POST/PATCH requests:
     - Returns cached response for duplicate requests
+    - Makes duplicates of a running request wait for its response
     - Stores response for new requests
     - Rejects conflicting key reuse with 422
 
@@ -45,7 +45,7 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         handler: IdempotencyHandler | None = None,
         methods: set[str] | None = None,
         required_endpoints: set[str] | None = None,
@@ -66,7 +66,7 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
             If handler is None, the middleware will try to get it from
             app.state.idempotency_handler on each request.
         """
-        super().__init__(app)
+        self.app = app
         self._handler = handler
         self._methods = methods or {"POST", "PATCH", "PUT"}
         self._required_endpoints = required_endpoints or set()
@@ -114,61 +114,69 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
             status=400,
         )
 
-    async def _handle_cached_record(
-        self,
-        record: Any,
-        request_hash: str,
-        idempotency_key: str,
-        path: str,
-    ) -> Response | None:
-        """Handle existing idempotency record. Returns response or None if conflict."""
-        if record.request_hash != request_hash:
-            logger.warning(
-                "Idempotency key conflict",
-                key=idempotency_key,
-                path=path,
-            )
-            return self._create_conflict_response()
+    def _create_in_progress_response(self) -> JSONResponse:
+        """Create idempotency request in progress response."""
+        return self._create_error_response(
+            error_type="idempotency-in-progress",
+            title="Idempotency Request In Progress",
+            detail="A request with this idempotency key is still being processed",
+            status=409,
+        )
 
+    async def _replay_record(self, record: IdempotencyRecord, idempotency_key: str, send: Send) -> None:
+        """Send a stored response as it was originally sent."""
         logger.info(
             "Replaying idempotent response",
             key=idempotency_key,
             status=record.status_code,
         )
-        return Response(
-            content=record.response_body,
-            status_code=record.status_code,
-            headers={
-                self._config.replay_header: "true",
-                "Content-Type": "application/json",
-            },
-        )
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Any],
-    ) -> Response:
+        body = record.response_body
+        if isinstance(body, str):
+            body = body.encode()
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record.headers]
+        if not headers:
+            headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        headers.append((self._config.replay_header.lower().encode("latin-1"), b"true"))
+        await send({"type": "http.response.start", "status": record.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with idempotency handling.
 
+        The request body is read once to compute its hash and replayed to
+        the application. The key is reserved before the application runs;
+        duplicates arriving meanwhile wait for its response. Successful
+        responses are buffered, stored as bytes and then sent; other
+        responses stream through unchanged and release the key.
+
         **Feature: api-best-practices-review-2025**
         **Validates: Requirements 23.1, 23.5**
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
         if not self._should_handle(request):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         handler = self._get_handler(request)
         if handler is None:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         idempotency_key = request.headers.get(self._config.header_name)
 
         if idempotency_key is None:
             if self._is_required(request.url.path):
-                return self._create_key_missing_response()
-            return await call_next(request)
+                await self._create_key_missing_response()(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
 
         body = await request.body()
+        replay_receive = _replay_body(body, receive)
         request_hash = compute_request_hash(
             method=request.method,
             path=request.url.path,
@@ -177,52 +185,97 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         )
 
         try:
-            record = await handler.get_record(idempotency_key)
-
-            if record is not None:
-                return await self._handle_cached_record(record, request_hash, idempotency_key, request.url.path)
-
-            response = await call_next(request)
-            return await self._store_and_return_response(handler, idempotency_key, request_hash, response)
-
-        except IdempotencyKeyConflictError:
-            return self._create_conflict_response()
+            reservation = await handler.reserve(idempotency_key, request_hash)
+        except IdempotencyRequestInProgressError:
+            await self._create_in_progress_response()(scope, receive, send)
+            return
         except Exception:
             logger.exception(
                 "Idempotency handling failed",
                 path=request.url.path,
                 operation="IDEMPOTENCY_HANDLE",
             )
-            return await call_next(request)
+            await self.app(scope, replay_receive, send)
+            return
+
+        if reservation.status is ReservationStatus.UNAVAILABLE:
+            await self.app(scope, replay_receive, send)
+            return
+
+        if reservation.status is not ReservationStatus.ACQUIRED:
+            if reservation.record is not None and reservation.request_hash == request_hash:
+                await self._replay_record(reservation.record, idempotency_key, send)
+                return
+            logger.warning(
+                "Idempotency key conflict",
+                key=idempotency_key,
+                path=request.url.path,
+            )
+            await self._create_conflict_response()(scope, receive, send)
+            return
+
+        try:
+            await self.app(
+                scope,
+                replay_receive,
+                self._storing_send(handler, idempotency_key, request_hash, scope, receive, send),
+            )
+        finally:
+            # No-op once the response was stored; frees the key otherwise.
+            await handler.release(idempotency_key)
 
-    async def _store_and_return_response(
+    def _storing_send(
         self,
         handler: IdempotencyHandler,
         idempotency_key: str,
         request_hash: str,
-        response: Response,
-    ) -> Response:
-        """Store successful response and return it."""
-        if not (200 <= response.status_code < 300):
-            return response
-
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
-
-        await handler.store_record(
-            idempotency_key=idempotency_key,
-            request_hash=request_hash,
-            response_body=response_body.decode(),
-            status_code=response.status_code,
-        )
-
-        return Response(
-            content=response_body,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.media_type,
-        )
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> Send:
+        """Wrap send to store successful responses before they are sent."""
+        start_message: Message | None = None
+        passthrough = False
+        chunks: list[bytes] = []
+
+        async def send_and_store(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                if 200 <= message["status"] < 300:
+                    start_message = message
+                    return
+                passthrough = True
+            if passthrough or start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            response_body = b"".join(chunks)
+            try:
+                await handler.store_record(
+                    idempotency_key=idempotency_key,
+                    request_hash=request_hash,
+                    response_body=response_body,
+                    status_code=start_message["status"],
+                    headers=tuple(
+                        (name.decode("latin-1"), value.decode("latin-1"))
+                        for name, value in start_message.get("headers", [])
+                    ),
+                )
+            except Exception:
+                logger.exception(
+                    "Idempotency handling failed",
+                    path=scope["path"],
+                    operation="IDEMPOTENCY_HANDLE",
+                )
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": response_body})
+
+        return send_and_store
 
     def _should_handle(self, request: Request) -> bool:
         """Check if request should be handled for idempotency."""
@@ -236,3 +289,17 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
     def _is_required(self, path: str) -> bool:
         """Check if idempotency key is required for path."""
         return any(path.startswith(required_path) for required_path in self._required_endpoints)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Create a receive callable that yields an already-read body first."""
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
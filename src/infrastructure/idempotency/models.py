@@ -0,0 +1,199 @@
+"""Idempotency configuration, request hashing, records and key reservations.
+
+**Feature: api-best-practices-review-2025**
+**Validates: Requirements 23.2, 23.3**
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any, Self
+
+type HeaderList = tuple[tuple[str, str], ...]
+
+
+def compute_request_hash(
+    method: str,
+    path: str,
+    body: bytes,
+    content_type: str | None = None,
+) -> str:
+    """Compute hash of request for comparison.
+
+    **Feature: api-best-practices-review-2025**
+    **Validates: Requirements 23.4**
+
+    Args:
+        method: HTTP method.
+        path: Request path.
+        body: Request body bytes.
+        content_type: Content-Type header.
+
+    Returns:
+        SHA-256 hash of request.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(method.encode())
+    hasher.update(path.encode())
+    hasher.update(body)
+    if content_type:
+        hasher.update(content_type.encode())
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Record of an idempotent operation.
+
+    **Feature: api-best-practices-review-2025**
+    **Validates: Requirements 23.2**
+
+    Stores:
+    - Request hash for conflict detection
+    - Response body, status and headers for replay
+    - Timestamps for TTL and debugging
+
+    ``to_bytes()`` stores the body as raw bytes after a one-line JSON
+    header, so binary bodies are neither decoded nor escaped.
+    """
+
+    idempotency_key: str
+    request_hash: str
+    response_body: str | bytes
+    status_code: int
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    headers: HeaderList = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON storage."""
+        return {
+            "idempotency_key": self.idempotency_key,
+            "request_hash": self.request_hash,
+            "response_body": self.response_body,
+            "status_code": self.status_code,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create from dictionary."""
+        return cls(
+            idempotency_key=data["idempotency_key"],
+            request_hash=data["request_hash"],
+            response_body=data["response_body"],
+            status_code=data["status_code"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a JSON header line followed by the raw body."""
+        body = self.response_body
+        is_text = isinstance(body, str)
+        header = {
+            "idempotency_key": self.idempotency_key,
+            "request_hash": self.request_hash,
+            "status_code": self.status_code,
+            "created_at": self.created_at.isoformat(),
+            "headers": self.headers,
+            "text": is_text,
+        }
+        raw = body.encode() if isinstance(body, str) else body
+        return json.dumps(header).encode() + b"\n" + raw
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Deserialize from ``to_bytes()`` output or a ``to_dict()`` JSON document."""
+        line, _, body = data.partition(b"\n")
+        header = json.loads(line)
+        if "response_body" in header:
+            return cls.from_dict(header)
+        return cls(
+            idempotency_key=header["idempotency_key"],
+            request_hash=header["request_hash"],
+            response_body=body.decode() if header["text"] else body,
+            status_code=header["status_code"],
+            created_at=datetime.fromisoformat(header["created_at"]),
+            headers=tuple((name, value) for name, value in header["headers"]),
+        )
+
+
+@dataclass(slots=True)
+class IdempotencyConfig:
+    """Configuration for idempotency handling.
+
+    **Feature: api-best-practices-review-2025**
+    **Validates: Requirements 23.2**
+    """
+
+    # TTL for idempotency records (24-48 hours recommended)
+    ttl_hours: int = 24
+
+    # Redis key prefix
+    key_prefix: str = "idempotency"
+
+    # Header name for idempotency key
+    header_name: str = "Idempotency-Key"
+
+    # Endpoints that require idempotency key
+    required_endpoints: set[str] = field(default_factory=set)
+
+    # Response header for replayed requests
+    replay_header: str = "X-Idempotent-Replayed"
+
+    # Seconds a key stays reserved by a request that never completes
+    lock_timeout_seconds: int = 30
+
+    # Seconds a duplicate waits for the request holding the key
+    wait_timeout_seconds: float = 10.0
+
+    # Seconds between checks for a result from another process
+    wait_interval_seconds: float = 0.1
+
+
+class ReservationStatus(Enum):
+    """Outcome of reserving an idempotency key."""
+
+    ACQUIRED = "acquired"  # Caller executes the request
+    COMPLETED = "completed"  # A stored response exists
+    IN_PROGRESS = "in_progress"  # Another request holds the key
+    UNAVAILABLE = "unavailable"  # Storage unreachable
+
+
+@dataclass(frozen=True, slots=True)
+class Reservation:
+    """Result of ``IdempotencyHandler.reserve()``.
+
+    **Feature: api-best-practices-review-2025**
+    **Validates: Requirements 23.3**
+
+    Attributes:
+        status: Reservation outcome.
+        request_hash: Hash of the request holding or completing the key.
+        record: Stored response when status is COMPLETED.
+    """
+
+    status: ReservationStatus
+    request_hash: str | None = None
+    record: IdempotencyRecord | None = None
+
+    @staticmethod
+    def marker(request_hash: str, token: str) -> bytes:
+        """Value stored under a key while a request holds it.
+
+        ``token`` is unique per reservation, so the holder can tell its
+        own marker from one written after its reservation expired.
+        """
+        return json.dumps(
+            {"state": ReservationStatus.IN_PROGRESS.value, "request_hash": request_hash, "token": token}
+        ).encode()
+
+    @classmethod
+    def from_stored(cls, data: bytes) -> Self:
+        """Read the value stored under a key: a marker or a record."""
+        header = json.loads(data.partition(b"\n")[0])
+        if header.get("state") == ReservationStatus.IN_PROGRESS.value:
+            return cls(ReservationStatus.IN_PROGRESS, request_hash=header["request_hash"])
+        record = IdempotencyRecord.from_bytes(data)
+        return cls(ReservationStatus.COMPLETED, request_hash=record.request_hash, record=record)
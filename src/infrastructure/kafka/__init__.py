@@ -8,7 +8,13 @@ Provides type-safe Kafka producer and consumer with PEP 695 generics.
 **Requirement: R3.1 - Transactional Producer with Exactly-Once Semantics**
 """
 
-from infrastructure.kafka.config import KafkaConfig
+from infrastructure.kafka.batching import (
+    BatchPublisher,
+    BatchPublishStats,
+    BatchReport,
+    serialize_payloads,
+)
+from infrastructure.kafka.config import KafkaConfig, ProducerProfile, select_compression
 from infrastructure.kafka.consumer import KafkaConsumer
 from infrastructure.kafka.event_publisher import (
     DomainEvent,
@@ -29,8 +35,23 @@ from infrastructure.kafka.producer import (
     TransactionResult,
     TransactionState,
 )
+from infrastructure.kafka.runtime import (
+    ConsumerRuntime,
+    ConsumerRuntimeConfig,
+    ConsumerRuntimeStats,
+    LaneStrategy,
+    OffsetTracker,
+)
 
 __all__ = [
+    # Batching
+    "BatchPublishStats",
+    "BatchPublisher",
+    "BatchReport",
+    # Consumer runtime
+    "ConsumerRuntime",
+    "ConsumerRuntimeConfig",
+    "ConsumerRuntimeStats",
     # Event Publisher
     "DomainEvent",
     "EventPublisher",
@@ -46,12 +67,17 @@ __all__ = [
     "KafkaMessage",
     # Producer
     "KafkaProducer",
+    "LaneStrategy",
     "MessageMetadata",
     "NoOpEventPublisher",
+    "OffsetTracker",
+    "ProducerProfile",
     "TransactionContext",
     "TransactionError",
     "TransactionResult",
     "TransactionState",
     "TransactionalKafkaProducer",
     "create_event_publisher",
+    "select_compression",
+    "serialize_payloads",
 ]
@@ -6,8 +6,50 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from typing import Any, Self
+
+
+class ProducerProfile(StrEnum):
+    """Producer linger, batch size and compression presets.
+
+    - LATENCY: send immediately in small uncompressed batches
+    - BALANCED: short linger, 64 KiB batches, fast compression
+    - THROUGHPUT: longer linger, 256 KiB batches, densest compression
+    """
+
+    LATENCY = "latency"
+    BALANCED = "balanced"
+    THROUGHPUT = "throughput"
+
+
+# linger_ms, max_batch_size and compression codecs in order of preference
+_PROFILES: dict[ProducerProfile, tuple[int, int, tuple[str, ...]]] = {
+    ProducerProfile.LATENCY: (0, 16384, ("none",)),
+    ProducerProfile.BALANCED: (5, 65536, ("lz4", "snappy", "gzip")),
+    ProducerProfile.THROUGHPUT: (20, 262144, ("zstd", "lz4", "gzip")),
+}
+
+
+def select_compression(*codecs: str) -> str:
+    """Get the first codec whose library is installed, or "none".
+
+    Args:
+        *codecs: Codec names (gzip, snappy, lz4, zstd) in order of preference
+    """
+    from aiokafka import codec
+
+    available = {
+        "gzip": codec.has_gzip,
+        "snappy": codec.has_snappy,
+        "lz4": codec.has_lz4,
+        "zstd": codec.has_zstd,
+    }
+    for name in codecs:
+        if name == "none" or (name in available and available[name]()):
+            return name
+    return "none"
 
 
 @dataclass(slots=True)
@@ -46,6 +88,25 @@ class KafkaConfig:
     linger_ms: int = 0
     compression_type: str = "none"
 
+    def with_profile(self, profile: ProducerProfile | str) -> Self:
+        """Copy with the linger, batch size and compression of a profile.
+
+        Compression is the profile's preferred codec among those installed.
+
+        Args:
+            profile: Producer profile
+
+        Returns:
+            New configuration
+        """
+        linger_ms, max_batch_size, codecs = _PROFILES[ProducerProfile(profile)]
+        return replace(
+            self,
+            linger_ms=linger_ms,
+            max_batch_size=max_batch_size,
+            compression_type=select_compression(*codecs),
+        )
+
     def to_producer_config(self) -> dict[str, Any]:
         """Convert to aiokafka producer config.
 
@@ -58,7 +119,8 @@ class KafkaConfig:
             "request_timeout_ms": self.request_timeout_ms,
             "max_batch_size": self.max_batch_size,
             "linger_ms": self.linger_ms,
-            "compression_type": self.compression_type,
+            # aiokafka expects None rather than "none" for no compression
+            "compression_type": None if self.compression_type == "none" else self.compression_type,
         }
 
         self._add_security_config(config)
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any, Self, TypeVar
 import structlog
 
 from infrastructure.kafka.message import KafkaMessage, MessageMetadata
+from infrastructure.kafka.runtime import ConsumerRuntime
 
 if TYPE_CHECKING:
     import asyncio
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer, ConsumerRecord
 
     from infrastructure.kafka.config import KafkaConfig
+    from infrastructure.kafka.runtime import BatchHandler, ConsumerRuntimeConfig, ConsumerRuntimeStats
 
 logger = structlog.get_logger(__name__)
 
@@ -66,6 +68,8 @@ class KafkaConsumer[T]:
         self._consumer: AIOKafkaConsumer | None = None
         self._started = False
         self._handlers: list[MessageHandler[T]] = []
+        self._batch_handlers: list[BatchHandler[T]] = []
+        self._runtime: ConsumerRuntime[T] | None = None
 
     @property
     def topics(self) -> list[str]:
@@ -230,31 +234,47 @@ class KafkaConsumer[T]:
         """
         self._handlers.append(handler)
 
-    async def run(self, stop_event: asyncio.Event | None = None) -> None:
+    def add_batch_handler(self, handler: BatchHandler[T]) -> None:
+        """Add a handler called with batches of messages.
+
+        Args:
+            handler: Async function to handle a list of messages
+        """
+        self._batch_handlers.append(handler)
+
+    async def run(
+        self,
+        stop_event: asyncio.Event | None = None,
+        runtime_config: ConsumerRuntimeConfig | None = None,
+    ) -> None:
         """Run the consumer loop with registered handlers.
 
+        Records are handled concurrently by a ``ConsumerRuntime``, in order
+        per partition or per key. With ``enable_auto_commit`` disabled the
+        runtime commits offsets once their records are handled.
+
         Args:
             stop_event: Optional event to signal stop
+            runtime_config: Concurrency, batching and backpressure settings
         """
-        if not self._handlers:
+        if not self._handlers and not self._batch_handlers:
             raise RuntimeError("No handlers registered")
+        if not self._consumer or not self._started:
+            raise RuntimeError("Consumer not started")
 
-        logger.info("Starting consumer loop")
-
-        async for message in self:
-            if stop_event and stop_event.is_set():
-                break
+        self._runtime = ConsumerRuntime(
+            self._consumer,
+            self._deserialize_record,
+            self._handlers,
+            self._batch_handlers,
+            runtime_config,
+            commit_offsets=not self._config.enable_auto_commit,
+        )
+        await self._runtime.run(stop_event)
 
-            for handler in self._handlers:
-                try:
-                    await handler(message)
-                except Exception:
-                    logger.exception(
-                        "Handler error",
-                        topic=message.metadata.topic if message.metadata else None,
-                        offset=message.metadata.offset if message.metadata else None,
-                        operation="KAFKA_HANDLE",
-                    )
+    def get_runtime_stats(self) -> ConsumerRuntimeStats | None:
+        """Get counters of the consumer loop, or None if it never ran."""
+        return self._runtime.get_stats() if self._runtime else None
 
     async def commit(self) -> None:
         """Manually commit offsets."""
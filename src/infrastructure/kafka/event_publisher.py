@@ -102,6 +102,16 @@ class EventPublisher(ABC):
         """
         ...
 
+    async def publish_batch(self, events: list[DomainEvent[Any]], topic: str) -> None:
+        """Publish domain events to specified topic.
+
+        Args:
+            events: Domain events to publish
+            topic: Target topic name
+        """
+        for event in events:
+            await self.publish(event, topic)
+
 
 class KafkaEventPublisher(EventPublisher):
     """Kafka implementation of event publisher.
@@ -139,12 +149,7 @@ class KafkaEventPublisher(EventPublisher):
             await self._producer.send(
                 payload=event.payload,
                 key=event.entity_id,
-                headers={
-                    "event_type": event.event_type,
-                    "entity_type": event.entity_type,
-                    "timestamp": event.timestamp.isoformat(),
-                    "correlation_id": event.correlation_id or "",
-                },
+                headers=self._headers(event),
                 topic=topic,
             )
             logger.info(
@@ -163,6 +168,45 @@ class KafkaEventPublisher(EventPublisher):
                 operation="KAFKA_PUBLISH",
             )
 
+    async def publish_batch(self, events: list[DomainEvent[Any]], topic: str) -> None:
+        """Publish domain events to Kafka topic in one producer batch.
+
+        Same fire-and-forget semantics as ``publish``.
+        """
+        if self._producer is None or not events:
+            return
+
+        try:
+            await self._producer.send_batch(
+                [event.payload for event in events],
+                topic=topic,
+                keys=[event.entity_id for event in events],
+                headers=[self._headers(event) for event in events],
+            )
+            logger.info(
+                "Events published",
+                topic=topic,
+                event_count=len(events),
+                operation="KAFKA_PUBLISH",
+            )
+        except Exception:
+            logger.exception(
+                "Failed to publish events",
+                topic=topic,
+                event_count=len(events),
+                operation="KAFKA_PUBLISH",
+            )
+
+    @staticmethod
+    def _headers(event: DomainEvent[Any]) -> dict[str, str]:
+        """Kafka headers describing a domain event."""
+        return {
+            "event_type": event.event_type,
+            "entity_type": event.entity_type,
+            "timestamp": event.timestamp.isoformat(),
+            "correlation_id": event.correlation_id or "",
+        }
+
 
 class NoOpEventPublisher(EventPublisher):
     """No-op event publisher for when Kafka is disabled.
@@ -173,6 +217,9 @@ class NoOpEventPublisher(EventPublisher):
     async def publish(self, event: DomainEvent[Any], topic: str) -> None:
         """Do nothing - Kafka is disabled."""
 
+    async def publish_batch(self, events: list[DomainEvent[Any]], topic: str) -> None:
+        """Do nothing - Kafka is disabled."""
+
 
 # =============================================================================
 # Factory Function
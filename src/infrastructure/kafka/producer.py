@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Self, TypeVar
 
 import structlog
 
+from infrastructure.kafka.batching import BatchPublisher, BatchPublishStats
 from infrastructure.kafka.message import KafkaMessage, MessageMetadata
 
 # Re-export transactional components for backward compatibility
@@ -23,7 +24,7 @@ from infrastructure.kafka.transaction import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from aiokafka import AIOKafkaProducer
 
@@ -68,6 +69,7 @@ class KafkaProducer[T]:
         self._payload_class = payload_class
         self._producer: AIOKafkaProducer | None = None
         self._started = False
+        self._publisher: BatchPublisher | None = None
 
     @property
     def topic(self) -> str:
@@ -104,6 +106,7 @@ class KafkaProducer[T]:
         if self._producer and self._started:
             await self._producer.stop()
             self._producer = None
+            self._publisher = None
             self._started = False
             logger.info("Kafka producer stopped")
 
@@ -181,55 +184,51 @@ class KafkaProducer[T]:
         payloads: list[T],
         key_func: Callable[[T], str | None] | None = None,
         topic: str | None = None,
+        keys: Sequence[str | None] | None = None,
+        headers: Sequence[dict[str, str] | None] | None = None,
     ) -> list[MessageMetadata]:
         """Send multiple messages in a batch.
 
+        Payloads are serialized together and sent as per-partition record
+        batches; see ``BatchPublisher``.
+
         Args:
             payloads: List of message payloads
             key_func: Function to extract key from payload
             topic: Topic to send to
+            keys: Key per payload, instead of key_func
+            headers: Headers per payload
 
         Returns:
-            List of message metadata
+            List of message metadata, in payload order
         """
         if not self._producer or not self._started:
             raise RuntimeError("Producer not started")
 
         target_topic = topic or self._topic
-        futures = []
-
-        for payload in payloads:
-            key = key_func(payload) if key_func else None
-            message = KafkaMessage[T](payload=payload, key=key)
-
-            future = await self._producer.send(
-                topic=target_topic,
-                value=message.serialize(),
-                key=message.serialize_key(),
-            )
-            futures.append((future, message))
-
-        results = []
-        for future, message in futures:
-            result = await future
-            metadata = MessageMetadata(
-                topic=result.topic,
-                partition=result.partition,
-                offset=result.offset,
-                timestamp=message.timestamp,
-                key=message.key,
-            )
-            results.append(metadata)
+        if keys is None and key_func:
+            keys = [key_func(payload) for payload in payloads]
+        if self._publisher is None:
+            self._publisher = BatchPublisher(self._producer)
+
+        results, report = await self._publisher.publish(target_topic, payloads, keys, headers)
 
         logger.info(
             "Batch sent",
             operation="KAFKA_BATCH_SEND",
-            message_count=len(results),
+            message_count=report.messages,
             topic=target_topic,
+            bytes=report.bytes,
+            record_batches=report.record_batches,
+            latency_ms=round(report.latency_seconds * 1000, 2),
         )
 
         return results
 
+    def get_batch_stats(self) -> BatchPublishStats:
+        """Get batch publishing counters since the producer started."""
+        return self._publisher.get_stats() if self._publisher else BatchPublishStats()
+
     async def flush(self) -> None:
         """Flush pending messages."""
         if self._producer:
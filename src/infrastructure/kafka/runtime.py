@@ -0,0 +1,381 @@
+"""Partition-parallel Kafka consumer runtime.
+
+Records fetched with ``getmany`` are dispatched to a fixed number of worker
+lanes. A record's lane is chosen by its partition or, with
+``LaneStrategy.KEY``, by a hash of its key, and each lane handles its
+records one batch at a time, so records of one partition (or one key) are
+handled in order while other lanes run concurrently.
+
+Completed offsets are tracked per partition and only the contiguous prefix
+of completed records is committed, in batches every
+``commit_interval_seconds``. A partition with too many records in flight
+is paused and resumed once its lanes have caught up.
+
+**Feature: observability-infrastructure**
+**Requirement: R3.3 - Generic Consumer**
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import zlib
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
+
+    from infrastructure.kafka.consumer import MessageHandler
+    from infrastructure.kafka.message import KafkaMessage
+
+logger = structlog.get_logger(__name__)
+
+# Batch handler type
+type BatchHandler[T] = Callable[[list[KafkaMessage[T]]], Awaitable[None]]
+
+# Lane item: partition, offset and the message (None if it failed to deserialize)
+type _LaneItem = tuple[TopicPartition, int, Any]
+
+
+class LaneStrategy(StrEnum):
+    """How records are assigned to worker lanes."""
+
+    PARTITION = "partition"
+    KEY = "key"
+
+
+@dataclass(frozen=True, slots=True)
+class ConsumerRuntimeConfig:
+    """Configuration for the consumer runtime.
+
+    Attributes:
+        lanes: Number of worker lanes handling records concurrently.
+        lane_strategy: Whether lanes are chosen by partition or by key hash.
+        max_batch_size: Most queued records a lane handles in one batch.
+        max_poll_records: Most records fetched by one poll.
+        poll_timeout_ms: Poll timeout in milliseconds.
+        max_in_flight_per_partition: Records of one partition in flight
+            before it is paused; it is resumed at half this number.
+        commit_interval_seconds: Interval between offset commits.
+    """
+
+    lanes: int = 8
+    lane_strategy: LaneStrategy = LaneStrategy.PARTITION
+    max_batch_size: int = 100
+    max_poll_records: int = 500
+    poll_timeout_ms: int = 500
+    max_in_flight_per_partition: int = 1000
+    commit_interval_seconds: float = 1.0
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if self.lanes < 1:
+            raise ValueError("lanes must be at least 1")
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if self.max_in_flight_per_partition < 1:
+            raise ValueError("max_in_flight_per_partition must be at least 1")
+
+
+@dataclass(slots=True)
+class ConsumerRuntimeStats:
+    """Consumer runtime counters.
+
+    Attributes:
+        in_flight: Records dispatched and not yet completed.
+        paused_partitions: Partitions paused for backpressure.
+        lag: Records between the committable position and the high
+            watermark, summed over assigned partitions.
+        processed: Records completed.
+        failed: Records a handler raised for or that failed to deserialize.
+        handler_calls: Handler invocations.
+        handler_latency_avg: Mean handler call duration in seconds.
+        handler_latency_max: Longest handler call duration in seconds.
+        commits: Offset commits sent.
+    """
+
+    in_flight: int = 0
+    paused_partitions: int = 0
+    lag: int = 0
+    processed: int = 0
+    failed: int = 0
+    handler_calls: int = 0
+    handler_latency_avg: float = 0.0
+    handler_latency_max: float = 0.0
+    commits: int = 0
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert to dictionary for export."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class _PartitionOffsets:
+    """Dispatched and completed offsets of one partition."""
+
+    position: int
+    pending: deque[int] = field(default_factory=deque)
+    done: set[int] = field(default_factory=set)
+    dirty: bool = False
+
+
+class OffsetTracker:
+    """Tracks the contiguous completed offset prefix of each partition.
+
+    Offsets are registered in fetch order when dispatched and may complete
+    in any order. The committable position of a partition is its first
+    incomplete offset, or one past the last completed one; gaps between
+    fetched offsets (compacted topics, transaction markers) are skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize offset tracker."""
+        self._partitions: dict[TopicPartition, _PartitionOffsets] = {}
+
+    def dispatched(self, tp: TopicPartition, offset: int) -> None:
+        """Register a fetched offset."""
+        state = self._partitions.get(tp)
+        if state is None:
+            state = self._partitions[tp] = _PartitionOffsets(offset)
+        state.pending.append(offset)
+
+    def completed(self, tp: TopicPartition, offset: int) -> None:
+        """Mark an offset done and advance the position past the done prefix."""
+        state = self._partitions.get(tp)
+        if state is None:
+            return
+        state.done.add(offset)
+        pending = state.pending
+        while pending and pending[0] in state.done:
+            state.done.discard(head := pending.popleft())
+            state.position = head + 1
+            state.dirty = True
+
+    def position(self, tp: TopicPartition) -> int | None:
+        """Committable position of a partition, or None if it is not tracked."""
+        state = self._partitions.get(tp)
+        return state.position if state else None
+
+    def partitions(self) -> list[TopicPartition]:
+        """Partitions with tracked offsets."""
+        return list(self._partitions)
+
+    def take_commits(self) -> dict[TopicPartition, int]:
+        """Positions that advanced since the last call."""
+        commits: dict[TopicPartition, int] = {}
+        for tp, state in self._partitions.items():
+            if state.dirty:
+                commits[tp] = state.position
+                state.dirty = False
+        return commits
+
+    def forget(self, partitions: set[TopicPartition]) -> None:
+        """Drop the state of partitions no longer assigned."""
+        for tp in partitions:
+            self._partitions.pop(tp, None)
+
+
+class ConsumerRuntime[T]:
+    """Runs message handlers for a consumer with bounded concurrency.
+
+    Per-message handlers run for every record in lane order; batch
+    handlers run once per lane batch with all its messages. Handler errors
+    are logged and the record still completes, as in the sequential loop.
+    Offsets are only committed when ``commit_offsets`` is set, which
+    requires a consumer created with ``enable_auto_commit=False``.
+
+    Example:
+        >>> runtime = ConsumerRuntime(aiokafka_consumer, deserialize, [handle])
+        >>> await runtime.run(stop_event)
+    """
+
+    def __init__(
+        self,
+        consumer: AIOKafkaConsumer,
+        deserialize: Callable[[ConsumerRecord], KafkaMessage[T]],
+        handlers: Sequence[MessageHandler[T]] = (),
+        batch_handlers: Sequence[BatchHandler[T]] = (),
+        config: ConsumerRuntimeConfig | None = None,
+        commit_offsets: bool = True,
+    ) -> None:
+        """Initialize consumer runtime.
+
+        Args:
+            consumer: Started aiokafka consumer
+            deserialize: Converts a record to a message
+            handlers: Handlers called with each message
+            batch_handlers: Handlers called with each lane batch
+            config: Runtime configuration
+            commit_offsets: Whether to commit completed offsets
+        """
+        self._consumer = consumer
+        self._deserialize = deserialize
+        self._handlers = list(handlers)
+        self._batch_handlers = list(batch_handlers)
+        self._config = config or ConsumerRuntimeConfig()
+        self._commit_offsets = commit_offsets
+        self._offsets = OffsetTracker()
+        self._lanes: list[asyncio.Queue[_LaneItem]] = []
+        self._partition_in_flight: dict[TopicPartition, int] = {}
+        self._paused: set[TopicPartition] = set()
+        self._stats = ConsumerRuntimeStats()
+        self._handler_seconds = 0.0
+
+    def get_stats(self) -> ConsumerRuntimeStats:
+        """Get a snapshot of runtime counters."""
+        stats = self._stats
+        stats.in_flight = sum(self._partition_in_flight.values())
+        stats.paused_partitions = len(self._paused)
+        stats.handler_latency_avg = self._handler_seconds / stats.handler_calls if stats.handler_calls else 0.0
+        stats.lag = 0
+        for tp in self._offsets.partitions():
+            highwater = self._consumer.highwater(tp)
+            position = self._offsets.position(tp)
+            if highwater is not None and position is not None:
+                stats.lag += max(highwater - position, 0)
+        return ConsumerRuntimeStats(**stats.to_dict())  # type: ignore[arg-type]
+
+    async def run(self, stop_event: asyncio.Event | None = None) -> None:
+        """Poll, dispatch and commit until ``stop_event`` is set.
+
+        On stop, records already dispatched are handled and their offsets
+        committed before returning.
+        """
+        if not self._handlers and not self._batch_handlers:
+            raise RuntimeError("No handlers registered")
+
+        self._lanes = [asyncio.Queue() for _ in range(self._config.lanes)]
+        workers = [asyncio.create_task(self._work(lane), name=f"kafka_lane_{i}") for i, lane in enumerate(self._lanes)]
+        last_commit = time.monotonic()
+        logger.info("Starting consumer runtime", lanes=self._config.lanes, strategy=self._config.lane_strategy)
+        try:
+            while not (stop_event and stop_event.is_set()):
+                records = await self._consumer.getmany(
+                    timeout_ms=self._config.poll_timeout_ms,
+                    max_records=self._config.max_poll_records,
+                )
+                for tp, partition_records in records.items():
+                    for record in partition_records:
+                        self._dispatch(tp, record)
+                if time.monotonic() - last_commit >= self._config.commit_interval_seconds:
+                    await self.commit()
+                    last_commit = time.monotonic()
+            await asyncio.gather(*(lane.join() for lane in self._lanes))
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            with contextlib.suppress(Exception):
+                await self.commit()
+
+    async def commit(self) -> None:
+        """Commit the contiguous completed offsets of assigned partitions."""
+        offsets = self._offsets.take_commits()
+        assigned = self._consumer.assignment()
+        self._offsets.forget(set(self._offsets.partitions()) - assigned)
+        offsets = {tp: position for tp, position in offsets.items() if tp in assigned}
+        if not offsets or not self._commit_offsets:
+            return
+        try:
+            await self._consumer.commit(offsets)
+            self._stats.commits += 1
+        except Exception:
+            logger.warning("Offset commit failed", partitions=len(offsets), operation="KAFKA_COMMIT", exc_info=True)
+
+    def _dispatch(self, tp: TopicPartition, record: ConsumerRecord) -> None:
+        """Queue a record on its lane, pausing its partition when saturated."""
+        self._offsets.dispatched(tp, record.offset)
+        count = self._partition_in_flight.get(tp, 0) + 1
+        self._partition_in_flight[tp] = count
+        if count >= self._config.max_in_flight_per_partition and tp not in self._paused:
+            self._consumer.pause(tp)
+            self._paused.add(tp)
+
+        try:
+            message = self._deserialize(record)
+        except Exception:
+            self._stats.failed += 1
+            message = None
+            logger.exception(
+                "Failed to deserialize message",
+                topic=record.topic,
+                partition=record.partition,
+                offset=record.offset,
+                operation="KAFKA_DESERIALIZE",
+            )
+        self._lane_for(tp, record.key).put_nowait((tp, record.offset, message))
+
+    def _lane_for(self, tp: TopicPartition, key: bytes | None) -> asyncio.Queue[_LaneItem]:
+        """Lane of a record."""
+        if self._config.lane_strategy is LaneStrategy.KEY and key is not None:
+            index = zlib.crc32(key)
+        else:
+            index = zlib.crc32(tp.topic.encode()) + tp.partition
+        return self._lanes[index % len(self._lanes)]
+
+    async def _work(self, lane: asyncio.Queue[_LaneItem]) -> None:
+        """Handle queued records of a lane one batch at a time."""
+        while True:
+            batch = [await lane.get()]
+            while len(batch) < self._config.max_batch_size and not lane.empty():
+                batch.append(lane.get_nowait())
+            try:
+                await self._handle(batch)
+            except BaseException:
+                # Cancelled mid-batch: leave the offsets incomplete so the
+                # records are redelivered instead of committed unhandled
+                for _ in batch:
+                    lane.task_done()
+                raise
+            for tp, offset, _ in batch:
+                self._complete(tp, offset)
+                lane.task_done()
+
+    async def _handle(self, batch: list[_LaneItem]) -> None:
+        """Run handlers for a lane batch."""
+        messages = [message for _, _, message in batch if message is not None]
+        for message in messages:
+            for handler in self._handlers:
+                await self._call(handler, message, 1)
+        if messages:
+            for batch_handler in self._batch_handlers:
+                await self._call(batch_handler, messages, len(messages))
+
+    async def _call(self, handler: Callable[[Any], Awaitable[None]], argument: Any, size: int) -> None:
+        """Call a handler, logging errors and recording its latency."""
+        start = time.perf_counter()
+        try:
+            await handler(argument)
+        except Exception:
+            self._stats.failed += size
+            metadata = argument[0].metadata if isinstance(argument, list) else argument.metadata
+            logger.exception(
+                "Handler error",
+                topic=metadata.topic if metadata else None,
+                offset=metadata.offset if metadata else None,
+                records=size,
+                operation="KAFKA_HANDLE",
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stats.handler_calls += 1
+            self._handler_seconds += elapsed
+            self._stats.handler_latency_max = max(self._stats.handler_latency_max, elapsed)
+
+    def _complete(self, tp: TopicPartition, offset: int) -> None:
+        """Record a completed offset, resuming its partition once drained."""
+        self._offsets.completed(tp, offset)
+        self._stats.processed += 1
+        count = self._partition_in_flight.get(tp, 1) - 1
+        self._partition_in_flight[tp] = count
+        if tp in self._paused and count <= self._config.max_in_flight_per_partition // 2:
+            self._paused.discard(tp)
+            if tp in self._consumer.assignment():
+                self._consumer.resume(tp)
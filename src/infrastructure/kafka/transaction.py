@@ -14,10 +14,11 @@ from typing import TYPE_CHECKING, Any, Self, TypeVar
 
 import structlog
 
+from infrastructure.kafka.batching import BatchPublisher
 from infrastructure.kafka.message import KafkaMessage, MessageMetadata
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Callable, Sequence
 
     from aiokafka import AIOKafkaProducer
 
@@ -98,6 +99,7 @@ class TransactionalKafkaProducer[T]:
         self._transactional_id = transactional_id or f"txn-{config.client_id}"
         self._payload_class = payload_class
         self._producer: AIOKafkaProducer | None = None
+        self._publisher: BatchPublisher | None = None
         self._started = False
         self._in_transaction = False
         self._transaction_state = TransactionState.IDLE
@@ -154,6 +156,7 @@ class TransactionalKafkaProducer[T]:
                 await self._abort_transaction()
             await self._producer.stop()
             self._producer = None
+            self._publisher = None
             self._started = False
             logger.info("Transactional Kafka producer stopped")
 
@@ -287,6 +290,37 @@ class TransactionalKafkaProducer[T]:
         )
         return metadata
 
+    async def send_batch_in_transaction(
+        self,
+        payloads: list[T],
+        keys: Sequence[str | None] | None = None,
+        headers: Sequence[dict[str, str] | None] | None = None,
+        topic: str | None = None,
+    ) -> list[MessageMetadata]:
+        """Send messages as record batches within the current transaction."""
+        if not self._producer or not self._started:
+            raise RuntimeError("Producer not started")
+
+        if not self._in_transaction:
+            raise TransactionError(
+                "Not in a transaction. Use transaction() context manager.",
+                self._transaction_state,
+            )
+
+        if self._publisher is None:
+            self._publisher = BatchPublisher(self._producer)
+        results, report = await self._publisher.publish(topic or self._topic, payloads, keys, headers)
+        self._messages_in_transaction += len(results)
+
+        logger.debug(
+            "Batch sent in transaction",
+            txn_id=self._transactional_id,
+            message_count=report.messages,
+            bytes=report.bytes,
+            latency_ms=round(report.latency_seconds * 1000, 2),
+        )
+        return results
+
 
 class TransactionContext[T]:
     """Context for sending messages within a transaction."""
@@ -327,10 +361,8 @@ class TransactionContext[T]:
         key_func: Callable[[T], str | None] | None = None,
         topic: str | None = None,
     ) -> list[MessageMetadata]:
-        """Send multiple messages in the transaction."""
-        results = []
-        for payload in payloads:
-            key = key_func(payload) if key_func else None
-            metadata = await self.send(payload, key=key, topic=topic)
-            results.append(metadata)
+        """Send multiple messages in the transaction as record batches."""
+        keys = [key_func(payload) for payload in payloads] if key_func else None
+        results = await self._producer.send_batch_in_transaction(payloads, keys=keys, topic=topic)
+        self._messages_sent.extend(results)
         return results
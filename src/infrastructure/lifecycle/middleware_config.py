@@ -24,8 +24,14 @@ from core.config import (
 from core.shared.logging import get_logger
 from infrastructure.audit import InMemoryAuditStore
 from infrastructure.idempotency import IdempotencyConfig, IdempotencyMiddleware
-from infrastructure.observability import LoggingMiddleware
-from infrastructure.prometheus import setup_prometheus
+from infrastructure.observability import (
+    CorrelationConfig,
+    CorrelationPlugin,
+    EdgeMiddleware,
+    EdgePlugin,
+    RouteSampling,
+)
+from infrastructure.prometheus import PrometheusPlugin, setup_prometheus
 from infrastructure.ratelimit import (
     InMemoryRateLimiter,
     IPClientExtractor,
@@ -33,7 +39,7 @@ from infrastructure.ratelimit import (
     RateLimitConfig,
     RateLimitMiddleware,
 )
-from interface.middleware.logging import RequestLoggerMiddleware
+from interface.middleware.logging import RequestLogPlugin
 from interface.middleware.production import (
     AuditConfig,
     MultitenancyConfig,
@@ -41,7 +47,7 @@ from interface.middleware.production import (
     setup_production_middleware,
 )
 from interface.middleware.request import (
-    RequestIDMiddleware,
+    RequestIdPlugin,
     RequestSizeLimitMiddleware,
 )
 from interface.middleware.security import SecurityHeadersMiddleware
@@ -56,60 +62,59 @@ def configure_middleware(app: FastAPI) -> None:
     """Configure all middleware for the application.
 
     Middleware stack order (outermost to innermost):
-    1. RequestIDMiddleware - Generate/propagate X-Request-ID
-    2. LoggingMiddleware - Correlation ID and structured logging
-    3. RequestLoggerMiddleware - Request/response logging with PII masking
-    4. CORSMiddleware - Cross-origin resource sharing
-    5. SecurityHeadersMiddleware - Security headers (CSP, HSTS, etc.)
-    6. RequestSizeLimitMiddleware - Limit request body size
-    7. ResilienceMiddleware - Circuit breaker pattern
-    8. MultitenancyMiddleware - Tenant context resolution
-    9. AuditMiddleware - Request audit trail
-    10. RateLimitMiddleware - Rate limiting
+    1. EdgeMiddleware - Request ID, correlation ID, request logging with PII
+       masking and HTTP metrics in a single pass
+    2. CORSMiddleware - Cross-origin resource sharing
+    3. SecurityHeadersMiddleware - Security headers (CSP, HSTS, etc.)
+    4. RequestSizeLimitMiddleware - Limit request body size
+    5. ResilienceMiddleware - Circuit breaker pattern
+    6. MultitenancyMiddleware - Tenant context resolution
+    7. AuditMiddleware - Request audit trail
+    8. RateLimitMiddleware - Rate limiting
     """
     settings = get_settings()
 
-    _configure_request_id_middleware(app)
-    _configure_logging_middleware(app, settings)
-    _configure_request_logger_middleware(app)
     _configure_cors_middleware(app, settings)
     _configure_security_headers_middleware(app)
     _configure_request_size_middleware(app)
     _configure_production_middleware(app)
+    _configure_edge_middleware(app, settings)
 
 
-def _configure_request_id_middleware(app: FastAPI) -> None:
-    """Configure RequestIDMiddleware."""
-    app.add_middleware(RequestIDMiddleware)
-    logger.info("middleware_configured", middleware="RequestIDMiddleware")
-
+def _configure_edge_middleware(app: FastAPI, settings) -> None:
+    """Configure EdgeMiddleware with request ID, correlation, logging and metrics plugins."""
+    obs = settings.observability
+    plugins: list[EdgePlugin] = [
+        RequestIdPlugin(),
+        CorrelationPlugin(
+            CorrelationConfig(
+                service_name=obs.service_name,
+                generate_if_missing=True,
+                propagate_to_response=True,
+            )
+        ),
+        RequestLogPlugin(),
+    ]
+    if obs.prometheus_enabled:
+        plugins.append(PrometheusPlugin(skip_paths=["/health/live", "/health/ready", "/docs", "/redoc"]))
 
-def _configure_logging_middleware(app: FastAPI, settings) -> None:
-    """Configure LoggingMiddleware."""
+    excluded_paths = ["/health/live", "/health/ready", "/metrics", "/docs", "/redoc", "/openapi.json"]
     app.add_middleware(
-        LoggingMiddleware,
-        service_name=settings.observability.service_name,
-        excluded_paths=["/health/live", "/health/ready", "/metrics", "/docs", "/redoc"],
+        EdgeMiddleware,
+        plugins=plugins,
+        sampling=dict.fromkeys(
+            excluded_paths, RouteSampling(log_rate=0.0, metrics_rate=obs.request_metrics_sample_rate)
+        ),
+        default_sampling=RouteSampling(
+            log_rate=obs.request_log_sample_rate,
+            metrics_rate=obs.request_metrics_sample_rate,
+        ),
     )
-    logger.info("middleware_configured", middleware="LoggingMiddleware")
-
-
-def _configure_request_logger_middleware(app: FastAPI) -> None:
-    """Configure RequestLoggerMiddleware."""
-    app.add_middleware(
-        RequestLoggerMiddleware,
-        log_request_body=False,
-        log_response_body=False,
-        excluded_paths=[
-            "/health/live",
-            "/health/ready",
-            "/metrics",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-        ],
+    logger.info(
+        "middleware_configured",
+        middleware="EdgeMiddleware",
+        plugins=[type(plugin).__name__ for plugin in plugins],
     )
-    logger.info("middleware_configured", middleware="RequestLoggerMiddleware")
 
 
 def _configure_cors_middleware(app: FastAPI, settings) -> None:
@@ -282,7 +287,7 @@ def configure_prometheus(app: FastAPI) -> None:
             app,
             endpoint=obs.prometheus_endpoint,
             include_in_schema=obs.prometheus_include_in_schema,
-            skip_paths=["/health/live", "/health/ready", "/docs", "/redoc"],
+            add_middleware=False,
         )
         logger.info(
             "prometheus_configured",
@@ -6,8 +6,9 @@ in the same transaction as domain changes.
 Components:
 - OutboxMessage: Message model with status, retries, idempotency
 - OutboxRepository: In-memory implementation (use SQLModel for production)
-- OutboxPublisher: Background publisher with exponential backoff
+- OutboxPublisher: Background publisher with exponential backoff and batch mode
 - IOutboxRepository: Protocol for custom repository implementations
+- IBatchOutboxRepository: Protocol adding leased batch claims for batch mode
 
 **Feature: python-api-base-2025-validation**
 **Validates: Requirements 33.1, 33.2, 33.3, 33.4, 33.5**
@@ -19,6 +20,7 @@ from infrastructure.messaging.outbox.outbox_message import (
     create_outbox_message,
 )
 from infrastructure.messaging.outbox.outbox_publisher import (
+    IBatchOutboxRepository,
     IOutboxRepository,
     OutboxPublisher,
     OutboxPublisherContext,
@@ -27,6 +29,7 @@ from infrastructure.messaging.outbox.outbox_repository import OutboxRepository
 
 __all__ = [
     # Repository
+    "IBatchOutboxRepository",
     "IOutboxRepository",
     # Message
     "OutboxMessage",
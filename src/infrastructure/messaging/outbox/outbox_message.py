@@ -51,6 +51,8 @@ class OutboxMessage(BaseModel):
     max_retries: int = Field(default=5, description="Maximum retry attempts")
     last_error: str | None = Field(default=None, description="Last error message")
     next_retry_at: datetime | None = Field(default=None, description="When to retry next")
+    locked_by: str | None = Field(default=None, description="Publisher instance holding the lease")
+    locked_until: datetime | None = Field(default=None, description="When the publish lease expires")
 
     model_config = {"frozen": False}
 
@@ -58,11 +60,37 @@ class OutboxMessage(BaseModel):
         """Mark message as being processed."""
         self.status = OutboxMessageStatus.PROCESSING
 
+    def claim(self, worker_id: str, locked_until: datetime) -> None:
+        """Lease message to a publisher instance.
+
+        Args:
+            worker_id: Publisher instance taking the lease.
+            locked_until: When the lease expires.
+        """
+        self.status = OutboxMessageStatus.PROCESSING
+        self.locked_by = worker_id
+        self.locked_until = locked_until
+
+    def release(self) -> None:
+        """Drop the publish lease."""
+        self.locked_by = None
+        self.locked_until = None
+
+    @property
+    def is_lease_expired(self) -> bool:
+        """Check if message is leased for processing but the lease has expired."""
+        return (
+            self.status == OutboxMessageStatus.PROCESSING
+            and self.locked_until is not None
+            and datetime.now(UTC) >= self.locked_until
+        )
+
     def mark_published(self) -> None:
         """Mark message as successfully published."""
         self.status = OutboxMessageStatus.PUBLISHED
         self.processed_at = datetime.now(UTC)
         self.last_error = None
+        self.release()
 
     def mark_failed(self, error: str, next_retry: datetime | None = None) -> None:
         """Mark message as failed.
@@ -74,6 +102,7 @@ class OutboxMessage(BaseModel):
         self.retry_count += 1
         self.last_error = error
         self.next_retry_at = next_retry
+        self.release()
 
         if self.retry_count >= self.max_retries:
             self.status = OutboxMessageStatus.DEAD_LETTER
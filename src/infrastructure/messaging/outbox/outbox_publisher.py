@@ -9,8 +9,8 @@ import contextlib
 import secrets
 from collections.abc import Callable, Sequence
 from datetime import UTC, datetime, timedelta
-from typing import Any, Protocol
-from uuid import UUID
+from typing import Any, Protocol, runtime_checkable
+from uuid import UUID, uuid4
 
 import structlog
 
@@ -38,6 +38,31 @@ class IOutboxRepository(Protocol):
     async def get_dead_letters(self, limit: int = 100) -> Sequence[OutboxMessage]: ...
 
 
+@runtime_checkable
+class IBatchOutboxRepository(IOutboxRepository, Protocol):
+    """Outbox repository supporting leased batch claims.
+
+    Required by ``OutboxPublisher`` in batch mode so several publisher
+    instances can share one outbox without publishing a message twice.
+    """
+
+    async def claim_batch(
+        self,
+        worker_id: str,
+        limit: int = 100,
+        lease_seconds: float = 60.0,
+        include_failed: bool = True,
+    ) -> Sequence[OutboxMessage]: ...
+    async def mark_processed_many(self, message_ids: Sequence[UUID], worker_id: str | None = None) -> int: ...
+    async def mark_failed(
+        self,
+        message_id: UUID,
+        error: str,
+        next_retry: datetime | None = None,
+        worker_id: str | None = None,
+    ) -> bool: ...
+
+
 class OutboxPublisher:
     """Background publisher for outbox messages.
 
@@ -50,6 +75,11 @@ class OutboxPublisher:
     - Dead letter queue support
     - Metrics hooks for observability
     - Graceful shutdown
+    - Batch mode: leased batch claims, bounded concurrent publishing and one
+      bulk status update per batch, safe to run on several instances
+
+    The poll loop polls again immediately while full batches keep coming
+    back, and sleeps ``poll_interval`` only once the backlog is drained.
 
     **Feature: python-api-base-2025-validation**
     **Validates: Requirements 33.3, 33.4, 33.5**
@@ -67,6 +97,10 @@ class OutboxPublisher:
         jitter_factor: float = 0.1,
         on_publish: Callable[[OutboxMessage], None] | None = None,
         on_failure: Callable[[OutboxMessage, Exception], None] | None = None,
+        batch_mode: bool = False,
+        concurrency: int = 10,
+        lease_seconds: float = 60.0,
+        worker_id: str | None = None,
     ) -> None:
         """Initialize outbox publisher.
 
@@ -80,7 +114,24 @@ class OutboxPublisher:
             jitter_factor: Random jitter factor (0-1). Default 0.1.
             on_publish: Callback when message published (for metrics).
             on_failure: Callback when message fails (for metrics).
+            batch_mode: Claim batches with a lease and publish them
+                concurrently. Requires an ``IBatchOutboxRepository``.
+            concurrency: Maximum concurrent publishes in batch mode. Default 10.
+            lease_seconds: Batch lease duration; messages of a publisher
+                that dies are reclaimed after it expires. Default 60.0.
+            worker_id: Lease owner name. Random per instance if not provided.
+
+        Raises:
+            ValueError: If concurrency or lease_seconds is not positive.
+            TypeError: If batch_mode is set and the repository cannot claim batches.
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be > 0")
+        if batch_mode and not isinstance(repository, IBatchOutboxRepository):
+            raise TypeError("batch_mode requires a repository implementing claim_batch and mark_processed_many")
+
         self._repository = repository
         self._publish_fn = publish_fn
         self._poll_interval = poll_interval
@@ -90,10 +141,15 @@ class OutboxPublisher:
         self._jitter_factor = jitter_factor
         self._on_publish = on_publish
         self._on_failure = on_failure
+        self._batch_mode = batch_mode
+        self._concurrency = concurrency
+        self._lease_seconds = lease_seconds
+        self._worker_id = worker_id or f"outbox-{uuid4().hex[:12]}"
         self._running = False
         self._task: asyncio.Task[None] | None = None
         self._published_count = 0
         self._failed_count = 0
+        self._backlog = False
 
     async def start(self) -> None:
         """Start the background publisher."""
@@ -128,12 +184,14 @@ class OutboxPublisher:
                         operation="OUTBOX_POLL",
                     )
             except Exception:
+                self._backlog = False
                 logger.exception(
                     "Error in outbox publisher",
                     operation="OUTBOX_POLL",
                 )
 
-            await asyncio.sleep(self._poll_interval)
+            # A full batch means more messages are likely waiting
+            await asyncio.sleep(0 if self._backlog else self._poll_interval)
 
     async def publish_pending(self) -> int:
         """Publish pending messages.
@@ -141,7 +199,11 @@ class OutboxPublisher:
         Returns:
             Number of messages published.
         """
+        if self._batch_mode:
+            return await self.publish_batch()
+
         messages = await self._repository.get_pending(limit=self._batch_size)
+        self._backlog = len(messages) >= self._batch_size
 
         if not messages:
             return 0
@@ -161,6 +223,85 @@ class OutboxPublisher:
 
         return published
 
+    async def publish_batch(self) -> int:
+        """Claim one batch and publish it with bounded concurrency.
+
+        Successfully published messages are marked processed in a single
+        repository call; failures are scheduled for retry individually.
+
+        Returns:
+            Number of messages published.
+
+        Raises:
+            TypeError: If the repository cannot claim batches.
+        """
+        repository = self._repository
+        if not isinstance(repository, IBatchOutboxRepository):
+            raise TypeError("publish_batch requires a repository implementing claim_batch and mark_processed_many")
+
+        messages = await repository.claim_batch(
+            self._worker_id,
+            limit=self._batch_size,
+            lease_seconds=self._lease_seconds,
+        )
+        self._backlog = len(messages) >= self._batch_size
+
+        if not messages:
+            return 0
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def send(message: OutboxMessage) -> bool:
+            async with semaphore:
+                try:
+                    await self._send(message)
+                except Exception as e:
+                    await self._handle_failure(message, e, self._worker_id)
+                    return False
+                return True
+
+        results = await asyncio.gather(*(send(message) for message in messages))
+        published = [message for message, ok in zip(messages, results, strict=True) if ok]
+
+        if published:
+            marked = await repository.mark_processed_many([m.id for m in published], self._worker_id)
+            if marked < len(published):
+                logger.warning(
+                    "Outbox lease lost before batch was marked processed",
+                    worker_id=self._worker_id,
+                    published=len(published),
+                    marked=marked,
+                    operation="OUTBOX_BATCH",
+                )
+            self._published_count += len(published)
+
+            if self._on_publish:
+                for message in published:
+                    self._on_publish(message)
+
+        logger.debug(
+            "Published outbox batch",
+            worker_id=self._worker_id,
+            claimed=len(messages),
+            published=len(published),
+            operation="OUTBOX_BATCH",
+        )
+        return len(published)
+
+    async def _send(self, message: OutboxMessage) -> None:
+        """Hand a message to the publish function.
+
+        Args:
+            message: Message to publish.
+        """
+        if self._publish_fn:
+            event_data = message.to_event_dict()
+            result = self._publish_fn(event_data)
+
+            # Handle async publish function
+            if asyncio.iscoroutine(result):
+                await result
+
     async def _publish_message(self, message: OutboxMessage) -> None:
         """Publish a single message.
 
@@ -184,14 +325,7 @@ class OutboxPublisher:
         await self._repository.update(message)
 
         try:
-            # Publish
-            if self._publish_fn:
-                event_data = message.to_event_dict()
-                result = self._publish_fn(event_data)
-
-                # Handle async publish function
-                if asyncio.iscoroutine(result):
-                    await result
+            await self._send(message)
 
             # Mark as published
             await self._repository.mark_processed(message.id)
@@ -209,44 +343,60 @@ class OutboxPublisher:
             )
 
         except Exception as e:
-            # Calculate next retry time with exponential backoff
-            delay = self._calculate_backoff(message.retry_count)
-            next_retry = datetime.now(UTC) + timedelta(seconds=delay)
-
-            await self._repository.mark_failed(
-                message.id,
-                str(e),
-                next_retry,
-            )
+            await self._handle_failure(message, e)
+            raise
 
-            self._failed_count += 1
+    async def _handle_failure(self, message: OutboxMessage, e: Exception, worker_id: str | None = None) -> None:
+        """Schedule a retry (or dead-letter) for a message that failed to publish.
 
-            # Metrics callback
-            if self._on_failure:
-                self._on_failure(message, e)
+        Args:
+            message: Message that failed.
+            e: Publish error.
+            worker_id: Lease owner in batch mode; the failure is only
+                recorded while this instance still holds the lease.
+        """
+        # Calculate next retry time with exponential backoff
+        delay = self._calculate_backoff(message.retry_count)
+        next_retry = datetime.now(UTC) + timedelta(seconds=delay)
+
+        repository = self._repository
+        if worker_id is None or not isinstance(repository, IBatchOutboxRepository):
+            await repository.mark_failed(message.id, str(e), next_retry)
+        elif not await repository.mark_failed(message.id, str(e), next_retry, worker_id=worker_id):
+            logger.warning(
+                "Outbox lease lost before failure was recorded",
+                message_id=str(message.id),
+                worker_id=worker_id,
+                operation="OUTBOX_BATCH",
+            )
+            return
 
-            if message.retry_count + 1 >= message.max_retries:
-                logger.error(
-                    "Outbox message moved to dead letter",
-                    message_id=str(message.id),
-                    event_type=message.event_type,
-                    correlation_id=message.correlation_id,
-                    retry_count=message.retry_count + 1,
-                    status="dead_letter",
-                    exc_info=e,
-                )
-            else:
-                logger.warning(
-                    "Outbox message failed, will retry",
-                    message_id=str(message.id),
-                    event_type=message.event_type,
-                    correlation_id=message.correlation_id,
-                    retry_count=message.retry_count + 1,
-                    next_retry_seconds=delay,
-                    exc_info=e,
-                )
+        self._failed_count += 1
 
-            raise
+        # Metrics callback
+        if self._on_failure:
+            self._on_failure(message, e)
+
+        if message.retry_count + 1 >= message.max_retries:
+            logger.error(
+                "Outbox message moved to dead letter",
+                message_id=str(message.id),
+                event_type=message.event_type,
+                correlation_id=message.correlation_id,
+                retry_count=message.retry_count + 1,
+                status="dead_letter",
+                exc_info=e,
+            )
+        else:
+            logger.warning(
+                "Outbox message failed, will retry",
+                message_id=str(message.id),
+                event_type=message.event_type,
+                correlation_id=message.correlation_id,
+                retry_count=message.retry_count + 1,
+                next_retry_seconds=delay,
+                exc_info=e,
+            )
 
     def _calculate_backoff(self, retry_count: int) -> float:
         """Calculate exponential backoff delay with jitter.
@@ -307,6 +457,11 @@ class OutboxPublisher:
 
         return retried
 
+    @property
+    def worker_id(self) -> str:
+        """Lease owner name of this publisher instance."""
+        return self._worker_id
+
     @property
     def is_running(self) -> bool:
         """Check if publisher is running."""
@@ -334,6 +489,9 @@ class OutboxPublisher:
             "failed_count": self._failed_count,
             "poll_interval": self._poll_interval,
             "batch_size": self._batch_size,
+            "batch_mode": self._batch_mode,
+            "concurrency": self._concurrency,
+            "worker_id": self._worker_id,
         }
 
 
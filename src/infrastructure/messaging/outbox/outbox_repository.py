@@ -5,7 +5,7 @@
 """
 
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from infrastructure.messaging.outbox.outbox_message import (
@@ -106,6 +106,68 @@ class OutboxRepository:
         pending.sort(key=lambda m: m.created_at)
         return pending[:limit]
 
+    async def claim_batch(
+        self,
+        worker_id: str,
+        limit: int = 100,
+        lease_seconds: float = 60.0,
+        include_failed: bool = True,
+    ) -> Sequence[OutboxMessage]:
+        """Atomically lease a batch of messages to one publisher instance.
+
+        Claimable messages are pending ones, failed ones ready for retry and
+        processing ones whose lease has expired (their publisher died).
+        Messages whose idempotency key was already processed, or repeats
+        the key of an earlier message in the same batch, are marked
+        published as duplicates instead of being returned.
+
+        A database-backed repository implements this as a single statement::
+
+            UPDATE outbox SET status = 'processing', locked_by = :worker,
+                   locked_until = now() + :lease
+            WHERE id IN (
+                SELECT id FROM outbox WHERE <claimable> ORDER BY created_at
+                LIMIT :limit FOR UPDATE SKIP LOCKED
+            ) RETURNING *
+
+        Args:
+            worker_id: Publisher instance taking the lease.
+            limit: Maximum messages to claim.
+            lease_seconds: Lease duration.
+            include_failed: Include failed messages ready for retry.
+
+        Returns:
+            Claimed messages in FIFO order.
+        """
+        candidates: list[OutboxMessage] = []
+        for msg in self._messages.values():
+            is_pending = msg.status == OutboxMessageStatus.PENDING
+            is_failed_ready = include_failed and msg.status == OutboxMessageStatus.FAILED and msg.is_ready_for_retry
+            if not (is_pending or is_failed_ready or msg.is_lease_expired):
+                continue
+            if msg.idempotency_key in self._processed_keys:
+                msg.mark_published()
+                continue
+            candidates.append(msg)
+
+        candidates.sort(key=lambda m: m.created_at)
+        claimed: list[OutboxMessage] = []
+        batch_keys: set[str] = set()
+        for msg in candidates:
+            if len(claimed) >= limit:
+                break
+            if msg.idempotency_key:
+                if msg.idempotency_key in batch_keys:
+                    msg.mark_published()
+                    continue
+                batch_keys.add(msg.idempotency_key)
+            claimed.append(msg)
+
+        locked_until = datetime.now(UTC) + timedelta(seconds=lease_seconds)
+        for msg in claimed:
+            msg.claim(worker_id, locked_until)
+        return claimed
+
     async def update(self, message: OutboxMessage) -> OutboxMessage:
         """Update outbox message.
 
@@ -139,11 +201,36 @@ class OutboxRepository:
 
         return True
 
+    async def mark_processed_many(self, message_ids: Sequence[UUID], worker_id: str | None = None) -> int:
+        """Mark a batch of messages as processed.
+
+        Args:
+            message_ids: Message identifiers.
+            worker_id: Only mark messages still leased to this publisher
+                instance; any holder if not provided.
+
+        Returns:
+            Number of messages marked.
+        """
+        marked = 0
+        for message_id in message_ids:
+            msg = self._messages.get(message_id)
+            if msg is None or (worker_id is not None and msg.locked_by != worker_id):
+                continue
+
+            msg.mark_published()
+            if msg.idempotency_key:
+                self._processed_keys.add(msg.idempotency_key)
+            marked += 1
+
+        return marked
+
     async def mark_failed(
         self,
         message_id: UUID,
         error: str,
         next_retry: datetime | None = None,
+        worker_id: str | None = None,
     ) -> bool:
         """Mark message as failed.
 
@@ -151,12 +238,14 @@ class OutboxRepository:
             message_id: Message identifier.
             error: Error message.
             next_retry: When to retry next.
+            worker_id: Only mark the message if it is still leased to this
+                publisher instance; any holder if not provided.
 
         Returns:
-            True if marked, False if not found.
+            True if marked, False if not found or the lease is not held.
         """
         msg = self._messages.get(message_id)
-        if msg is None:
+        if msg is None or (worker_id is not None and msg.locked_by != worker_id):
             return False
 
         msg.mark_failed(error, next_retry)
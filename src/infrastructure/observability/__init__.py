@@ -2,6 +2,7 @@
 
 Provides:
 - Correlation ID propagation
+- Fused edge middleware with pluggable request instrumentation
 - Structured logging with ECS compatibility
 - Elasticsearch log shipping
 - OpenTelemetry tracing
@@ -22,13 +23,27 @@ from infrastructure.observability.correlation_id import (
     set_correlation_id,
     set_request_id,
 )
+from infrastructure.observability.edge import (
+    CorrelationPlugin,
+    EdgeContext,
+    EdgeMiddleware,
+    EdgePlugin,
+    RouteSampling,
+    get_edge_context,
+)
 from infrastructure.observability.elasticsearch_handler import (
     ElasticsearchConfig,
     ElasticsearchHandler,
     ElasticsearchLogProcessor,
     create_elasticsearch_handler,
 )
+from infrastructure.observability.elasticsearch_shipping import (
+    LogShipper,
+    ShippingMetricsExporter,
+    ShippingStats,
+)
 from infrastructure.observability.logging_middleware import (
+    ClientInfoPlugin,
     LoggingMiddleware,
     create_logging_middleware,
 )
@@ -38,17 +53,27 @@ from infrastructure.observability.middleware import TracingMiddleware
 __all__ = [
     # Metrics
     "CacheMetrics",
+    "ClientInfoPlugin",
     # Correlation
     "CorrelationConfig",
     "CorrelationContext",
     "CorrelationContextManager",
+    "CorrelationPlugin",
     "CorrelationService",
+    # Edge
+    "EdgeContext",
+    "EdgeMiddleware",
+    "EdgePlugin",
     # Elasticsearch
     "ElasticsearchConfig",
     "ElasticsearchHandler",
     "ElasticsearchLogProcessor",
+    "LogShipper",
     # Logging
     "LoggingMiddleware",
+    "RouteSampling",
+    "ShippingMetricsExporter",
+    "ShippingStats",
     # Tracing
     "TracingMiddleware",
     "add_correlation_context",
@@ -56,6 +81,7 @@ __all__ = [
     "create_elasticsearch_handler",
     "create_logging_middleware",
     "get_correlation_id",
+    "get_edge_context",
     "get_request_id",
     "set_correlation_id",
     "set_request_id",
@@ -1,7 +1,8 @@
 """Anomaly Detection for metrics monitoring.
 
 This module provides anomaly detection capabilities using
-statistical methods for automatic problem detection.
+statistical methods for automatic problem detection. Samples are analyzed
+in O(1) against streaming per-metric statistics.
 
 **Feature: api-architecture-analysis**
 **Validates: Requirements 7.3**
@@ -9,12 +10,14 @@ statistical methods for automatic problem detection.
 
 import math
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Protocol, runtime_checkable
 
 import structlog
 
+from infrastructure.observability.streaming_stats import RollingWindow, TrendWindow
+
 logger = structlog.get_logger(__name__)
 
 
@@ -173,11 +176,18 @@ class StatisticalAnalyzer:
 
 
 class AnomalyDetector:
-    """Detects anomalies in metric data."""
+    """Detects anomalies in metric data.
+
+    Each metric keeps a bounded rolling window of recent samples with
+    running statistics and a trend window, so recording a sample and
+    reading statistics take constant time regardless of history size.
+    """
 
     # Maximum data points per metric to prevent memory exhaustion
     MAX_DATA_POINTS_PER_METRIC: int = 10000
     MAX_METRICS: int = 1000
+    # Samples older than this are dropped
+    MAX_DATA_AGE_SECONDS: float = 24 * 60 * 60
 
     def __init__(
         self,
@@ -186,54 +196,57 @@ class AnomalyDetector:
     ) -> None:
         self._config = config or AnomalyConfig()
         self._handler = handler or LogAnomalyHandler()
-        self._data: dict[str, list[DataPoint]] = {}
-        self._stats = StatisticalAnalyzer()
+        self._windows: dict[str, RollingWindow] = {}
+        self._trends: dict[str, TrendWindow] = {}
 
     async def record(self, metric_name: str, value: float, labels: dict[str, str] | None = None) -> Anomaly | None:
-        """Record a data point and check for anomalies."""
-        # Prevent unbounded metric growth (DoS protection)
-        if metric_name not in self._data and len(self._data) >= self.MAX_METRICS:
-            logger.warning(
-                "Max metrics limit reached, dropping new metric",
-                metric_name=metric_name,
-                max_metrics=self.MAX_METRICS,
-            )
-            return None
-
-        point = DataPoint(value=value, timestamp=datetime.now(UTC), labels=labels or {})
+        """Record a data point and check for anomalies.
 
-        if metric_name not in self._data:
-            self._data[metric_name] = []
-        self._data[metric_name].append(point)
+        NaN and infinite values are dropped, as they carry no magnitude to
+        compare against the window.
+        """
+        if not math.isfinite(value):
+            logger.warning("Dropping non-finite metric value", metric_name=metric_name, value=value)
+            return None
+        window = self._windows.get(metric_name)
+        if window is None:
+            # Prevent unbounded metric growth (DoS protection)
+            if len(self._windows) >= self.MAX_METRICS:
+                logger.warning(
+                    "Max metrics limit reached, dropping new metric",
+                    metric_name=metric_name,
+                    max_metrics=self.MAX_METRICS,
+                )
+                return None
+            window = self._windows[metric_name] = RollingWindow(
+                self.MAX_DATA_POINTS_PER_METRIC, self.MAX_DATA_AGE_SECONDS
+            )
+            self._trends[metric_name] = TrendWindow(self._config.trend_window)
 
-        # Trim old data by time
-        cutoff = datetime.now(UTC) - timedelta(hours=24)
-        self._data[metric_name] = [p for p in self._data[metric_name] if p.timestamp > cutoff]
+        timestamp = datetime.now(UTC)
+        now = timestamp.timestamp()
+        window.expire(now)
 
-        # Enforce max data points per metric (memory protection)
-        if len(self._data[metric_name]) > self.MAX_DATA_POINTS_PER_METRIC:
-            self._data[metric_name] = self._data[metric_name][-self.MAX_DATA_POINTS_PER_METRIC :]
+        # Check against the samples before this one, then add it
+        anomaly = self._detect_anomaly(metric_name, value, timestamp)
+        window.add(value, now)
+        self._trends[metric_name].add(value)
 
-        # Check for anomalies
-        anomaly = self._detect_anomaly(metric_name, point)
         if anomaly:
             await self._handler.handle(anomaly)
         return anomaly
 
-    def _detect_anomaly(self, metric_name: str, point: DataPoint) -> Anomaly | None:
+    def _detect_anomaly(self, metric_name: str, current: float, timestamp: datetime) -> Anomaly | None:
         """Detect anomaly in the latest data point."""
-        data = self._data.get(metric_name, [])
-        if len(data) < self._config.min_data_points:
+        window = self._windows[metric_name]
+        if len(window) + 1 < self._config.min_data_points:
             return None
 
-        values = [p.value for p in data[:-1]]  # Exclude current point
-        current = point.value
-
-        mean = self._stats.mean(values)
-        std = self._stats.std_dev(values)
+        mean = window.mean
+        std = window.std_dev
 
         # Check for outlier using z-score
-        z = self._stats.z_score(current, mean, std)
+        z = StatisticalAnalyzer.z_score(current, mean, std)
         if abs(z) > self._config.z_score_threshold:
             severity = self._determine_severity(abs(z))
             anomaly_type = AnomalyType.SPIKE if current > mean else AnomalyType.DROP
@@ -243,15 +256,15 @@ class AnomalyDetector:
                 value=current,
                 expected_value=mean,
                 deviation=abs(z),
-                timestamp=point.timestamp,
+                timestamp=timestamp,
                 metric_name=metric_name,
                 description=f"Z-score: {z:.2f}",
             )
 
         # Check for trend
-        if len(values) >= self._config.trend_window:
-            recent = values[-self._config.trend_window :]
-            slope = self._stats.linear_regression_slope(recent)
+        trend = self._trends[metric_name]
+        if len(window) >= self._config.trend_window and trend.is_full:
+            slope = trend.slope
             normalized_slope = slope / (mean if mean != 0 else 1)
 
             if abs(normalized_slope) > self._config.trend_threshold:
@@ -262,7 +275,7 @@ class AnomalyDetector:
                     value=current,
                     expected_value=mean,
                     deviation=abs(normalized_slope),
-                    timestamp=point.timestamp,
+                    timestamp=timestamp,
                     metric_name=metric_name,
                     description=f"Trend slope: {normalized_slope:.4f}",
                 )
@@ -278,21 +291,23 @@ class AnomalyDetector:
         return AnomalySeverity.INFO
 
     def get_statistics(self, metric_name: str) -> dict[str, float]:
-        """Get current statistics for a metric."""
-        data = self._data.get(metric_name, [])
-        if not data:
+        """Get current statistics for a metric.
+
+        Percentiles are approximate, within 1% of the true value.
+        """
+        window = self._windows.get(metric_name)
+        if not window:
             return {"mean": 0, "std_dev": 0, "min": 0, "max": 0, "count": 0}
 
-        values = [p.value for p in data]
         return {
-            "mean": self._stats.mean(values),
-            "std_dev": self._stats.std_dev(values),
-            "min": min(values),
-            "max": max(values),
-            "count": len(values),
-            "p50": self._stats.percentile(values, 0.50),
-            "p95": self._stats.percentile(values, 0.95),
-            "p99": self._stats.percentile(values, 0.99),
+            "mean": window.mean,
+            "std_dev": window.std_dev,
+            "min": window.min,
+            "max": window.max,
+            "count": len(window),
+            "p50": window.quantile(0.50),
+            "p95": window.quantile(0.95),
+            "p99": window.quantile(0.99),
         }
 
 
@@ -0,0 +1,331 @@
+"""Fused edge middleware for per-request HTTP observability.
+
+**Feature: observability-infrastructure**
+**Requirement: R1, R2 - Structured Logging**
+
+Request ID, correlation, access logging and HTTP metrics run as plugins of
+one pure ASGI middleware. Headers are parsed once, the request is timed
+once, context is bound once and a single structured log record is written
+per request. Logging and metrics are sampled per route.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+import structlog
+from starlette.datastructures import Headers, MutableHeaders
+
+from infrastructure.observability.correlation_id import (
+    CorrelationConfig,
+    CorrelationContext,
+    CorrelationContextManager,
+    CorrelationService,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_edge_context: ContextVar[EdgeContext | None] = ContextVar("edge_context", default=None)
+
+
+def get_edge_context() -> EdgeContext | None:
+    """Get the edge context of the request being handled, if any."""
+    return _edge_context.get()
+
+
+def _parse_content_length(value: str | None) -> int | None:
+    """Parse a Content-Length header, None if missing or malformed."""
+    if value is None:
+        return None
+    try:
+        size = int(value)
+    except ValueError:
+        return None
+    return size if size >= 0 else None
+
+
+@dataclass(frozen=True, slots=True)
+class RouteSampling:
+    """Sampling rates for a route.
+
+    Attributes:
+        log_rate: Fraction of requests written to the access log. Server
+            errors and exceptions are always logged.
+        metrics_rate: Fraction of requests recorded in metrics. Counters of
+            sampled requests are scaled by ``1 / metrics_rate``.
+    """
+
+    log_rate: float = 1.0
+    metrics_rate: float = 1.0
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.log_rate <= 1.0 or not 0.0 <= self.metrics_rate <= 1.0:
+            raise ValueError("Sampling rates must be between 0 and 1")
+
+
+class RouteSampler:
+    """Resolve sampling rates by request path.
+
+    Rules are exact paths, or prefixes ending in ``*``; the longest
+    matching prefix wins.
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[str, RouteSampling] | None = None,
+        default: RouteSampling | None = None,
+        random_func: Callable[[], float] = random.random,
+    ) -> None:
+        rules = rules or {}
+        self._exact = {path: rates for path, rates in rules.items() if not path.endswith("*")}
+        self._prefixes = sorted(
+            ((path[:-1], rates) for path, rates in rules.items() if path.endswith("*")),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._default = default or RouteSampling()
+        self._random = random_func
+
+    def rates(self, path: str) -> RouteSampling:
+        """Get the sampling rates for a path."""
+        rates = self._exact.get(path)
+        if rates is not None:
+            return rates
+        for prefix, prefix_rates in self._prefixes:
+            if path.startswith(prefix):
+                return prefix_rates
+        return self._default
+
+    def sample(self, rate: float) -> bool:
+        """Decide whether one request is sampled at the given rate."""
+        return rate >= 1.0 or (rate > 0.0 and self._random() < rate)
+
+
+@dataclass(slots=True)
+class EdgeContext:
+    """State shared by edge plugins for one request.
+
+    Plugins set ``response_headers``, ``log_fields`` (added to the request
+    log record) and ``context_fields`` (bound to structlog contextvars while
+    the request runs). ``data`` is scratch space for per-request plugin
+    state.
+    """
+
+    scope: Scope
+    method: str
+    path: str
+    headers: Headers
+    start: float
+    log_sampled: bool = True
+    metrics_sampled: bool = True
+    metrics_weight: float = 1.0
+    request_id: str | None = None
+    correlation: CorrelationContext | None = None
+    status_code: int = 500
+    response_size: int = 0
+    duration: float = 0.0
+    error: BaseException | None = None
+    response_headers: dict[str, str] = field(default_factory=dict)
+    log_fields: dict[str, Any] = field(default_factory=dict)
+    context_fields: dict[str, Any] = field(default_factory=dict)
+    data: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Request state backing ``request.state``."""
+        return self.scope.setdefault("state", {})
+
+    @property
+    def client(self) -> tuple[str, int] | None:
+        """Client host and port."""
+        return self.scope.get("client")
+
+
+@runtime_checkable
+class EdgePlugin(Protocol):
+    """Hooks into the edge middleware request lifecycle.
+
+    ``on_request`` runs before the application, in plugin order.
+    ``on_complete`` runs after the response has been sent or the
+    application raised, in reverse order, with ``status_code``,
+    ``response_size``, ``duration`` and ``error`` set.
+    """
+
+    def on_request(self, ctx: EdgeContext) -> None:
+        """Handle the start of a request."""
+        ...
+
+    def on_complete(self, ctx: EdgeContext) -> None:
+        """Handle the end of a request."""
+        ...
+
+
+class CorrelationPlugin:
+    """Bind correlation IDs from request headers and echo them back.
+
+    Reuses the request ID set by an earlier plugin when there is one.
+    """
+
+    _HEADERS = ("X-Correlation-ID", "X-Request-ID", "X-Span-ID", "X-Parent-Span-ID", "X-Trace-ID")
+
+    def __init__(self, config: CorrelationConfig | None = None) -> None:
+        self._config = config or CorrelationConfig()
+        self._service = CorrelationService(self._config)
+
+    def on_request(self, ctx: EdgeContext) -> None:
+        """Resolve the correlation context and enter it."""
+        incoming = {name: value for name in self._HEADERS if (value := ctx.headers.get(name))}
+        if ctx.request_id is not None:
+            incoming["X-Request-ID"] = ctx.request_id
+
+        context = self._service.extract_from_headers(incoming)
+        manager = CorrelationContextManager(context, self._config.service_name)
+        manager.__enter__()
+        ctx.data["correlation_manager"] = manager
+        ctx.correlation = context
+        if ctx.request_id is None:
+            ctx.request_id = context.request_id
+
+        ctx.response_headers.update(self._service.get_response_headers(context))
+        ctx.context_fields["correlation_id"] = context.correlation_id
+        ctx.context_fields["request_id"] = context.request_id
+
+    def on_complete(self, ctx: EdgeContext) -> None:
+        """Restore the previous correlation context."""
+        manager = ctx.data.pop("correlation_manager", None)
+        if manager is not None:
+            manager.__exit__(None, None, None)
+
+
+class EdgeMiddleware:
+    """Single-pass ASGI middleware running observability plugins.
+
+    **Feature: observability-infrastructure**
+    **Requirement: R1, R2 - Structured Logging**
+
+    Example:
+        >>> app.add_middleware(
+        ...     EdgeMiddleware,
+        ...     plugins=[RequestIdPlugin(), CorrelationPlugin(), PrometheusPlugin()],
+        ...     sampling={"/health/*": RouteSampling(log_rate=0.0)},
+        ... )
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        plugins: Sequence[EdgePlugin] = (),
+        *,
+        sampling: Mapping[str, RouteSampling] | None = None,
+        default_sampling: RouteSampling | None = None,
+        log_event: str | None = "request_completed",
+        logger_name: str = "http",
+        random_func: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize edge middleware.
+
+        Args:
+            app: ASGI application.
+            plugins: Plugins to run for each request.
+            sampling: Sampling rates by path or ``*``-terminated prefix.
+            default_sampling: Sampling rates for other paths.
+            log_event: Event name of the request log record, or None to
+                write no record.
+            logger_name: Name of the structlog logger.
+            random_func: Source of uniform random numbers for sampling.
+        """
+        self.app = app
+        self._plugins = tuple(plugins)
+        self._sampler = RouteSampler(sampling, default_sampling, random_func)
+        self._log_event = log_event
+        self._logger = structlog.get_logger(logger_name)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the plugins around one request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        rates = self._sampler.rates(path)
+        ctx = EdgeContext(
+            scope=scope,
+            method=scope["method"],
+            path=path,
+            headers=Headers(scope=scope),
+            start=time.perf_counter(),
+            log_sampled=self._log_event is not None and self._sampler.sample(rates.log_rate),
+            metrics_sampled=self._sampler.sample(rates.metrics_rate),
+            metrics_weight=1.0 / rates.metrics_rate if rates.metrics_rate > 0.0 else 0.0,
+        )
+
+        count_body = True
+
+        async def send_with_context(message: Message) -> None:
+            nonlocal count_body
+            if message["type"] == "http.response.start":
+                ctx.status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                for name, value in ctx.response_headers.items():
+                    headers[name] = value
+                content_length = _parse_content_length(headers.get("content-length"))
+                if content_length is not None:
+                    ctx.response_size = content_length
+                    count_body = False
+            elif message["type"] == "http.response.body" and count_body:
+                ctx.response_size += len(message.get("body", b""))
+            await send(message)
+
+        token = _edge_context.set(ctx)
+        started: list[EdgePlugin] = []
+        bound: Mapping[str, Any] = {}
+        try:
+            for plugin in self._plugins:
+                plugin.on_request(ctx)
+                started.append(plugin)
+            bound = structlog.contextvars.bind_contextvars(method=ctx.method, path=path, **ctx.context_fields)
+            await self.app(scope, receive, send_with_context)
+        except Exception as exc:
+            ctx.error = exc
+            raise
+        finally:
+            ctx.duration = time.perf_counter() - ctx.start
+            self._write_log(ctx)
+            structlog.contextvars.reset_contextvars(**bound)
+            for plugin in reversed(started):
+                plugin.on_complete(ctx)
+            _edge_context.reset(token)
+
+    def _write_log(self, ctx: EdgeContext) -> None:
+        """Write the request log record if sampled or failed."""
+        if self._log_event is None:
+            return
+        failed = ctx.error is not None or ctx.status_code >= 500
+        if not (ctx.log_sampled or failed):
+            return
+
+        fields: dict[str, Any] = {
+            "method": ctx.method,
+            "path": ctx.path,
+            "status_code": ctx.status_code,
+            "duration_ms": round(ctx.duration * 1000, 2),
+            "response_size": ctx.response_size,
+            **ctx.log_fields,
+        }
+        if ctx.error is not None:
+            fields["error_type"] = type(ctx.error).__name__
+            fields["exc_info"] = ctx.error
+
+        if failed:
+            self._logger.error(self._log_event, **fields)
+        elif ctx.status_code >= 400:
+            self._logger.warning(self._log_event, **fields)
+        else:
+            self._logger.info(self._log_event, **fields)
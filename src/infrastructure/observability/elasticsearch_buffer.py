@@ -6,20 +6,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import gzip
 import json
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
 if TYPE_CHECKING:
-    import asyncio
+    from collections.abc import Callable
 
     from elasticsearch import AsyncElasticsearch
 
 
+class OverflowPolicy(Enum):
+    """What a full log buffer does with new events."""
+
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest buffered event
+    DROP_NEWEST = "drop_newest"  # Reject the new event
+    SAMPLE = "sample"  # Keep a sample of new events once half full
+
+
 class LogBuffer:
-    """Buffered log storage with periodic flushing.
+    """Bounded log storage with periodic flushing.
+
+    A ring buffer of at most ``capacity`` events. ``deque`` appends and
+    pops are atomic, so events can be added from any thread without a
+    lock. When the buffer fills, ``overflow`` decides which events are
+    dropped; dropped events are counted in ``dropped``.
 
     **Feature: observability-infrastructure**
     **Requirement: R1.3 - Batched bulk indexing**
@@ -29,18 +50,40 @@ class LogBuffer:
         self,
         batch_size: int = 100,
         flush_interval_seconds: float = 5.0,
+        capacity: int = 10_000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        sample_rate: float = 0.1,
+        random_func: Callable[[], float] = random.random,
     ) -> None:
         """Initialize log buffer.
 
         Args:
             batch_size: Number of logs to batch before auto-flush
             flush_interval_seconds: Max seconds between flushes
+            capacity: Maximum number of buffered events
+            overflow: Policy applied when the buffer is full
+            sample_rate: Share of events kept once a SAMPLE buffer is half full
+            random_func: Source of random numbers for sampling
         """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
         self._batch_size = batch_size
         self._flush_interval = flush_interval_seconds
-        self._buffer: list[dict[str, Any]] = []
-        self._flush_task: asyncio.Task[None] | None = None
+        self._capacity = capacity
+        self._overflow = overflow
+        self._sample_rate = sample_rate
+        self._random = random_func
+        self._buffer: deque[dict[str, Any]] = deque()
         self._closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of buffered events."""
+        return self._capacity
 
     def add(self, event: dict[str, Any]) -> bool:
         """Add event to buffer.
@@ -54,8 +97,32 @@ class LogBuffer:
         if self._closed:
             return False
 
+        size = len(self._buffer)
+        if size >= self._capacity:
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                self._buffer.popleft()
+            else:
+                self.dropped += 1
+                return True
+            self.dropped += 1
+        elif (
+            self._overflow is OverflowPolicy.SAMPLE
+            and size >= self._capacity // 2
+            and self._random() >= self._sample_rate
+        ):
+            self.dropped += 1
+            return size >= self._batch_size
+
         self._buffer.append(event)
-        return len(self._buffer) >= self._batch_size
+        return size + 1 >= self._batch_size
+
+    def take(self, max_events: int) -> list[dict[str, Any]]:
+        """Take up to ``max_events`` of the oldest buffered events."""
+        events: list[dict[str, Any]] = []
+        buffer = self._buffer
+        while buffer and len(events) < max_events:
+            events.append(buffer.popleft())
+        return events
 
     def take_all(self) -> list[dict[str, Any]]:
         """Take all buffered events and clear buffer.
@@ -63,9 +130,7 @@ class LogBuffer:
         Returns:
             List of buffered events
         """
-        events = self._buffer.copy()
-        self._buffer.clear()
-        return events
+        return self.take(len(self._buffer))
 
     def has_events(self) -> bool:
         """Check if buffer has events."""
@@ -76,41 +141,165 @@ class LogBuffer:
         self._closed = True
 
 
+@dataclass(frozen=True, slots=True)
+class SpoolBatch:
+    """Events read back from the spool.
+
+    Attributes:
+        events: Spooled events, oldest first
+        end_offset: Spool position after the batch, committed on acknowledge
+    """
+
+    events: list[dict[str, Any]]
+    end_offset: int
+
+
 class FallbackWriter:
-    """Writes logs to local file when Elasticsearch is unavailable.
+    """Spools logs to a local file when Elasticsearch is unavailable.
+
+    File access runs in a worker thread. Replay rotates the spool to a
+    replay file, so new failures keep spooling, and reads it back with
+    ``read_batch()``. Each batch is consumed only by ``acknowledge()``, which
+    saves the replay position beside the file; unacknowledged batches are
+    read again, even after a restart.
 
     **Feature: observability-infrastructure**
     **Requirement: R1.3 - Fallback to local file on failure**
     """
 
-    def __init__(self, fallback_path: Path | str) -> None:
+    def __init__(self, fallback_path: Path | str, max_bytes: int | None = None) -> None:
         """Initialize fallback writer.
 
         Args:
             fallback_path: Path for fallback log file
+            max_bytes: Size above which new events are dropped instead of spooled
         """
         self._path = Path(fallback_path) if isinstance(fallback_path, str) else fallback_path
+        self._replay_path = self._path.with_name(self._path.name + ".replay")
+        self._offset_path = self._path.with_name(self._path.name + ".replay.offset")
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
         self._logger = structlog.get_logger(__name__)
 
-    async def write(self, events: list[dict[str, Any]]) -> None:
+    @property
+    def path(self) -> Path:
+        """Path of the spool file."""
+        return self._path
+
+    def has_spooled(self) -> bool:
+        """Check if the spool or an unfinished replay holds events."""
+        return self._path.exists() or self._replay_path.exists()
+
+    async def write(self, events: list[dict[str, Any]]) -> bool:
         """Write events to fallback file.
 
         Args:
             events: Events to write
+
+        Returns:
+            True if the events were spooled
         """
         try:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-
-            with self._path.open("a", encoding="utf-8") as f:
-                for event in events:
-                    f.write(json.dumps(event) + "\n")
-
+            return await asyncio.to_thread(self._write, events)
         except Exception:
             self._logger.exception(
                 "Failed to write fallback log",
                 path=str(self._path),
                 operation="ES_FALLBACK_WRITE",
             )
+            return False
+
+    async def read_batch(self, max_events: int) -> SpoolBatch | None:
+        """Read the next unacknowledged spooled events.
+
+        Args:
+            max_events: Maximum events in the batch
+
+        Returns:
+            Next batch, or None once the spool is fully replayed
+        """
+        try:
+            return await asyncio.to_thread(self._read_batch, max_events)
+        except Exception:
+            self._logger.exception(
+                "Failed to read fallback log",
+                path=str(self._replay_path),
+                operation="ES_FALLBACK_REPLAY",
+            )
+            return None
+
+    async def acknowledge(self, batch: SpoolBatch) -> bool:
+        """Consume a shipped batch, returning whether its position was saved."""
+        try:
+            await asyncio.to_thread(self._acknowledge, batch.end_offset)
+        except Exception:
+            self._logger.exception(
+                "Failed to save fallback replay position",
+                path=str(self._offset_path),
+                operation="ES_FALLBACK_REPLAY",
+            )
+            return False
+        return True
+
+    def _write(self, events: list[dict[str, Any]]) -> bool:
+        """Append events to the spool file."""
+        lines = "".join(json.dumps(event, default=str) + "\n" for event in events)
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            if self._max_bytes is not None and self._path.exists() and self._path.stat().st_size >= self._max_bytes:
+                self._logger.warning(
+                    "Fallback log full, dropping events",
+                    path=str(self._path),
+                    dropped=len(events),
+                    operation="ES_FALLBACK_WRITE",
+                )
+                return False
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write(lines)
+        return True
+
+    def _read_batch(self, max_events: int) -> SpoolBatch | None:
+        """Read up to ``max_events`` lines after the committed position."""
+        with self._lock:
+            if not self._replay_path.exists():
+                if not self._path.exists():
+                    return None
+                self._offset_path.unlink(missing_ok=True)
+                self._path.rename(self._replay_path)
+            offset = int(self._offset_path.read_text()) if self._offset_path.exists() else 0
+
+            events: list[dict[str, Any]] = []
+            with self._replay_path.open("rb") as f:
+                f.seek(offset)
+                while len(events) < max_events:
+                    line = f.readline()
+                    if not line:
+                        break
+                    with contextlib.suppress(ValueError):
+                        events.append(json.loads(line))
+                end_offset = f.tell()
+
+            if end_offset == offset:
+                self._finish_replay()
+                return None
+            return SpoolBatch(events, end_offset)
+
+    def _acknowledge(self, end_offset: int) -> None:
+        """Commit the replay position, removing the replay file at its end."""
+        with self._lock:
+            if not self._replay_path.exists():
+                return
+            if end_offset >= self._replay_path.stat().st_size:
+                self._finish_replay()
+                return
+            partial = self._offset_path.with_name(self._offset_path.name + ".tmp")
+            partial.write_text(str(end_offset))
+            partial.replace(self._offset_path)
+
+    def _finish_replay(self) -> None:
+        """Remove the fully replayed file and its position."""
+        self._replay_path.unlink(missing_ok=True)
+        self._offset_path.unlink(missing_ok=True)
 
 
 class BulkIndexer:
@@ -140,6 +329,27 @@ class BulkIndexer:
         date_suffix = datetime.now(UTC).strftime("%Y.%m.%d")
         return f"{self._index_prefix}-{date_suffix}"
 
+    def encode(self, events: list[dict[str, Any]], compression_level: int = 6) -> bytes:
+        """Encode events as an NDJSON bulk request body.
+
+        CPU-bound; run it in a worker thread.
+
+        Args:
+            events: Events to index
+            compression_level: gzip level, or 0 for an uncompressed body
+
+        Returns:
+            Bulk request body, gzip-compressed unless level is 0
+        """
+        action = json.dumps({"index": {"_index": self.get_index_name()}})
+        lines: list[str] = []
+        for event in events:
+            lines.append(action)
+            lines.append(json.dumps(event, default=str))
+        lines.append("")
+        body = "\n".join(lines).encode()
+        return gzip.compress(body, compression_level) if compression_level else body
+
     async def bulk_index(
         self,
         client: AsyncElasticsearch,
@@ -167,13 +377,21 @@ class BulkIndexer:
 
         # Execute bulk request
         response = await client.bulk(operations=operations, refresh=False)
+        self.log_errors(response)
 
-        # Check for errors
-        if response.get("errors"):
-            error_count = sum(1 for item in response.get("items", []) if "error" in item.get("index", {}))
-            self._logger.warning(
-                "Bulk index had errors",
-                error_count=error_count,
-                index=index_name,
-                operation="ES_BULK_INDEX",
-            )
+    def log_errors(self, response: dict[str, Any]) -> int:
+        """Log item errors of a bulk response.
+
+        Returns:
+            Number of rejected events
+        """
+        if not response.get("errors"):
+            return 0
+        error_count = sum(1 for item in response.get("items", []) if "error" in item.get("index", {}))
+        self._logger.warning(
+            "Bulk index had errors",
+            error_count=error_count,
+            index=self.get_index_name(),
+            operation="ES_BULK_INDEX",
+        )
+        return error_count
@@ -27,6 +27,15 @@ class ElasticsearchConfig:
         timeout: Connection timeout in seconds
         max_retries: Maximum retry attempts
         retry_on_timeout: Whether to retry on timeout
+        queue_capacity: Maximum number of events waiting to be shipped
+        overflow_policy: What a full queue does ("drop_oldest",
+            "drop_newest" or "sample")
+        sample_rate: Share of events kept once a sampling queue is half full
+        max_concurrent_requests: Bulk requests in flight at once
+        compression_level: gzip level of bulk bodies, 0 to disable
+        retry_backoff_seconds: Delay before the first retry, doubled per retry
+        spool_max_bytes: Size limit of the fallback spool file
+        spool_replay_interval_seconds: Min seconds between spool replays
     """
 
     hosts: list[str] = field(default_factory=lambda: ["http://localhost:9200"])
@@ -42,6 +51,14 @@ class ElasticsearchConfig:
     timeout: int = 30
     max_retries: int = 3
     retry_on_timeout: bool = True
+    queue_capacity: int = 10_000
+    overflow_policy: str = "drop_oldest"
+    sample_rate: float = 0.1
+    max_concurrent_requests: int = 4
+    compression_level: int = 6
+    retry_backoff_seconds: float = 0.5
+    spool_max_bytes: int | None = 100 * 1024 * 1024
+    spool_replay_interval_seconds: float = 30.0
 
 
 # Index template for ECS-compatible logs
@@ -11,7 +11,6 @@ Main handler interface that composes configuration, buffering, and indexing.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
@@ -22,11 +21,13 @@ from infrastructure.observability.elasticsearch_buffer import (
     BulkIndexer,
     FallbackWriter,
     LogBuffer,
+    OverflowPolicy,
 )
 from infrastructure.observability.elasticsearch_config import (
     ECS_INDEX_TEMPLATE,
     ElasticsearchConfig,
 )
+from infrastructure.observability.elasticsearch_shipping import LogShipper, ShippingStats
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -55,10 +56,11 @@ class ElasticsearchHandler:
     """Async Elasticsearch handler for structured logs.
 
     Features:
-    - Batched bulk indexing
+    - Bounded buffer with drop or sample overflow policy
+    - Batched, gzip-compressed bulk indexing from a background task
     - Automatic index rotation (daily)
-    - Connection retry with exponential backoff
-    - Fallback to local file on persistent failure
+    - Concurrent bulk requests with exponential backoff retries
+    - On-disk spool on persistent failure, replayed on recovery
     - ILM (Index Lifecycle Management) support
 
     **Feature: observability-infrastructure**
@@ -87,61 +89,34 @@ class ElasticsearchHandler:
         self._buffer = LogBuffer(
             batch_size=config.batch_size,
             flush_interval_seconds=config.flush_interval_seconds,
+            capacity=config.queue_capacity,
+            overflow=OverflowPolicy(config.overflow_policy),
+            sample_rate=config.sample_rate,
+        )
+        self._fallback = FallbackWriter(
+            fallback_path or Path("logs/fallback.log"),
+            max_bytes=config.spool_max_bytes,
         )
-        self._fallback = FallbackWriter(fallback_path or Path("logs/fallback.log"))
         self._indexer = BulkIndexer(config.index_prefix)
-        self._client: AsyncElasticsearch | None = None
-        self._flush_task: asyncio.Task[None] | None = None
-        self._logger = structlog.get_logger(__name__)
-        self._consecutive_failures = 0
-        self._max_consecutive_failures = 5
-
-    async def _get_client(self) -> AsyncElasticsearch:
-        """Get or create Elasticsearch client."""
-        if self._client is None:
-            from elasticsearch import AsyncElasticsearch
-
-            # Build auth params
-            auth_params: dict[str, Any] = {}
-            if self._config.api_key:
-                auth_params["api_key"] = self._config.api_key
-            elif self._config.username and self._config.password:
-                auth_params["basic_auth"] = (
-                    self._config.username,
-                    self._config.password,
-                )
-
-            # Build SSL params
-            ssl_params: dict[str, Any] = {}
-            if self._config.use_ssl:
-                ssl_params["use_ssl"] = True
-                ssl_params["verify_certs"] = self._config.verify_certs
-                if self._config.ca_certs:
-                    ssl_params["ca_certs"] = self._config.ca_certs
-
-            self._client = AsyncElasticsearch(
-                hosts=self._config.hosts,
-                timeout=self._config.timeout,
-                max_retries=self._config.max_retries,
-                retry_on_timeout=self._config.retry_on_timeout,
-                **auth_params,
-                **ssl_params,
-            )
-
-        return self._client
+        self._shipper = LogShipper(config, self._buffer, self._indexer, self._fallback)
 
-    async def emit(self, event: dict[str, Any]) -> None:
-        """Add log event to buffer.
+    @property
+    def shipper(self) -> LogShipper:
+        """Background shipping pipeline."""
+        return self._shipper
+
+    def get_stats(self) -> ShippingStats:
+        """Get log shipping counters."""
+        return self._shipper.get_stats()
+
+    def emit_nowait(self, event: dict[str, Any]) -> None:
+        """Add log event to buffer without blocking.
+
+        Safe to call from any thread; outside the event loop thread the
+        event is shipped on the next flush interval.
 
         Args:
             event: Log event dictionary
-
-        Example:
-            >>> await handler.emit({
-            ...     "message": "User logged in",
-            ...     "level": "INFO",
-            ...     "user_id": "123",
-            ... })
         """
         # Add timestamp if not present
         if "@timestamp" not in event and "timestamp" not in event:
@@ -149,69 +124,43 @@ class ElasticsearchHandler:
 
         should_flush = self._buffer.add(event)
 
-        # Flush if buffer is full
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._shipper.start()
         if should_flush:
-            await self.flush()
+            self._shipper.notify()
 
-        # Start periodic flush task if not running
-        if self._flush_task is None or self._flush_task.done():
-            self._flush_task = asyncio.create_task(self._periodic_flush())
+    async def emit(self, event: dict[str, Any]) -> None:
+        """Add log event to buffer.
 
-    async def _periodic_flush(self) -> None:
-        """Periodically flush buffer."""
-        while self._buffer.has_events():
-            await asyncio.sleep(self._config.flush_interval_seconds)
-            if self._buffer.has_events():
-                await self.flush()
+        Args:
+            event: Log event dictionary
+
+        Example:
+            >>> await handler.emit(
+            ...     {
+            ...         "message": "User logged in",
+            ...         "level": "INFO",
+            ...         "user_id": "123",
+            ...     }
+            ... )
+        """
+        self.emit_nowait(event)
 
     async def flush(self) -> None:
-        """Flush buffer to Elasticsearch.
+        """Ship buffered events to Elasticsearch.
 
-        Uses bulk API for efficient indexing. Falls back to local file
-        if Elasticsearch is unavailable.
+        Uses bulk API for efficient indexing. Batches that cannot be
+        indexed are spooled to the fallback file.
         """
-        events = self._buffer.take_all()
-        if not events:
-            return
-
-        try:
-            client = await self._get_client()
-            await self._indexer.bulk_index(client, events)
-            self._consecutive_failures = 0
-        except Exception:
-            self._consecutive_failures += 1
-            self._logger.warning(
-                "Failed to send logs to Elasticsearch",
-                operation="ES_FLUSH",
-                consecutive_failures=self._consecutive_failures,
-                exc_info=True,
-            )
-
-            # Fallback to local file
-            await self._fallback.write(events)
-
-            # Re-buffer events if we haven't hit max failures
-            if self._consecutive_failures < self._max_consecutive_failures:
-                for event in events:
-                    self._buffer.add(event)
+        await self._shipper.flush()
 
     async def close(self) -> None:
         """Close handler and flush remaining events."""
         self._buffer.close()
-
-        # Cancel periodic flush task
-        if self._flush_task and not self._flush_task.done():
-            self._flush_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._flush_task
-
-        # Final flush
-        await self.flush()
-
-        # Close client
-        if self._client:
-            await self._client.close()
-            self._client = None
+        await self._shipper.close()
 
     async def __aenter__(self) -> ElasticsearchHandler:
         """Async context manager entry."""
@@ -250,7 +199,6 @@ class ElasticsearchLogProcessor:
         """
         self._handler = ElasticsearchHandler(config) if enabled else None
         self._enabled = enabled
-        self._pending_tasks: set[asyncio.Task[None]] = set()
 
     def __call__(
         self,
@@ -260,19 +208,11 @@ class ElasticsearchLogProcessor:
     ) -> dict[str, Any]:
         """Process log event and ship to Elasticsearch.
 
-        This is a pass-through processor that queues the event
-        for async shipping while returning it unchanged.
+        This is a pass-through processor that buffers the event
+        for background shipping while returning it unchanged.
         """
         if self._enabled and self._handler:
-            # Queue event for async shipping (fire and forget)
-            try:
-                loop = asyncio.get_running_loop()
-                task = loop.create_task(self._handler.emit(event_dict.copy()))
-                self._pending_tasks.add(task)
-                task.add_done_callback(self._pending_tasks.discard)
-            except RuntimeError:
-                # No running loop - skip shipping
-                pass
+            self._handler.emit_nowait(event_dict.copy())
 
         return event_dict
 
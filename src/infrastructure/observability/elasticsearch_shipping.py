@@ -0,0 +1,354 @@
+"""Background log shipping pipeline for Elasticsearch.
+
+Events wait in a bounded ``LogBuffer``; a worker task drains it in
+batches, encodes each batch to a gzip-compressed NDJSON bulk body in a
+worker thread, and sends up to ``max_concurrent_requests`` bulk requests
+at once with retries. Batches that still fail are spooled to disk through
+``FallbackWriter`` and replayed batch by batch once Elasticsearch accepts
+requests again.
+
+**Feature: observability-infrastructure**
+**Requirement: R1.3 - Ship logs to Elasticsearch with buffering**
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import itertools
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import structlog
+
+if TYPE_CHECKING:
+    from infrastructure.observability.elasticsearch_buffer import (
+        BulkIndexer,
+        FallbackWriter,
+        LogBuffer,
+    )
+    from infrastructure.observability.elasticsearch_config import ElasticsearchConfig
+
+logger = structlog.get_logger(__name__)
+
+
+class RetryableBulkError(Exception):
+    """Bulk request rejected with a status worth retrying (429 or 5xx)."""
+
+
+@dataclass(slots=True)
+class ShippingStats:
+    """Log shipping counters.
+
+    Attributes:
+        queue_depth: Events waiting in the buffer.
+        dropped_events: Events dropped by the buffer's overflow policy.
+        shipped_events: Events accepted by bulk requests.
+        shipped_bytes: Bulk body bytes sent successfully.
+        rejected_events: Events Elasticsearch reported item errors for.
+        failed_requests: Bulk requests that failed after all retries.
+        retries: Bulk request retries.
+        spooled_events: Events written to the fallback spool.
+        replayed_events: Events read back from the spool.
+        in_flight_requests: Bulk requests currently in flight.
+    """
+
+    queue_depth: int = 0
+    dropped_events: int = 0
+    shipped_events: int = 0
+    shipped_bytes: int = 0
+    rejected_events: int = 0
+    failed_requests: int = 0
+    retries: int = 0
+    spooled_events: int = 0
+    replayed_events: int = 0
+    in_flight_requests: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for export."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class BulkTransport:
+    """Sends pre-encoded bulk bodies to Elasticsearch over HTTP.
+
+    Requests rotate across the configured hosts.
+    """
+
+    def __init__(self, config: ElasticsearchConfig, client: httpx.AsyncClient | None = None) -> None:
+        """Initialize bulk transport.
+
+        Args:
+            config: Elasticsearch configuration
+            client: HTTP client to use instead of one built from config
+        """
+        self._hosts = itertools.cycle([host.rstrip("/") for host in config.hosts])
+        self._headers = {"Content-Type": "application/x-ndjson"}
+        if config.compression_level:
+            self._headers["Content-Encoding"] = "gzip"
+        if config.api_key:
+            api_key = config.api_key
+            if isinstance(api_key, tuple):
+                api_key = base64.b64encode(f"{api_key[0]}:{api_key[1]}".encode()).decode()
+            self._headers["Authorization"] = f"ApiKey {api_key}"
+        auth = (
+            httpx.BasicAuth(config.username, config.password)
+            if config.username and config.password and not config.api_key
+            else None
+        )
+        self._client = client or httpx.AsyncClient(
+            auth=auth,
+            timeout=config.timeout,
+            verify=config.ca_certs or config.verify_certs,
+        )
+
+    async def send(self, body: bytes) -> dict[str, Any]:
+        """Send one bulk request.
+
+        Raises:
+            RetryableBulkError: On 429 or 5xx responses
+            httpx.HTTPError: On transport errors and other error statuses
+        """
+        response = await self._client.post(f"{next(self._hosts)}/_bulk", content=body, headers=self._headers)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableBulkError(f"Bulk request failed with status {response.status_code}")
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+
+class LogShipper:
+    """Ships buffered log events to Elasticsearch from a background task.
+
+    Call ``notify()`` when the buffer reaches a batch; otherwise the worker
+    wakes every ``flush_interval_seconds``. The worker waits for a free
+    request slot before taking the next batch, so while Elasticsearch is
+    slow events accumulate in the bounded buffer, where the overflow
+    policy applies, instead of in memory.
+    """
+
+    def __init__(
+        self,
+        config: ElasticsearchConfig,
+        buffer: LogBuffer,
+        indexer: BulkIndexer,
+        fallback: FallbackWriter,
+        transport: BulkTransport | None = None,
+    ) -> None:
+        """Initialize log shipper.
+
+        Args:
+            config: Elasticsearch configuration
+            buffer: Buffer events are taken from
+            indexer: Encoder of bulk bodies
+            fallback: Spool for batches that could not be shipped
+            transport: Bulk transport, built from config if omitted
+        """
+        self._config = config
+        self._buffer = buffer
+        self._indexer = indexer
+        self._fallback = fallback
+        self._transport = transport or BulkTransport(config)
+        self._stats = ShippingStats()
+        self._slots = asyncio.Semaphore(config.max_concurrent_requests)
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._wake = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._healthy = True
+        self._last_replay = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background worker is running."""
+        return self._worker is not None and not self._worker.done()
+
+    def get_stats(self) -> ShippingStats:
+        """Get a snapshot of shipping counters."""
+        self._stats.queue_depth = len(self._buffer)
+        self._stats.dropped_events = self._buffer.dropped
+        self._stats.in_flight_requests = len(self._in_flight)
+        return ShippingStats(**self._stats.to_dict())
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop."""
+        if not self.is_running:
+            self._worker = asyncio.create_task(self._run(), name="log_shipper")
+
+    def notify(self) -> None:
+        """Wake the worker to ship a full batch."""
+        self._wake.set()
+
+    async def flush(self) -> None:
+        """Ship all buffered events and wait for in-flight requests."""
+        await self._ship_buffered()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def replay_spool(self) -> None:
+        """Ship events spooled while Elasticsearch was unavailable.
+
+        Batches are read and shipped one at a time and each is removed from
+        the spool only after Elasticsearch accepted it. Replay stops at the
+        first batch that fails, leaving it and the rest spooled.
+        """
+        self._last_replay = time.monotonic()
+        while self._fallback.has_spooled():
+            batch = await self._fallback.read_batch(self._config.batch_size)
+            if batch is None:
+                return
+            if batch.events:
+                async with self._slots:
+                    if not await self._send(batch.events):
+                        return
+            self._stats.replayed_events += len(batch.events)
+            if not await self._fallback.acknowledge(batch):
+                return
+
+    async def close(self) -> None:
+        """Stop the worker, ship remaining events and close the transport."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        await self.flush()
+        await self._transport.aclose()
+
+    async def _run(self) -> None:
+        """Ship batches as they fill or the flush interval passes."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._config.flush_interval_seconds)
+            self._wake.clear()
+            try:
+                await self._ship_buffered()
+                if self._healthy and time.monotonic() - self._last_replay >= self._config.spool_replay_interval_seconds:
+                    await self.replay_spool()
+            except Exception:
+                logger.exception("Log shipping iteration failed", operation="ES_SHIP")
+
+    async def _ship_buffered(self) -> None:
+        """Dispatch buffered events in batches."""
+        while self._buffer.has_events():
+            await self._dispatch(self._buffer.take(self._config.batch_size))
+
+    async def _dispatch(self, events: list[dict[str, Any]]) -> None:
+        """Start shipping a batch once a request slot is free."""
+        if not events:
+            return
+        await self._slots.acquire()
+        task = asyncio.create_task(self._ship(events))
+        self._in_flight.add(task)
+        task.add_done_callback(self._release)
+
+    def _release(self, task: asyncio.Task[None]) -> None:
+        """Free the request slot of a finished batch."""
+        self._in_flight.discard(task)
+        self._slots.release()
+
+    async def _ship(self, events: list[dict[str, Any]]) -> None:
+        """Send one batch, spooling it if every attempt fails."""
+        if not await self._send(events) and await self._fallback.write(events):
+            self._stats.spooled_events += len(events)
+
+    async def _send(self, events: list[dict[str, Any]]) -> bool:
+        """Encode and send one batch with retries.
+
+        Returns:
+            True if Elasticsearch accepted the request
+        """
+        body = await asyncio.to_thread(self._indexer.encode, events, self._config.compression_level)
+        error: Exception | None = None
+        for attempt in range(self._config.max_retries + 1):
+            try:
+                response = await self._transport.send(body)
+            except (RetryableBulkError, httpx.HTTPError) as e:
+                error = e
+                if attempt == self._config.max_retries:
+                    break
+                self._stats.retries += 1
+                await asyncio.sleep(self._config.retry_backoff_seconds * 2**attempt)
+                continue
+            self._healthy = True
+            self._stats.shipped_events += len(events)
+            self._stats.shipped_bytes += len(body)
+            self._stats.rejected_events += self._indexer.log_errors(response)
+            return True
+
+        self._healthy = False
+        self._stats.failed_requests += 1
+        logger.warning(
+            "Failed to send logs to Elasticsearch",
+            operation="ES_FLUSH",
+            events=len(events),
+            error=str(error),
+        )
+        return False
+
+
+class ShippingMetricsExporter:
+    """Export log shipping counters to OpenTelemetry.
+
+    Registers observable instruments read from ``LogShipper.get_stats()``
+    at collection time, so shipping itself records nothing extra.
+
+    Metrics exported:
+        - log_shipping.queue_depth (Gauge): Events waiting to be shipped
+        - log_shipping.in_flight (Gauge): Bulk requests in flight
+        - log_shipping.dropped (Counter): Events dropped on overflow
+        - log_shipping.shipped (Counter): Events shipped
+        - log_shipping.bytes (Counter): Bulk body bytes shipped
+        - log_shipping.spooled (Counter): Events spooled to disk
+
+    Example:
+        >>> ShippingMetricsExporter(handler.shipper)
+    """
+
+    _COUNTERS = (
+        ("log_shipping.dropped", "dropped_events", "Log events dropped on overflow", "1"),
+        ("log_shipping.shipped", "shipped_events", "Log events shipped", "1"),
+        ("log_shipping.bytes", "shipped_bytes", "Bulk body bytes shipped", "By"),
+        ("log_shipping.spooled", "spooled_events", "Log events spooled to disk", "1"),
+    )
+    _GAUGES = (
+        ("log_shipping.queue_depth", "queue_depth", "Log events waiting to be shipped", "1"),
+        ("log_shipping.in_flight", "in_flight_requests", "Bulk requests in flight", "1"),
+    )
+
+    def __init__(self, shipper: LogShipper, meter_name: str = "my_app.log_shipping") -> None:
+        """Initialize shipping metrics exporter.
+
+        Args:
+            shipper: Log shipper to observe.
+            meter_name: OpenTelemetry meter name.
+        """
+        self._shipper = shipper
+        try:
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter(meter_name)
+            for name, field, description, unit in self._COUNTERS:
+                meter.create_observable_counter(
+                    name=name, callbacks=[self._observe(field)], description=description, unit=unit
+                )
+            for name, field, description, unit in self._GAUGES:
+                meter.create_observable_gauge(
+                    name=name, callbacks=[self._observe(field)], description=description, unit=unit
+                )
+        except ImportError:
+            logger.warning("OpenTelemetry not available, log shipping metrics will not be exported")
+
+    def _observe(self, field: str) -> Any:
+        """Build an instrument callback reading one stats field."""
+        from opentelemetry.metrics import Observation
+
+        def callback(options: Any) -> list[Observation]:
+            return [Observation(getattr(self._shipper.get_stats(), field))]
+
+        return callback
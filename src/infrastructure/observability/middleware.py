@@ -8,12 +8,10 @@ with OpenTelemetry, including context propagation and metrics.
 """
 
 import time
-from collections.abc import Callable
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from infrastructure.observability.telemetry import (
     _current_span_id,
@@ -22,7 +20,7 @@ from infrastructure.observability.telemetry import (
 )
 
 
-class TracingMiddleware(BaseHTTPMiddleware):
+class TracingMiddleware:
     """Middleware for HTTP request tracing with OpenTelemetry.
 
     Creates spans for each HTTP request with:
@@ -37,7 +35,7 @@ class TracingMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         service_name: str = "my-api",
         excluded_paths: list[str] | None = None,
     ) -> None:
@@ -48,7 +46,7 @@ class TracingMiddleware(BaseHTTPMiddleware):
             service_name: Service name for span attributes.
             excluded_paths: Paths to exclude from tracing (e.g., health checks).
         """
-        super().__init__(app)
+        self.app = app
         self._service_name = service_name
         self._excluded_paths = excluded_paths or ["/health/live", "/health/ready"]
         self._request_counter: Any = None
@@ -148,35 +146,36 @@ class TracingMiddleware(BaseHTTPMiddleware):
         if self._request_duration:
             self._request_duration.record(duration, labels)
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Any],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with tracing.
 
         **Refactored: 2025 - Reduced complexity from 11 to 6**
         """
-        path = request.url.path
-
-        if not self._should_trace(path):
-            return await call_next(request)
+        if scope["type"] != "http" or not self._should_trace(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
+        path = scope["path"]
         tracer = get_telemetry().get_tracer()
-        method = request.method
+        method = scope["method"]
         context = self._extract_trace_context(request)
         start_time = time.perf_counter()
         status_code = 500
 
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         with tracer.start_as_current_span(f"{method} {path}", context=context, kind=_get_span_kind()) as span:
             self._set_request_attributes(span, request)
             self._update_trace_context_vars()
 
             try:
-                response = await call_next(request)
-                status_code = response.status_code
+                await self.app(scope, receive, send_with_status)
                 self._set_response_status(span, status_code)
-                return response
             except Exception as e:
                 span.record_exception(e)
                 try:
@@ -0,0 +1,316 @@
+"""Streaming statistics over sliding windows.
+
+Constant-time building blocks for per-sample metric analysis:
+
+- QuantileSketch: mergeable log-bucket quantile sketch (DDSketch) with
+  bounded relative error, supporting removal of values
+- RollingWindow: bounded, time-limited window with running mean and
+  variance (Welford), sliding min/max and a quantile sketch
+- TrendWindow: least-squares slope of the last N values, updated in O(1)
+
+**Feature: api-architecture-analysis**
+**Validates: Requirements 7.3**
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+
+class QuantileSketch:
+    """Quantile sketch with relative accuracy guarantees.
+
+    Values are counted in logarithmically sized buckets, so a quantile is
+    returned within ``relative_accuracy`` of the true value and the number
+    of buckets depends on the value range, not the number of samples.
+    Sketches with the same accuracy can be merged.
+
+    Example:
+        >>> sketch = QuantileSketch(relative_accuracy=0.01)
+        >>> for v in range(1, 101):
+        ...     sketch.add(float(v))
+        >>> round(sketch.quantile(0.5))
+        51
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """Initialize quantile sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of a quantile.
+
+        Raises:
+            ValueError: If relative_accuracy is not between 0 and 1.
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self._relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def relative_accuracy(self) -> float:
+        """Maximum relative error of a quantile."""
+        return self._relative_accuracy
+
+    def add(self, value: float) -> None:
+        """Add a value.
+
+        Raises:
+            ValueError: If the value is NaN or infinite.
+        """
+        self._update(value, 1)
+
+    def remove(self, value: float) -> None:
+        """Remove a previously added value."""
+        self._update(value, -1)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Add all values counted by another sketch.
+
+        Raises:
+            ValueError: If the sketches have different accuracy.
+        """
+        if other._gamma != self._gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, count in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + count
+        for key, count in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + count
+        self._zero += other._zero
+        self._count += other._count
+
+    def quantile(self, q: float) -> float:
+        """Get the value at quantile ``q`` (0 to 1), or 0.0 if empty."""
+        if self._count == 0:
+            return 0.0
+        rank = min(int(self._count * q), self._count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self._positive))
+
+    def _update(self, value: float, delta: int) -> None:
+        """Adjust the count of the bucket holding a value."""
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot sketch non-finite value: {value}")
+        self._count += delta
+        if value == 0:
+            self._zero += delta
+            return
+        buckets = self._positive if value > 0 else self._negative
+        key = math.ceil(math.log(abs(value)) / self._log_gamma)
+        count = buckets.get(key, 0) + delta
+        if count > 0:
+            buckets[key] = count
+        else:
+            buckets.pop(key, None)
+
+    def _bucket_value(self, key: int) -> float:
+        """Representative magnitude of a bucket."""
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+
+class RollingWindow:
+    """Sliding window of samples with O(1) running statistics.
+
+    Holds at most ``capacity`` samples no older than ``max_age_seconds``.
+    Mean and variance are maintained with Welford's algorithm extended to
+    removals and recomputed exactly once per ``capacity`` removals to
+    bound floating-point drift; min and max use monotonic queues.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        max_age_seconds: float,
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        """Initialize rolling window.
+
+        Args:
+            capacity: Maximum number of samples.
+            max_age_seconds: Maximum sample age.
+            relative_accuracy: Relative accuracy of quantiles.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._max_age = max_age_seconds
+        self._values: deque[float] = deque()
+        self._times: deque[float] = deque()
+        self._mins: deque[float] = deque()
+        self._maxs: deque[float] = deque()
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removals = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window."""
+        return self._mean
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation of the window."""
+        n = len(self._values)
+        return math.sqrt(self._m2 / (n - 1)) if n > 1 else 0.0
+
+    @property
+    def min(self) -> float:
+        """Smallest value in the window, or 0.0 if empty."""
+        return self._mins[0] if self._mins else 0.0
+
+    @property
+    def max(self) -> float:
+        """Largest value in the window, or 0.0 if empty."""
+        return self._maxs[0] if self._maxs else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile ``q``, clamped to the window range."""
+        if not self._values:
+            return 0.0
+        return min(max(self._sketch.quantile(q), self.min), self.max)
+
+    def expire(self, now: float) -> None:
+        """Drop samples older than the maximum age."""
+        cutoff = now - self._max_age
+        while self._times and self._times[0] <= cutoff:
+            self._evict()
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full.
+
+        Raises:
+            ValueError: If the value is NaN or infinite; the window is
+                left unchanged.
+        """
+        self._sketch.add(value)
+        if len(self._values) >= self._capacity:
+            self._evict()
+        self._values.append(value)
+        self._times.append(timestamp)
+
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+        while self._mins and self._mins[-1] > value:
+            self._mins.pop()
+        self._mins.append(value)
+        while self._maxs and self._maxs[-1] < value:
+            self._maxs.pop()
+        self._maxs.append(value)
+
+    def _evict(self) -> None:
+        """Remove the oldest sample."""
+        value = self._values.popleft()
+        self._times.popleft()
+        self._sketch.remove(value)
+        if self._mins[0] == value:
+            self._mins.popleft()
+        if self._maxs[0] == value:
+            self._maxs.popleft()
+
+        n = len(self._values)
+        if n == 0:
+            self._mean = self._m2 = 0.0
+            return
+        self._removals += 1
+        if self._removals >= self._capacity:
+            self._recompute()
+            return
+        old_mean = self._mean
+        self._mean = old_mean - (value - old_mean) / n
+        self._m2 = max(0.0, self._m2 - (value - old_mean) * (value - self._mean))
+
+    def _recompute(self) -> None:
+        """Recompute mean and variance exactly from the window."""
+        n = len(self._values)
+        self._mean = math.fsum(self._values) / n
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+        self._removals = 0
+
+
+class TrendWindow:
+    """Least-squares slope of the last ``size`` values.
+
+    Keeps the sums of ``y`` and ``x * y`` (``x`` being the position in the
+    window) and shifts them in O(1) as values slide out.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize trend window.
+
+        Args:
+            size: Number of most recent values the slope is fitted to.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._size = size
+        self._values: deque[float] = deque()
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the window holds ``size`` values."""
+        return len(self._values) == self._size
+
+    @property
+    def slope(self) -> float:
+        """Slope of the least-squares line through the window."""
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        x_mean = (n - 1) / 2
+        return (self._sum_xy - x_mean * self._sum_y) / (n * (n * n - 1) / 12)
+
+    def add(self, value: float) -> None:
+        """Append a value, sliding the oldest out if the window is full.
+
+        Raises:
+            ValueError: If the value is NaN or infinite.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot add non-finite value: {value}")
+        n = len(self._values)
+        if n == self._size:
+            oldest = self._values.popleft()
+            self._sum_xy += (n - 1) * value - (self._sum_y - oldest)
+            self._sum_y += value - oldest
+        else:
+            self._sum_xy += n * value
+            self._sum_y += value
+        self._values.append(value)
+
+        self._updates += 1
+        if self._updates >= 1024:
+            self._sum_y = math.fsum(self._values)
+            self._sum_xy = math.fsum(i * v for i, v in enumerate(self._values))
+            self._updates = 0
@@ -16,7 +16,7 @@ from infrastructure.prometheus.metrics import (
     summary,
     timer,
 )
-from infrastructure.prometheus.middleware import PrometheusMiddleware
+from infrastructure.prometheus.middleware import PrometheusMiddleware, PrometheusPlugin
 from infrastructure.prometheus.registry import (
     MetricsRegistry,
     get_registry,
@@ -29,6 +29,7 @@ __all__ = [
     "PrometheusConfig",
     # FastAPI
     "PrometheusMiddleware",
+    "PrometheusPlugin",
     "count_exceptions",
     # Metrics decorators
     "counter",
@@ -67,6 +67,7 @@ def setup_prometheus(
     endpoint: str = "/metrics",
     include_in_schema: bool = False,
     skip_paths: list[str] | None = None,
+    add_middleware: bool = True,
 ) -> None:
     """Setup Prometheus metrics for a FastAPI application.
 
@@ -81,6 +82,8 @@ def setup_prometheus(
         endpoint: Metrics endpoint path
         include_in_schema: Include endpoint in OpenAPI schema
         skip_paths: Paths to skip from metrics collection
+        add_middleware: Add PrometheusMiddleware; pass False when HTTP
+            metrics are collected by a ``PrometheusPlugin`` instead
 
     Example:
         >>> from fastapi import FastAPI
@@ -90,11 +93,12 @@ def setup_prometheus(
     from infrastructure.prometheus.middleware import PrometheusMiddleware
 
     # Add middleware
-    app.add_middleware(
-        PrometheusMiddleware,
-        registry=registry,
-        skip_paths=skip_paths,
-    )
+    if add_middleware:
+        app.add_middleware(
+            PrometheusMiddleware,
+            registry=registry,
+            skip_paths=skip_paths,
+        )
 
     # Add endpoint
     router = create_metrics_endpoint(
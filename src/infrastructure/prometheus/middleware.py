@@ -6,74 +6,123 @@
 
 from __future__ import annotations
 
-import time
-from typing import TYPE_CHECKING
-
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import TYPE_CHECKING, Any
 
+from infrastructure.observability.edge import EdgeMiddleware
 from infrastructure.prometheus.registry import get_registry
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
-
     from starlette.requests import Request
-    from starlette.responses import Response
-    from starlette.types import ASGIApp
+    from starlette.types import ASGIApp, Receive, Scope, Send
 
+    from infrastructure.observability.edge import EdgeContext
     from infrastructure.prometheus.registry import MetricsRegistry
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect HTTP request metrics.
+def _route_path(scope: Scope | dict[str, Any]) -> str | None:
+    """Get the route pattern matched for a request, if any."""
+    route = scope.get("route")
+    return getattr(route, "path", None)
+
+
+class PrometheusPlugin:
+    """Edge plugin collecting HTTP request metrics.
 
     Collects:
     - http_requests_total: Counter of total requests
     - http_request_duration_seconds: Histogram of request durations
     - http_requests_in_progress: Gauge of active requests
 
+    Only requests sampled for metrics are recorded; the counter is
+    incremented by the sampling weight so totals stay unbiased.
+
     **Feature: observability-infrastructure**
     **Requirement: R5.3 - HTTP Metrics Middleware**
-
-    Example:
-        >>> app.add_middleware(PrometheusMiddleware)
     """
 
     def __init__(
         self,
-        app: ASGIApp,
         registry: MetricsRegistry | None = None,
         skip_paths: list[str] | None = None,
     ) -> None:
-        """Initialize middleware.
+        """Initialize plugin.
 
         Args:
-            app: ASGI application
             registry: Metrics registry (uses global if not provided)
             skip_paths: Paths to skip from metrics collection
         """
-        super().__init__(app)
-        self._registry = registry or get_registry()
-        self._skip_paths = set(skip_paths or ["/metrics", "/health", "/ready"])
+        self.registry = registry or get_registry()
+        self.skip_paths = set(skip_paths or ["/metrics", "/health", "/ready"])
 
         # Create metrics
-        self._requests_total = self._registry.counter(
+        self._requests_total = self.registry.counter(
             "http_requests_total",
             "Total HTTP requests",
             labels=["method", "endpoint", "status"],
         )
 
-        self._request_duration = self._registry.histogram(
+        self._request_duration = self.registry.histogram(
             "http_request_duration_seconds",
             "HTTP request duration in seconds",
             labels=["method", "endpoint"],
         )
 
-        self._requests_in_progress = self._registry.gauge(
+        self._requests_in_progress = self.registry.gauge(
             "http_requests_in_progress",
             "HTTP requests currently in progress",
             labels=["method", "endpoint"],
         )
 
+    def on_request(self, ctx: EdgeContext) -> None:
+        """Track the request as in progress."""
+        if not ctx.metrics_sampled or ctx.path in self.skip_paths:
+            return
+        endpoint = _route_path(ctx.scope) or ctx.path
+        ctx.data["metrics_endpoint"] = endpoint
+        self._requests_in_progress.labels(method=ctx.method, endpoint=endpoint).inc()
+
+    def on_complete(self, ctx: EdgeContext) -> None:
+        """Record duration and count of a tracked request."""
+        endpoint = ctx.data.pop("metrics_endpoint", None)
+        if endpoint is None:
+            return
+        status = "500" if ctx.error is not None else str(ctx.status_code)
+        self._request_duration.labels(method=ctx.method, endpoint=endpoint).observe(ctx.duration)
+        self._requests_total.labels(method=ctx.method, endpoint=endpoint, status=status).inc(ctx.metrics_weight)
+        self._requests_in_progress.labels(method=ctx.method, endpoint=endpoint).dec()
+
+
+class PrometheusMiddleware(EdgeMiddleware):
+    """Middleware to collect HTTP request metrics.
+
+    Runs a ``PrometheusPlugin`` in an ``EdgeMiddleware`` without writing
+    a request log record.
+
+    **Feature: observability-infrastructure**
+    **Requirement: R5.3 - HTTP Metrics Middleware**
+
+    Example:
+        >>> app.add_middleware(PrometheusMiddleware)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry | None = None,
+        skip_paths: list[str] | None = None,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+            registry: Metrics registry (uses global if not provided)
+            skip_paths: Paths to skip from metrics collection
+        """
+        plugin = PrometheusPlugin(registry, skip_paths)
+        self._registry = plugin.registry
+        self._skip_paths = plugin.skip_paths
+        super().__init__(app, [plugin], log_event=None)
+
     def _get_endpoint(self, request: Request) -> str:
         """Get normalized endpoint for metrics.
 
@@ -83,64 +132,18 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         Returns:
             Endpoint path (uses route pattern if available)
         """
-        # Try to get the route pattern for better grouping
-        if hasattr(request, "scope") and "route" in request.scope:
-            route = request.scope["route"]
-            if hasattr(route, "path"):
-                return route.path
+        return _route_path(request.scope) or request.url.path
 
-        return request.url.path
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics.
 
         Args:
-            request: HTTP request
-            call_next: Next middleware/handler
-
-        Returns:
-            HTTP response
+            scope: ASGI scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
         # Skip metrics collection for certain paths
-        if request.url.path in self._skip_paths:
-            return await call_next(request)
-
-        method = request.method
-        endpoint = self._get_endpoint(request)
-
-        # Track in-progress requests
-        self._requests_in_progress.labels(method=method, endpoint=endpoint).inc()
-        start_time = time.perf_counter()
-
-        try:
-            response = await call_next(request)
-            status = str(response.status_code)
-        except Exception:
-            status = "500"
-            raise
-        finally:
-            # Record duration
-            duration = time.perf_counter() - start_time
-            self._request_duration.labels(
-                method=method,
-                endpoint=endpoint,
-            ).observe(duration)
-
-            # Record request count
-            self._requests_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status=status,
-            ).inc()
-
-            # Decrement in-progress
-            self._requests_in_progress.labels(
-                method=method,
-                endpoint=endpoint,
-            ).dec()
-
-        return response
+        if scope["type"] == "http" and scope["path"] in self._skip_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -10,13 +10,14 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 import structlog
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from fastapi import Response
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
     from infrastructure.ratelimit.config import RateLimit
     from infrastructure.ratelimit.limiter import RateLimiter, RateLimitResult
@@ -150,7 +151,7 @@ class APIKeyExtractor:
 # =============================================================================
 
 
-class RateLimitMiddleware[TClient](BaseHTTPMiddleware):
+class RateLimitMiddleware[TClient]:
     """Generic rate limit middleware for FastAPI.
 
     **Requirement: R5.5 - Generic_RateLimitMiddleware[TClient]**
@@ -175,7 +176,7 @@ class RateLimitMiddleware[TClient](BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         limiter: RateLimiter[TClient],
         extractor: ClientExtractor[TClient],
         endpoint_limits: dict[str, RateLimit] | None = None,
@@ -192,7 +193,7 @@ class RateLimitMiddleware[TClient](BaseHTTPMiddleware):
             exclude_paths: Paths to exclude from rate limiting.
             on_rate_limited: Custom handler for rate limited requests.
         """
-        super().__init__(app)
+        self.app = app
         self._limiter = limiter
         self._extractor = extractor
         self._exclude_paths = exclude_paths or {
@@ -206,23 +207,20 @@ class RateLimitMiddleware[TClient](BaseHTTPMiddleware):
         if endpoint_limits:
             self._limiter.configure(endpoint_limits)
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through rate limiter.
 
         Args:
-            request: FastAPI request.
-            call_next: Next middleware/handler.
-
-        Returns:
-            Response with rate limit headers.
+            scope: ASGI scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        # Skip excluded paths
-        if request.url.path in self._exclude_paths:
-            return await call_next(request)
+        # Skip non-HTTP scopes and excluded paths
+        if scope["type"] != "http" or scope["path"] in self._exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
         # Extract client identifier
         try:
@@ -234,7 +232,8 @@ class RateLimitMiddleware[TClient](BaseHTTPMiddleware):
                 operation="RATELIMIT_EXTRACT",
                 exc_info=True,
             )
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get endpoint-specific limit
         endpoint = self._get_endpoint_key(request)
@@ -244,16 +243,19 @@ class RateLimitMiddleware[TClient](BaseHTTPMiddleware):
         result = await self._limiter.check(client, limit, endpoint)
 
         if not result.is_allowed:
-            return await self._handle_rate_limited(result)
-
-        # Process request and add headers
-        response = await call_next(request)
-
-        # Add rate limit headers
-        for key, value in result.headers.items():
-            response.headers[key] = value
-
-        return response
+            response = await self._handle_rate_limited(result)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers
+                response_headers = MutableHeaders(scope=message)
+                for key, value in result.headers.items():
+                    response_headers[key] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
     def _get_endpoint_key(self, request: Request) -> str:
         """Get endpoint key for rate limit lookup.
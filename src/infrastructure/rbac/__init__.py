@@ -7,12 +7,14 @@ Exports:
     - Permission[TResource, TAction]: Generic permission
     - Role[TPermission]: Generic role
     - RBAC[TUser]: Generic RBAC checker
+    - PermissionIndex, RoleMaskCache: Compiled permission bitsets
     - requires: Permission decorator
     - AuditEvent: Audit event model
 """
 
 from infrastructure.rbac.audit import AuditEvent, AuditLogger, InMemoryAuditSink
 from infrastructure.rbac.checker import RBAC, requires
+from infrastructure.rbac.compiled import PermissionIndex, PermissionValues, RoleMaskCache
 from infrastructure.rbac.permission import Action, Permission, Resource
 from infrastructure.rbac.role import Role, RoleRegistry
 
@@ -26,9 +28,13 @@ __all__ = [
     "InMemoryAuditSink",
     # Permission
     "Permission",
+    # Compiled
+    "PermissionIndex",
+    "PermissionValues",
     "Resource",
     # Role
     "Role",
+    "RoleMaskCache",
     "RoleRegistry",
     "requires",
 ]
@@ -13,7 +13,9 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 import structlog
 from fastapi import HTTPException, Request
 
+from infrastructure.rbac.compiled import PermissionIndex, RoleMaskCache
 from infrastructure.rbac.permission import Permission
+from infrastructure.rbac.role import role_generation
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -51,6 +53,9 @@ class RBAC[TUser: RBACUser, TResource: Enum, TAction: Enum]:
 
     **Requirement: R14.2 - Generic_RBAC[TUser].has_permission()**
 
+    Roles are compiled into permission bitmasks, memoized per role
+    combination and recompiled whenever a role or the registry changes.
+
     Type Parameters:
         TUser: User type implementing RBACUser protocol.
         TResource: Resource enum type.
@@ -84,6 +89,22 @@ class RBAC[TUser: RBACUser, TResource: Enum, TAction: Enum]:
         """
         self._registry = role_registry
         self._audit_logger = audit_logger
+        self._index: PermissionIndex[Permission[TResource, TAction]] = PermissionIndex()
+        self._masks = RoleMaskCache(self._index, self._role_permissions)
+        self._generation = role_generation()
+
+    def _role_permissions(self, name: str) -> set[Permission[TResource, TAction]] | None:
+        """Get the flattened permissions of a role."""
+        role = self._registry.get(name)
+        return role.get_all_permissions() if role else None
+
+    def _user_mask(self, user: TUser) -> int:
+        """Get the compiled permission mask of a user's roles."""
+        generation = role_generation()
+        if generation != self._generation:
+            self._masks.invalidate()
+            self._generation = generation
+        return self._masks.mask(user.roles)
 
     def has_permission(
         self,
@@ -101,11 +122,7 @@ class RBAC[TUser: RBACUser, TResource: Enum, TAction: Enum]:
         Returns:
             True if user has permission.
         """
-        for role_name in user.roles:
-            role = self._registry.get(role_name)
-            if role and role.has_permission(permission):
-                return True
-        return False
+        return bool(self._user_mask(user) & self._index.bit(permission))
 
     def check_permission(
         self,
@@ -138,12 +155,7 @@ class RBAC[TUser: RBACUser, TResource: Enum, TAction: Enum]:
         Returns:
             Set of all user permissions.
         """
-        permissions: set[Permission[TResource, TAction]] = set()
-        for role_name in user.roles:
-            role = self._registry.get(role_name)
-            if role:
-                permissions |= role.get_all_permissions()
-        return permissions
+        return set(self._index.permissions(self._user_mask(user)))
 
     async def require_permission(
         self,
@@ -0,0 +1,129 @@
+"""Compiled permission bitsets for RBAC checks.
+
+**Feature: enterprise-generics-2025**
+**Requirement: R14.2 - Generic_RBAC[TUser].has_permission()**
+
+Each permission is assigned one bit of an integer, each role with its
+inheritance flattened becomes a mask, and the effective mask of a role
+combination is memoized, so a permission check is a dictionary lookup and
+a bitwise AND.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class PermissionIndex[TPermission: Hashable]:
+    """Enumerated permission space mapping each permission to one bit.
+
+    Bits are assigned on first use, so a permission no role grants gets a
+    bit that is set in no mask and every check against it fails.
+
+    Example:
+        >>> index = PermissionIndex([Permission.READ, Permission.WRITE])
+        >>> index.mask([Permission.READ]) & index.bit(Permission.WRITE)
+        0
+    """
+
+    def __init__(self, permissions: Iterable[TPermission] = ()) -> None:
+        """Initialize permission index.
+
+        Args:
+            permissions: Permissions to enumerate up front.
+        """
+        self._bits: dict[TPermission, int] = {}
+        self._lock = threading.Lock()
+        for permission in permissions:
+            self.bit(permission)
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    def bit(self, permission: TPermission) -> int:
+        """Get the bit of a permission, assigning one if it is new."""
+        bit = self._bits.get(permission)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(permission)
+                if bit is None:
+                    bit = self._bits[permission] = 1 << len(self._bits)
+        return bit
+
+    def mask(self, permissions: Iterable[TPermission]) -> int:
+        """Get the mask with the bits of all given permissions set."""
+        mask = 0
+        for permission in permissions:
+            mask |= self.bit(permission)
+        return mask
+
+    def permissions(self, mask: int) -> list[TPermission]:
+        """Decode a mask back into its permissions."""
+        return [permission for permission, bit in self._bits.items() if mask & bit]
+
+
+class RoleMaskCache[TPermission: Hashable]:
+    """Memoized permission masks per combination of role names.
+
+    ``resolve`` returns the flattened permissions of one role, or None for
+    an unknown role. Masks are computed once per distinct combination and
+    kept until ``invalidate()`` is called; call it whenever a role changes.
+    """
+
+    def __init__(
+        self,
+        index: PermissionIndex[TPermission],
+        resolve: Callable[[str], Iterable[TPermission] | None],
+        max_entries: int = 4096,
+    ) -> None:
+        """Initialize role mask cache.
+
+        Args:
+            index: Permission space the masks are built over.
+            resolve: Returns the flattened permissions of a role name.
+            max_entries: Combinations kept before the cache is reset.
+        """
+        self._index = index
+        self._resolve = resolve
+        self._max_entries = max_entries
+        self._masks: dict[tuple[str, ...], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Get the combined permission mask of the given role names."""
+        key = tuple(names)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = 0
+            for name in key:
+                permissions = self._resolve(name)
+                if permissions is not None:
+                    mask |= self._index.mask(permissions)
+            if len(self._masks) >= self._max_entries:
+                self._masks.clear()
+            self._masks[key] = mask
+        return mask
+
+    def invalidate(self) -> None:
+        """Drop all memoized masks."""
+        self._masks.clear()
+
+
+class PermissionValues:
+    """Permission values of a mask, decoded only when a log line renders it."""
+
+    __slots__ = ("_index", "_mask")
+
+    def __init__(self, index: PermissionIndex[Any], mask: int) -> None:
+        self._index = index
+        self._mask = mask
+
+    def __repr__(self) -> str:
+        return repr([getattr(p, "value", p) for p in self._index.permissions(self._mask)])
@@ -12,6 +12,24 @@ from typing import Any
 
 from infrastructure.rbac.permission import Permission
 
+_generation = 0
+
+
+def _role_changed() -> None:
+    """Record a change to any role or registry."""
+    global _generation
+    _generation += 1
+
+
+def role_generation() -> int:
+    """Get a counter bumped whenever a role or registry changes.
+
+    Compiled permission masks are valid while it is unchanged. Changes made
+    by mutating ``Role.permissions`` directly are not tracked.
+    """
+    return _generation
+
+
 # =============================================================================
 # Generic Role
 # =============================================================================
@@ -69,6 +87,7 @@ class Role[TPermission]:
             permission: Permission to add.
         """
         self.permissions.add(permission)
+        _role_changed()
 
     def remove_permission(self, permission: TPermission) -> None:
         """Remove permission from role.
@@ -77,6 +96,7 @@ class Role[TPermission]:
             permission: Permission to remove.
         """
         self.permissions.discard(permission)
+        _role_changed()
 
     def get_all_permissions(self) -> set[TPermission]:
         """Get all permissions including inherited.
@@ -99,6 +119,7 @@ class Role[TPermission]:
             Self for chaining.
         """
         self.parent = parent
+        _role_changed()
         return self
 
 
@@ -126,6 +147,7 @@ class RoleRegistry[TResource: Enum, TAction: Enum]:
             role: Role to register.
         """
         self._roles[role.name] = role
+        _role_changed()
 
     def get(self, name: str) -> Role[Permission[TResource, TAction]] | None:
         """Get role by name.
@@ -6,12 +6,19 @@ Provides type-safe ScyllaDB operations with PEP 695 generics.
 **Requirement: R4 - Generic ScyllaDB Repository**
 """
 
+from infrastructure.scylladb.aio import ResultPage
+from infrastructure.scylladb.bulk import BulkWriteConfig, BulkWriter, BulkWriteResult, RowResult
 from infrastructure.scylladb.client import ScyllaDBClient
 from infrastructure.scylladb.config import ScyllaDBConfig
 from infrastructure.scylladb.entity import ScyllaDBEntity
 from infrastructure.scylladb.repository import ScyllaDBRepository
 
 __all__ = [
+    "BulkWriteConfig",
+    "BulkWriteResult",
+    "BulkWriter",
+    "ResultPage",
+    "RowResult",
     "ScyllaDBClient",
     "ScyllaDBConfig",
     "ScyllaDBEntity",
@@ -0,0 +1,104 @@
+"""Asyncio bridge for cassandra-driver response futures.
+
+The driver completes requests on its own I/O thread and reports them
+through ``ResponseFuture.add_callbacks``. ``bridge`` hands each outcome to
+the event loop with ``call_soon_threadsafe``, so awaiting a query holds no
+executor thread. Paged results are read one page at a time by issuing the
+query again with the previous page's ``paging_state``.
+
+**Feature: observability-infrastructure**
+**Requirement: R4.1 - Client Wrapper**
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from cassandra.cluster import ResponseFuture
+
+
+@dataclass(frozen=True, slots=True)
+class ResultPage:
+    """One page of query results.
+
+    Attributes:
+        rows: Rows of this page
+        paging_state: State to fetch the next page with, None on the last page
+    """
+
+    rows: list[Any]
+    paging_state: bytes | None = None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether more pages follow."""
+        return self.paging_state is not None
+
+
+def bridge(
+    response_future: ResponseFuture,
+    loop: asyncio.AbstractEventLoop | None = None,
+) -> asyncio.Future[ResultPage]:
+    """Get an asyncio future resolved with the first page of a driver request.
+
+    Args:
+        response_future: Future returned by ``Session.execute_async``
+        loop: Loop to resolve on, the running loop if omitted
+
+    Returns:
+        Future resolved with the page, or failed with the driver error
+    """
+    loop = loop or asyncio.get_running_loop()
+    future: asyncio.Future[ResultPage] = loop.create_future()
+
+    def on_result(rows: Any) -> None:
+        # The driver sets the paging state before running callbacks; this is
+        # the field ResultSet.paging_state reads.
+        paging_state = response_future._paging_state if response_future.has_more_pages else None
+        _call_soon(loop, _resolve, future, ResultPage(list(rows) if rows else [], paging_state))
+
+    def on_error(exc: BaseException) -> None:
+        _call_soon(loop, _fail, future, exc)
+
+    response_future.add_callbacks(on_result, on_error)
+    return future
+
+
+async def paginate(fetch_page: Callable[[bytes | None], Awaitable[ResultPage]]) -> AsyncIterator[ResultPage]:
+    """Follow a query's paging state, fetching each page after the previous one.
+
+    Args:
+        fetch_page: Fetches the page for a paging state, the first for None
+    """
+    paging_state = None
+    while True:
+        page = await fetch_page(paging_state)
+        yield page
+        if page.paging_state is None:
+            return
+        paging_state = page.paging_state
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable[..., None], *args: Any) -> None:
+    """Schedule a callback on the loop from the driver thread."""
+    # The loop may have closed while the request was in flight.
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(callback, *args)
+
+
+def _resolve(future: asyncio.Future[ResultPage], page: ResultPage) -> None:
+    """Resolve a future unless it was cancelled."""
+    if not future.done():
+        future.set_result(page)
+
+
+def _fail(future: asyncio.Future[ResultPage], exc: BaseException) -> None:
+    """Fail a future unless it was cancelled."""
+    if not future.done():
+        future.set_exception(exc)
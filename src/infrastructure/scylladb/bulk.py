@@ -0,0 +1,197 @@
+"""Partition-grouped concurrent bulk writes.
+
+One large ``UNLOGGED`` batch spanning many partitions makes its coordinator
+fan out to every replica set and fails beyond the batch size limits.
+``BulkWriter`` instead:
+
+- Groups statements by partition key, so a batch only ever holds rows of
+  one partition and is routed to that partition's replicas by the
+  token-aware policy (prepared statements carry the routing key)
+- Splits large partition groups into batches of ``max_batch_rows`` and
+  sends single-row groups as plain statements
+- Runs the groups on ``concurrency`` workers, retrying each group with
+  exponential backoff
+- Reports the outcome of every row
+
+Retries assume idempotent statements, as plain INSERT and DELETE are.
+
+**Feature: observability-infrastructure**
+**Requirement: R4.3 - Generic Repository**
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, Sequence
+
+    from infrastructure.scylladb.client import ScyllaDBClient
+
+logger = structlog.get_logger(__name__)
+
+type Statement = tuple[Any, tuple[Any, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class BulkWriteConfig:
+    """Bulk write tuning.
+
+    Attributes:
+        concurrency: Partition groups written at the same time
+        max_batch_rows: Rows per batch within one partition
+        max_attempts: Attempts per group, including the first
+        retry_backoff_seconds: Delay before the first retry, doubled after each
+    """
+
+    concurrency: int = 32
+    max_batch_rows: int = 100
+    max_attempts: int = 3
+    retry_backoff_seconds: float = 0.05
+
+    def __post_init__(self) -> None:
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.max_batch_rows < 1:
+            raise ValueError("max_batch_rows must be at least 1")
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+
+@dataclass(frozen=True, slots=True)
+class RowResult[T]:
+    """Outcome of one row.
+
+    Attributes:
+        item: Entity or key the row was written for
+        success: Whether the row was written
+        attempts: Attempts made for the row's group
+        error: Last error if the row was not written
+    """
+
+    item: T
+    success: bool
+    attempts: int
+    error: Exception | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BulkWriteResult[T]:
+    """Outcome of a bulk write, one result per row in input order.
+
+    Attributes:
+        rows: Row results
+        requests: Statements and batches sent, retries included
+    """
+
+    rows: list[RowResult[T]]
+    requests: int = 0
+
+    @property
+    def succeeded(self) -> list[T]:
+        """Items that were written."""
+        return [row.item for row in self.rows if row.success]
+
+    @property
+    def failed(self) -> list[tuple[T, Exception]]:
+        """Items that were not written, with their errors."""
+        return [(row.item, row.error) for row in self.rows if row.error is not None]
+
+    @property
+    def all_succeeded(self) -> bool:
+        """Whether every row was written."""
+        return all(row.success for row in self.rows)
+
+
+class BulkWriter:
+    """Writes statements in partition-local batches on a bounded window.
+
+    Example:
+        >>> writer = BulkWriter(client, BulkWriteConfig(concurrency=16))
+        >>> result = await writer.write(users, statements, [(u.id,) for u in users])
+    """
+
+    def __init__(self, client: ScyllaDBClient, config: BulkWriteConfig | None = None) -> None:
+        """Initialize bulk writer.
+
+        Args:
+            client: Connected ScyllaDB client
+            config: Tuning, defaults if omitted
+        """
+        self._client = client
+        self._config = config or BulkWriteConfig()
+
+    async def write[T](
+        self,
+        items: Sequence[T],
+        statements: Sequence[Statement],
+        partition_keys: Sequence[Hashable],
+    ) -> BulkWriteResult[T]:
+        """Write one statement per item.
+
+        Args:
+            items: Items reported back in the row results
+            statements: Prepared statement and parameters per item
+            partition_keys: Partition key values per item
+
+        Returns:
+            Per-row results in input order
+        """
+        groups: dict[Hashable, list[int]] = {}
+        for index, key in enumerate(partition_keys):
+            groups.setdefault(key, []).append(index)
+        size = self._config.max_batch_rows
+        chunks = iter([indexes[i : i + size] for indexes in groups.values() for i in range(0, len(indexes), size)])
+
+        results: list[RowResult[T] | None] = [None] * len(items)
+        requests = [0]
+
+        async def worker() -> None:
+            for chunk in chunks:
+                attempts, error = await self._write_group([statements[i] for i in chunk], requests)
+                for i in chunk:
+                    results[i] = RowResult(items[i], error is None, attempts, error)
+
+        await asyncio.gather(*(worker() for _ in range(min(self._config.concurrency, len(groups) or 1))))
+        return BulkWriteResult([row for row in results if row is not None], requests[0])
+
+    async def _write_group(self, statements: list[Statement], requests: list[int]) -> tuple[int, Exception | None]:
+        """Write one partition group, retrying on failure.
+
+        Returns:
+            Attempts made and the last error, None on success
+        """
+        error: Exception | None = None
+        for attempt, delay in enumerate(self._backoff(), start=1):
+            requests[0] += 1
+            try:
+                if len(statements) == 1:
+                    await self._client.execute(*statements[0])
+                else:
+                    await self._client.execute_batch(statements, batch_type="UNLOGGED")
+            except Exception as exc:
+                error = exc
+                logger.warning(
+                    "Bulk write group failed",
+                    rows=len(statements),
+                    attempt=attempt,
+                    error=str(exc),
+                    operation="SCYLLA_BULK_WRITE",
+                )
+                if delay is not None:
+                    await asyncio.sleep(delay)
+            else:
+                return attempt, None
+        return self._config.max_attempts, error
+
+    def _backoff(self) -> Iterator[float | None]:
+        """Yield the delay after each attempt, None after the last."""
+        delay = self._config.retry_backoff_seconds
+        for _ in range(self._config.max_attempts - 1):
+            yield delay
+            delay *= 2
+        yield None
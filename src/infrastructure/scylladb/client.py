@@ -14,8 +14,11 @@ from typing import TYPE_CHECKING, Any, Final, Self
 import structlog
 
 from infrastructure.errors import DatabaseError
+from infrastructure.scylladb.aio import ResultPage, bridge, paginate
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from cassandra.cluster import Cluster, Session
 
     from infrastructure.scylladb.config import ScyllaDBConfig
@@ -52,7 +55,10 @@ logger = structlog.get_logger(__name__)
 class ScyllaDBClient:
     """Async-compatible ScyllaDB client.
 
-    Wraps cassandra-driver with async execution support.
+    Wraps cassandra-driver with async execution support. Queries run on the
+    driver's own I/O thread and are awaited through ``bridge``, at most
+    ``max_concurrent_requests`` at a time; the thread pool only serves
+    blocking setup calls (connect, prepare, shutdown).
 
     **Feature: observability-infrastructure**
     **Requirement: R4.1 - Client Wrapper**
@@ -72,13 +78,14 @@ class ScyllaDBClient:
 
         Args:
             config: ScyllaDB configuration
-            executor: Optional thread pool for async execution
+            executor: Optional thread pool for blocking setup calls
         """
         self._config = config
-        self._executor = executor or ThreadPoolExecutor(max_workers=10)
+        self._executor = executor or ThreadPoolExecutor(max_workers=4)
         self._owns_executor = executor is None
         self._cluster: Cluster | None = None
         self._session: Session | None = None
+        self._limiter = asyncio.Semaphore(config.max_concurrent_requests)
 
     async def connect(self) -> Self:
         """Connect to ScyllaDB.
@@ -99,6 +106,7 @@ class ScyllaDBClient:
             session = cluster.connect(self._config.keyspace)
             session.default_timeout = self._config.request_timeout
             session.default_consistency_level = self._config.get_consistency_level()
+            session.default_fetch_size = self._config.page_size
             return cluster, session
 
         self._cluster, self._session = await loop.run_in_executor(self._executor, _connect)
@@ -146,61 +154,85 @@ class ScyllaDBClient:
 
     async def execute(
         self,
-        query: str,
+        query: str | Any,
         parameters: tuple | dict | None = None,
         timeout: float | None = None,
     ) -> list[Any]:
         """Execute a CQL query.
 
         Args:
-            query: CQL query string
+            query: CQL query string or statement
             parameters: Query parameters
             timeout: Query timeout
 
         Returns:
-            List of result rows
+            List of result rows, across all pages
         """
-        if not self._session:
-            raise DatabaseError("ScyllaDB not connected")
-
-        loop = asyncio.get_event_loop()
-
-        def _execute() -> list[Any]:
-            result = self._session.execute(
-                query,
-                parameters,
-                timeout=timeout or self._config.request_timeout,
-            )
-            return list(result)
-
-        return await loop.run_in_executor(self._executor, _execute)
+        rows: list[Any] = []
+        async for page in self.pages(query, parameters, timeout):
+            rows.extend(page.rows)
+        return rows
 
     async def execute_async(
         self,
-        query: str,
+        query: str | Any,
         parameters: tuple | dict | None = None,
-    ) -> Any:
-        """Execute query using driver's async.
+    ) -> list[Any]:
+        """Execute query using driver's async; same as ``execute``."""
+        return await self.execute(query, parameters)
 
-        Uses cassandra-driver's built-in async execution.
+    async def execute_page(
+        self,
+        query: str | Any,
+        parameters: tuple | dict | None = None,
+        paging_state: bytes | None = None,
+        timeout: float | None = None,
+    ) -> ResultPage:
+        """Fetch one page of a query's results.
 
         Args:
-            query: CQL query string
+            query: CQL query string or statement
             parameters: Query parameters
+            paging_state: Paging state of the previous page
+            timeout: Query timeout
 
         Returns:
-            ResponseFuture that can be awaited
+            Result page
         """
-        if not self._session:
-            raise DatabaseError("ScyllaDB not connected")
+        session = self.session
+        async with self._limiter:
+            response_future = session.execute_async(
+                query,
+                parameters,
+                timeout=timeout or self._config.request_timeout,
+                paging_state=paging_state,
+            )
+            return await bridge(response_future)
 
-        future = self._session.execute_async(query, parameters)
+    async def pages(
+        self,
+        query: str | Any,
+        parameters: tuple | dict | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[ResultPage]:
+        """Iterate over result pages, requesting each after the previous one.
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            future.result,
-        )
+        Pages hold ``ScyllaDBConfig.page_size`` rows unless the statement
+        sets its own fetch size.
+        """
+        async for page in paginate(lambda state: self.execute_page(query, parameters, state, timeout)):
+            yield page
+
+    async def iterate(
+        self,
+        query: str | Any,
+        parameters: tuple | dict | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate over result rows without materializing every page."""
+        async for page in self.pages(query, parameters, timeout):
+            for row in page.rows:
+                yield row
 
     async def prepare(self, query: str) -> Any:
         """Prepare a CQL statement.
@@ -211,15 +243,9 @@ class ScyllaDBClient:
         Returns:
             PreparedStatement
         """
-        if not self._session:
-            raise DatabaseError("ScyllaDB not connected")
-
+        # The driver has no asynchronous prepare.
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            self._session.prepare,
-            query,
-        )
+        return await loop.run_in_executor(self._executor, self.session.prepare, query)
 
     async def execute_batch(
         self,
@@ -232,23 +258,13 @@ class ScyllaDBClient:
             statements: List of (query, parameters) tuples
             batch_type: LOGGED, UNLOGGED, or COUNTER
         """
-        if not self._session:
-            raise DatabaseError("ScyllaDB not connected")
-
         from cassandra.query import BatchStatement, BatchType
 
-        loop = asyncio.get_event_loop()
-
-        def _batch() -> None:
-            bt = getattr(BatchType, batch_type)
-            batch = BatchStatement(batch_type=bt)
-
-            for query, params in statements:
-                batch.add(query, params)
-
-            self._session.execute(batch)
+        batch = BatchStatement(batch_type=getattr(BatchType, batch_type))
+        for query, params in statements:
+            batch.add(query, params)
 
-        await loop.run_in_executor(self._executor, _batch)
+        await self.execute_page(batch)
 
     async def create_keyspace(
         self,
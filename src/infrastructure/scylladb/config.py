@@ -28,6 +28,8 @@ class ScyllaDBConfig:
         ssl_enabled: Whether to use SSL
         ssl_certfile: Path to SSL certificate
         ssl_keyfile: Path to SSL key
+        max_concurrent_requests: Requests in flight before callers wait
+        page_size: Rows fetched per result page
     """
 
     hosts: list[str] = field(default_factory=lambda: ["localhost"])
@@ -43,6 +45,8 @@ class ScyllaDBConfig:
     ssl_enabled: bool = False
     ssl_certfile: str | None = None
     ssl_keyfile: str | None = None
+    max_concurrent_requests: int = 256
+    page_size: int = 5000
 
     def to_cluster_kwargs(self) -> dict[str, Any]:
         """Convert to cassandra-driver Cluster kwargs.
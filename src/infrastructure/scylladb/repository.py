@@ -13,9 +13,11 @@ from typing import TYPE_CHECKING, Any, TypeVar
 
 import structlog
 
+from infrastructure.scylladb.bulk import BulkWriteConfig, BulkWriter, BulkWriteResult
 from infrastructure.scylladb.entity import ScyllaDBEntity
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from uuid import UUID
 
     from infrastructure.scylladb.client import ScyllaDBClient
@@ -68,16 +70,19 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
         self,
         client: ScyllaDBClient,
         entity_class: type[T],
+        bulk_config: BulkWriteConfig | None = None,
     ) -> None:
         """Initialize repository.
 
         Args:
             client: ScyllaDB client
             entity_class: Entity class for type conversion
+            bulk_config: Tuning for bulk_create and bulk_delete
         """
         self._client = client
         self._entity_class = entity_class
         self._prepared_statements: dict[str, Any] = {}
+        self._bulk_writer = BulkWriter(client, bulk_config)
 
     @property
     def table_name(self) -> str:
@@ -102,6 +107,21 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
             self._prepared_statements[key] = await self._client.prepare(query)
         return self._prepared_statements[key]
 
+    async def _insert_statement(self, columns: tuple[str, ...]) -> Any:
+        """Get the prepared INSERT for a set of columns."""
+        cols_str = ", ".join(self._validate_columns(list(columns)))
+        placeholders = ", ".join(["?"] * len(columns))
+        # S608: False positive - table/column names validated via _validate_identifier
+        query = f"INSERT INTO {self.table_name} ({cols_str}) VALUES ({placeholders})"  # noqa: S608
+        return await self._get_prepared(f"insert_{self.table_name}_{'_'.join(columns)}", query)
+
+    async def _delete_statement(self) -> Any:
+        """Get the prepared DELETE by primary key."""
+        where = " AND ".join(f"{col} = ?" for col in self._validate_columns(self._entity_class.primary_key()))
+        # S608: False positive - identifiers validated, uses prepared statement
+        query = f"DELETE FROM {self.table_name} WHERE {where}"  # noqa: S608
+        return await self._get_prepared(f"delete_{self.table_name}", query)
+
     # CRUD Operations
 
     async def create(self, entity: T) -> T:
@@ -115,14 +135,7 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
         """
         entity.updated_at = datetime.now(UTC)
         data = entity.to_dict()
-        columns = self._validate_columns(list(data.keys()))
-        placeholders = ", ".join(["%s"] * len(columns))
-        cols_str = ", ".join(columns)
-
-        stmt_key = f"insert_{self.table_name}"
-        # S608: False positive - table/column names validated via _validate_identifier
-        query = f"INSERT INTO {self.table_name} ({cols_str}) VALUES ({placeholders})"  # noqa: S608
-        prepared = await self._get_prepared(stmt_key, query)
+        prepared = await self._insert_statement(tuple(data))
         await self._client.execute(prepared, tuple(data.values()))
 
         logger.debug("Created entity", table=self.table_name, id=str(entity.id))
@@ -138,7 +151,7 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
             Entity or None if not found
         """
         pk_cols = self._validate_columns(self._entity_class.primary_key())
-        where = " AND ".join(f"{col} = %s" for col in pk_cols)
+        where = " AND ".join(f"{col} = ?" for col in pk_cols)
 
         stmt_key = f"get_{self.table_name}"
         # S608: False positive - identifiers validated, uses prepared statement
@@ -161,7 +174,7 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
             Entity or None if not found
         """
         columns = self._validate_columns(list(key_values.keys()))
-        where_parts = [f"{col} = %s" for col in columns]
+        where_parts = [f"{col} = ?" for col in columns]
         values = list(key_values.values())
 
         where = " AND ".join(where_parts)
@@ -198,11 +211,11 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
         validated_update_cols = self._validate_columns(list(update_cols.keys()))
 
         # Build SET clause
-        set_parts = [f"{col} = %s" for col in validated_update_cols]
+        set_parts = [f"{col} = ?" for col in validated_update_cols]
         set_clause = ", ".join(set_parts)
 
         # Build WHERE clause
-        where_parts = [f"{col} = %s" for col in pk_cols]
+        where_parts = [f"{col} = ?" for col in pk_cols]
         where_clause = " AND ".join(where_parts)
 
         stmt_key = f"update_{self.table_name}"
@@ -225,14 +238,7 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
         Returns:
             True if deleted
         """
-        pk_cols = self._validate_columns(self._entity_class.primary_key())
-        where = " AND ".join(f"{col} = %s" for col in pk_cols)
-
-        stmt_key = f"delete_{self.table_name}"
-        # S608: False positive - identifiers validated, uses prepared statement
-        query = f"DELETE FROM {self.table_name} WHERE {where}"  # noqa: S608
-        prepared = await self._get_prepared(stmt_key, query)
-        await self._client.execute(prepared, (id,))
+        await self._client.execute(await self._delete_statement(), (id,))
 
         logger.debug("Deleted entity", table=self.table_name, id=str(id))
         return True
@@ -247,7 +253,7 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
             True if deleted
         """
         columns = self._validate_columns(list(key_values.keys()))
-        where_parts = [f"{col} = %s" for col in columns]
+        where_parts = [f"{col} = ?" for col in columns]
         values = list(key_values.values())
 
         where = " AND ".join(where_parts)
@@ -283,11 +289,9 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
         """
         stmt_key = f"find_all_{self.table_name}"
         # S608: False positive - table name validated, uses prepared statement
-        query = f"SELECT * FROM {self.table_name} LIMIT %s"  # noqa: S608
+        query = f"SELECT * FROM {self.table_name} LIMIT ?"  # noqa: S608
         prepared = await self._get_prepared(stmt_key, query)
-        rows = await self._client.execute(prepared, (limit,))
-
-        return [self._entity_class.from_row(row) for row in rows]
+        return await self._collect(prepared, (limit,))
 
     async def find_by(
         self,
@@ -310,11 +314,9 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
         validated_col = _validate_identifier(column, "column name")
         stmt_key = f"find_by_{self.table_name}_{validated_col}"
         # S608: False positive - identifiers validated, uses prepared statement
-        query = f"SELECT * FROM {self.table_name} WHERE {validated_col} = %s LIMIT %s"  # noqa: S608
+        query = f"SELECT * FROM {self.table_name} WHERE {validated_col} = ? LIMIT ?"  # noqa: S608
         prepared = await self._get_prepared(stmt_key, query)
-        rows = await self._client.execute(prepared, (value, limit))
-
-        return [self._entity_class.from_row(row) for row in rows]
+        return await self._collect(prepared, (value, limit))
 
     async def find_by_query(
         self,
@@ -353,9 +355,19 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
             query += " ALLOW FILTERING"
 
         params = (*(values or ()), limit)
-        rows = await self._client.execute(query, params)
+        return await self._collect(query, params)
 
-        return [self._entity_class.from_row(row) for row in rows]
+    async def stream_all(self) -> AsyncIterator[T]:
+        """Stream all entities, fetching one page at a time."""
+        # S608: False positive - table name validated, uses prepared statement
+        query = f"SELECT * FROM {self.table_name}"  # noqa: S608
+        prepared = await self._get_prepared(f"stream_all_{self.table_name}", query)
+        async for row in self._client.iterate(prepared):
+            yield self._entity_class.from_row(row)
+
+    async def _collect(self, query: Any, params: tuple) -> list[T]:
+        """Read matching entities through the client's paged row iterator."""
+        return [self._entity_class.from_row(row) async for row in self._client.iterate(query, params)]
 
     async def count(self) -> int:
         """Count all entities.
@@ -373,57 +385,49 @@ class ScyllaDBRepository[T: ScyllaDBEntity]:
 
     # Bulk Operations
 
-    async def bulk_create(self, entities: list[T]) -> list[T]:
-        """Bulk create entities.
+    async def bulk_create(self, entities: list[T]) -> BulkWriteResult[T]:
+        """Bulk create entities in partition-local batches.
 
         Args:
             entities: Entities to create
 
         Returns:
-            Created entities
+            Per-entity results, in input order
         """
-        if not entities:
-            return []
-
-        statements = []
+        now = datetime.now(UTC)
+        pk_cols = self._entity_class.primary_key()
+        statements: list[tuple[Any, tuple[Any, ...]]] = []
+        keys: list[tuple[Any, ...]] = []
+        inserts: dict[tuple[str, ...], Any] = {}
         for entity in entities:
-            entity.updated_at = datetime.now(UTC)
+            entity.updated_at = now
             data = entity.to_dict()
-            columns = self._validate_columns(list(data.keys()))
-            placeholders = ", ".join(["%s"] * len(columns))
-            cols_str = ", ".join(columns)
+            columns = tuple(data)
+            prepared = inserts.get(columns) or await self._insert_statement(columns)
+            inserts[columns] = prepared
+            statements.append((prepared, tuple(data.values())))
+            keys.append(tuple(data.get(col) for col in pk_cols))
 
-            # S608: False positive - identifiers validated via _validate_columns
-            query = f"INSERT INTO {self.table_name} ({cols_str}) VALUES ({placeholders})"  # noqa: S608
-            statements.append((query, tuple(data.values())))
+        result = await self._bulk_writer.write(entities, statements, keys)
+        logger.info("Bulk created %d entities in %s", len(result.succeeded), self.table_name)
+        return result
 
-        await self._client.execute_batch(statements, batch_type="UNLOGGED")
-
-        logger.info("Bulk created %d entities in %s", len(entities), self.table_name)
-        return entities
-
-    async def bulk_delete(self, ids: list[UUID]) -> int:
-        """Bulk delete entities.
+    async def bulk_delete(self, ids: list[UUID]) -> BulkWriteResult[UUID]:
+        """Bulk delete entities, each ID in its own partition group.
 
         Args:
             ids: Entity IDs to delete
 
         Returns:
-            Number deleted
+            Per-ID results, in input order
         """
         if not ids:
-            return 0
-
-        pk_cols = self._validate_columns(self._entity_class.primary_key())
-        where = " AND ".join(f"{col} = %s" for col in pk_cols)
-        # S608: False positive - identifiers validated, parameterized query
-        query = f"DELETE FROM {self.table_name} WHERE {where}"  # noqa: S608
-
-        statements = [(query, (id,)) for id in ids]
-        await self._client.execute_batch(statements, batch_type="UNLOGGED")
+            return BulkWriteResult([])
 
-        logger.info("Bulk deleted %d entities from %s", len(ids), self.table_name)
-        return len(ids)
+        prepared = await self._delete_statement()
+        result = await self._bulk_writer.write(ids, [(prepared, (id,)) for id in ids], ids)
+        logger.info("Bulk deleted %d entities from %s", len(result.succeeded), self.table_name)
+        return result
 
     # Table Management
 
@@ -15,7 +15,6 @@ Note:
     basic permission checking scenarios.
 """
 
-import contextlib
 import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -26,6 +25,7 @@ from typing import Any, Protocol, Self, runtime_checkable
 import structlog
 
 from core.errors import AuthorizationError
+from infrastructure.rbac.compiled import PermissionIndex, PermissionValues, RoleMaskCache
 
 logger = structlog.get_logger(__name__)
 
@@ -147,11 +147,19 @@ class RBACUser:
     scopes: list[str] = field(default_factory=list)
 
 
+_PERMISSION_INDEX: PermissionIndex[Permission] = PermissionIndex(Permission)
+
+
+_SCOPE_PERMISSIONS: dict[str, tuple[Permission, ...]] = {p.value: (p,) for p in Permission}
+
+
 class RBACService:
     """Service for role-based access control.
 
     Handles permission checking, role management, and
-    authorization decisions.
+    authorization decisions. Roles and scopes are compiled into permission
+    bitmasks memoized per combination; change roles through ``add_role``
+    so the masks are recompiled.
     """
 
     def __init__(self, roles: dict[str, Role] | None = None) -> None:
@@ -167,6 +175,21 @@ class RBACService:
             ROLE_VIEWER.name: ROLE_VIEWER,
             ROLE_MODERATOR.name: ROLE_MODERATOR,
         }
+        self._role_masks = RoleMaskCache(_PERMISSION_INDEX, self._role_permissions)
+        self._scope_masks = RoleMaskCache(_PERMISSION_INDEX, _SCOPE_PERMISSIONS.get)
+
+    def _role_permissions(self, role_name: str) -> frozenset[Permission] | None:
+        """Get the permissions of a role."""
+        role = self._roles.get(role_name)
+        return role.permissions if role else None
+
+    def _user_mask(self, user: UserProtocol | RBACUser) -> int:
+        """Get the compiled permission mask of a user's roles and scopes."""
+        mask = self._role_masks.mask(user.roles)
+        scopes = getattr(user, "scopes", None)
+        if scopes:
+            mask |= self._scope_masks.mask(scopes)
+        return mask
 
     def get_role(self, role_name: str) -> Role | None:
         """Get a role by name.
@@ -186,6 +209,7 @@ class RBACService:
             role: Role to add.
         """
         self._roles[role.name] = role
+        self._role_masks.invalidate()
         logger.debug(
             "Added role",
             role_name=role.name,
@@ -203,20 +227,7 @@ class RBACService:
         Returns:
             Set of all permissions the user has.
         """
-        permissions: set[Permission] = set()
-
-        for role_name in user.roles:
-            role = self._roles.get(role_name)
-            if role:
-                permissions.update(role.permissions)
-
-        # Add scope-based permissions if user has scopes
-        if hasattr(user, "scopes"):
-            for scope in user.scopes:
-                with contextlib.suppress(ValueError):
-                    permissions.add(Permission(scope))
-
-        return permissions
+        return set(_PERMISSION_INDEX.permissions(self._user_mask(user)))
 
     def check_permission(
         self,
@@ -232,8 +243,8 @@ class RBACService:
         Returns:
             True if user has permission, False otherwise.
         """
-        permissions = self.get_user_permissions(user)
-        has_permission = required in permissions
+        mask = self._user_mask(user)
+        has_permission = bool(mask & _PERMISSION_INDEX.bit(required))
 
         if not has_permission:
             logger.debug(
@@ -241,7 +252,7 @@ class RBACService:
                 operation="RBAC_CHECK",
                 user_id=user.id,
                 required=required.value,
-                has_permissions=[p.value for p in permissions],
+                has_permissions=PermissionValues(_PERMISSION_INDEX, mask),
             )
 
         return has_permission
@@ -260,8 +271,7 @@ class RBACService:
         Returns:
             True if user has at least one permission.
         """
-        permissions = self.get_user_permissions(user)
-        return bool(permissions & set(required))
+        return bool(self._user_mask(user) & _PERMISSION_INDEX.mask(required))
 
     def check_all_permissions(
         self,
@@ -277,8 +287,8 @@ class RBACService:
         Returns:
             True if user has all permissions.
         """
-        permissions = self.get_user_permissions(user)
-        return set(required).issubset(permissions)
+        required_mask = _PERMISSION_INDEX.mask(required)
+        return self._user_mask(user) & required_mask == required_mask
 
     def require_permission(
         self,
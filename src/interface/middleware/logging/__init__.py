@@ -17,6 +17,7 @@ from interface.middleware.logging.request_logger import (
     SENSITIVE_HEADERS,
     RequestLogEntry,
     RequestLoggerMiddleware,
+    RequestLogPlugin,
     ResponseLogEntry,
     mask_dict,
     mask_sensitive_value,
@@ -29,6 +30,7 @@ __all__ = [
     "SENSITIVE_FIELDS",
     "SENSITIVE_HEADERS",
     "RequestLogEntry",
+    "RequestLogPlugin",
     "RequestLoggerMiddleware",
     "ResponseLogEntry",
     # Error handlers
@@ -5,18 +5,13 @@
 """
 
 import logging
-import time
-from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-
-logger = structlog.get_logger(__name__)
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp
 
+from infrastructure.observability.edge import EdgeContext, EdgeMiddleware, RouteSampling
 
 # Fields that should be masked in logs
 SENSITIVE_FIELDS = frozenset(
@@ -178,17 +173,52 @@ def sanitize_headers(headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
+class RequestLogPlugin:
+    """Edge plugin adding request details to the request log record.
+
+    Headers are sanitized and the client IP honours ``X-Forwarded-For``.
+    """
+
+    def on_request(self, ctx: EdgeContext) -> None:
+        """Collect request details for sampled requests."""
+        if not ctx.log_sampled:
+            return
+        request_id = ctx.request_id or ctx.state.get("request_id") or ctx.headers.get("X-Request-ID", "unknown")
+        entry = RequestLogEntry(
+            request_id=request_id,
+            method=ctx.method,
+            path=ctx.path,
+            query_params=dict(QueryParams(ctx.scope.get("query_string", b""))),
+            headers=sanitize_headers(dict(ctx.headers)),
+            client_ip=self._get_client_ip(ctx),
+            user_agent=ctx.headers.get("User-Agent"),
+        )
+        ctx.log_fields.update(entry.to_dict(), correlation_id=request_id)
+
+    def on_complete(self, ctx: EdgeContext) -> None:
+        """Nothing to release."""
+
+    @staticmethod
+    def _get_client_ip(ctx: EdgeContext) -> str | None:
+        """Get client IP address, preferring X-Forwarded-For."""
+        forwarded = ctx.headers.get("X-Forwarded-For")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+        client = ctx.client
+        return client[0] if client else None
+
+
+class RequestLoggerMiddleware(EdgeMiddleware):
     """Middleware for logging requests and responses.
 
-    Logs incoming requests with method, path, headers (sanitized),
-    and outgoing responses with status, duration, and size.
+    Logs one ``response_sent`` record per request with method, path,
+    headers (sanitized), status, duration, and size.
     All sensitive data is masked.
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         *,
         log_request_body: bool = False,
         log_response_body: bool = False,
@@ -204,11 +234,17 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
             excluded_paths: Paths to exclude from logging.
             log_level: Logging level to use.
         """
-        super().__init__(app)
         self._log_request_body = log_request_body
         self._log_response_body = log_response_body
         self._excluded_paths = set(excluded_paths or [])
         self._log_level = log_level
+        super().__init__(
+            app,
+            [RequestLogPlugin()],
+            sampling=dict.fromkeys(self._excluded_paths, RouteSampling(log_rate=0.0)),
+            log_event="response_sent",
+            logger_name=__name__,
+        )
 
     def _should_log(self, path: str) -> bool:
         """Check if request should be logged.
@@ -220,101 +256,3 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
             True if request should be logged.
         """
         return path not in self._excluded_paths
-
-    def _get_request_id(self, request: Request) -> str:
-        """Get request ID from request state or headers.
-
-        Args:
-            request: Incoming request.
-
-        Returns:
-            Request ID string.
-        """
-        # Try to get from state (set by RequestIDMiddleware)
-        if hasattr(request.state, "request_id"):
-            return request.state.request_id
-
-        # Try to get from header
-        return request.headers.get("X-Request-ID", "unknown")
-
-    def _get_client_ip(self, request: Request) -> str | None:
-        """Get client IP address.
-
-        Args:
-            request: Incoming request.
-
-        Returns:
-            Client IP address or None.
-        """
-        # Check X-Forwarded-For header first (for proxied requests)
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-
-        # Fall back to client host
-        if request.client:
-            return request.client.host
-
-        return None
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Log request and response.
-
-        Args:
-            request: Incoming request.
-            call_next: Next middleware/handler.
-
-        Returns:
-            Response from handler.
-        """
-        if not self._should_log(request.url.path):
-            return await call_next(request)
-
-        start_time = time.perf_counter()
-        request_id = self._get_request_id(request)
-
-        # Log request
-        request_entry = RequestLogEntry(
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            query_params=dict(request.query_params),
-            headers=sanitize_headers(dict(request.headers)),
-            client_ip=self._get_client_ip(request),
-            user_agent=request.headers.get("User-Agent"),
-        )
-
-        logger.info(
-            "request_received",
-            correlation_id=request_id,
-            **request_entry.to_dict(),
-        )
-
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Get response size
-        response_size = 0
-        if hasattr(response, "body"):
-            response_size = len(response.body)
-        elif "content-length" in response.headers:
-            response_size = int(response.headers["content-length"])
-
-        # Log response
-        response_entry = ResponseLogEntry(
-            request_id=request_id,
-            status_code=response.status_code,
-            duration_ms=duration_ms,
-            response_size=response_size,
-        )
-
-        logger.info(
-            "response_sent",
-            correlation_id=request_id,
-            **response_entry.to_dict(),
-        )
-
-        return response
@@ -6,13 +6,12 @@
 """
 
 import time
-from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import Message, Receive, Scope, Send
 
 from infrastructure.audit import (
     AuditAction,
@@ -33,7 +32,7 @@ class AuditConfig:
     exclude_paths: set[str] | None = None
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
+class AuditMiddleware:
     """Middleware that creates audit records for all requests.
 
     **Feature: python-api-base-2025-generics-audit**
@@ -50,23 +49,30 @@ class AuditMiddleware(BaseHTTPMiddleware):
         store: AuditStore[Any],
         config: AuditConfig | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._store = store
         self._config = config or AuditConfig()
         self._exclude = self._config.exclude_paths or {"/health", "/metrics", "/docs"}
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and create audit record."""
-        if not self._config.enabled:
-            return await call_next(request)
+        if scope["type"] != "http" or not self._config.enabled:
+            await self.app(scope, receive, send)
+            return
 
         # Skip excluded paths
-        if request.url.path in self._exclude:
-            return await call_next(request)
+        if scope["path"] in self._exclude:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Get correlation ID
         correlation_id = request.headers.get("X-Correlation-ID")
@@ -85,7 +91,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
         start_time = time.time()
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_status)
             duration_ms = (time.time() - start_time) * 1000
 
             # Create audit record
@@ -100,7 +106,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 metadata={
                     "method": request.method,
                     "path": request.url.path,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "duration_ms": round(duration_ms, 2),
                 },
             )
@@ -113,8 +119,6 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 path=request.url.path,
             )
 
-            return response
-
         except Exception as e:
             # Create error audit record
             record = AuditRecord[dict](
@@ -5,12 +5,11 @@
 **Refactored: Split from production.py for one-class-per-file compliance**
 """
 
-from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import Receive, Scope, Send
 
 from infrastructure.feature_flags import (
     EvaluationContext,
@@ -20,7 +19,7 @@ from infrastructure.feature_flags import (
 logger = structlog.get_logger(__name__)
 
 
-class FeatureFlagMiddleware(BaseHTTPMiddleware):
+class FeatureFlagMiddleware:
     """Middleware that provides feature flag evaluation in request context.
 
     **Feature: python-api-base-2025-generics-audit**
@@ -33,15 +32,17 @@ class FeatureFlagMiddleware(BaseHTTPMiddleware):
     """
 
     def __init__(self, app: Any, evaluator: FeatureFlagEvaluator[Any]) -> None:
-        super().__init__(app)
+        self.app = app
         self._evaluator = evaluator
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with feature flag context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Extract user ID from request (from auth header, JWT, etc.)
         user_id = request.headers.get("X-User-ID")
 
@@ -58,7 +59,7 @@ class FeatureFlagMiddleware(BaseHTTPMiddleware):
         request.state.feature_flags = self._evaluator
         request.state.feature_context = context
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def is_feature_enabled(request: Request, flag_key: str) -> bool:
@@ -5,13 +5,12 @@
 **Refactored: Split from production.py for one-class-per-file compliance**
 """
 
-from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Receive, Scope, Send
 
 from infrastructure.multitenancy import (
     TenantContext,
@@ -32,7 +31,7 @@ class MultitenancyConfig:
     default_tenant_id: str | None = None
 
 
-class MultitenancyMiddleware(BaseHTTPMiddleware):
+class MultitenancyMiddleware:
     """Middleware that resolves and sets tenant context.
 
     **Feature: python-api-base-2025-generics-audit**
@@ -43,19 +42,21 @@ class MultitenancyMiddleware(BaseHTTPMiddleware):
     """
 
     def __init__(self, app: Any, config: MultitenancyConfig | None = None) -> None:
-        super().__init__(app)
+        self.app = app
         self._config = config or MultitenancyConfig()
         self._context = TenantContext[str](
             strategy=self._config.strategy,
             header_name=self._config.header_name,
         )
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with tenant context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Resolve tenant ID from headers
         tenant_id = request.headers.get(self._config.header_name)
 
@@ -70,11 +71,13 @@ class MultitenancyMiddleware(BaseHTTPMiddleware):
                     detail=f"Header '{self._config.header_name}' is required",
                     instance=str(request.url),
                 )
-                return Response(
+                response = Response(
                     content=problem.model_dump_json(),
                     status_code=400,
                     media_type=PROBLEM_JSON_MEDIA_TYPE,
                 )
+                await response(scope, receive, send)
+                return
             tenant_id = self._config.default_tenant_id
 
         # Get correlation_id for logging
@@ -94,7 +97,7 @@ class MultitenancyMiddleware(BaseHTTPMiddleware):
             )
 
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             # Clear tenant context
             TenantContext.set_current(None)
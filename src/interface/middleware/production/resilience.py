@@ -5,14 +5,13 @@
 **Refactored: Split from production.py for one-class-per-file compliance**
 """
 
-from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
 import structlog
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message, Receive, Scope, Send
 
 from infrastructure.resilience import CircuitBreaker, CircuitBreakerConfig, CircuitState
 
@@ -28,7 +27,7 @@ class ResilienceConfig:
     enabled: bool = True
 
 
-class ResilienceMiddleware(BaseHTTPMiddleware):
+class ResilienceMiddleware:
     """Middleware that applies circuit breaker pattern to requests.
 
     **Feature: python-api-base-2025-generics-audit**
@@ -39,7 +38,7 @@ class ResilienceMiddleware(BaseHTTPMiddleware):
     """
 
     def __init__(self, app: Any, config: ResilienceConfig | None = None) -> None:
-        super().__init__(app)
+        self.app = app
         self._config = config or ResilienceConfig()
         self._circuit = CircuitBreaker(
             "production_middleware",
@@ -49,14 +48,13 @@ class ResilienceMiddleware(BaseHTTPMiddleware):
             ),
         )
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with circuit breaker protection."""
-        if not self._config.enabled:
-            return await call_next(request)
+        if scope["type"] != "http" or not self._config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
         # Get correlation_id for logging
         correlation_id = request.headers.get("X-Request-ID") or request.headers.get("X-Correlation-ID")
@@ -75,19 +73,28 @@ class ResilienceMiddleware(BaseHTTPMiddleware):
                 service="api",
                 retry_after=int(self._config.timeout.total_seconds()),
             )
-            return Response(
+            response = Response(
                 content=problem.model_dump_json(),
                 status_code=503,
                 media_type=PROBLEM_JSON_MEDIA_TYPE,
             )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-            if response.status_code < 500:
+            await self.app(scope, receive, send_with_status)
+            if status_code < 500:
                 self._circuit._record_success()
             else:
                 self._circuit._record_failure()
-            return response
         except Exception:
             self._circuit._record_failure()
             logger.exception(
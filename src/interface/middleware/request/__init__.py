@@ -6,6 +6,7 @@
 
 from interface.middleware.request.request_id import (
     RequestIDMiddleware,
+    RequestIdPlugin,
     get_request_id,
 )
 from interface.middleware.request.request_size_limit import (
@@ -28,6 +29,7 @@ from interface.middleware.request.timeout import (
 __all__ = [
     # Request ID
     "RequestIDMiddleware",
+    "RequestIdPlugin",
     # Request Size Limit
     "RequestSizeLimitMiddleware",
     "RouteSizeLimit",
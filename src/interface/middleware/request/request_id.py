@@ -2,13 +2,12 @@
 
 import re
 import uuid
-from collections.abc import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp
 
 from core.config.observability.logging import clear_request_id, set_request_id
+from infrastructure.observability.edge import EdgeContext, EdgeMiddleware
 
 # UUID format pattern for validation
 UUID_PATTERN = re.compile(
@@ -31,51 +30,62 @@ def _is_valid_request_id(request_id: str) -> bool:
     return bool(UUID_PATTERN.match(request_id))
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware that adds request ID to all requests for tracing.
+class RequestIdPlugin:
+    """Edge plugin that assigns the request ID.
 
-    Generates a unique request ID for each request or uses the one
-    provided in X-Request-ID header if it's a valid UUID format.
-    The ID is added to request state, logging context, and included
-    in the response headers.
+    Uses the X-Request-ID header if it's a valid UUID and generates one
+    otherwise. The ID is added to request state, logging context, and
+    included in the response headers.
     """
 
     HEADER_NAME = "X-Request-ID"
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Response]) -> Response:
-        """Add request ID to request and response.
+    def on_request(self, ctx: EdgeContext) -> None:
+        """Assign the request ID.
 
         Args:
-            request: Incoming request.
-            call_next: Next middleware/handler in chain.
-
-        Returns:
-            Response with X-Request-ID header.
+            ctx: Edge context of the request.
         """
         # Get existing request ID or generate new one
-        request_id = request.headers.get(self.HEADER_NAME)
+        request_id = ctx.headers.get(self.HEADER_NAME)
 
         # Validate format - generate new if invalid to prevent injection
         if not _is_valid_request_id(request_id):
             request_id = str(uuid.uuid4())
 
         # Store in request state for access in handlers
-        request.state.request_id = request_id
+        ctx.request_id = request_id
+        ctx.state["request_id"] = request_id
+        ctx.response_headers[self.HEADER_NAME] = request_id
 
         # Set request ID in logging context
         set_request_id(request_id)
 
-        try:
-            # Process request
-            response = await call_next(request)
+    def on_complete(self, ctx: EdgeContext) -> None:
+        """Clear request ID from logging context.
 
-            # Add request ID to response headers
-            response.headers[self.HEADER_NAME] = request_id
+        Args:
+            ctx: Edge context of the request.
+        """
+        clear_request_id()
+
+
+class RequestIDMiddleware(EdgeMiddleware):
+    """Middleware that adds request ID to all requests for tracing.
 
-            return response
-        finally:
-            # Clear request ID from context
-            clear_request_id()
+    Runs ``RequestIdPlugin`` on its own; the default stack runs the plugin
+    inside the shared edge middleware instead.
+    """
+
+    HEADER_NAME = RequestIdPlugin.HEADER_NAME
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize request ID middleware.
+
+        Args:
+            app: ASGI application.
+        """
+        super().__init__(app, [RequestIdPlugin()], log_event=None)
 
 
 def get_request_id(request: Request) -> str | None:
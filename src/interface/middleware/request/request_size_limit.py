@@ -8,9 +8,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import URL, Headers
+from starlette.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 
 
 @dataclass(slots=True)
@@ -35,7 +35,7 @@ class RouteSizeLimit:
         return bool(self._compiled.match(path))
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
+class RequestSizeLimitMiddleware:
     """Middleware to limit request body size.
 
     Prevents large request bodies that could cause memory issues
@@ -67,7 +67,7 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
             route_limits: Dictionary mapping route patterns to size limits.
             error_response: Custom error response body.
         """
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size
         self.route_limits: list[RouteSizeLimit] = []
         self.error_response = error_response or {
@@ -94,36 +94,42 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
                 return route_limit.max_size
         return self.max_size
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Check request size before processing.
 
-        Args:
-            request: Incoming request.
-            call_next: Next middleware/handler in chain.
+        Requests over the limit get a 413 response without reaching the app.
 
-        Returns:
-            Response or 413 error if request too large.
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        content_length = request.headers.get("content-length")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
 
         if content_length is not None:
             size = int(content_length)
-            limit = self.get_limit_for_path(request.url.path)
+            limit = self.get_limit_for_path(scope["path"])
 
             if size > limit:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=413,
                     content={
                         **self.error_response,
                         "detail": f"Request body too large. Maximum size is {limit} bytes, got {size} bytes.",
                         "max_size": limit,
                         "actual_size": size,
-                        "instance": str(request.url),
+                        "instance": str(URL(scope=scope)),
                     },
                     media_type="application/problem+json",
                 )
+                await response(scope, receive, send)
+                return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     def add_route_limit(self, pattern: str, max_size: int) -> None:
         """Add a route-specific size limit.
@@ -148,7 +154,7 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
         return len(self.route_limits) < initial_len
 
 
-class StreamingRequestSizeLimitMiddleware(BaseHTTPMiddleware):
+class StreamingRequestSizeLimitMiddleware:
     """Middleware to limit streaming request body size.
 
     Checks size during body consumption for streaming requests
@@ -166,23 +172,25 @@ class StreamingRequestSizeLimitMiddleware(BaseHTTPMiddleware):
             app: ASGI application.
             max_size: Maximum request body size in bytes.
         """
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Check request size during body consumption.
 
         Args:
-            request: Incoming request.
-            call_next: Next middleware/handler in chain.
-
-        Returns:
-            Response or 413 error if request too large.
+            scope: ASGI scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # For requests with Content-Length, check upfront
-        content_length = request.headers.get("content-length")
+        content_length = Headers(scope=scope).get("content-length")
         if content_length is not None and int(content_length) > self.max_size:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=413,
                 content={
                     "type": "https://httpstatuses.com/413",
@@ -192,8 +200,10 @@ class StreamingRequestSizeLimitMiddleware(BaseHTTPMiddleware):
                 },
                 media_type="application/problem+json",
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def create_size_limit_middleware(
@@ -4,17 +4,14 @@
 **Validates: Requirements 5.3 (Security Headers)**
 """
 
-from collections.abc import Awaitable, Callable
-
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Middleware that adds security headers to all responses.
 
     Implements standard security headers to protect against common
@@ -45,7 +42,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             referrer_policy: Referrer-Policy header value.
             permissions_policy: Permissions-Policy header value (optional).
         """
-        super().__init__(app)
+        self.app = app
         self.headers = {
             "X-Frame-Options": x_frame_options,
             "X-Content-Type-Options": x_content_type_options,
@@ -58,32 +55,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         if permissions_policy:
             self.headers["Permissions-Policy"] = permissions_policy
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to the response.
 
         Args:
-            request: Incoming request.
-            call_next: Next middleware/handler in chain.
-
-        Returns:
-            Response with security headers added.
+            scope: ASGI scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
         """
-        correlation_id = getattr(request.state, "correlation_id", None)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for header_name, header_value in self.headers.items():
+                    response_headers[header_name] = header_value
+            await send(message)
 
-        for header_name, header_value in self.headers.items():
-            response.headers[header_name] = header_value
+        await self.app(scope, receive, send_with_headers)
 
         logger.debug(
             "security_headers_applied",
-            correlation_id=correlation_id,
-            path=request.url.path,
+            correlation_id=scope.get("state", {}).get("correlation_id"),
+            path=scope["path"],
             headers_count=len(self.headers),
         )
-
-        return response
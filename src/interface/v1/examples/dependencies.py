@@ -13,6 +13,7 @@ from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.examples import (
+    ItemExampleExportService,
     ItemExampleResponse,
     ItemExampleUseCase,
     PedidoExampleResponse,
@@ -106,6 +107,13 @@ async def get_item_use_case(
     return ItemExampleUseCase(repository=repo, kafka_publisher=event_publisher, cache=cache)
 
 
+async def get_item_export_service(
+    repo: ItemExampleRepository = Depends(get_item_repository),
+) -> ItemExampleExportService:
+    """Get ItemExampleExportService with real repository."""
+    return ItemExampleExportService(repo)
+
+
 async def get_pedido_use_case(
     item_repo: ItemExampleRepository = Depends(get_item_repository),
     pedido_repo: PedidoExampleRepository = Depends(get_pedido_repository),
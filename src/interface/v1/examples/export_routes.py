@@ -0,0 +1,102 @@
+"""Item export API routes.
+
+Exports are streamed: rows are read in keyset-paginated chunks and encoded
+as they are sent. The checksum is only known once the body is complete,
+so it is sent as an HTTP trailer when the server supports the ASGI
+``http.response.trailers`` extension, and logged with the export either way.
+
+**Feature: application-common-integration**
+**Validates: Requirements 7.1, 7.2, 7.3**
+"""
+
+import structlog
+from fastapi import APIRouter, Depends, Query, Request
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from application.examples import ExportFormat, ExportStream, ItemExampleExportService
+from application.examples.item.export.formats import CONTENT_TYPES
+from interface.v1.examples.dependencies import get_item_export_service
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter()
+
+CHECKSUM_TRAILER = "X-Export-Checksum"
+RECORD_COUNT_TRAILER = "X-Export-Record-Count"
+
+
+class ExportStreamingResponse(StreamingResponse):
+    """Streaming response that sends export metadata as trailers."""
+
+    def __init__(self, stream: ExportStream, filename: str, background: BackgroundTask | None = None) -> None:
+        super().__init__(
+            stream,
+            media_type=stream.content_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            background=background,
+        )
+        self._stream = stream
+        self._send_trailers = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._send_trailers = "http.response.trailers" in scope.get("extensions", {})
+        if self._send_trailers:
+            self.headers["Trailer"] = f"{CHECKSUM_TRAILER}, {RECORD_COUNT_TRAILER}"
+        await super().__call__(scope, receive, send)
+
+    async def stream_response(self, send: Send) -> None:
+        if not self._send_trailers:
+            await super().stream_response(send)
+            return
+
+        await send(
+            {"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers, "trailers": True}
+        )
+        async for chunk in self.body_iterator:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        metadata = self._stream.metadata
+        trailers = (
+            []
+            if metadata is None
+            else [
+                (CHECKSUM_TRAILER.lower().encode(), metadata.checksum.encode()),
+                (RECORD_COUNT_TRAILER.lower().encode(), str(metadata.record_count).encode()),
+            ]
+        )
+        await send({"type": "http.response.trailers", "headers": trailers, "more_trailers": False})
+
+
+@router.get(
+    "/items/export",
+    responses={
+        200: {"content": {content_type: {} for content_type in CONTENT_TYPES.values()}, "description": "Export body"}
+    },
+    summary="Export items",
+    description="Stream all items as JSON, CSV or JSON Lines, with the checksum as a trailer.",
+)
+async def export_items(
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.JSONL, description="Export format"),
+    category: str | None = Query(None, description="Filter by category"),
+    status: str | None = Query(None, description="Filter by status"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="Rows read per query"),
+    service: ItemExampleExportService = Depends(get_item_export_service),
+) -> ExportStreamingResponse:
+    correlation_id = getattr(request.state, "correlation_id", None)
+    stream = service.stream(format, chunk_size=chunk_size, category=category, status=status)
+
+    def log_export() -> None:
+        metadata = stream.metadata
+        logger.info(
+            "items_exported",
+            format=format.value,
+            record_count=metadata.record_count if metadata else None,
+            checksum=metadata.checksum if metadata else None,
+            correlation_id=correlation_id,
+        )
+
+    return ExportStreamingResponse(stream, f"items.{format.value}", background=BackgroundTask(log_export))
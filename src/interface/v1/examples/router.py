@@ -3,7 +3,7 @@
 **Feature: example-system-demo**
 **Feature: infrastructure-examples-integration-fix**
 **Validates: Requirements 2.1, 2.2, 2.3, 2.4**
-**Refactored: Split into item_routes.py, pedido_routes.py, dependencies.py**
+**Refactored: Split into item_routes.py, pedido_routes.py, export_routes.py, dependencies.py**
 """
 
 from fastapi import APIRouter
@@ -12,6 +12,7 @@ from fastapi import APIRouter
 from interface.v1.examples.dependencies import (
     get_current_user_optional,
     get_event_publisher,
+    get_item_export_service,
     get_item_repository,
     get_item_response_adapter,
     get_item_use_case,
@@ -22,18 +23,21 @@ from interface.v1.examples.dependencies import (
     require_delete_permission,
     require_write_permission,
 )
+from interface.v1.examples.export_routes import router as export_router
 from interface.v1.examples.item_routes import router as item_router
 from interface.v1.examples.pedido_routes import router as pedido_router
 
 router = APIRouter(prefix="/examples", tags=["Examples"])
 
-# Include sub-routers
+# Include sub-routers (export first so /items/export is not taken for an item ID)
+router.include_router(export_router)
 router.include_router(item_router)
 router.include_router(pedido_router)
 
 __all__ = [
     "get_current_user_optional",
     "get_event_publisher",
+    "get_item_export_service",
     "get_item_repository",
     "get_item_response_adapter",
     "get_item_use_case",
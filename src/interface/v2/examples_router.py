@@ -10,7 +10,7 @@ import structlog
 from fastapi import Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.common.dto import ApiResponse, PaginatedResponse
+from application.common.dto import ApiResponse, CursorPaginatedResponse, PaginatedResponse
 from application.examples import (
     ItemExampleCreate,
     ItemExampleResponse,
@@ -18,6 +18,7 @@ from application.examples import (
     PedidoExampleResponse,
     PedidoExampleUseCase,
 )
+from core.base.patterns.pagination import CountMode
 from infrastructure.db.repositories.examples import (
     ItemExampleRepository,
     PedidoExampleRepository,
@@ -129,6 +130,43 @@ async def list_items_v2(
     )
 
 
+@router.get(
+    "/items/cursor",
+    response_model=CursorPaginatedResponse[ItemExampleResponse],
+    summary="List items with cursor pagination (v2)",
+    description="Get ItemExample entities newest first using keyset pagination.",
+)
+async def list_items_cursor_v2(
+    request: Request,
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    category: str | None = Query(None, description="Filter by category"),
+    status: str | None = Query(None, description="Filter by status"),
+    count: CountMode = Query(CountMode.NONE, description="Total count strategy"),
+    use_case: ItemExampleUseCase = Depends(get_item_use_case),
+) -> CursorPaginatedResponse[ItemExampleResponse]:
+    """List items with keyset pagination; deep pages cost the same as the first."""
+    correlation_id = getattr(request.state, "correlation_id", None)
+    result = await use_case.list_page(
+        cursor=cursor,
+        page_size=page_size,
+        category=category,
+        status=status,
+        count=count,
+    )
+    if result.is_err():
+        raise handle_result_error(result.unwrap_err(), correlation_id=correlation_id)
+
+    page = result.unwrap()
+    logger.info(
+        "items_listed_cursor_v2",
+        count=len(page.items),
+        has_more=page.has_more,
+        correlation_id=correlation_id,
+    )
+    return CursorPaginatedResponse.from_page(page)
+
+
 @router.get(
     "/items/{item_id}",
     response_model=ApiResponse[ItemExampleResponse],
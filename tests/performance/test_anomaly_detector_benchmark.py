@@ -0,0 +1,62 @@
+"""Benchmark: AnomalyDetector samples per second at 1,000 metrics.
+
+Records samples round-robin across 1,000 metrics after each metric has
+been warmed with a full history, and compares against recomputing mean,
+standard deviation and trend slope from scratch over the same history.
+Run with ``pytest tests/performance -m benchmark -s``.
+
+**Feature: api-architecture-analysis**
+**Validates: Requirements 7.3**
+"""
+
+import random
+import time
+
+import pytest
+
+from infrastructure.observability.anomaly import AnomalyConfig, AnomalyDetector, StatisticalAnalyzer
+
+pytestmark = pytest.mark.benchmark
+
+METRICS = 1_000
+HISTORY = 1_000
+SAMPLES = 20_000
+
+
+class _NullHandler:
+    async def handle(self, anomaly: object) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_anomaly_detector_throughput() -> None:
+    rng = random.Random(42)
+    names = [f"metric_{i}" for i in range(METRICS)]
+    detector = AnomalyDetector(AnomalyConfig(), _NullHandler())
+    history = {name: [rng.gauss(100, 5) for _ in range(HISTORY)] for name in names}
+    for name in names:
+        for value in history[name]:
+            await detector.record(name, value)
+
+    start = time.perf_counter()
+    for i in range(SAMPLES):
+        await detector.record(names[i % METRICS], rng.gauss(100, 5))
+    streaming = time.perf_counter() - start
+
+    baseline_samples = SAMPLES // 20
+    start = time.perf_counter()
+    for i in range(baseline_samples):
+        values = history[names[i % METRICS]]
+        mean = StatisticalAnalyzer.mean(values)
+        StatisticalAnalyzer.std_dev(values)
+        StatisticalAnalyzer.linear_regression_slope(values[-10:])
+        StatisticalAnalyzer.z_score(rng.gauss(100, 5), mean, 1.0)
+    from_scratch = time.perf_counter() - start
+
+    print(f"\n{METRICS} metrics, {HISTORY} samples of history each")
+    print(f"  {'streaming detector':<30} {SAMPLES / streaming:12,.0f} samples/s")
+    print(f"  {'from-scratch statistics':<30} {baseline_samples / from_scratch:12,.0f} samples/s")
+
+    stats = detector.get_statistics(names[0])
+    assert stats["count"] == HISTORY + SAMPLES // METRICS
+    assert 90 < stats["p50"] < 110
@@ -0,0 +1,141 @@
+"""Benchmark: cache serializers and compression on DTO payloads.
+
+Reports encode/decode time and bytes stored per serializer for lists of
+user and item DTOs. Backends whose package is not installed are skipped.
+Run with ``pytest tests/performance -m benchmark -s``.
+
+**Feature: python-api-base-2025-state-of-art**
+"""
+
+import importlib.util
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from application.examples.item.dtos import ItemExampleResponse
+from application.examples.item.dtos.dtos import ItemExampleListResponse
+from application.examples.shared.dtos import MoneyDTO
+from application.users.dtos.commands import UserDTO
+from infrastructure.cache.serializers import Serializer, get_serializer, register_model
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 500
+ROUNDS = 20
+COMPRESSION_THRESHOLD = 1024
+
+VARIANTS: list[tuple[str, str, str | None]] = [
+    ("json", "json", None),
+    ("json+zlib", "json", "zlib"),
+    ("orjson", "orjson", None),
+    ("orjson+lz4", "orjson", "lz4"),
+    ("msgpack", "msgpack", None),
+    ("msgpack+zlib", "msgpack", "zlib"),
+    ("pickle", "pickle", None),
+]
+
+_REQUIRES = {"orjson": "orjson", "msgpack": "msgpack", "lz4": "lz4"}
+
+for _model in (UserDTO, ItemExampleListResponse):
+    register_model(_model)
+
+
+def _installed(*names: str | None) -> bool:
+    return all(name is None or importlib.util.find_spec(_REQUIRES.get(name, name)) is not None for name in names)
+
+
+def _users() -> list[UserDTO]:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    return [
+        UserDTO(
+            id=f"01HZ{i:022d}",
+            email=f"user{i}@example.com",
+            username=f"user_{i}",
+            display_name=f"User Number {i}",
+            is_verified=i % 2 == 0,
+            created_at=now,
+            updated_at=now,
+            last_login_at=now,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def _items() -> ItemExampleListResponse:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    items = [
+        ItemExampleResponse(
+            id=f"01HZ{i:022d}",
+            name=f"Item {i}",
+            description="Representative item description used for cache sizing.",
+            sku=f"SKU-{i:06d}",
+            price=MoneyDTO(amount=Decimal("19.90"), currency="USD"),
+            quantity=i % 50,
+            status="active",
+            category="tools",
+            tags=["new", "featured"],
+            is_available=True,
+            total_value=MoneyDTO(amount=Decimal("19.90") * (i % 50), currency="USD"),
+            created_at=now,
+            updated_at=now,
+            created_by="system",
+            updated_by="system",
+        )
+        for i in range(ROWS)
+    ]
+    return ItemExampleListResponse(items=items, total=ROWS, page=1, page_size=ROWS)
+
+
+def _measure(serializer: Serializer[Any], payload: Any) -> tuple[int, float, float]:
+    data = serializer.serialize(payload)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        serializer.serialize(payload)
+    encode = (time.perf_counter() - start) / ROUNDS
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        serializer.deserialize(data)
+    decode = (time.perf_counter() - start) / ROUNDS
+    return len(data), encode, decode
+
+
+def _report(name: str, results: dict[str, tuple[int, float, float]]) -> None:
+    print(f"\n{name} ({ROWS} rows, mean of {ROUNDS} rounds)")
+    for variant, (size, encode, decode) in results.items():
+        print(f"  {variant:<13} bytes={size:<9,} encode={encode * 1000:7.2f} ms  decode={decode * 1000:7.2f} ms")
+
+
+def _run(name: str, build: Callable[[], Any]) -> dict[str, tuple[int, float, float]]:
+    payload = build()
+    results: dict[str, tuple[int, float, float]] = {}
+    for variant, serializer_name, compression in VARIANTS:
+        if not _installed(serializer_name, compression):
+            continue
+        serializer = get_serializer(
+            serializer_name,
+            compression=compression,
+            compression_threshold=COMPRESSION_THRESHOLD,
+        )
+        assert serializer.deserialize(serializer.serialize(payload)) == payload
+        results[variant] = _measure(serializer, payload)
+    _report(name, results)
+    return results
+
+
+def test_user_dto_list() -> None:
+    results = _run("list[UserDTO]", _users)
+
+    assert results["json+zlib"][0] < results["json"][0]
+    if "msgpack" in results:
+        assert results["msgpack"][0] < results["json"][0]
+
+
+def test_item_list_response() -> None:
+    results = _run("ItemExampleListResponse", _items)
+
+    assert results["json+zlib"][0] < results["json"][0]
+    assert results["pickle"][0] < results["json"][0]
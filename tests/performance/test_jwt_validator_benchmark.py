@@ -0,0 +1,95 @@
+"""Benchmark: JWTValidator validations per second.
+
+Validates one RS256 and one ES256 access token repeatedly, as a client
+reusing its token does, with the verified-token cache disabled and enabled.
+Also reports a revocation-checked run against a store with a fixed latency.
+Run with ``pytest tests/performance -m benchmark -s``.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from infrastructure.auth.validators.jwt_validator import JWTValidator
+
+pytestmark = pytest.mark.benchmark
+
+VALIDATIONS = 2_000
+STORE_LATENCY = 0.0005
+
+
+class _SlowRevocationStore:
+    async def is_revoked(self, jti: str) -> bool:
+        await asyncio.sleep(STORE_LATENCY)
+        return False
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        pass
+
+
+def _key_pair(algorithm: str) -> tuple[str, str]:
+    key = rsa.generate_private_key(65537, 2048) if algorithm == "RS256" else ec.generate_private_key(ec.SECP256R1())
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = (
+        key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+def _token(private_pem: str, algorithm: str) -> str:
+    now = datetime.now(UTC)
+    claims = {
+        "sub": "user-1",
+        "jti": uuid.uuid4().hex,
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(hours=1)).timestamp()),
+    }
+    return jwt.encode(claims, private_pem, algorithm=algorithm)
+
+
+def _report(name: str, elapsed: float) -> None:
+    print(f"  {name:<38} {VALIDATIONS / elapsed:12,.0f} validations/s")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256"])
+async def test_jwt_validation_throughput(algorithm: str) -> None:
+    private_pem, public_pem = _key_pair(algorithm)
+    token = _token(private_pem, algorithm)
+
+    print(f"\n{algorithm} ({VALIDATIONS} validations of one token)")
+    for name, cache_size in (("no cache", 0), ("verified-token cache", 1024)):
+        validator = JWTValidator(public_pem, algorithm=algorithm, cache_size=cache_size)
+        start = time.perf_counter()
+        for _ in range(VALIDATIONS):
+            validator.validate(token)
+        _report(name, time.perf_counter() - start)
+
+    for name, cache_size, revocation_ttl in (
+        ("with revocation, no caches", 0, 0.0),
+        ("with revocation, both caches", 1024, 5.0),
+    ):
+        validator = JWTValidator(
+            public_pem,
+            algorithm=algorithm,
+            revocation_store=_SlowRevocationStore(),
+            cache_size=cache_size,
+            revocation_cache_ttl_seconds=revocation_ttl,
+        )
+        start = time.perf_counter()
+        for _ in range(VALIDATIONS):
+            await validator.validate_with_revocation(token)
+        _report(name, time.perf_counter() - start)
+
+    if validator.token_cache is not None:
+        assert validator.token_cache.metrics.hits == VALIDATIONS - 1
@@ -0,0 +1,131 @@
+"""Benchmark: KafkaProducer.send_batch messages per second with 1 KB payloads.
+
+Sends Pydantic payloads of about 1 KB through a stub producer that builds
+real aiokafka record batches, and compares the batch path against one
+``KafkaMessage`` and one ``send`` call per payload.
+Run with ``pytest tests/performance -m benchmark -s``.
+
+**Feature: observability-infrastructure**
+**Requirement: R3.2 - Generic Producer**
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+
+import pytest
+from aiokafka.partitioner import DefaultPartitioner
+from aiokafka.producer.message_accumulator import BatchBuilder
+from aiokafka.structs import RecordMetadata, TopicPartition
+from pydantic import BaseModel
+
+from infrastructure.kafka.config import KafkaConfig
+from infrastructure.kafka.message import KafkaMessage
+from infrastructure.kafka.producer import KafkaProducer
+
+pytestmark = pytest.mark.benchmark
+
+MESSAGES = 20_000
+PARTITIONS = 6
+BATCH_SIZE = 65536
+
+
+class OrderEvent(BaseModel):
+    order_id: str
+    customer_id: str
+    status: str
+    total: float
+    placed_at: datetime
+    notes: str
+
+
+class StubProducer:
+    """aiokafka-like producer appending records to per-partition batches."""
+
+    def __init__(self) -> None:
+        self._partitioner = DefaultPartitioner()
+        self._open: dict[int, BatchBuilder] = {}
+        self._offsets = dict.fromkeys(range(PARTITIONS), 0)
+
+    async def partitions_for(self, topic: str) -> set[int]:
+        return set(range(PARTITIONS))
+
+    def create_batch(self) -> BatchBuilder:
+        return BatchBuilder(BATCH_SIZE, 0)
+
+    async def send_batch(self, batch: BatchBuilder, topic: str, *, partition: int) -> asyncio.Future:
+        batch._build()
+        return self._ack(topic, partition, batch.record_count())
+
+    async def send(self, topic: str, value: bytes, key: bytes | None = None) -> asyncio.Future:
+        """Per-message send, appending to the partition's open batch like the accumulator."""
+        partition = self._partitioner(key, list(range(PARTITIONS)), list(range(PARTITIONS)))
+        batch = self._open.get(partition)
+        if batch is None or batch.append(timestamp=None, key=key, value=value) is None:
+            if batch is not None:
+                batch._build()
+            batch = self._open[partition] = self.create_batch()
+            batch.append(timestamp=None, key=key, value=value)
+        return self._ack(topic, partition, 1)
+
+    def _ack(self, topic: str, partition: int, count: int) -> asyncio.Future:
+        base = self._offsets[partition]
+        self._offsets[partition] += count
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(RecordMetadata(topic, partition, TopicPartition(topic, partition), base, -1, 0, 0))
+        return future
+
+
+def make_events() -> list[OrderEvent]:
+    placed_at = datetime(2025, 1, 2, tzinfo=UTC)
+    return [
+        OrderEvent(
+            order_id=f"order-{i:08d}",
+            customer_id=f"customer-{i % 500}",
+            status="placed",
+            total=i * 1.25,
+            placed_at=placed_at,
+            notes="n" * 860,
+        )
+        for i in range(MESSAGES)
+    ]
+
+
+async def send_one_by_one(stub: StubProducer, events: list[OrderEvent]) -> None:
+    """Original send_batch loop: one message model and one send per payload."""
+    futures = []
+    for event in events:
+        message = KafkaMessage[OrderEvent](payload=event, key=event.customer_id)
+        future = await stub.send("orders", value=message.serialize(), key=message.serialize_key())
+        futures.append(future)
+    for future in futures:
+        await future
+
+
+def test_send_batch_throughput() -> None:
+    events = make_events()
+    assert 950 <= len(events[0].model_dump_json()) <= 1100
+
+    async def run() -> tuple[float, float]:
+        producer = KafkaProducer[OrderEvent](KafkaConfig(), "orders")
+        producer._producer = StubProducer()  # type: ignore[assignment]
+        producer._started = True
+
+        start = time.perf_counter()
+        for offset in range(0, MESSAGES, 1000):
+            await producer.send_batch(events[offset : offset + 1000], key_func=lambda e: e.customer_id)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await send_one_by_one(StubProducer(), events)
+        sequential = time.perf_counter() - start
+
+        stats = producer.get_batch_stats()
+        assert stats.messages == MESSAGES
+        print(f"\n{MESSAGES} messages of ~1 KB, {stats.bytes / MESSAGES:,.0f} encoded bytes per message")
+        print(f"  mean batch latency {stats.total_latency_seconds / stats.batches * 1000:.2f} ms")
+        return batched, sequential
+
+    batched, sequential = asyncio.run(run())
+    print(f"  {'send_batch (record batches)':<30} {MESSAGES / batched:12,.0f} msg/s")
+    print(f"  {'per-message send':<30} {MESSAGES / sequential:12,.0f} msg/s")
@@ -0,0 +1,118 @@
+"""Benchmark: HTTP middleware stack throughput.
+
+Drives a tiny JSON endpoint through the production middleware stack
+(``configure_middleware`` plus rate limiting and idempotency) by calling the
+ASGI app directly, with a distinct client per request and INFO logs
+filtered, so the numbers reflect middleware overhead rather than an HTTP
+client, the rate limit or log output. For reference it also reports the
+bare app and the same number of pass-through ``BaseHTTPMiddleware`` layers,
+the per-layer floor the stack paid before it was rewritten as pure ASGI.
+Run with ``pytest tests/performance -m benchmark -s``.
+"""
+
+import logging
+import time
+from typing import Any
+
+import pytest
+import structlog
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from core.config import get_settings
+from infrastructure.lifecycle.middleware_config import (
+    configure_idempotency,
+    configure_middleware,
+    configure_rate_limiting,
+)
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 2_000
+
+
+class _PassThrough(BaseHTTPMiddleware):
+    async def dispatch(self, request: Any, call_next: Any) -> Any:
+        return await call_next(request)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+def _scope(client: int) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/ping",
+        "raw_path": b"/api/v1/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"user-agent", b"bench")],
+        "client": (f"10.0.{client // 256 % 256}.{client % 256}", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+async def _run(app: FastAPI, requests: int) -> float:
+    statuses: list[int] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    start = time.perf_counter()
+    for client in range(requests):
+        await app(_scope(client), receive, send)
+    elapsed = time.perf_counter() - start
+    assert statuses == [200] * requests
+    return elapsed
+
+
+def _report(name: str, elapsed: float) -> None:
+    print(f"  {name:<34} {elapsed / REQUESTS * 1e6:8.1f} us/req  {REQUESTS / elapsed:10,.0f} req/s")
+
+
+@pytest.fixture()
+def settings_env(monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setenv("SECURITY__SECRET_KEY", "b" * 32)
+    monkeypatch.setenv("SECURITY__CORS_ORIGINS", '["http://localhost"]')
+    get_settings.cache_clear()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    yield
+    structlog.reset_defaults()
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_middleware_stack_throughput(settings_env: Any) -> None:
+    full = _app()
+    configure_middleware(full)
+    configure_rate_limiting(full)
+    configure_idempotency(full)
+    layers = len(full.user_middleware)
+
+    wrapped = _app()
+    for _ in range(layers):
+        wrapped.add_middleware(_PassThrough)
+
+    print(f"\nMiddleware stack ({REQUESTS} GET requests, {layers} layers)")
+    for name, app in (
+        ("bare app", _app()),
+        (f"{layers} x BaseHTTPMiddleware pass-through", wrapped),
+        ("full stack, pure ASGI", full),
+    ):
+        await _run(app, 50)
+        _report(name, await _run(app, REQUESTS))
@@ -0,0 +1,83 @@
+"""Benchmark: sequential vs batch-mode outbox publishing.
+
+Drains an in-memory ``OutboxRepository`` through a publish function that
+simulates broker latency and reports messages/sec for the sequential path,
+batch mode, and several batch-mode publishers sharing one outbox.
+Run with ``pytest tests/performance -m benchmark -s``.
+
+**Feature: python-api-base-2025-validation**
+**Validates: Requirements 33.3, 33.4, 33.5**
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from infrastructure.messaging.outbox import (
+    OutboxPublisher,
+    OutboxRepository,
+    create_outbox_message,
+)
+
+pytestmark = pytest.mark.benchmark
+
+MESSAGES = 2_000
+BATCH_SIZE = 100
+BROKER_LATENCY = 0.0005
+
+
+async def _repository() -> OutboxRepository:
+    repository = OutboxRepository()
+    await repository.save_many(
+        [create_outbox_message("Order", str(i), "OrderPlaced", {"n": i}) for i in range(MESSAGES)]
+    )
+    return repository
+
+
+class _Broker:
+    def __init__(self) -> None:
+        self.ids: list[str] = []
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        await asyncio.sleep(BROKER_LATENCY)
+        self.ids.append(event["id"])
+
+
+async def _drain(repository: OutboxRepository, publishers: list[OutboxPublisher]) -> float:
+    start = time.perf_counter()
+    while await repository.get_pending(limit=1):
+        await asyncio.gather(*(p.publish_pending() for p in publishers))
+    return time.perf_counter() - start
+
+
+def _report(name: str, elapsed: float) -> None:
+    print(f"  {name:<28} {elapsed * 1000:8.1f} ms  {MESSAGES / elapsed:10,.0f} msg/s")
+
+
+@pytest.mark.asyncio
+async def test_outbox_publish_throughput() -> None:
+    print(f"\nOutbox publish ({MESSAGES} messages, batch {BATCH_SIZE}, broker latency {BROKER_LATENCY * 1000} ms)")
+
+    repository = await _repository()
+    broker = _Broker()
+    sequential = OutboxPublisher(repository, broker.publish, batch_size=BATCH_SIZE)
+    _report("sequential", await _drain(repository, [sequential]))
+    assert len(broker.ids) == MESSAGES
+
+    repository = await _repository()
+    broker = _Broker()
+    batched = OutboxPublisher(repository, broker.publish, batch_size=BATCH_SIZE, batch_mode=True, concurrency=32)
+    _report("batch, concurrency=32", await _drain(repository, [batched]))
+    assert len(broker.ids) == MESSAGES
+
+    repository = await _repository()
+    broker = _Broker()
+    workers = [
+        OutboxPublisher(repository, broker.publish, batch_size=BATCH_SIZE, batch_mode=True, concurrency=32)
+        for _ in range(4)
+    ]
+    _report("4 workers, concurrency=32", await _drain(repository, workers))
+    assert sorted(broker.ids) == sorted(set(broker.ids))
+    assert len(broker.ids) == MESSAGES
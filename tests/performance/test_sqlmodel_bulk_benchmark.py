@@ -0,0 +1,149 @@
+"""Benchmark: set-based vs per-row bulk operations in SQLModelRepository.
+
+Runs against in-memory SQLite and reports database round trips, wall time
+and rows/sec per operation. Run with ``pytest tests/performance -m benchmark -s``.
+
+**Feature: python-api-base-2025-review**
+**Validates: Requirements 1.4**
+"""
+
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import Field, SQLModel
+
+from infrastructure.db.repositories.sqlmodel_repository import SQLModelRepository
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 2_000
+
+
+class BenchRow(SQLModel, table=True):
+    """Table used only by this benchmark."""
+
+    __tablename__ = "bench_bulk_rows"
+
+    id: str = Field(primary_key=True)
+    name: str
+    status: str = "active"
+    is_deleted: bool = False
+
+
+class BenchRowCreate(BaseModel):
+    id: str
+    name: str
+
+
+class BenchRowUpdate(BaseModel):
+    status: str | None = None
+
+
+class BenchRowRepository(SQLModelRepository[BenchRow, BenchRowCreate, BenchRowUpdate, str]):
+    pass
+
+
+class RoundTripCounter:
+    """Counts statements sent to the database."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.count = 0
+        event.listen(session.get_bind(), "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args: object) -> None:
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+@pytest.fixture()
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchRow.metadata.create_all, tables=[BenchRow.__table__])
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db_session:
+        db_session.add_all(BenchRow(id=f"r{i:05d}", name=f"row-{i}") for i in range(ROWS))
+        await db_session.commit()
+        yield db_session
+    await engine.dispose()
+
+
+async def _measure(counter: RoundTripCounter, operation) -> tuple[int, float]:
+    counter.reset()
+    start = time.perf_counter()
+    await operation()
+    return counter.count, time.perf_counter() - start
+
+
+def _report(name: str, rows: int, results: dict[str, tuple[int, float]]) -> None:
+    print(f"\n{name} ({rows} rows per mode)")
+    for mode, (trips, seconds) in results.items():
+        print(f"  {mode:<10} round trips={trips:<6} time={seconds * 1000:8.1f} ms")
+
+
+async def test_bulk_update_round_trips(session: AsyncSession) -> None:
+    repo = BenchRowRepository(session, BenchRow)
+    counter = RoundTripCounter(session)
+    ids = [f"r{i:05d}" for i in range(ROWS)]
+
+    results = {
+        "per-row": await _measure(
+            counter, lambda: repo.bulk_update([(i, BenchRowUpdate(status="a")) for i in ids], set_based=False)
+        ),
+        "set-based": await _measure(counter, lambda: repo.bulk_update([(i, BenchRowUpdate(status="b")) for i in ids])),
+    }
+    _report("bulk_update", ROWS, results)
+
+    assert results["per-row"][0] >= 2 * ROWS
+    assert results["set-based"][0] <= -(-ROWS // repo._bulk_chunk_size)
+
+
+async def test_bulk_soft_delete_round_trips(session: AsyncSession) -> None:
+    repo = BenchRowRepository(session, BenchRow)
+    counter = RoundTripCounter(session)
+    half = ROWS // 2
+    first = [f"r{i:05d}" for i in range(half)]
+    second = [f"r{i:05d}" for i in range(half, ROWS)]
+
+    results = {
+        "per-row": await _measure(counter, lambda: repo.bulk_delete(first, set_based=False)),
+        "set-based": await _measure(counter, lambda: repo.bulk_delete(second)),
+    }
+    _report("bulk_delete (soft)", half, results)
+
+    assert results["per-row"][0] >= half
+    assert results["set-based"][0] <= -(-half // repo._bulk_chunk_size)
+
+
+async def test_create_many_rows_per_second(session: AsyncSession) -> None:
+    repo = BenchRowRepository(session, BenchRow)
+    counter = RoundTripCounter(session)
+
+    async def per_row() -> None:
+        entities = [BenchRow.model_validate({"id": f"a{i:05d}", "name": "a"}) for i in range(ROWS)]
+        session.add_all(entities)
+        await session.flush()
+        for entity in entities:
+            await session.refresh(entity)
+
+    results = {
+        "per-row": await _measure(counter, per_row),
+        "chunked": await _measure(
+            counter, lambda: repo.create_many([BenchRowCreate(id=f"b{i:05d}", name="b") for i in range(ROWS)])
+        ),
+    }
+    _report("create_many", ROWS, results)
+    for mode, (_trips, seconds) in results.items():
+        print(f"  {mode:<10} rows/sec={ROWS / seconds:,.0f}")
+
+    assert results["per-row"][0] >= ROWS
+    assert results["chunked"][0] <= -(-ROWS // repo._bulk_chunk_size)
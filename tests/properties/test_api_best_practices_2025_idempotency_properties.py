@@ -101,21 +101,37 @@ class TestIdempotencyKeyReplay:
         **Validates: Requirements 23.1, 23.3**
         """
         # Setup
-        stored_record: dict | None = None
+        stored_record: bytes | None = None
 
-        async def mock_get(key: str) -> str | None:
-            if stored_record:
-                return json.dumps(stored_record)
-            return None
+        async def mock_get(key: str) -> bytes | None:
+            return stored_record
 
-        async def mock_setex(key: str, ttl: int, value: str) -> None:
+        async def mock_set(key: str, value: bytes, nx: bool = False, ex: int | None = None) -> bool:
             nonlocal stored_record
-            stored_record = json.loads(value)
+            if nx and stored_record is not None:
+                return False
+            stored_record = value
+            return True
+
+        async def mock_setex(key: str, ttl: int, value: bytes) -> None:
+            nonlocal stored_record
+            stored_record = value
+
+        async def mock_eval(
+            script: str, numkeys: int, key: str, expected: bytes, value: bytes | None = None, ttl: int = 0
+        ) -> int:
+            nonlocal stored_record
+            if stored_record != expected:
+                return 0
+            stored_record = value
+            return 1
 
         mock_redis = AsyncMock()
         mock_redis.ping = AsyncMock()
         mock_redis.get = mock_get
+        mock_redis.set = mock_set
         mock_redis.setex = mock_setex
+        mock_redis.eval = mock_eval
 
         handler = IdempotencyHandler()
         handler._redis = mock_redis
@@ -157,21 +173,37 @@ class TestIdempotencyKeyReplay:
 
         **Feature: api-best-practices-review-2025, Property 11**
         """
-        stored_record: dict | None = None
+        stored_record: bytes | None = None
+
+        async def mock_get(key: str) -> bytes | None:
+            return stored_record
+
+        async def mock_set(key: str, value: bytes, nx: bool = False, ex: int | None = None) -> bool:
+            nonlocal stored_record
+            if nx and stored_record is not None:
+                return False
+            stored_record = value
+            return True
 
-        async def mock_get(key: str) -> str | None:
-            if stored_record:
-                return json.dumps(stored_record)
-            return None
+        async def mock_setex(key: str, ttl: int, value: bytes) -> None:
+            nonlocal stored_record
+            stored_record = value
 
-        async def mock_setex(key: str, ttl: int, value: str) -> None:
+        async def mock_eval(
+            script: str, numkeys: int, key: str, expected: bytes, value: bytes | None = None, ttl: int = 0
+        ) -> int:
             nonlocal stored_record
-            stored_record = json.loads(value)
+            if stored_record != expected:
+                return 0
+            stored_record = value
+            return 1
 
         mock_redis = AsyncMock()
         mock_redis.ping = AsyncMock()
         mock_redis.get = mock_get
+        mock_redis.set = mock_set
         mock_redis.setex = mock_setex
+        mock_redis.eval = mock_eval
 
         handler = IdempotencyHandler()
         handler._redis = mock_redis
@@ -226,21 +258,37 @@ class TestIdempotencyKeyConflict:
         if body1 == body2:
             return
 
-        stored_record: dict | None = None
+        stored_record: bytes | None = None
+
+        async def mock_get(key: str) -> bytes | None:
+            return stored_record
 
-        async def mock_get(key: str) -> str | None:
-            if stored_record:
-                return json.dumps(stored_record)
-            return None
+        async def mock_set(key: str, value: bytes, nx: bool = False, ex: int | None = None) -> bool:
+            nonlocal stored_record
+            if nx and stored_record is not None:
+                return False
+            stored_record = value
+            return True
+
+        async def mock_setex(key: str, ttl: int, value: bytes) -> None:
+            nonlocal stored_record
+            stored_record = value
 
-        async def mock_setex(key: str, ttl: int, value: str) -> None:
+        async def mock_eval(
+            script: str, numkeys: int, key: str, expected: bytes, value: bytes | None = None, ttl: int = 0
+        ) -> int:
             nonlocal stored_record
-            stored_record = json.loads(value)
+            if stored_record != expected:
+                return 0
+            stored_record = value
+            return 1
 
         mock_redis = AsyncMock()
         mock_redis.ping = AsyncMock()
         mock_redis.get = mock_get
+        mock_redis.set = mock_set
         mock_redis.setex = mock_setex
+        mock_redis.eval = mock_eval
 
         handler = IdempotencyHandler()
         handler._redis = mock_redis
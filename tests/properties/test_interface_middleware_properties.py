@@ -6,6 +6,8 @@
 Tests correctness properties for middleware stack using Hypothesis.
 """
 
+import inspect
+
 import pytest
 from hypothesis import given, settings, strategies as st
 
@@ -24,9 +26,8 @@ class TestSecurityHeadersProperties:
         """Test SecurityHeadersMiddleware has required configuration."""
         from interface.middleware.security import SecurityHeadersMiddleware
 
-        # Verify middleware class exists and has dispatch method
-        assert hasattr(SecurityHeadersMiddleware, "dispatch")
-        assert callable(SecurityHeadersMiddleware.dispatch)
+        # Verify middleware class exists and is a pure ASGI application
+        assert inspect.iscoroutinefunction(SecurityHeadersMiddleware.__call__)
 
     @given(
         x_frame_options=st.sampled_from(["DENY", "SAMEORIGIN"]),
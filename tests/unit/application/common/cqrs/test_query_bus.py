@@ -3,6 +3,7 @@
 Tests query registration, dispatch, and caching.
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -12,6 +13,7 @@ from application.common.cqrs import (
     Query,
     QueryBus,
 )
+from infrastructure.cache.single_flight import SingleFlight
 
 
 class GetUserQuery(Query[dict[str, str]]):
@@ -133,6 +135,44 @@ class TestQueryBusCaching:
         assert bus._cache is None
 
 
+class TestQueryBusSingleFlight:
+    """Tests for coalescing concurrent identical queries."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cacheable_queries_run_handler_once(self) -> None:
+        """Test identical in-flight queries share one handler call."""
+        bus = QueryBus()
+        flight = SingleFlight()
+        bus.set_single_flight(flight)
+        calls = 0
+
+        async def handler(query: CacheableQuery) -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return f"Result for {query.key}"
+
+        bus.register(CacheableQuery, handler)
+
+        results = await asyncio.gather(*(bus.dispatch(CacheableQuery("a")) for _ in range(10)))
+
+        assert results == ["Result for a"] * 10
+        assert calls == 1
+        assert flight.get_stats().coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_non_cacheable_queries_are_not_coalesced(self) -> None:
+        """Test queries without a cache key always reach the handler."""
+        bus = QueryBus()
+        bus.set_single_flight(SingleFlight())
+        handler = AsyncMock(return_value={"id": "1"})
+        bus.register(GetUserQuery, handler)
+
+        await asyncio.gather(bus.dispatch(GetUserQuery("1")), bus.dispatch(GetUserQuery("1")))
+
+        assert handler.await_count == 2
+
+
 class TestQueryBusCacheKey:
     """Tests for cache key generation."""
 
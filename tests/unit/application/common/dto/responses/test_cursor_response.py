@@ -0,0 +1,36 @@
+"""Tests for cursor-paginated response DTO.
+
+**Feature: application-layer-improvements-2025**
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from application.common.dto.responses.cursor_response import CursorPaginatedResponse
+from core.base.patterns.pagination import CursorPage
+
+
+class TestCursorPaginatedResponse:
+    """Tests for CursorPaginatedResponse."""
+
+    def test_from_page(self) -> None:
+        page = CursorPage(items=["a", "b"], next_cursor="n", prev_cursor="p", has_more=True, total=10)
+
+        response = CursorPaginatedResponse[str].from_page(page)
+
+        assert response.items == ["a", "b"]
+        assert response.next_cursor == "n"
+        assert response.prev_cursor == "p"
+        assert response.has_more is True
+        assert response.total == 10
+
+    def test_total_is_optional(self) -> None:
+        response = CursorPaginatedResponse[int](items=[1], has_more=False)
+
+        assert response.total is None
+        assert response.next_cursor is None
+        assert response.model_dump()["total"] is None
+
+    def test_negative_total_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            CursorPaginatedResponse[int](items=[], has_more=False, total=-1)
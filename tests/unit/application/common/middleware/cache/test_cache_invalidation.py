@@ -13,9 +13,13 @@ from application.common.middleware.cache.cache_invalidation import (
     CacheInvalidationStrategy,
     CompositeCacheInvalidationStrategy,
     InvalidationRule,
+    UserCacheInvalidationStrategy,
     create_entity_specific_pattern,
     create_query_type_pattern,
 )
+from application.common.middleware.cache.query_cache import InMemoryQueryCache, QueryCacheMiddleware
+from application.users.queries.read.get_user import GetUserByEmailQuery, GetUserByIdQuery, ListUsersQuery
+from domain.users.events import UserEmailChangedEvent, UserProfileUpdatedEvent
 
 
 class MockQueryCache:
@@ -147,6 +151,80 @@ class TestCacheInvalidationStrategy:
 
         assert len(cache.clear_pattern_calls) == 0
 
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_on_tagged_cache(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("query_cache:GetUser:user:1", "user1", ttl=300, tags=["user:1"])
+        await cache.set("query_cache:GetUser:user:2", "user2", ttl=300, tags=["user:2"])
+        strategy = SampleCacheInvalidationStrategy(cache)  # type: ignore[arg-type]
+        strategy.add_rule(
+            InvalidationRule(
+                event_type=UserUpdatedEvent,
+                patterns=[],
+                tags=lambda event: [f"user:{event.user_id}"],
+            )
+        )
+
+        await strategy.invalidate(UserUpdatedEvent(user_id="1"))
+
+        assert await cache.get("query_cache:GetUser:user:1") is None
+        assert await cache.get("query_cache:GetUser:user:2") == "user2"
+
+    @pytest.mark.asyncio
+    async def test_tags_ignored_without_tagged_cache(self, cache: MockQueryCache) -> None:
+        strategy = SampleCacheInvalidationStrategy(cache)
+        strategy.add_rule(
+            InvalidationRule(
+                event_type=UserUpdatedEvent,
+                patterns=["query_cache:ListUsers:*"],
+                tags=lambda event: [f"user:{event.user_id}"],
+            )
+        )
+
+        await strategy.invalidate(UserUpdatedEvent(user_id="1"))
+
+        assert cache.clear_pattern_calls == ["query_cache:ListUsers:*"]
+
+
+class TestUserCacheInvalidationStrategy:
+    """Tests for the user rules against cached user queries."""
+
+    @staticmethod
+    async def cached(cache: InMemoryQueryCache, *queries: Any) -> QueryCacheMiddleware:
+        middleware = QueryCacheMiddleware(cache)
+
+        async def handle(query: Any) -> str:
+            return repr(query)
+
+        for query in queries:
+            await middleware(query, handle)
+        return middleware
+
+    @pytest.mark.asyncio
+    async def test_profile_update_clears_only_that_user_by_tag(self) -> None:
+        cache = InMemoryQueryCache()
+        await self.cached(cache, GetUserByIdQuery(user_id="1"), GetUserByIdQuery(user_id="2"), ListUsersQuery())
+
+        await UserCacheInvalidationStrategy(cache).invalidate(UserProfileUpdatedEvent(user_id="1"))
+
+        assert await cache.get("query_cache:GetUserByIdQuery:user:1") is None
+        assert await cache.get("query_cache:GetUserByIdQuery:user:2") is not None
+        assert await cache.get("query_cache:ListUsersQuery:users:list:1:20:False") is None
+
+    @pytest.mark.asyncio
+    async def test_email_change_clears_both_email_lookups(self) -> None:
+        cache = InMemoryQueryCache()
+        queries = [GetUserByEmailQuery(email=email) for email in ("old@x.io", "new@x.io", "other@x.io")]
+        await self.cached(cache, *queries)
+
+        await UserCacheInvalidationStrategy(cache).invalidate(
+            UserEmailChangedEvent(user_id="1", old_email="old@x.io", new_email="new@x.io")
+        )
+
+        assert await cache.get("query_cache:GetUserByEmailQuery:user:email:old@x.io") is None
+        assert await cache.get("query_cache:GetUserByEmailQuery:user:email:new@x.io") is None
+        assert await cache.get("query_cache:GetUserByEmailQuery:user:email:other@x.io") is not None
+
 
 class TestCompositeCacheInvalidationStrategy:
     """Tests for CompositeCacheInvalidationStrategy."""
@@ -112,6 +112,70 @@ class TestInMemoryQueryCache:
         cleared = await cache.clear_pattern("nonexistent:*")
         assert cleared == 0
 
+    @pytest.mark.asyncio
+    async def test_clear_pattern_partial_segment(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("query_cache:GetUser:1", "user1", ttl=300)
+        await cache.set("query_cache:GetUserByEmail:a", "user2", ttl=300)
+        await cache.set("query_cache:ListUsers:all", "users", ttl=300)
+
+        cleared = await cache.clear_pattern("query_cache:GetUser*")
+        assert cleared == 2
+        assert cache.size() == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_pattern_exact_key(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("query_cache:GetUser:1", "user1", ttl=300)
+        await cache.set("query_cache:GetUser:10", "user10", ttl=300)
+
+        assert await cache.clear_pattern("query_cache:GetUser:1") == 1
+        assert await cache.get("query_cache:GetUser:10") == "user10"
+
+    @pytest.mark.asyncio
+    async def test_clear_pattern_after_delete_and_clear(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("query_cache:GetUser:1", "user1", ttl=300)
+        await cache.delete("query_cache:GetUser:1")
+        assert await cache.clear_pattern("query_cache:*") == 0
+
+        await cache.set("query_cache:GetUser:2", "user2", ttl=300)
+        await cache.clear()
+        assert await cache.clear_pattern("query_cache:*") == 0
+        assert cache._trie.children == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("query_cache:GetUser:user:1", "user1", ttl=300, tags=["user:1"])
+        await cache.set("query_cache:GetUserByEmail:a", "user1", ttl=300, tags=["user:1"])
+        await cache.set("query_cache:GetUser:user:2", "user2", ttl=300, tags=["user:2"])
+
+        cleared = await cache.invalidate_tags(["user:1"])
+        assert cleared == 2
+        assert await cache.get("query_cache:GetUser:user:2") == "user2"
+        assert await cache.invalidate_tags(["user:1"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_overwrite_replaces_tags(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("key", "v1", ttl=300, tags=["user:1"])
+        await cache.set("key", "v2", ttl=300, tags=["user:2"])
+
+        assert await cache.invalidate_tags(["user:1"]) == 0
+        assert await cache.invalidate_tags(["user:2"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_keys_leave_indexes(self) -> None:
+        cache = InMemoryQueryCache()
+        await cache.set("query_cache:GetUser:1", "user1", ttl=300, tags=["user:1"])
+        value, _ = cache._cache["query_cache:GetUser:1"]
+        cache._cache["query_cache:GetUser:1"] = (value, datetime.now(UTC) - timedelta(seconds=1))
+
+        assert cache.cleanup() == 1
+        assert cache._tag_index == {}
+        assert cache._trie.children == {}
+
 
 class TestQueryCacheConfig:
     """Tests for QueryCacheConfig."""
@@ -161,6 +225,19 @@ class QueryWithCacheKey:
     cache_key: str = "static_key"
 
 
+@dataclass
+class TaggedQuery:
+    """Query supplying entity tags."""
+
+    user_id: str
+
+    def get_cache_key(self) -> str:
+        return f"user:{self.user_id}"
+
+    def get_cache_tags(self) -> list[str]:
+        return [f"user:{self.user_id}"]
+
+
 @dataclass
 class QueryWithoutCache:
     """Query without caching support."""
@@ -299,3 +376,13 @@ class TestQueryCacheMiddleware:
         key1 = middleware._generate_cache_key(query1)
         key2 = middleware._generate_cache_key(query2)
         assert key1 != key2
+
+    @pytest.mark.asyncio
+    async def test_stores_query_cache_tags(self, cache: InMemoryQueryCache, middleware: QueryCacheMiddleware) -> None:
+        async def handler(q: Any) -> dict:
+            return {"id": q.user_id}
+
+        await middleware(TaggedQuery(user_id="123"), handler)
+
+        assert await cache.invalidate_tags(["user:123"]) == 1
+        assert cache.size() == 0
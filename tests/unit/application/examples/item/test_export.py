@@ -4,10 +4,11 @@
 **Requirements: 7.1, 7.2, 7.3, 7.4, 7.5**
 """
 
+import hashlib
 import json
 from datetime import UTC, datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 
@@ -15,10 +16,12 @@ from application.examples.item.export.export import (
     ExportFormat,
     ExportMetadata,
     ExportResult,
+    ExportStream,
     ImportResult,
     ItemExampleExportService,
     ItemExampleImportService,
 )
+from core.base.patterns.pagination import CursorPage
 from domain.examples.item.entity import ItemExample, ItemExampleStatus, Money
 
 
@@ -157,6 +160,7 @@ class TestItemExampleExportService:
 
         data = json.loads(result.data)
         assert data["version"] == "1.0"
+        assert data["export_timestamp"] == result.metadata.export_timestamp.isoformat()
         assert len(data["data"]) == 1
         assert data["data"][0]["name"] == "Test Item"
 
@@ -368,3 +372,102 @@ Item 1,Desc 1,SKU-1,10.00,BRL,5,Cat1,tag1"""
 
         assert result.processed == 1
         assert result.failed == 1
+
+
+class KeysetRepository:
+    """Repository serving items through keyset pages with offset cursors."""
+
+    def __init__(self, items: list[ItemExample]) -> None:
+        self.items = items
+        self.page_calls: list[tuple[str | None, int]] = []
+
+    async def get_page(self, cursor: str | None = None, page_size: int = 20, **filters: str) -> CursorPage:
+        self.page_calls.append((cursor, page_size))
+        start = int(cursor or 0)
+        end = min(start + page_size, len(self.items))
+        has_more = end < len(self.items)
+        return CursorPage(
+            items=self.items[start:end],
+            next_cursor=str(end) if has_more else None,
+            prev_cursor=cursor,
+            has_more=has_more,
+        )
+
+    async def get_all(self, **filters: str) -> list[ItemExample]:
+        return self.items
+
+
+def make_items(count: int) -> list[ItemExample]:
+    return [
+        ItemExample.create(
+            name=f"Item {i}",
+            description="Streamed",
+            sku=f"SKU-{i:04d}",
+            price=Money(Decimal("9.90"), "BRL"),
+            quantity=i,
+            category="Tools",
+            tags=["a", "b"],
+            created_by="user-1",
+        )
+        for i in range(count)
+    ]
+
+
+async def collect(stream: ExportStream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestItemExampleExportStream:
+    """Tests for streaming exports."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format", [ExportFormat.CSV, ExportFormat.JSONL])
+    async def test_stream_matches_buffered_export(self, format: ExportFormat) -> None:
+        service = ItemExampleExportService(KeysetRepository(make_items(7)))
+
+        stream = service.stream(format, chunk_size=3)
+        body = await collect(stream)
+        buffered = await service.export(format)
+
+        assert body.decode() == buffered.data
+        assert stream.metadata is not None
+        assert stream.metadata.checksum == buffered.metadata.checksum
+        assert stream.metadata.record_count == 7
+        assert stream.content_type == buffered.content_type
+
+    @pytest.mark.asyncio
+    async def test_stream_reads_repository_in_chunks(self) -> None:
+        repository = KeysetRepository(make_items(10))
+
+        chunks = [
+            chunk async for chunk in ItemExampleExportService(repository).stream(ExportFormat.JSONL, chunk_size=4)
+        ]
+
+        assert repository.page_calls == [(None, 4), ("4", 4), ("8", 4)]
+        assert [chunk.count(b"\n") for chunk in chunks] == [3, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_stream_json_is_one_document(self) -> None:
+        stream = ItemExampleExportService(KeysetRepository(make_items(5))).stream(ExportFormat.JSON, chunk_size=2)
+
+        body = await collect(stream)
+
+        data = json.loads(body)
+        assert data["record_count"] == 5
+        assert [item["sku"] for item in data["data"]] == [f"SKU-{i:04d}" for i in range(5)]
+        assert stream.metadata is not None
+        assert stream.metadata.checksum == hashlib.sha256(body).hexdigest()[:16]
+
+    @pytest.mark.asyncio
+    async def test_empty_stream(self) -> None:
+        stream = ItemExampleExportService(KeysetRepository([])).stream(ExportFormat.JSON)
+
+        assert stream.metadata is None
+        assert json.loads(await collect(stream)) == {
+            "version": "1.0",
+            "export_timestamp": ANY,
+            "data": [],
+            "record_count": 0,
+        }
+        assert stream.metadata is not None
+        assert stream.metadata.record_count == 0
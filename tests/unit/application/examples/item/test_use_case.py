@@ -16,6 +16,7 @@ from application.examples.item.dtos import (
 )
 from application.examples.item.use_cases.use_case import ItemExampleUseCase
 from application.examples.shared.dtos import MoneyDTO
+from core.base.patterns.pagination import CountMode, CursorPage
 from domain.examples.item.entity import ItemExample, Money
 
 
@@ -47,6 +48,19 @@ class MockItemRepository:
     async def count(self, **kwargs: Any) -> int:
         return len(self._items)
 
+    async def get_page(self, cursor: str | None = None, page_size: int = 20, **kwargs: Any) -> CursorPage:
+        if cursor == "bad":
+            raise ValueError("Invalid pagination cursor")
+        items = list(self._items.values())
+        total = len(items) if kwargs.get("count", CountMode.NONE) is not CountMode.NONE else None
+        return CursorPage(
+            items=items[:page_size],
+            next_cursor="next" if len(items) > page_size else None,
+            prev_cursor=cursor,
+            has_more=len(items) > page_size,
+            total=total,
+        )
+
     def add_item(self, item: ItemExample) -> None:
         """Helper to add item directly for testing."""
         self._items[item.id] = item
@@ -344,3 +358,34 @@ class TestItemExampleUseCaseList:
         assert result.is_ok()
         items = result.unwrap()
         assert len(items) == 3
+
+    @pytest.mark.asyncio
+    async def test_list_page_maps_items_and_cursors(
+        self, use_case: ItemExampleUseCase, repository: MockItemRepository
+    ) -> None:
+        """Test cursor listing returns mapped items with navigation data."""
+        for i in range(3):
+            repository.add_item(
+                ItemExample.create(
+                    name=f"Item {i}",
+                    sku=f"PG-{i:03d}",
+                    price=Money(Decimal("10.00")),
+                    description="Paged item",
+                )
+            )
+
+        result = await use_case.list_page(page_size=2, count=CountMode.EXACT)
+
+        assert result.is_ok()
+        page = result.unwrap()
+        assert [item.sku for item in page.items] == ["PG-000", "PG-001"]
+        assert page.has_more is True
+        assert page.next_cursor == "next"
+        assert page.total == 3
+
+    @pytest.mark.asyncio
+    async def test_list_page_invalid_cursor_fails(self, use_case: ItemExampleUseCase) -> None:
+        """Test an invalid cursor is reported as a validation error."""
+        result = await use_case.list_page(cursor="bad")
+
+        assert result.is_err()
@@ -4,10 +4,11 @@ import base64
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from decimal import Decimal
 
 import pytest
 
-from core.base.patterns.pagination import CursorPage, CursorPagination
+from core.base.patterns.pagination import CountMode, CursorPage, CursorPagination
 
 
 @dataclass
@@ -134,3 +135,59 @@ class TestCursorPagination:
         # URL-safe base64 should not contain + or /
         assert "+" not in cursor
         assert "/" not in cursor
+
+
+class TestKeysetCursor:
+    """Tests for typed keyset cursors."""
+
+    def test_round_trip_preserves_types(self) -> None:
+        created = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        pagination = CursorPagination[SampleEntity, str](cursor_fields=["created_at", "id"])
+        cursor = pagination.encode_keyset(SampleEntity(id="42", name="x", created_at=created))
+
+        assert pagination.decode_keyset(cursor) == [created, "42"]
+
+    def test_round_trip_decimal(self) -> None:
+        @dataclass
+        class Priced:
+            price: Decimal
+            id: int
+
+        pagination = CursorPagination[Priced, str](cursor_fields=["price", "id"])
+        cursor = pagination.encode_keyset(Priced(price=Decimal("9.99"), id=7), sort_order="desc")
+
+        assert pagination.decode_keyset(cursor, sort_order="desc") == [Decimal("9.99"), 7]
+
+    def test_rejects_other_sort_order(self) -> None:
+        pagination = CursorPagination[SampleEntity, str](cursor_fields=["id"])
+        cursor = pagination.encode_keyset(SampleEntity(id="1", name="x", created_at=datetime.now(UTC)))
+
+        assert pagination.decode_keyset(cursor, sort_order="desc") is None
+
+    def test_rejects_other_fields(self) -> None:
+        entity = SampleEntity(id="1", name="x", created_at=datetime.now(UTC))
+        cursor = CursorPagination[SampleEntity, str](cursor_fields=["name", "id"]).encode_keyset(entity)
+
+        assert CursorPagination[SampleEntity, str](cursor_fields=["id"]).decode_keyset(cursor) is None
+
+    def test_rejects_garbage(self) -> None:
+        pagination = CursorPagination[SampleEntity, str](cursor_fields=["id"])
+
+        assert pagination.decode_keyset("not-a-cursor") is None
+        assert pagination.decode_keyset(base64.urlsafe_b64encode(b"[1, 2]").decode()) is None
+
+    def test_rejects_invalid_decimal(self) -> None:
+        pagination = CursorPagination[SampleEntity, str](cursor_fields=["id"])
+        payload = {"f": ["id"], "o": "asc", "v": [{"$t": "dec", "v": "not-a-number"}]}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        assert pagination.decode_keyset(cursor) is None
+
+    def test_page_total_defaults_to_none(self) -> None:
+        page = CursorPage(items=[], next_cursor=None, prev_cursor=None, has_more=False)
+
+        assert page.total is None
+
+    def test_count_mode_values(self) -> None:
+        assert CountMode("exact") is CountMode.EXACT
+        assert CountMode("none") is CountMode.NONE
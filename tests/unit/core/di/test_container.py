@@ -7,7 +7,12 @@ import pytest
 
 from core.di.container import Container
 from core.di.lifecycle import Lifetime
-from core.di.resolution import CircularDependencyError, ServiceNotRegisteredError
+from core.di.resolution import (
+    CircularDependencyError,
+    ContainerFrozenError,
+    DependencyResolutionError,
+    ServiceNotRegisteredError,
+)
 
 
 class SimpleService:
@@ -38,6 +43,13 @@ class ServiceB:
         self.a = a
 
 
+class OptionalDependentService:
+    """Service with an optional dependency."""
+
+    def __init__(self, simple: SimpleService | None = None) -> None:
+        self.simple = simple
+
+
 class TestContainerRegistration:
     """Tests for service registration."""
 
@@ -238,3 +250,77 @@ class TestGetRegistration:
 
         with pytest.raises(ServiceNotRegisteredError):
             container.get_registration(SimpleService)
+
+
+class TestResolutionPlans:
+    """Tests for compiled resolution plans."""
+
+    def test_plan_is_compiled_once(self) -> None:
+        """Test repeated resolutions reuse the cached plan."""
+        container = Container()
+        container.register(SimpleService)
+        container.register(DependentService)
+
+        container.resolve(DependentService)
+        plan = container._resolver.plan_for(container.get_registration(DependentService))
+        container.resolve(DependentService)
+
+        assert container._resolver.plan_for(container.get_registration(DependentService)) is plan
+        assert [(d.name, d.service_type) for d in plan.dependencies] == [("simple", SimpleService)]
+
+    def test_reregistration_recompiles_plan(self) -> None:
+        """Test replacing a factory replaces its plan."""
+        container = Container()
+        container.register(SimpleService)
+        container.resolve(SimpleService)
+
+        container.register(SimpleService, factory=lambda: "replaced")
+
+        assert container.resolve(SimpleService) == "replaced"
+
+    def test_optional_dependency_follows_registrations(self) -> None:
+        """Test optional dependencies are looked up on each resolution."""
+        container = Container()
+        container.register(OptionalDependentService)
+        assert container.resolve(OptionalDependentService).simple is None
+
+        container.register(SimpleService)
+
+        assert isinstance(container.resolve(OptionalDependentService).simple, SimpleService)
+
+
+class TestFreeze:
+    """Tests for Container.freeze()."""
+
+    def test_freeze_reports_cycles_up_front(self) -> None:
+        """Test freeze detects circular dependencies before resolution."""
+        container = Container()
+        container.register(ServiceA)
+        container.register(ServiceB)
+
+        with pytest.raises(CircularDependencyError) as exc_info:
+            container.freeze()
+
+        assert exc_info.value.chain == [ServiceA, ServiceB, ServiceA]
+        assert not container.is_frozen
+
+    def test_freeze_reports_missing_dependencies(self) -> None:
+        """Test freeze detects unregistered required dependencies."""
+        container = Container()
+        container.register(DependentService)
+
+        with pytest.raises(DependencyResolutionError):
+            container.freeze()
+
+    def test_frozen_container_resolves_and_rejects_registrations(self) -> None:
+        """Test a frozen container resolves services but cannot change."""
+        container = Container()
+        container.register_singleton(SimpleService)
+        container.register(DependentService)
+        container.freeze()
+
+        service = container.resolve(DependentService)
+
+        assert service.simple is container.resolve(SimpleService)
+        with pytest.raises(ContainerFrozenError):
+            container.register(ServiceA)
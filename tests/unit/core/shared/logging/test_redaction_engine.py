@@ -0,0 +1,118 @@
+"""Unit tests for the compiled PII redaction engine.
+
+**Feature: observability-infrastructure**
+**Requirement: R1 - Structured Logging Infrastructure (AC5: PII redaction)**
+"""
+
+import re
+
+from core.shared.logging.redaction import PII_PATTERNS, PIIPattern, RedactionProcessor
+from core.shared.logging.redaction_engine import RedactionEngine
+
+SAFE_FIELDS = RedactionProcessor.SAFE_FIELDS
+
+
+def make_engine(patterns: dict[str, PIIPattern] | None = None, fields: set[str] | None = None) -> RedactionEngine:
+    return RedactionEngine(PII_PATTERNS if patterns is None else patterns, fields or {"password"}, SAFE_FIELDS)
+
+
+class TestRedactionEngine:
+    """Tests for RedactionEngine."""
+
+    def test_single_pass_matches_sequential_patterns(self) -> None:
+        engine = make_engine()
+        text = (
+            "user admin@example.com paid with 4111 1111 1111 1111, "
+            "ssn 123-45-6789, phone 555-123-4567, password=hunter2, "
+            "Authorization: Bearer abc.def.ghi"
+        )
+        sequential = text
+        for pattern in PII_PATTERNS.values():
+            sequential = pattern.redact(sequential)
+
+        assert engine.redact_string(text) == sequential
+
+    def test_unchanged_event_is_not_copied(self) -> None:
+        engine = make_engine()
+        event = {"event": "GET /health", "status": 200, "tags": ["a", "b"], "http": {"method": "GET"}}
+
+        assert engine.redact(event) is event
+
+    def test_copies_only_changed_containers(self) -> None:
+        engine = make_engine()
+        untouched = {"method": "GET"}
+        event = {"http": untouched, "user": {"email": "admin@example.com"}, "password": "secret"}
+
+        result = engine.redact(event)
+
+        assert result is not event
+        assert result["http"] is untouched
+        assert result["user"] == {"email": "ad***@example.com"}
+        assert result["password"] == "***"
+        assert event["user"] == {"email": "admin@example.com"}
+        assert event["password"] == "secret"
+
+    def test_field_names_are_case_folded(self) -> None:
+        engine = make_engine(fields={"Api_Key"})
+
+        assert engine.redact({"API_KEY": "x", "api_key": "y"}) == {"API_KEY": "***", "api_key": "***"}
+
+    def test_safe_fields_are_not_scanned(self) -> None:
+        engine = make_engine()
+        event = {"correlation_id": "555-123-4567"}
+
+        assert engine.redact(event) is event
+
+    def test_numbered_groups_refer_to_own_pattern(self) -> None:
+        engine = make_engine(
+            {
+                "email": PII_PATTERNS["email"],
+                "customer": PIIPattern("customer", re.compile(r"(CUST-)(\d{6})"), replacement=r"\1******"),
+            }
+        )
+
+        assert engine.redact_string("CUST-123456 a@b.io") == "CUST-****** ***@b.io"
+
+    def test_backreference_pattern_falls_back_to_sequential(self) -> None:
+        engine = make_engine({"repeat": PIIPattern("repeat", re.compile(r"(\w+) \1"), replacement="***")})
+
+        assert engine.redact_string("hello hello world") == "*** world"
+
+    def test_pattern_without_hints_disables_precheck(self) -> None:
+        engine = make_engine({"word": PIIPattern("word", re.compile(r"classified"), replacement="***")})
+
+        assert engine.redact_string("classified report") == "*** report"
+
+    def test_precheck_skips_strings_without_hints(self) -> None:
+        engine = make_engine({"word": PIIPattern("word", re.compile(r"classified"), replacement="***", hints=("@",))})
+
+        assert engine.redact_string("classified report") == "classified report"
+
+    def test_repeated_strings_are_cached(self) -> None:
+        engine = make_engine()
+
+        assert engine.redact_string("mail a@example.com") is engine.redact_string("mail a@example.com")
+
+
+class TestProcessorEngine:
+    """Tests for RedactionProcessor engine compilation."""
+
+    def test_engine_is_reused(self) -> None:
+        processor = RedactionProcessor()
+
+        assert processor.engine is processor.engine
+
+    def test_engine_recompiled_after_direct_changes(self) -> None:
+        processor = RedactionProcessor()
+        engine = processor.engine
+        processor.fields_to_redact.add("ssn_number")
+
+        assert processor.engine is not engine
+        assert processor(None, "info", {"ssn_number": "x"})["ssn_number"] == "***"
+
+    def test_engine_recompiled_after_pattern_removed(self) -> None:
+        processor = RedactionProcessor()
+        processor(None, "info", {"event": "a@example.com"})
+        processor.remove_pattern("email")
+
+        assert processor(None, "info", {"event": "a@example.com"})["event"] == "a@example.com"
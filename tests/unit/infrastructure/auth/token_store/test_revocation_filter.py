@@ -0,0 +1,259 @@
+"""Unit tests for the Bloom-filter revocation fast path.
+
+**Feature: infrastructure-generics-review-2025**
+**Validates: Requirements 8.2, 8.3, 8.5**
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from infrastructure.auth.token_store.revocation_filter import (
+    DEFAULT_REVOCATION_CHANNEL,
+    BloomFilter,
+    RevocationFilter,
+)
+from infrastructure.auth.token_store.stores import RedisTokenStore
+
+
+class FakeRevocationStore:
+    """Authoritative store counting lookups."""
+
+    def __init__(self, revoked: set[str] | None = None, redis: "FakeRedis | None" = None) -> None:
+        self.revoked = set(revoked or ())
+        self.redis = redis
+        self.lookups = 0
+        self.fail = False
+
+    async def is_revoked(self, jti: str) -> bool:
+        self.lookups += 1
+        if self.fail:
+            raise ConnectionError("store down")
+        return jti in self.revoked
+
+    async def add_to_blacklist(self, jti: str, ttl: int) -> None:
+        self.revoked.add(jti)
+        if self.redis is not None:
+            await self.redis.publish(DEFAULT_REVOCATION_CHANNEL, jti)
+
+    async def revoked_jtis(self) -> AsyncIterator[str]:
+        for jti in list(self.revoked):
+            yield jti
+
+
+class FakePubSub:
+    """In-memory stand-in for a Redis pub/sub connection."""
+
+    def __init__(self, broker: "FakeRedis") -> None:
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        broker.subscribers.append(self._queue)
+
+    async def subscribe(self, channel: str) -> None:
+        pass
+
+    async def unsubscribe(self, channel: str) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self._queue.get()
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis publish API."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[asyncio.Queue[dict[str, Any]]] = []
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def publish(self, channel: str, data: str) -> None:
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "data": data.encode()})
+
+
+EXPIRES = datetime.now(UTC) + timedelta(hours=1)
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+
+    def test_no_false_negatives(self) -> None:
+        bloom = BloomFilter(capacity=1_000, false_positive_rate=0.01)
+        items = [f"jti-{i}" for i in range(1_000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_near_target(self) -> None:
+        bloom = BloomFilter(capacity=5_000, false_positive_rate=0.01)
+        for i in range(5_000):
+            bloom.add(f"revoked-{i}")
+
+        false_positives = sum(f"valid-{i}" in bloom for i in range(20_000))
+
+        assert false_positives / 20_000 < 0.02
+        assert bloom.expected_false_positive_rate == pytest.approx(0.01, rel=0.2)
+
+    def test_memory_budget_caps_size(self) -> None:
+        bloom = BloomFilter(capacity=100_000, false_positive_rate=0.001, max_bytes=4_096)
+
+        assert bloom.size_bytes == 4_096
+
+    @pytest.mark.parametrize("kwargs", [{"capacity": 0}, {"capacity": 10, "false_positive_rate": 1.0}])
+    def test_rejects_invalid_arguments(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(**kwargs)
+
+
+class TestRevocationFilter:
+    """Tests for RevocationFilter."""
+
+    @pytest.mark.asyncio
+    async def test_only_filter_positives_reach_store(self) -> None:
+        store = FakeRevocationStore({"revoked-1"})
+        revocations = RevocationFilter(store, store.revoked_jtis, capacity=100)
+        await revocations.start()
+
+        assert await revocations.is_revoked("revoked-1") is True
+        assert await revocations.is_revoked("valid-1") is False
+
+        stats = revocations.get_stats()
+        assert store.lookups == stats.hits == 1
+        assert stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_false_positive_is_confirmed_with_store(self) -> None:
+        store = FakeRevocationStore()
+        revocations = RevocationFilter(store, store.revoked_jtis, capacity=1, max_bytes=1)
+        await revocations.start()
+        for i in range(50):
+            revocations.filter.add(f"other-{i}")
+
+        assert await revocations.is_revoked("valid") is False
+        assert revocations.get_stats().false_positives == 1
+
+    @pytest.mark.asyncio
+    async def test_unbuilt_filter_bypasses_to_store(self) -> None:
+        store = FakeRevocationStore({"revoked-1"})
+        revocations = RevocationFilter(store, store.revoked_jtis)
+
+        assert await revocations.is_revoked("revoked-1") is True
+        assert revocations.get_stats().bypassed == 1
+
+    @pytest.mark.asyncio
+    async def test_store_errors_propagate(self) -> None:
+        store = FakeRevocationStore({"revoked-1"})
+        revocations = RevocationFilter(store, store.revoked_jtis)
+        await revocations.start()
+        store.fail = True
+
+        with pytest.raises(ConnectionError):
+            await revocations.is_revoked("revoked-1")
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_keeps_bypassing(self) -> None:
+        store = FakeRevocationStore({"revoked-1"})
+
+        async def failing_loader() -> AsyncIterator[str]:
+            raise ConnectionError("store down")
+            yield  # pragma: no cover
+
+        revocations = RevocationFilter(store, failing_loader)
+        await revocations.start()
+
+        assert not revocations.is_ready
+        assert await revocations.is_revoked("revoked-1") is True
+
+    @pytest.mark.asyncio
+    async def test_revocation_is_broadcast_to_other_workers(self) -> None:
+        redis = FakeRedis()
+        store = FakeRevocationStore(redis=redis)
+        worker_a = RevocationFilter(store, store.revoked_jtis, redis_client=redis)
+        worker_b = RevocationFilter(store, store.revoked_jtis, redis_client=redis)
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            await worker_a.revoke("jti-1", EXPIRES)
+            await asyncio.sleep(0)
+
+            assert "jti-1" in worker_b.filter
+            assert await worker_b.is_revoked("jti-1") is True
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
+
+    @pytest.mark.asyncio
+    async def test_stopped_listener_bypasses_to_store(self) -> None:
+        store = FakeRevocationStore()
+        revocations = RevocationFilter(store, store.revoked_jtis, redis_client=FakeRedis())
+        await revocations.start()
+        await revocations.stop()
+        store.revoked.add("revoked-elsewhere")
+
+        assert await revocations.is_revoked("revoked-elsewhere") is True
+        assert revocations.get_stats().bypassed == 1
+
+    @pytest.mark.asyncio
+    async def test_direct_store_blacklist_reaches_filter(self) -> None:
+        fakeredis = pytest.importorskip("fakeredis")
+        redis = fakeredis.FakeAsyncRedis()
+        store = RedisTokenStore(redis)
+        revocations = RevocationFilter(store, store.revoked_jtis, redis_client=redis)
+        await revocations.start()
+        try:
+            await store.add_to_blacklist("jti-1", 3600)
+            for _ in range(100):
+                if "jti-1" in revocations.filter:
+                    break
+                await asyncio.sleep(0.001)
+
+            assert await revocations.is_revoked("jti-1") is True
+            assert revocations.get_stats().hits == 1
+        finally:
+            await revocations.stop()
+
+    @pytest.mark.asyncio
+    async def test_revoke_blacklists_until_expiry(self) -> None:
+        store = FakeRevocationStore()
+        ttls: list[int] = []
+        blacklist = store.add_to_blacklist
+
+        async def add_to_blacklist(jti: str, ttl: int) -> None:
+            ttls.append(ttl)
+            await blacklist(jti, ttl)
+
+        store.add_to_blacklist = add_to_blacklist  # type: ignore[method-assign]
+        revocations = RevocationFilter(store, store.revoked_jtis, rebuild_interval=None)
+        await revocations.start()
+
+        await revocations.revoke("jti-1", EXPIRES)
+
+        assert 3500 < ttls[0] <= 3600
+        assert "jti-1" in revocations.filter
+        assert await revocations.is_revoked("jti-1") is True
+
+    @pytest.mark.asyncio
+    async def test_filter_is_rebuilt_on_schedule(self) -> None:
+        store = FakeRevocationStore()
+        revocations = RevocationFilter(store, store.revoked_jtis, rebuild_interval=0.01)
+        await revocations.start()
+        try:
+            store.revoked.add("revoked-elsewhere")
+            await asyncio.sleep(0.05)
+
+            assert "revoked-elsewhere" in revocations.filter
+        finally:
+            await revocations.stop()
+
+    def test_rejects_invalid_rebuild_interval(self) -> None:
+        with pytest.raises(ValueError, match="rebuild_interval"):
+            RevocationFilter(FakeRevocationStore(), FakeRevocationStore().revoked_jtis, rebuild_interval=0)
@@ -243,6 +243,7 @@ class TestRedisTokenStore:
         await store.add_to_blacklist("jti-1", 3600)
 
         mock_redis.setex.assert_called_with("revoked:jti-1", 3600, "1")
+        mock_redis.publish.assert_awaited_once_with("auth:revoked", "jti-1")
 
     @pytest.mark.asyncio
     async def test_cleanup_expired_returns_zero(self, store: RedisTokenStore) -> None:
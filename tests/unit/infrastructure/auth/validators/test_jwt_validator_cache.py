@@ -0,0 +1,185 @@
+"""Tests for JWTValidator verified-token and revocation caches.
+
+**Feature: api-best-practices-review-2025**
+**Validates: Requirements 20.4**
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import jwt
+
+from infrastructure.auth.jwt.jwks import JWKSService
+from infrastructure.auth.validators.jwt_validator import InvalidTokenError, JWTValidator
+from infrastructure.auth.validators.token_cache import RevocationCache, VerifiedTokenCache
+
+
+def ec_key_pair() -> tuple[str, str]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = (
+        key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+def make_token(private_pem: str, kid: str | None = None, expires_in: int = 3600) -> str:
+    now = datetime.now(UTC)
+    claims = {
+        "sub": "user-1",
+        "jti": uuid.uuid4().hex,
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(seconds=expires_in)).timestamp()),
+    }
+    headers = {"kid": kid} if kid else None
+    return jwt.encode(claims, private_pem, algorithm="ES256", headers=headers)
+
+
+@pytest.fixture(scope="module")
+def keys() -> tuple[str, str]:
+    return ec_key_pair()
+
+
+class TestVerifiedTokenCache:
+    """Tests for JWTValidator with the verified-token cache."""
+
+    def test_repeated_validation_skips_decode(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        validator = JWTValidator(public_pem, algorithm="ES256")
+        token = make_token(private_pem)
+
+        first = validator.validate(token)
+        with patch("infrastructure.auth.validators.jwt_validator.jwt.decode") as decode:
+            second = validator.validate(token)
+
+        decode.assert_not_called()
+        assert second is first
+        assert validator.token_cache.metrics.hits == 1
+        assert validator.token_cache.metrics.misses == 1
+
+    def test_tampered_token_is_not_served_from_cache(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        validator = JWTValidator(public_pem, algorithm="ES256")
+        token = make_token(private_pem)
+        validator.validate(token)
+
+        with pytest.raises(InvalidTokenError):
+            validator.validate(token[:-4] + ("AAAA" if not token.endswith("AAAA") else "BBBB"))
+
+    def test_cached_token_still_checks_type(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        validator = JWTValidator(public_pem, algorithm="ES256")
+        token = make_token(private_pem)
+        validator.validate(token)
+
+        with pytest.raises(InvalidTokenError, match="Expected refresh"):
+            validator.validate(token, expected_type="refresh")
+
+    def test_entry_expires_with_token(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        now = [1_000.0]
+        cache = VerifiedTokenCache(max_ttl_seconds=300, clock=lambda: now[0])
+        validated = JWTValidator(public_pem, algorithm="ES256", cache_size=0).validate(make_token(private_pem))
+        token_exp = validated.exp.timestamp()
+        now[0] = token_exp - 10
+
+        cache.put("token", validated)
+        assert cache.get("token") is not None
+        now[0] = token_exp
+        assert cache.get("token") is None
+
+    def test_lru_bound(self) -> None:
+        cache = VerifiedTokenCache(max_size=2)
+        validated = AsyncMock(exp=datetime.now(UTC) + timedelta(hours=1))
+        for token in ("a", "b", "c"):
+            cache.put(token, validated)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.metrics.evictions == 1
+
+    def test_cache_can_be_disabled(self, keys: tuple[str, str]) -> None:
+        _, public_pem = keys
+        assert JWTValidator(public_pem, algorithm="ES256", cache_size=0).token_cache is None
+
+
+class TestJWKSKeys:
+    """Tests for key resolution by kid."""
+
+    def test_validates_with_key_from_jwks(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        jwks = JWKSService()
+        kid = jwks.add_key(public_pem, "ES256")
+        validator = JWTValidator("", algorithm="ES256", jwks_service=jwks)
+
+        assert validator.validate(make_token(private_pem, kid)).sub == "user-1"
+
+    def test_unknown_kid_rejected(self, keys: tuple[str, str]) -> None:
+        private_pem, _ = keys
+        validator = JWTValidator("", algorithm="ES256", jwks_service=JWKSService())
+
+        with pytest.raises(InvalidTokenError, match="signing key"):
+            validator.validate(make_token(private_pem, "missing"))
+
+    def test_revoked_key_invalidates_cached_token(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        jwks = JWKSService()
+        kid = jwks.add_key(public_pem, "ES256")
+        validator = JWTValidator("", algorithm="ES256", jwks_service=jwks)
+        token = make_token(private_pem, kid)
+        validator.validate(token)
+
+        jwks.revoke_key(kid)
+
+        with pytest.raises(InvalidTokenError):
+            validator.validate(token)
+
+
+class TestRevocationCache:
+    """Tests for cached revocation lookups."""
+
+    @pytest.mark.asyncio
+    async def test_store_is_consulted_once_within_ttl(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        store = AsyncMock()
+        store.is_revoked.return_value = False
+        validator = JWTValidator(public_pem, algorithm="ES256", revocation_store=store)
+        token = make_token(private_pem)
+
+        for _ in range(3):
+            await validator.validate_with_revocation(token)
+
+        store.is_revoked.assert_awaited_once()
+        assert validator.revocation_cache.metrics.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_local_revoke_takes_effect_immediately(self, keys: tuple[str, str]) -> None:
+        private_pem, public_pem = keys
+        store = AsyncMock()
+        store.is_revoked.return_value = False
+        validator = JWTValidator(public_pem, algorithm="ES256", revocation_store=store)
+        token = make_token(private_pem)
+        await validator.validate_with_revocation(token)
+
+        await validator.revoke(token)
+
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            await validator.validate_with_revocation(token)
+
+    def test_not_revoked_result_expires_after_ttl(self) -> None:
+        now = [0.0]
+        cache = RevocationCache(ttl_seconds=5, clock=lambda: now[0])
+        cache.put("jti", False, token_expires_at=3600)
+        cache.put("revoked", True, token_expires_at=3600)
+        now[0] = 6
+
+        assert cache.get("jti") is None
+        assert cache.get("revoked") is True
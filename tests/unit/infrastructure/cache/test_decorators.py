@@ -6,6 +6,7 @@ Tests cache decorators for use cases.
 **Validates: Requirements 4.2**
 """
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,6 +18,7 @@ from infrastructure.cache.decorators import (
     invalidate_pattern,
     set_default_cache,
 )
+from infrastructure.cache.single_flight import SingleFlight
 
 
 class MockRedis:
@@ -179,6 +181,31 @@ class TestCachedDecorator:
 
         assert result == {"id": "123"}
 
+    @pytest.mark.asyncio
+    async def test_cached_with_single_flight_coalesces_misses(self) -> None:
+        """@cached with single_flight should call the function once per key."""
+        flight = SingleFlight()
+        calls = 0
+
+        class UseCase:
+            def __init__(self) -> None:
+                self._redis = MockRedis()
+
+            @cached("item", ttl=300, single_flight=flight)
+            async def get_item(self, item_id: str) -> dict:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                return {"id": item_id}
+
+        uc = UseCase()
+        results = await asyncio.gather(*(uc.get_item("123") for _ in range(20)))
+
+        assert results == [{"id": "123"}] * 20
+        assert calls == 1
+        assert flight.get_stats().coalesced == 19
+        assert uc._redis._store["item:123"] == {"id": "123"}
+
 
 class TestInvalidateCacheDecorator:
     """Tests for @invalidate_cache decorator."""
@@ -0,0 +1,133 @@
+"""Unit tests for the Redis query cache with prefix and tag index sets.
+
+**Feature: application-layer-code-review-fixes**
+**Validates: Requirements F-05**
+"""
+
+from typing import Any
+
+import pytest
+
+from application.common.middleware.cache.query_cache import TaggedQueryCache
+from infrastructure.cache.providers.redis_query_cache import RedisQueryCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture()
+def redis() -> Any:
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture()
+def cache(redis: Any) -> RedisQueryCache:
+    return RedisQueryCache(redis)
+
+
+class TestRedisQueryCache:
+    """Tests for RedisQueryCache."""
+
+    def test_conforms_to_tagged_protocol(self, cache: RedisQueryCache) -> None:
+        assert isinstance(cache, TaggedQueryCache)
+
+    async def test_set_and_get(self, cache: RedisQueryCache) -> None:
+        await cache.set("query_cache:GetUser:user:1", {"id": "1"}, ttl=300)
+
+        assert await cache.get("query_cache:GetUser:user:1") == {"id": "1"}
+        assert await cache.get("missing") is None
+
+    async def test_clear_pattern_prefix(self, cache: RedisQueryCache) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300)
+        await cache.set("query_cache:GetUser:user:2", 2, ttl=300)
+        await cache.set("query_cache:ListUsers:all", 3, ttl=300)
+
+        assert await cache.clear_pattern("query_cache:GetUser:*") == 2
+        assert await cache.get("query_cache:ListUsers:all") == 3
+        assert await cache.clear_pattern("query_cache:GetUser:*") == 0
+
+    async def test_clear_pattern_filters_candidates(self, cache: RedisQueryCache) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300)
+        await cache.set("query_cache:GetUserByEmail:a", 2, ttl=300)
+        await cache.set("query_cache:ListUsers:all", 3, ttl=300)
+
+        assert await cache.clear_pattern("query_cache:GetUser*") == 2
+        assert await cache.clear_pattern("*all") == 1
+
+    async def test_clear_pattern_does_not_scan(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300)
+
+        async def fail_scan(*args: Any, **kwargs: Any) -> Any:
+            raise AssertionError("SCAN should not be used")
+
+        redis.scan_iter = fail_scan
+        redis.scan = fail_scan
+
+        assert await cache.clear_pattern("query_cache:*") == 1
+
+    async def test_invalidate_tags(self, cache: RedisQueryCache) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300, tags=["user:1"])
+        await cache.set("query_cache:ListUsers:all", 2, ttl=300, tags=["user:1", "user:2"])
+        await cache.set("query_cache:GetUser:user:2", 3, ttl=300, tags=["user:2"])
+
+        assert await cache.invalidate_tags(["user:1"]) == 2
+        assert await cache.get("query_cache:GetUser:user:2") == 3
+        assert await cache.invalidate_tags([]) == 0
+
+    async def test_index_sets_expire_with_keys(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=60, tags=["user:1"])
+        await cache.set("query_cache:GetUser:user:2", 2, ttl=300)
+
+        assert 0 < await redis.ttl("query_cache_index:tag:user:1") <= 60
+        assert 60 < await redis.ttl("query_cache_index:prefix:query_cache:") <= 300
+
+    async def test_delete_and_clear(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300, tags=["user:1"])
+        await cache.set("query_cache:GetUser:user:2", 2, ttl=300)
+
+        await cache.delete("query_cache:GetUser:user:1")
+        assert await cache.clear_pattern("query_cache:*") == 1
+
+        await cache.set("query_cache:GetUser:user:3", 3, ttl=300, tags=["user:3"])
+        await cache.clear()
+        assert await redis.keys("*") == []
+
+    async def test_indexes_only_configured_prefix_depth(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300)
+
+        index_keys = sorted(key.decode() for key in await redis.keys("query_cache_index:*"))
+
+        assert index_keys == [
+            "query_cache_index:prefix:query_cache:",
+            "query_cache_index:prefix:query_cache:GetUser:",
+        ]
+        assert await cache.clear_pattern("query_cache:GetUser:user:*") == 1
+
+    async def test_leading_wildcard_falls_back_to_scan(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300, tags=["user:1"])
+        await cache.set("query_cache:ListUsers:all", 2, ttl=300)
+
+        assert await cache.clear_pattern("*user:*") == 1
+        assert await redis.exists("query_cache_index:tag:user:1") == 0
+        assert await cache.get("query_cache:ListUsers:all") == 2
+
+    async def test_delete_removes_key_from_tag_sets(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300, tags=["user:1"])
+        await cache.set("query_cache:ListUsers:all", 2, ttl=300, tags=["user:1"])
+
+        await cache.delete("query_cache:GetUser:user:1")
+
+        assert await redis.smembers("query_cache_index:tag:user:1") == {b"query_cache:ListUsers:all"}
+        assert await redis.exists("query_cache_index:keytags:query_cache:GetUser:user:1") == 0
+
+    async def test_lookup_drops_members_of_vanished_keys(self, cache: RedisQueryCache, redis: Any) -> None:
+        await cache.set("query_cache:GetUser:user:1", 1, ttl=300, tags=["user:1"])
+        await cache.set("query_cache:GetUser:user:2", 2, ttl=300, tags=["user:1"])
+        await redis.delete("query_cache:GetUser:user:1")
+
+        assert await cache.clear_pattern("query_cache:GetUser:user:9*") == 0
+        assert await redis.smembers("query_cache_index:prefix:query_cache:GetUser:") == {b"query_cache:GetUser:user:2"}
+        assert await cache.invalidate_tags(["user:1"]) == 1
+
+    def test_rejects_empty_prefix_depth(self, redis: Any) -> None:
+        with pytest.raises(ValueError, match="prefix_depth"):
+            RedisQueryCache(redis, prefix_depth=0)
@@ -1,4 +1,24 @@
-from infrastructure.cache.serializers import JsonSerializer
+import sys
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from application.examples.item.dtos import ItemExampleResponse
+from application.examples.shared.dtos import MoneyDTO
+from application.users.dtos.commands import UserDTO
+from infrastructure.cache.config import CacheConfig
+from infrastructure.cache.core import serializers
+from infrastructure.cache.serializers import (
+    CompressedSerializer,
+    JsonSerializer,
+    PickleSerializer,
+    available_serializers,
+    get_serializer,
+    register_model,
+    register_serializer,
+    serializer_from_config,
+)
 
 
 class TestJsonSerializer:
@@ -20,3 +40,175 @@ class TestJsonSerializer:
         serialized = serializer.serialize(data)
         deserialized = serializer.deserialize(serialized)
         assert deserialized == data
+
+
+BACKENDS = ["json", "orjson", "msgpack", "pickle"]
+
+
+@pytest.fixture(autouse=True)
+def cache_models(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serializers, "_MODELS", {})
+    register_model(ItemExampleResponse)
+    register_model(UserDTO)
+
+
+def make_serializer(name: str, **kwargs: object):
+    if name in ("orjson", "msgpack"):
+        pytest.importorskip(name)
+    return get_serializer(name, **kwargs)
+
+
+def make_user(index: int = 1) -> UserDTO:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    return UserDTO(id=f"u{index}", email=f"user{index}@example.com", created_at=now, updated_at=now)
+
+
+def make_item(index: int = 1) -> ItemExampleResponse:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    price = MoneyDTO(amount=Decimal("19.90"), currency="USD")
+    return ItemExampleResponse(
+        id=f"i{index}",
+        name="Widget",
+        description="A widget",
+        sku=f"SKU-{index}",
+        price=price,
+        quantity=3,
+        status="active",
+        category="tools",
+        tags=["a", "b"],
+        is_available=True,
+        total_value=MoneyDTO(amount=Decimal("59.70"), currency="USD"),
+        created_at=now,
+        updated_at=now,
+        created_by="system",
+        updated_by="system",
+    )
+
+
+class TestSerializerRegistry:
+    def test_available_serializers(self) -> None:
+        assert set(BACKENDS) <= set(available_serializers())
+
+    def test_unknown_serializer_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown serializer"):
+            get_serializer("yaml")
+
+    def test_unknown_compression_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown compression"):
+            get_serializer("json", compression="brotli")
+
+    def test_register_serializer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serializers, "_SERIALIZERS", dict(serializers._SERIALIZERS))
+        register_serializer("test-pickle", PickleSerializer)
+        assert isinstance(get_serializer("test-pickle"), PickleSerializer)
+
+    def test_from_config(self) -> None:
+        serializer = serializer_from_config(
+            CacheConfig(serializer="json", compression="zlib", compression_threshold=10)
+        )
+        assert isinstance(serializer, CompressedSerializer)
+        assert serializer.threshold == 10
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+class TestSerializerRoundTrip:
+    def test_plain_values(self, name: str) -> None:
+        serializer = make_serializer(name)
+        data = {"key": "value", "numbers": [1, 2.5, None], "nested": {"ok": True}}
+        assert serializer.deserialize(serializer.serialize(data)) == data
+
+    def test_pydantic_model(self, name: str) -> None:
+        serializer = make_serializer(name)
+        item = make_item()
+
+        restored = serializer.deserialize(serializer.serialize(item))
+
+        assert isinstance(restored, ItemExampleResponse)
+        assert restored == item
+        assert restored.price.amount == Decimal("19.90")
+
+    def test_list_of_models(self, name: str) -> None:
+        serializer = make_serializer(name)
+        users = [make_user(i) for i in range(5)]
+
+        restored = serializer.deserialize(serializer.serialize({"users": users, "total": 5}))
+
+        assert restored == {"users": users, "total": 5}
+        assert all(isinstance(user, UserDTO) for user in restored["users"])
+
+
+class TestModelTagging:
+    def test_rejects_unregistered_tag(self) -> None:
+        serializer = get_serializer("json")
+        with pytest.raises(ValueError, match="not a registered cache model"):
+            serializer.deserialize(b'{"__pydantic_model__": "collections:OrderedDict", "data": {}}')
+
+    def test_unregistered_module_is_not_imported(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delitem(sys.modules, "wsgiref.simple_server", raising=False)
+        serializer = get_serializer("json")
+
+        with pytest.raises(ValueError, match="not a registered cache model"):
+            serializer.deserialize(b'{"__pydantic_model__": "wsgiref.simple_server:WSGIServer", "data": {}}')
+
+        assert "wsgiref.simple_server" not in sys.modules
+
+    def test_unregistered_model_is_stored_as_data(self) -> None:
+        serializer = get_serializer("json")
+
+        restored = serializer.deserialize(serializer.serialize(MoneyDTO(amount=Decimal("1.50"), currency="USD")))
+
+        assert restored == {"amount": "1.50", "currency": "USD"}
+
+    def test_constructor_registers_models(self) -> None:
+        serializer = JsonSerializer(models=[MoneyDTO])
+        money = MoneyDTO(amount=Decimal("1.50"), currency="USD")
+
+        assert serializer.deserialize(serializer.serialize(money)) == money
+
+    def test_orjson_skips_model_walk_for_untagged_payloads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        serializer = make_serializer("orjson")
+        walked: list[object] = []
+        monkeypatch.setattr(serializers, "_decode_models", lambda value: walked.append(value) or value)
+
+        serializer.deserialize(serializer.serialize({"users": [{"id": "u1"}], "total": 1}))
+        assert walked == []
+
+        serializer.deserialize(serializer.serialize({"users": [make_user()], "total": 1}))
+        assert len(walked) == 1
+
+
+class TestCompressedSerializer:
+    @pytest.mark.parametrize("algorithm", ["zlib", "lz4"])
+    def test_compresses_above_threshold(self, algorithm: str) -> None:
+        if algorithm == "lz4":
+            pytest.importorskip("lz4")
+        serializer = get_serializer("json", compression=algorithm, compression_threshold=64)
+        large = {"payload": "x" * 10_000}
+
+        data = serializer.serialize(large)
+
+        assert len(data) < 1000
+        assert serializer.deserialize(data) == large
+
+    def test_small_payload_stored_raw(self) -> None:
+        serializer = get_serializer("json", compression="zlib", compression_threshold=1024)
+
+        data = serializer.serialize({"a": 1})
+
+        assert data == b'\x00{"a": 1}'
+        assert serializer.deserialize(data) == {"a": 1}
+
+    def test_reads_values_written_with_other_threshold(self) -> None:
+        writer = get_serializer("json", compression="zlib", compression_threshold=0)
+        reader = get_serializer("json", compression="zlib", compression_threshold=10_000)
+
+        assert reader.deserialize(writer.serialize({"a": 1})) == {"a": 1}
+
+    def test_unknown_header_raises(self) -> None:
+        serializer = get_serializer("json", compression="zlib")
+        with pytest.raises(ValueError, match="Unknown compression header"):
+            serializer.deserialize(b"\x09{}")
+
+    def test_negative_threshold_raises(self) -> None:
+        with pytest.raises(ValueError):
+            get_serializer("json", compression="zlib", compression_threshold=-1)
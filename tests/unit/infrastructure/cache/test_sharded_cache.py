@@ -0,0 +1,292 @@
+"""Unit tests for the sharded in-memory cache provider.
+
+**Feature: python-api-base-2025-state-of-art**
+**Validates: CacheProvider protocol, TTL reaper, memory accounting**
+"""
+
+import asyncio
+
+import pytest
+
+from infrastructure.cache.config import CacheConfig
+from infrastructure.cache.providers.sharded import ShardedMemoryCacheProvider
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def cache(clock: FakeClock) -> ShardedMemoryCacheProvider[object]:
+    return ShardedMemoryCacheProvider(
+        CacheConfig(max_size=1000, default_ttl=None),
+        shard_count=8,
+        clock=clock,
+    )
+
+
+class TestShardLayout:
+    """Tests for shard count and capacity distribution."""
+
+    def test_shard_count_rounded_to_power_of_two(self) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(max_size=1000), shard_count=10)
+        assert cache.shard_count == 16
+
+    def test_shard_count_capped_by_max_size(self) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(max_size=3), shard_count=16)
+        assert cache.shard_count == 2
+
+    def test_capacity_sums_to_max_size(self) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(max_size=1001), shard_count=8)
+        assert sum(shard.capacity for shard in cache._shards) == 1001
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"shard_count": 0}, {"reap_interval": 0}, {"reap_batch_size": 0}, {"max_memory_bytes": 0}],
+    )
+    def test_rejects_invalid_arguments(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            ShardedMemoryCacheProvider[int](**kwargs)
+
+
+class TestBasicOperations:
+    """Tests for the CacheProvider protocol surface."""
+
+    async def test_set_get(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set("k", {"a": 1})
+        assert await cache.get("k") == {"a": 1}
+        assert cache.hits == 1
+
+    async def test_get_missing_counts_miss(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        assert await cache.get("missing") is None
+        assert cache.misses == 1
+
+    async def test_delete_and_exists(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set("k", 1)
+        assert await cache.exists("k") is True
+        assert await cache.delete("k") is True
+        assert await cache.delete("k") is False
+        assert await cache.exists("k") is False
+
+    async def test_key_prefix(self, clock: FakeClock) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(key_prefix="app"), clock=clock)
+        await cache.set("k", 1)
+        assert await cache.get("k") == 1
+        assert await cache.clear_pattern("k") == 1
+
+    async def test_clear_pattern(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        for i in range(50):
+            await cache.set(f"user:{i}", i)
+            await cache.set(f"order:{i}", i)
+
+        assert await cache.clear_pattern("user:*") == 50
+        assert await cache.size() == 50
+        assert await cache.get("order:7") == 7
+
+    async def test_clear(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set_with_tags("k", 1, ["t"])
+        await cache.clear()
+        assert await cache.size() == 0
+        assert cache.memory_usage_bytes == 0
+        assert await cache.get_tags_for_key("k") == []
+
+
+class TestEviction:
+    """Tests for per-shard LRU eviction."""
+
+    async def test_size_never_exceeds_max_size(self, clock: FakeClock) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(max_size=64), shard_count=8, clock=clock)
+        for i in range(500):
+            await cache.set(f"key:{i}", i)
+
+        assert await cache.size() <= 64
+        assert cache.evictions == 500 - await cache.size()
+
+    async def test_single_shard_is_exact_lru(self, clock: FakeClock) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(max_size=3), shard_count=1, clock=clock)
+        for i in range(3):
+            await cache.set(f"key_{i}", i)
+        await cache.get("key_0")
+        await cache.set("key_3", 3)
+
+        assert await cache.get("key_0") == 0
+        assert await cache.get("key_1") is None
+
+
+class TestExpiry:
+    """Tests for monotonic TTL handling and the reaper."""
+
+    async def test_expired_entry_is_miss(self, cache: ShardedMemoryCacheProvider[object], clock: FakeClock) -> None:
+        await cache.set("k", 1, ttl=10)
+        clock.advance(9.9)
+        assert await cache.get("k") == 1
+        clock.advance(0.2)
+        assert await cache.get("k") is None
+        assert await cache.exists("k") is False
+        assert cache.expirations == 1
+
+    async def test_default_ttl_applies(self, clock: FakeClock) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(default_ttl=5), clock=clock)
+        await cache.set("k", 1)
+        clock.advance(5)
+        assert await cache.get("k") is None
+
+    async def test_cleanup_expired_removes_only_expired(
+        self, cache: ShardedMemoryCacheProvider[object], clock: FakeClock
+    ) -> None:
+        for i in range(100):
+            await cache.set(f"short:{i}", i, ttl=1)
+            await cache.set(f"long:{i}", i, ttl=100)
+        await cache.set("forever", 0)
+
+        clock.advance(2)
+
+        assert await cache.cleanup_expired() == 100
+        assert await cache.size() == 101
+
+    async def test_overwritten_entry_not_reaped_by_stale_deadline(
+        self, cache: ShardedMemoryCacheProvider[object], clock: FakeClock
+    ) -> None:
+        await cache.set("k", 1, ttl=1)
+        await cache.set("k", 2, ttl=100)
+        clock.advance(2)
+
+        assert await cache.cleanup_expired() == 0
+        assert await cache.get("k") == 2
+
+    async def test_cleanup_runs_in_bounded_batches(self, clock: FakeClock) -> None:
+        cache = ShardedMemoryCacheProvider[int](
+            CacheConfig(max_size=1000), shard_count=1, reap_batch_size=10, clock=clock
+        )
+        for i in range(95):
+            await cache.set(f"k{i}", i, ttl=1)
+        clock.advance(2)
+
+        assert cache._reap_shard(cache._shards[0], clock(), 10) == 10
+        assert await cache.cleanup_expired() == 85
+
+    async def test_heap_compacts_after_repeated_overwrites(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        for i in range(1000):
+            await cache.set("hot", i, ttl=60)
+
+        assert sum(len(shard.expiry_heap) for shard in cache._shards) <= 2 + 64 + 1
+
+    async def test_background_reaper(self, clock: FakeClock) -> None:
+        cache = ShardedMemoryCacheProvider[int](CacheConfig(), reap_interval=0.01, clock=clock)
+        await cache.set("k", 1, ttl=1)
+        clock.advance(2)
+
+        await cache.start()
+        assert cache.is_reaping
+        for _ in range(50):
+            if await cache.size() == 0:
+                break
+            await asyncio.sleep(0.01)
+        await cache.stop()
+
+        assert await cache.size() == 0
+        assert cache.expirations == 1
+        assert not cache.is_reaping
+
+
+class TestTags:
+    """Tests for tag-based invalidation."""
+
+    async def test_invalidate_by_tag(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set_with_tags("a", 1, ["users"])
+        await cache.set_with_tags("b", 2, ["users", "admins"])
+        await cache.set("c", 3)
+
+        assert await cache.invalidate_by_tag("users") == 2
+        assert await cache.get("c") == 3
+        assert await cache.get_tags_for_key("b") == []
+        assert cache._tag_index == {}
+
+    async def test_delete_drops_tag_membership(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set_with_tags("a", 1, ["t1", "t2"])
+        assert await cache.get_tags_for_key("a") == ["t1", "t2"]
+
+        await cache.delete("a")
+
+        assert cache._tag_index == {}
+        assert await cache.invalidate_by_tag("t1") == 0
+
+
+class TestMetrics:
+    """Tests for hit ratio and memory accounting."""
+
+    async def test_sizes_are_not_measured_without_budget(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set("k", "x" * 10_000)
+
+        assert cache.memory_usage_bytes == 0
+
+    async def test_memory_usage_tracks_entries(self) -> None:
+        cache = ShardedMemoryCacheProvider[object](CacheConfig(max_size=100), shard_count=1, max_memory_bytes=1 << 20)
+        assert cache.get_metrics().memory_usage_bytes == 0
+
+        await cache.set("small", "x")
+        small = cache.memory_usage_bytes
+        await cache.set("large", b"x" * 10_000)
+
+        assert small == len("small") + 1
+        assert cache.memory_usage_bytes == small + len("large") + 10_000
+
+        await cache.delete("large")
+        assert cache.memory_usage_bytes == small
+
+    async def test_overwrite_replaces_accounted_size(self) -> None:
+        cache = ShardedMemoryCacheProvider[object](CacheConfig(max_size=100), shard_count=1, max_memory_bytes=1 << 20)
+        await cache.set("k", "x" * 10_000)
+        await cache.set("k", "y")
+
+        assert cache.memory_usage_bytes == 2
+
+    async def test_memory_budget_evicts_lru(self) -> None:
+        cache = ShardedMemoryCacheProvider[object](CacheConfig(max_size=100), shard_count=1, max_memory_bytes=35)
+        for key in ("a", "b", "c"):
+            await cache.set(key, "x" * 9)
+        await cache.get("a")
+
+        await cache.set("d", "x" * 9)
+
+        assert await cache.get("b") is None
+        assert [await cache.get(key) for key in ("a", "c", "d")] == ["x" * 9] * 3
+        assert cache.memory_usage_bytes == 30
+        assert cache.evictions == 1
+
+    async def test_custom_sizer(self) -> None:
+        cache = ShardedMemoryCacheProvider[list[int]](
+            CacheConfig(max_size=100), shard_count=1, max_memory_bytes=1000, sizer=lambda value: 8 * len(value)
+        )
+        await cache.set("k", [1, 2, 3])
+
+        assert cache.memory_usage_bytes == 1 + 24
+
+    async def test_get_stats(self, cache: ShardedMemoryCacheProvider[object]) -> None:
+        await cache.set("k", 1)
+        await cache.get("k")
+        await cache.get("missing")
+
+        stats = await cache.get_stats()
+
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+        assert stats.entry_count == 1
+
+        cache.reset_stats()
+        assert cache.hits == cache.misses == cache.evictions == cache.expirations == 0
@@ -0,0 +1,132 @@
+"""Unit tests for in-process request coalescing.
+
+**Feature: python-api-base-2025-state-of-art**
+**Validates: SingleFlight, RedisCacheWithJitter.get_or_compute coalescing**
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from infrastructure.cache.providers.redis_jitter import RedisCacheWithJitter
+from infrastructure.cache.single_flight import SingleFlight, SingleFlightStats
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.do."""
+
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight[int]()
+        calls = 0
+        release = asyncio.Event()
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(flight.do("k", compute)) for _ in range(200)]
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1
+
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert results == [42] * 200
+        assert calls == 1
+        assert flight.get_stats() == SingleFlightStats(executions=1, coalesced=199)
+        assert flight.in_flight == 0
+
+    async def test_distinct_keys_run_independently(self) -> None:
+        flight = SingleFlight[str]()
+
+        async def compute(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: compute("a")),
+            flight.do("b", lambda: compute("b")),
+        )
+
+        assert results == ["a", "b"]
+        assert flight.get_stats().executions == 2
+
+    async def test_sequential_calls_recompute(self) -> None:
+        flight = SingleFlight[int]()
+        compute = AsyncMock(side_effect=[1, 2])
+
+        assert await flight.do("k", compute) == 1
+        assert await flight.do("k", compute) == 2
+        assert flight.get_stats().coalesced == 0
+
+    async def test_exception_propagates_to_all_waiters(self) -> None:
+        flight = SingleFlight[int]()
+
+        async def fail() -> int:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail),
+            flight.do("k", fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not flight.is_in_flight("k")
+
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        flight = SingleFlight[int]()
+        release = asyncio.Event()
+
+        async def compute() -> int:
+            await release.wait()
+            return 7
+
+        first = asyncio.create_task(flight.do("k", compute))
+        second = asyncio.create_task(flight.do("k", compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 7
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    def test_stats_ratio(self) -> None:
+        stats = SingleFlightStats(executions=1, coalesced=3)
+
+        assert stats.total_calls == 4
+        assert stats.coalesce_ratio == 0.75
+        assert SingleFlightStats().coalesce_ratio == 0.0
+
+
+class TestGetOrComputeCoalescing:
+    """Tests for single-flight in RedisCacheWithJitter.get_or_compute."""
+
+    async def test_concurrent_misses_compute_once(self) -> None:
+        cache = RedisCacheWithJitter[dict]()
+        client = AsyncMock()
+        client.get = AsyncMock(return_value=None)
+        client.set = AsyncMock(return_value=True)
+        cache._redis = client
+        cache._connected = True
+
+        calls = 0
+
+        async def compute() -> dict:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+
+        results = await asyncio.gather(*(cache.get_or_compute("user:1", compute) for _ in range(50)))
+
+        assert results == [{"id": 1}] * 50
+        assert calls == 1
+        assert client.set.await_count == 1
+        assert cache.get_stats().coalesced_waiters == 49
+        assert cache.get_stats().stampede_prevented == 0
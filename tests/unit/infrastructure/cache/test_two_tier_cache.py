@@ -0,0 +1,201 @@
+"""Unit tests for the two-tier (L1 local, L2 Redis) cache provider.
+
+**Feature: python-api-base-2025-state-of-art**
+**Validates: L1/L2 lookups, pub/sub invalidation, per-tier stats**
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from infrastructure.cache.providers.cache_models import TwoTierCacheStats
+from infrastructure.cache.providers.redis_jitter import RedisCacheWithJitter
+from infrastructure.cache.providers.two_tier import TwoTierCacheProvider
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture()
+def server() -> Any:
+    return fakeredis.FakeServer()
+
+
+def make_redis(server: Any) -> Any:
+    return fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+
+def make_cache(server: Any, **kwargs: Any) -> TwoTierCacheProvider[dict]:
+    l2 = RedisCacheWithJitter[dict](redis_client=make_redis(server))
+    return TwoTierCacheProvider[dict](l2, **kwargs)
+
+
+@pytest.fixture()
+async def cache(server: Any) -> AsyncIterator[TwoTierCacheProvider[dict]]:
+    provider = make_cache(server)
+    yield provider
+    await provider.stop()
+
+
+async def wait_for(condition: Any, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestLookups:
+    """Tests for L1/L2 read-through behaviour."""
+
+    async def test_set_populates_both_tiers(self, cache: TwoTierCacheProvider[dict]) -> None:
+        await cache.set("user:1", {"name": "Ada"})
+
+        assert cache.l1.get("user:1") == {"name": "Ada"}
+        assert await cache.l2.get("user:1") == {"name": "Ada"}
+
+    async def test_l1_hit_skips_redis(self, cache: TwoTierCacheProvider[dict]) -> None:
+        await cache.set("user:1", {"name": "Ada"})
+        cache.l2.reset_stats()
+
+        assert await cache.get("user:1") == {"name": "Ada"}
+
+        stats = cache.get_stats()
+        assert stats.l1_hits == 1
+        assert stats.l2_hits == stats.l2_misses == 0
+        assert cache.l2.get_stats().total_requests == 0
+
+    async def test_l1_hit_returns_same_object(self, cache: TwoTierCacheProvider[dict]) -> None:
+        await cache.l2.set("user:1", {"name": "Ada"})
+
+        first = await cache.get("user:1")
+
+        assert await cache.get("user:1") is first
+
+    async def test_l2_hit_fills_l1(self, cache: TwoTierCacheProvider[dict]) -> None:
+        await cache.l2.set("user:1", {"name": "Ada"})
+
+        assert await cache.get("user:1") == {"name": "Ada"}
+        assert await cache.get("user:1") == {"name": "Ada"}
+
+        stats = cache.get_stats()
+        assert (stats.l1_hits, stats.l1_misses) == (1, 1)
+        assert (stats.l2_hits, stats.l2_misses) == (1, 0)
+
+    async def test_miss_in_both_tiers(self, cache: TwoTierCacheProvider[dict]) -> None:
+        assert await cache.get("missing") is None
+        assert await cache.exists("missing") is False
+
+        stats = cache.get_stats()
+        assert stats.l2_misses == 2
+        assert stats.hit_ratio == 0.0
+
+    async def test_delete_removes_both_tiers(self, cache: TwoTierCacheProvider[dict]) -> None:
+        await cache.set("user:1", {"name": "Ada"})
+
+        assert await cache.delete("user:1") is True
+        assert cache.l1.get("user:1") is None
+        assert await cache.l2.get("user:1") is None
+        assert await cache.delete("user:1") is False
+
+    async def test_clear_pattern(self, cache: TwoTierCacheProvider[dict]) -> None:
+        await cache.set("user:1", {"id": 1})
+        await cache.set("user:2", {"id": 2})
+        await cache.set("order:1", {"id": 1})
+
+        assert await cache.clear_pattern("user:*") == 2
+        assert cache.l1.keys() == ["order:1"]
+
+    def test_rejects_non_positive_l1_ttl(self, server: Any) -> None:
+        with pytest.raises(ValueError):
+            make_cache(server, l1_ttl=0)
+
+
+class TestInvalidation:
+    """Tests for cross-worker L1 invalidation over pub/sub."""
+
+    async def test_set_invalidates_other_workers(self, server: Any) -> None:
+        worker_a = make_cache(server)
+        worker_b = make_cache(server)
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            await worker_a.set("user:1", {"v": 1})
+            assert await worker_b.get("user:1") == {"v": 1}
+
+            await worker_a.set("user:1", {"v": 2})
+            await wait_for(lambda: worker_b.get_stats().invalidations_received == 2)
+
+            assert worker_b.l1.get("user:1") is None
+            assert await worker_b.get("user:1") == {"v": 2}
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
+
+    async def test_own_messages_keep_local_copy(self, server: Any) -> None:
+        worker_a = make_cache(server)
+        worker_b = make_cache(server)
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            await worker_a.set("user:1", {"v": 1})
+            await wait_for(lambda: worker_b.get_stats().invalidations_received == 1)
+
+            assert worker_a.l1.get("user:1") == {"v": 1}
+            assert worker_a.get_stats().invalidations_received == 0
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
+
+    async def test_delete_and_pattern_invalidate_other_workers(self, server: Any) -> None:
+        worker_a = make_cache(server)
+        worker_b = make_cache(server)
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            await worker_b.l2.set("user:1", {"v": 1})
+            await worker_b.l2.set("user:2", {"v": 2})
+            await worker_b.get("user:1")
+            await worker_b.get("user:2")
+
+            await worker_a.delete("user:1")
+            await worker_a.clear_pattern("user:*")
+            await wait_for(lambda: worker_b.get_stats().invalidations_received == 2)
+
+            assert worker_b.l1.keys() == []
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
+
+    async def test_malformed_message_is_ignored(self, server: Any) -> None:
+        worker = make_cache(server)
+        await worker.start()
+        try:
+            publisher = make_redis(server)
+            await publisher.publish("cache:invalidate", "not json")
+            await worker.set("user:1", {"v": 1})
+            await asyncio.sleep(0.05)
+
+            assert worker.is_listening
+        finally:
+            await worker.stop()
+
+        assert not worker.is_listening
+
+
+class TestTwoTierCacheStats:
+    """Tests for per-tier hit ratios."""
+
+    def test_ratios(self) -> None:
+        stats = TwoTierCacheStats(l1_hits=6, l1_misses=4, l2_hits=3, l2_misses=1)
+
+        assert stats.l1_hit_ratio == 0.6
+        assert stats.l2_hit_ratio == 0.75
+        assert stats.hit_ratio == 0.9
+        assert stats.total_requests == 10
+
+    def test_empty_ratios(self) -> None:
+        stats = TwoTierCacheStats()
+
+        assert stats.l1_hit_ratio == stats.l2_hit_ratio == stats.hit_ratio == 0.0
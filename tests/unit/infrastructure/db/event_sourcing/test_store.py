@@ -0,0 +1,154 @@
+"""Tests for event sourcing store module.
+
+Tests for InMemoryEventStore version-range reads, global positions and
+streaming.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from infrastructure.db.event_sourcing.aggregate import Aggregate
+from infrastructure.db.event_sourcing.events import SourcedEvent
+from infrastructure.db.event_sourcing.exceptions import ConcurrencyError
+from infrastructure.db.event_sourcing.store import InMemoryEventStore
+
+
+@dataclass(frozen=True)
+class Deposited(SourcedEvent):
+    """Sample event for testing."""
+
+    amount: int = 0
+
+
+class Account(Aggregate[str]):
+    """Sample aggregate summing deposits."""
+
+    def __init__(self, id: str = "") -> None:
+        super().__init__(id)
+        self.balance = 0
+
+    def apply_event(self, event: SourcedEvent) -> None:
+        if isinstance(event, Deposited):
+            self.balance += event.amount
+
+    def deposit(self, amount: int) -> None:
+        self.raise_event(Deposited(amount=amount))
+
+
+async def save_deposits(store: InMemoryEventStore, account_id: str, amounts: list[int]) -> Account:
+    account = (await store.load(account_id, Account)) or Account(account_id)
+    for amount in amounts:
+        account.deposit(amount)
+    await store.save(account)
+    return account
+
+
+class TestInMemoryEventStore:
+    """Tests for InMemoryEventStore."""
+
+    @pytest.fixture()
+    def store(self) -> InMemoryEventStore:
+        return InMemoryEventStore()
+
+    @pytest.mark.asyncio
+    async def test_get_events_version_range(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", list(range(1, 11)))
+
+        events = await store.get_events("a", from_version=3, to_version=5)
+
+        assert [e.version for e in events] == [3, 4, 5]
+        assert len(await store.get_events("a")) == 10
+        assert [e.version for e in await store.get_events("a", from_version=9)] == [9, 10]
+        assert await store.get_events("a", from_version=11) == []
+        assert await store.get_events("missing") == []
+
+    @pytest.mark.asyncio
+    async def test_load_replays_after_snapshot(self, store: InMemoryEventStore) -> None:
+        account = await save_deposits(store, "a", [10, 20])
+        await store.save_snapshot(account)
+        await save_deposits(store, "a", [5])
+
+        loaded = await store.load("a", Account)
+
+        assert loaded is not None
+        assert loaded.balance == 35
+        assert loaded.version == 3
+
+    @pytest.mark.asyncio
+    async def test_events_get_global_positions(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", [1, 2])
+        await save_deposits(store, "b", [3])
+        await save_deposits(store, "a", [4])
+
+        events = await store.get_all_events()
+
+        assert [e.position for e in events] == [1, 2, 3, 4]
+        assert [e.aggregate_id for e in events] == ["a", "a", "b", "a"]
+        assert [e.position for e in await store.get_events("a")] == [1, 2, 4]
+        assert [e.position for e in await store.get_all_events(from_position=2)] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_stream_all_from_position(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", [1, 2, 3])
+        await save_deposits(store, "b", [4, 5])
+
+        positions = [e.position async for e in store.stream_all(from_position=2)]
+
+        assert positions == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_stream_all_sees_events_appended_during_iteration(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", [1])
+        seen: list[int] = []
+
+        async for event in store.stream_all():
+            seen.append(event.position)
+            if event.position == 1:
+                await save_deposits(store, "b", [2])
+
+        assert seen == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stream_all_yields_to_loop_between_batches(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", [1, 2, 3, 4])
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        seen: list[tuple[int, int]] = [(e.position, ticks) async for e in store.stream_all(batch_size=2)]
+        task.cancel()
+
+        assert [ticks for _, ticks in seen] == [1, 1, 2, 2]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    async def test_stream_all_rejects_empty_batches(self, store: InMemoryEventStore, batch_size: int) -> None:
+        await save_deposits(store, "a", [1])
+
+        with pytest.raises(ValueError, match="batch_size"):
+            [e async for e in store.stream_all(batch_size=batch_size)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_check_still_applies(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", [1])
+        account = Account("a")
+        account.deposit(2)
+
+        with pytest.raises(ConcurrencyError):
+            await store.save(account, expected_version=0)
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_positions(self, store: InMemoryEventStore) -> None:
+        await save_deposits(store, "a", [1])
+        store.clear()
+        await save_deposits(store, "b", [2])
+
+        assert [e.position for e in await store.get_all_events()] == [1]
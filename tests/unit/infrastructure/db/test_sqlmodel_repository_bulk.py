@@ -0,0 +1,232 @@
+"""Unit tests for set-based bulk operations in SQLModelRepository.
+
+**Feature: python-api-base-2025-review**
+**Validates: Requirements 1.4**
+"""
+
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import Field, SQLModel
+
+from core.errors import ValidationError as AppValidationError
+from infrastructure.db.repositories.sqlmodel_repository import OnConflict, SQLModelRepository
+from infrastructure.errors import DatabaseError
+
+
+class BulkWidget(SQLModel, table=True):
+    """Table used only by these tests."""
+
+    __tablename__ = "test_bulk_widgets"
+
+    id: str = Field(primary_key=True)
+    name: str
+    status: str = "new"
+    is_deleted: bool = False
+
+
+class BulkGadget(SQLModel, table=True):
+    """Table with generated IDs used only by these tests."""
+
+    __tablename__ = "test_bulk_gadgets"
+
+    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    name: str
+    quantity: int = 0
+
+
+class BulkGadgetCreate(BaseModel):
+    name: str
+    quantity: int | str = 0
+
+
+class BulkWidgetCreate(BaseModel):
+    id: str
+    name: str
+    status: str = "new"
+
+
+class BulkWidgetUpdate(BaseModel):
+    name: str | None = None
+    status: str | None = None
+
+
+class BulkWidgetRepository(SQLModelRepository[BulkWidget, BulkWidgetCreate, BulkWidgetUpdate, str]):
+    _bulk_chunk_size = 3
+
+
+@pytest.fixture()
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            BulkWidget.metadata.create_all,
+            tables=[BulkWidget.__table__, BulkGadget.__table__],
+        )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db_session:
+        db_session.add_all(BulkWidget(id=f"w{i}", name=f"widget-{i}") for i in range(10))
+        await db_session.flush()
+        yield db_session
+    await engine.dispose()
+
+
+@pytest.fixture()
+def repo(session: AsyncSession) -> BulkWidgetRepository:
+    return BulkWidgetRepository(session, BulkWidget)
+
+
+def _count_statements(session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", _record)
+    return statements
+
+
+class TestBulkUpdate:
+    async def test_groups_rows_sharing_a_patch(self, repo: BulkWidgetRepository, session: AsyncSession) -> None:
+        statements = _count_statements(session)
+        updates = [(f"w{i}", BulkWidgetUpdate(status="archived")) for i in range(6)]
+
+        result = await repo.bulk_update(updates)
+
+        assert [w.id for w in result] == [f"w{i}" for i in range(6)]
+        assert all(w.status == "archived" for w in result)
+        # 6 ids in chunks of 3 -> two UPDATE ... RETURNING statements
+        assert len(statements) == 2
+        assert all(s.lstrip().upper().startswith("UPDATE") for s in statements)
+
+    async def test_distinct_patches_and_missing_ids(self, repo: BulkWidgetRepository) -> None:
+        result = await repo.bulk_update(
+            [
+                ("w1", BulkWidgetUpdate(name="one")),
+                ("missing", BulkWidgetUpdate(name="ghost")),
+                ("w2", BulkWidgetUpdate(status="done")),
+            ]
+        )
+
+        assert [(w.id, w.name, w.status) for w in result] == [
+            ("w1", "one", "new"),
+            ("w2", "widget-2", "done"),
+        ]
+
+    async def test_repeated_id_merges_patches_in_order(self, repo: BulkWidgetRepository) -> None:
+        result = await repo.bulk_update(
+            [
+                ("w1", BulkWidgetUpdate(name="first", status="a")),
+                ("w1", BulkWidgetUpdate(name="second")),
+            ]
+        )
+
+        assert len(result) == 1
+        assert (result[0].name, result[0].status) == ("second", "a")
+
+    async def test_skips_soft_deleted_rows(self, repo: BulkWidgetRepository) -> None:
+        await repo.bulk_delete(["w3"])
+
+        result = await repo.bulk_update([("w3", BulkWidgetUpdate(name="revived"))])
+
+        assert result == []
+
+    async def test_matches_per_row_mode(self, repo: BulkWidgetRepository) -> None:
+        updates = [("w4", BulkWidgetUpdate(name="x")), ("w5", BulkWidgetUpdate(name=None, status="y"))]
+
+        set_based = await repo.bulk_update(updates)
+        per_row = await repo.bulk_update(updates, set_based=False)
+
+        assert [(w.id, w.name, w.status) for w in set_based] == [(w.id, w.name, w.status) for w in per_row]
+
+
+class TestBulkDelete:
+    async def test_soft_delete_counts_active_rows_once(self, repo: BulkWidgetRepository) -> None:
+        deleted = await repo.bulk_delete(["w0", "w1", "w1", "missing"])
+
+        assert deleted == 2
+        assert await repo.get_by_id("w0") is None
+        assert await repo.bulk_delete(["w0"]) == 0
+
+    async def test_hard_delete_removes_rows(self, repo: BulkWidgetRepository, session: AsyncSession) -> None:
+        statements = _count_statements(session)
+
+        deleted = await repo.bulk_delete([f"w{i}" for i in range(7)], soft=False)
+
+        assert deleted == 7
+        assert await repo.count() == 3
+        # 7 ids in chunks of 3 -> three DELETE statements plus the count query
+        assert sum(s.lstrip().upper().startswith("DELETE") for s in statements) == 3
+
+
+class TestCreateMany:
+    async def test_inserts_in_chunks_with_returning(self, repo: BulkWidgetRepository, session: AsyncSession) -> None:
+        statements = _count_statements(session)
+
+        created = await repo.create_many([BulkWidgetCreate(id=f"n{i}", name=f"new-{i}") for i in range(7)])
+
+        assert [w.id for w in created] == [f"n{i}" for i in range(7)]
+        assert all(w.status == "new" and w.is_deleted is False for w in created)
+        # 7 rows in chunks of 3 -> three INSERT ... RETURNING statements, no refreshes
+        assert len(statements) == 3
+        assert all(s.lstrip().upper().startswith("INSERT") for s in statements)
+
+    async def test_explicit_chunk_size(self, repo: BulkWidgetRepository, session: AsyncSession) -> None:
+        statements = _count_statements(session)
+
+        await repo.create_many([BulkWidgetCreate(id=f"n{i}", name="n") for i in range(7)], chunk_size=100)
+
+        assert len(statements) == 1
+
+    async def test_validates_batch_and_applies_default_factories(self, session: AsyncSession) -> None:
+        repo = SQLModelRepository(session, BulkGadget)
+
+        created = await repo.create_many([BulkGadgetCreate(name="a", quantity="5"), BulkGadgetCreate(name="b")])
+
+        assert [(g.name, g.quantity) for g in created] == [("a", 5), ("b", 0)]
+        assert len({g.id for g in created}) == 2
+
+    async def test_invalid_row_raises_validation_error(self, session: AsyncSession) -> None:
+        repo = SQLModelRepository(session, BulkGadget)
+
+        with pytest.raises(AppValidationError):
+            await repo.create_many([BulkGadgetCreate(name="ok"), BulkGadgetCreate(name="bad", quantity="x")])
+
+    async def test_on_conflict_do_nothing_skips_existing(self, repo: BulkWidgetRepository) -> None:
+        created = await repo.create_many(
+            [BulkWidgetCreate(id="w0", name="dup"), BulkWidgetCreate(id="fresh", name="fresh")],
+            on_conflict=OnConflict.NOTHING,
+        )
+
+        assert [w.id for w in created] == ["fresh"]
+        assert (await repo.get_by_id("w0")).name == "widget-0"
+
+    async def test_on_conflict_update_overwrites_columns(self, repo: BulkWidgetRepository) -> None:
+        created = await repo.create_many(
+            [BulkWidgetCreate(id="w0", name="renamed", status="done")],
+            on_conflict=OnConflict.UPDATE,
+            update_columns=["name"],
+        )
+
+        assert [(w.id, w.name, w.status) for w in created] == [("w0", "renamed", "new")]
+
+    async def test_on_conflict_without_returning_raises(
+        self, repo: BulkWidgetRepository, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(session.get_bind().dialect, "insert_returning", False)
+
+        with pytest.raises(DatabaseError, match="RETURNING"):
+            await repo.create_many([BulkWidgetCreate(id="w0", name="dup")], on_conflict=OnConflict.NOTHING)
+
+        created = await repo.create_many([BulkWidgetCreate(id="fresh", name="fresh")])
+        assert [w.id for w in created] == ["fresh"]
+
+    async def test_empty_input(self, repo: BulkWidgetRepository) -> None:
+        assert await repo.create_many([]) == []
@@ -0,0 +1,145 @@
+"""Unit tests for keyset pagination and count modes in SQLModelRepository.
+
+**Feature: python-api-base-2025-review**
+"""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import Field, SQLModel
+
+from core.base.patterns.pagination import CountMode
+from core.errors import ValidationError as AppValidationError
+from infrastructure.db.repositories.sqlmodel_repository import SQLModelRepository
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class PagedRecord(SQLModel, table=True):
+    """Table used only by these tests."""
+
+    __tablename__ = "test_paged_records"
+
+    id: str = Field(primary_key=True)
+    category: str
+    created_at: datetime
+    is_deleted: bool = False
+
+
+class PagedRecordDTO(BaseModel):
+    id: str
+
+
+class PagedRecordRepository(SQLModelRepository[PagedRecord, PagedRecordDTO, PagedRecordDTO, str]):
+    _allowed_filter_fields = {"category"}
+
+
+@pytest.fixture()
+async def session_factory() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(PagedRecord.metadata.create_all, tables=[PagedRecord.__table__])
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db_session:
+        # Two records share each timestamp so the id tie-breaker matters
+        db_session.add_all(
+            PagedRecord(
+                id=f"r{i:02d}",
+                category="even" if i % 2 == 0 else "odd",
+                created_at=BASE_TIME + timedelta(minutes=i // 2),
+                is_deleted=i == 9,
+            )
+            for i in range(12)
+        )
+        await db_session.commit()
+    yield factory
+    await engine.dispose()
+
+
+@pytest.fixture()
+async def session(session_factory: async_sessionmaker[AsyncSession]) -> AsyncIterator[AsyncSession]:
+    async with session_factory() as db_session:
+        yield db_session
+
+
+async def _collect(repo: PagedRecordRepository, **kwargs) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        page = await repo.get_page(cursor, limit=4, **kwargs)
+        pages.append([r.id for r in page.items])
+        if not page.has_more:
+            assert page.next_cursor is None
+            return pages
+        cursor = page.next_cursor
+
+
+class TestGetPage:
+    async def test_walks_all_rows_by_id(self, session: AsyncSession) -> None:
+        repo = PagedRecordRepository(session, PagedRecord)
+
+        pages = await _collect(repo)
+
+        expected = [f"r{i:02d}" for i in range(12) if i != 9]
+        assert [rid for page in pages for rid in page] == expected
+        assert [len(page) for page in pages] == [4, 4, 3]
+
+    async def test_sort_by_with_ties_descending(self, session: AsyncSession) -> None:
+        repo = PagedRecordRepository(session, PagedRecord)
+
+        pages = await _collect(repo, sort_by="created_at", sort_order="desc")
+
+        flat = [rid for page in pages for rid in page]
+        expected = [f"r{i:02d}" for i in sorted(range(12), key=lambda i: (i // 2, i), reverse=True) if i != 9]
+        assert flat == expected
+
+    async def test_filters_apply_to_every_page(self, session: AsyncSession) -> None:
+        repo = PagedRecordRepository(session, PagedRecord)
+
+        pages = await _collect(repo, filters={"category": "odd"})
+
+        assert [rid for page in pages for rid in page] == ["r01", "r03", "r05", "r07", "r11"]
+
+    async def test_cursor_for_other_sort_is_rejected(self, session: AsyncSession) -> None:
+        repo = PagedRecordRepository(session, PagedRecord)
+        first = await repo.get_page(limit=2, sort_by="created_at")
+
+        with pytest.raises(AppValidationError):
+            await repo.get_page(first.next_cursor, limit=2, sort_by="created_at", sort_order="desc")
+        with pytest.raises(AppValidationError):
+            await repo.get_page("garbage", limit=2)
+
+    async def test_count_modes(self, session: AsyncSession) -> None:
+        repo = PagedRecordRepository(session, PagedRecord)
+
+        assert (await repo.get_page(limit=2)).total is None
+        assert (await repo.get_page(limit=2, count=CountMode.EXACT)).total == 11
+        # SQLite has no planner estimate, so ESTIMATED falls back to an exact count
+        assert (await repo.get_page(limit=2, count=CountMode.ESTIMATED)).total == 11
+
+
+class TestGetAllCountModes:
+    async def test_skip_count(self, session: AsyncSession) -> None:
+        repo = PagedRecordRepository(session, PagedRecord)
+
+        items, total = await repo.get_all(limit=3, count=CountMode.NONE)
+
+        assert len(items) == 3
+        assert total is None
+
+    async def test_concurrent_count_uses_separate_session(
+        self, session: AsyncSession, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        repo = PagedRecordRepository(session, PagedRecord, count_session_factory=session_factory)
+
+        items, total = await repo.get_all(limit=3, filters={"category": "even"}, sort_by="id")
+        page = await repo.get_page(limit=3, count=CountMode.EXACT)
+
+        assert [r.id for r in items] == ["r00", "r02", "r04"]
+        assert total == 6
+        assert page.total == 11
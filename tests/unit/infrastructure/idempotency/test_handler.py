@@ -1,14 +1,59 @@
 """Tests for idempotency handler module."""
 
+import asyncio
+import json
 from datetime import UTC, datetime
+from typing import Any
 
 import pytest
 
+from infrastructure.idempotency.errors import IdempotencyRequestInProgressError
 from infrastructure.idempotency.handler import (
     IdempotencyConfig,
+    IdempotencyHandler,
     IdempotencyRecord,
     compute_request_hash,
 )
+from infrastructure.idempotency.models import ReservationStatus
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the handler uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    async def eval(self, script: str, numkeys: int, key: str, expected: bytes, *replacement: Any) -> int:
+        """Compare-and-delete, or compare-and-set given a value and TTL."""
+        if self.data.get(key) != expected:
+            return 0
+        if replacement:
+            self.data[key] = replacement[0]
+        else:
+            del self.data[key]
+        return 1
+
+
+def make_handler(redis: FakeRedis, **config: float) -> IdempotencyHandler:
+    handler = IdempotencyHandler(config=IdempotencyConfig(wait_interval_seconds=0.01, **config))  # type: ignore[arg-type]
+    handler._redis = redis
+    handler._connected = True
+    return handler
 
 
 class TestIdempotencyRecord:
@@ -164,3 +209,145 @@ class TestComputeRequestHash:
         result = compute_request_hash("POST", "/api/users", b"")
         assert isinstance(result, str)
         assert len(result) == 64
+
+
+class TestRecordBytes:
+    """Tests for binary record serialization."""
+
+    def test_binary_body_and_headers_roundtrip(self) -> None:
+        original = IdempotencyRecord(
+            idempotency_key="key",
+            request_hash="hash",
+            response_body=b"\x00\xff\n{}",
+            status_code=201,
+            headers=(("content-type", "application/octet-stream"),),
+        )
+        restored = IdempotencyRecord.from_bytes(original.to_bytes())
+        assert restored == original
+
+    def test_text_body_stays_text(self) -> None:
+        original = IdempotencyRecord(idempotency_key="k", request_hash="h", response_body='{"a": 1}', status_code=200)
+        assert IdempotencyRecord.from_bytes(original.to_bytes()).response_body == '{"a": 1}'
+
+    def test_reads_json_records(self) -> None:
+        original = IdempotencyRecord(idempotency_key="k", request_hash="h", response_body="body", status_code=200)
+        restored = IdempotencyRecord.from_bytes(json.dumps(original.to_dict()).encode())
+        assert restored.response_body == "body"
+
+
+class TestReservation:
+    """Tests for key reservation and duplicate coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_execute_once(self) -> None:
+        handler = make_handler(FakeRedis())
+        calls = 0
+
+        async def operation() -> tuple[bytes, int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"done", 201
+
+        results = await asyncio.gather(*(handler.execute_idempotent("k1", "h1", operation) for _ in range(5)))
+
+        assert calls == 1
+        assert {(body, status) for body, status, _ in results} == {(b"done", 201)}
+        assert sorted(replay for _, _, replay in results) == [False, True, True, True, True]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_in_other_process_waits_for_result(self) -> None:
+        redis = FakeRedis()
+        first, second = make_handler(redis), make_handler(redis)
+        assert (await first.reserve("k1", "h1")).status is ReservationStatus.ACQUIRED
+
+        waiter = asyncio.create_task(second.reserve("k1", "h1"))
+        await asyncio.sleep(0.03)
+        assert not waiter.done()
+        await first.store_record("k1", "h1", b"done", 200)
+
+        reservation = await waiter
+        assert reservation.status is ReservationStatus.COMPLETED
+        assert reservation.record is not None
+        assert reservation.record.response_body == b"done"
+
+    @pytest.mark.asyncio
+    async def test_release_lets_duplicate_execute(self) -> None:
+        handler = make_handler(FakeRedis())
+        await handler.reserve("k1", "h1")
+
+        waiter = asyncio.create_task(handler.reserve("k1", "h1"))
+        await asyncio.sleep(0)
+        assert await handler.release("k1") is True
+
+        assert (await waiter).status is ReservationStatus.ACQUIRED
+
+    @pytest.mark.asyncio
+    async def test_release_after_expiry_keeps_new_reservation(self) -> None:
+        redis = FakeRedis()
+        first, second = make_handler(redis), make_handler(redis)
+        await first.reserve("k1", "h1")
+        redis.data.clear()  # the first reservation expires
+        assert (await second.reserve("k1", "h1")).status is ReservationStatus.ACQUIRED
+
+        assert await first.release("k1") is True
+
+        assert "idempotency:k1" in redis.data
+        assert (await make_handler(redis).reserve("k1", "h2")).status is ReservationStatus.IN_PROGRESS
+
+    @pytest.mark.asyncio
+    async def test_store_after_expiry_keeps_new_reservation(self) -> None:
+        redis = FakeRedis()
+        first, second = make_handler(redis), make_handler(redis)
+        await first.reserve("k1", "h1")
+        redis.data.clear()  # the first reservation expires
+        await second.reserve("k1", "h1")
+
+        assert await first.store_record("k1", "h1", b"stale", 200) is False
+
+        assert await second.get_record("k1") is None
+        assert await second.store_record("k1", "h1", b"fresh", 200) is True
+        record = await first.get_record("k1")
+        assert record is not None
+        assert record.response_body == b"fresh"
+
+    @pytest.mark.asyncio
+    async def test_release_keeps_stored_record(self) -> None:
+        redis = FakeRedis()
+        first, second = make_handler(redis), make_handler(redis)
+        await first.reserve("k1", "h1")
+        redis.data.clear()
+        await second.store_record("k1", "h1", b"done", 200)
+
+        await first.release("k1")
+
+        record = await second.get_record("k1")
+        assert record is not None
+        assert record.response_body == b"done"
+
+    @pytest.mark.asyncio
+    async def test_different_request_is_not_coalesced(self) -> None:
+        handler = make_handler(FakeRedis())
+        await handler.reserve("k1", "h1")
+
+        reservation = await handler.reserve("k1", "h2")
+
+        assert reservation.status is ReservationStatus.IN_PROGRESS
+        assert reservation.request_hash == "h1"
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_raises(self) -> None:
+        handler = make_handler(FakeRedis(), wait_timeout_seconds=0.02)
+        await handler.reserve("k1", "h1")
+
+        with pytest.raises(IdempotencyRequestInProgressError):
+            await handler.reserve("k1", "h1")
+
+    @pytest.mark.asyncio
+    async def test_unavailable_without_redis(self) -> None:
+        handler = make_handler(FakeRedis())
+        handler._redis = None
+        handler._connected = False
+        handler._redis_url = "redis://127.0.0.1:1"
+
+        assert (await handler.reserve("k1", "h1")).status is ReservationStatus.UNAVAILABLE
@@ -4,13 +4,16 @@
 **Validates: Requirements 23.1, 23.5, 23.6**
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from starlette.responses import JSONResponse
 
-from infrastructure.idempotency.handler import IdempotencyConfig
+from infrastructure.idempotency.errors import IdempotencyRequestInProgressError
+from infrastructure.idempotency.handler import IdempotencyConfig, compute_request_hash
 from infrastructure.idempotency.middleware import IdempotencyMiddleware
+from infrastructure.idempotency.models import IdempotencyRecord, Reservation, ReservationStatus
 
 
 class TestIdempotencyMiddlewareInit:
@@ -157,117 +160,245 @@ class TestIdempotencyMiddlewareHelpers:
         assert middleware._get_handler(request) is None
 
 
-class TestIdempotencyMiddlewareDispatch:
-    """Tests for IdempotencyMiddleware dispatch method."""
+def http_scope(method: str, path: str, headers: dict[str, str] | None = None) -> dict:
+    """Build a minimal HTTP ASGI scope."""
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "app": SimpleNamespace(state=SimpleNamespace()),
+    }
+
+
+def body_receive(body: bytes) -> AsyncMock:
+    """Create a receive callable yielding a single request body message."""
+    return AsyncMock(return_value={"type": "http.request", "body": body, "more_body": False})
+
+
+def echo_app(status: int) -> AsyncMock:
+    """Create an ASGI app mock that echoes the request body in two chunks."""
+
+    async def app(scope: dict, receive: object, send: object) -> None:
+        message = await receive()
+        body = message["body"]
+        await send(
+            {"type": "http.response.start", "status": status, "headers": [(b"content-length", b"%d" % len(body))]}
+        )
+        await send({"type": "http.response.body", "body": body[:2], "more_body": True})
+        await send({"type": "http.response.body", "body": body[2:]})
+
+    return AsyncMock(side_effect=app)
+
+
+def keyed_handler(reservation: Reservation | None = None) -> MagicMock:
+    """Create a handler mock whose reservations are acquired by default."""
+    handler = MagicMock()
+    handler._config = IdempotencyConfig()
+    handler.reserve = AsyncMock(return_value=reservation or Reservation(ReservationStatus.ACQUIRED))
+    handler.store_record = AsyncMock()
+    handler.release = AsyncMock()
+    return handler
+
+
+def completed(record: IdempotencyRecord) -> Reservation:
+    """Reservation for a key with a stored response."""
+    return Reservation(ReservationStatus.COMPLETED, request_hash=record.request_hash, record=record)
+
+
+def sent(send: AsyncMock) -> tuple[int, bytes]:
+    """Get the status and full body from the messages sent."""
+    messages = [c.args[0] for c in send.call_args_list]
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return messages[0]["status"], body
+
+
+class TestIdempotencyMiddlewareCall:
+    """Tests for IdempotencyMiddleware ASGI request handling."""
 
     @pytest.mark.asyncio
-    async def test_dispatch_skip_get_request(self) -> None:
-        """Test dispatch skips GET requests."""
-        app = MagicMock()
-        middleware = IdempotencyMiddleware(app)
-        request = MagicMock()
-        request.method = "GET"
-        request.url.path = "/api/users"
+    async def test_call_skip_get_request(self) -> None:
+        """Test GET requests pass through."""
+        app = AsyncMock()
+        middleware = IdempotencyMiddleware(app, handler=keyed_handler())
+        scope, receive, send = http_scope("GET", "/api/users"), AsyncMock(), AsyncMock()
 
-        call_next = AsyncMock(return_value=MagicMock())
-        await middleware.dispatch(request, call_next)
-        call_next.assert_called_once_with(request)
+        await middleware(scope, receive, send)
+        app.assert_called_once_with(scope, receive, send)
 
     @pytest.mark.asyncio
-    async def test_dispatch_skip_excluded_path(self) -> None:
-        """Test dispatch skips excluded paths."""
-        app = MagicMock()
-        middleware = IdempotencyMiddleware(app)
-        request = MagicMock()
-        request.method = "POST"
-        request.url.path = "/health"
+    async def test_call_skip_excluded_path(self) -> None:
+        """Test excluded paths pass through."""
+        app = AsyncMock()
+        middleware = IdempotencyMiddleware(app, handler=keyed_handler())
+        scope, receive, send = http_scope("POST", "/health"), AsyncMock(), AsyncMock()
 
-        call_next = AsyncMock(return_value=MagicMock())
-        await middleware.dispatch(request, call_next)
-        call_next.assert_called_once_with(request)
+        await middleware(scope, receive, send)
+        app.assert_called_once_with(scope, receive, send)
 
     @pytest.mark.asyncio
-    async def test_dispatch_no_handler(self) -> None:
-        """Test dispatch when no handler available."""
-        app = MagicMock()
+    async def test_call_no_handler(self) -> None:
+        """Test requests pass through when no handler is available."""
+        app = AsyncMock()
         middleware = IdempotencyMiddleware(app)
-        request = MagicMock()
-        request.method = "POST"
-        request.url.path = "/api/users"
-        del request.app.state.idempotency_handler
+        scope, receive, send = http_scope("POST", "/api/users"), AsyncMock(), AsyncMock()
 
-        call_next = AsyncMock(return_value=MagicMock())
-        await middleware.dispatch(request, call_next)
-        call_next.assert_called_once_with(request)
+        await middleware(scope, receive, send)
+        app.assert_called_once_with(scope, receive, send)
 
     @pytest.mark.asyncio
-    async def test_dispatch_no_key_not_required(self) -> None:
-        """Test dispatch without key on non-required endpoint."""
-        app = MagicMock()
-        handler = MagicMock()
-        handler._config = IdempotencyConfig()
-        middleware = IdempotencyMiddleware(app, handler=handler)
-        request = MagicMock()
-        request.method = "POST"
-        request.url.path = "/api/users"
-        request.headers.get.return_value = None
+    async def test_call_no_key_not_required(self) -> None:
+        """Test request without key on non-required endpoint."""
+        app = AsyncMock()
+        middleware = IdempotencyMiddleware(app, handler=keyed_handler())
+        scope, receive, send = http_scope("POST", "/api/users"), AsyncMock(), AsyncMock()
 
-        call_next = AsyncMock(return_value=MagicMock())
-        await middleware.dispatch(request, call_next)
-        call_next.assert_called_once_with(request)
+        await middleware(scope, receive, send)
+        app.assert_called_once_with(scope, receive, send)
 
     @pytest.mark.asyncio
-    async def test_dispatch_no_key_required(self) -> None:
-        """Test dispatch without key on required endpoint."""
-        app = MagicMock()
-        handler = MagicMock()
-        handler._config = IdempotencyConfig()
-        middleware = IdempotencyMiddleware(app, handler=handler, required_endpoints={"/api/payments"})
-        request = MagicMock()
-        request.method = "POST"
-        request.url.path = "/api/payments"
-        request.headers.get.return_value = None
+    async def test_call_no_key_required(self) -> None:
+        """Test request without key on required endpoint."""
+        app = AsyncMock()
+        middleware = IdempotencyMiddleware(app, handler=keyed_handler(), required_endpoints={"/api/payments"})
+        send = AsyncMock()
 
-        call_next = AsyncMock(return_value=MagicMock())
-        response = await middleware.dispatch(request, call_next)
-        assert response.status_code == 400
-        call_next.assert_not_called()
+        await middleware(http_scope("POST", "/api/payments"), AsyncMock(), send)
+
+        assert sent(send)[0] == 400
+        app.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_call_stores_successful_response(self) -> None:
+        """Test body is replayed to the app and the 2xx response is stored."""
+        request_hash = compute_request_hash(method="POST", path="/api/orders", body=b'{"a": 1}', content_type=None)
+        handler = keyed_handler(Reservation(ReservationStatus.ACQUIRED, request_hash=request_hash))
+        middleware = IdempotencyMiddleware(echo_app(201), handler=handler)
+        send = AsyncMock()
+
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b'{"a": 1}'), send)
 
-class TestIdempotencyMiddlewareCachedRecord:
-    """Tests for _handle_cached_record method."""
+        assert sent(send) == (201, b'{"a": 1}')
+        handler.store_record.assert_awaited_once()
+        assert handler.store_record.call_args.kwargs["response_body"] == b'{"a": 1}'
+        assert handler.store_record.call_args.kwargs["status_code"] == 201
+        assert handler.store_record.call_args.kwargs["headers"] == (("content-length", "8"),)
 
     @pytest.mark.asyncio
-    async def test_handle_cached_record_conflict(self) -> None:
-        """Test handling cached record with hash conflict."""
-        app = MagicMock()
-        middleware = IdempotencyMiddleware(app)
-        record = MagicMock()
-        record.request_hash = "hash1"
+    async def test_call_does_not_store_error_response(self) -> None:
+        """Test non-2xx responses stream through without being stored."""
+        handler = keyed_handler()
+        middleware = IdempotencyMiddleware(echo_app(400), handler=handler)
+        send = AsyncMock()
 
-        response = await middleware._handle_cached_record(
-            record=record,
-            request_hash="hash2",
-            idempotency_key="key-123",
-            path="/api/users",
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b"bad"), send)
+
+        assert sent(send) == (400, b"bad")
+        assert len(send.call_args_list) == 3
+        handler.store_record.assert_not_awaited()
+        handler.release.assert_awaited_once_with("k1")
+
+    @pytest.mark.asyncio
+    async def test_call_replays_cached_record(self) -> None:
+        """Test a stored record is replayed without calling the app."""
+        request_hash = compute_request_hash(method="POST", path="/api/orders", body=b"{}", content_type=None)
+        record = IdempotencyRecord(
+            idempotency_key="k1",
+            request_hash=request_hash,
+            response_body=b'{"id": 1}',
+            status_code=201,
+            headers=(("content-type", "application/vnd.api+json"), ("content-length", "9")),
         )
-        assert response.status_code == 422
+        app = AsyncMock()
+        middleware = IdempotencyMiddleware(app, handler=keyed_handler(completed(record)))
+        send = AsyncMock()
+
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b"{}"), send)
+
+        assert sent(send) == (201, b'{"id": 1}')
+        assert send.call_args_list[0].args[0]["headers"] == [
+            (b"content-type", b"application/vnd.api+json"),
+            (b"content-length", b"9"),
+            (b"x-idempotent-replayed", b"true"),
+        ]
+        app.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_handle_cached_record_replay(self) -> None:
-        """Test handling cached record with matching hash."""
-        app = MagicMock()
-        middleware = IdempotencyMiddleware(app)
-        record = MagicMock()
-        record.request_hash = "hash1"
-        record.response_body = '{"id": 1}'
-        record.status_code = 201
+    async def test_call_rejects_key_held_by_different_request(self) -> None:
+        """Test a key reserved for another request body is a conflict."""
+        app = AsyncMock()
+        handler = keyed_handler(Reservation(ReservationStatus.IN_PROGRESS, request_hash="other"))
+        middleware = IdempotencyMiddleware(app, handler=handler)
+        send = AsyncMock()
 
-        response = await middleware._handle_cached_record(
-            record=record,
-            request_hash="hash1",
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b"{}"), send)
+
+        assert sent(send)[0] == 422
+        app.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_duplicate_still_running_returns_409(self) -> None:
+        """Test a duplicate that outlasts the wait timeout is rejected."""
+        app = AsyncMock()
+        handler = keyed_handler()
+        handler.reserve.side_effect = IdempotencyRequestInProgressError("k1")
+        middleware = IdempotencyMiddleware(app, handler=handler)
+        send = AsyncMock()
+
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b"{}"), send)
+
+        assert sent(send)[0] == 409
+        app.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_store_failure_still_sends_response(self) -> None:
+        """Test a storage error does not drop or repeat the response."""
+        handler = keyed_handler()
+        handler.store_record.side_effect = RuntimeError("redis down")
+        app = echo_app(200)
+        middleware = IdempotencyMiddleware(app, handler=handler)
+        send = AsyncMock()
+
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b"ok!"), send)
+
+        assert sent(send) == (200, b"ok!")
+        app.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_call_lookup_failure_passes_through(self) -> None:
+        """Test a lookup error runs the request once without idempotency."""
+        handler = keyed_handler()
+        handler.reserve.side_effect = RuntimeError("redis down")
+        app = echo_app(200)
+        middleware = IdempotencyMiddleware(app, handler=handler)
+        send = AsyncMock()
+
+        await middleware(http_scope("POST", "/api/orders", {"Idempotency-Key": "k1"}), body_receive(b"ok!"), send)
+
+        assert sent(send) == (200, b"ok!")
+        app.assert_called_once()
+        handler.store_record.assert_not_awaited()
+
+
+class TestIdempotencyMiddlewareReplay:
+    """Tests for _replay_record method."""
+
+    @pytest.mark.asyncio
+    async def test_replay_legacy_text_record(self) -> None:
+        """Test a record stored without headers is replayed as JSON."""
+        middleware = IdempotencyMiddleware(MagicMock())
+        record = IdempotencyRecord(
             idempotency_key="key-123",
-            path="/api/users",
+            request_hash="hash1",
+            response_body='{"id": 1}',
+            status_code=201,
         )
-        assert response.status_code == 201
-        assert "X-Idempotent-Replayed" in response.headers
+        send = AsyncMock()
+
+        await middleware._replay_record(record, "key-123", send)
+
+        assert sent(send) == (201, b'{"id": 1}')
+        headers = dict(send.call_args_list[0].args[0]["headers"])
+        assert headers[b"content-type"] == b"application/json"
+        assert headers[b"x-idempotent-replayed"] == b"true"
@@ -0,0 +1,214 @@
+"""Unit tests for pipelined Kafka batch publishing.
+
+Record batches are submitted to a stub producer that decodes them and
+acknowledges them with sequential offsets per partition.
+
+**Feature: observability-infrastructure**
+**Requirement: R3.2 - Generic Producer**
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka.partitioner import DefaultPartitioner
+from aiokafka.producer.message_accumulator import BatchBuilder
+from aiokafka.record.default_records import DefaultRecordBatch
+from aiokafka.structs import RecordMetadata, TopicPartition
+from pydantic import BaseModel
+
+from infrastructure.kafka.batching import BatchPublisher, serialize_payloads
+from infrastructure.kafka.config import KafkaConfig
+from infrastructure.kafka.event_publisher import DomainEvent, KafkaEventPublisher
+from infrastructure.kafka.producer import KafkaProducer
+from infrastructure.kafka.transaction import TransactionalKafkaProducer
+
+
+class OrderEvent(BaseModel):
+    order_id: str
+    total: float
+    placed_at: datetime
+
+
+class StubProducer:
+    """Stand-in for ``AIOKafkaProducer`` acknowledging record batches."""
+
+    def __init__(self, partitions: int = 3, batch_size: int = 16384) -> None:
+        self._partitions = set(range(partitions))
+        self._batch_size = batch_size
+        self._offsets = dict.fromkeys(self._partitions, 0)
+        self.records: dict[int, list[tuple[bytes | None, bytes, list[tuple[str, bytes]]]]] = {}
+        self.batches = 0
+
+    async def partitions_for(self, topic: str) -> set[int]:
+        return self._partitions
+
+    def create_batch(self) -> BatchBuilder:
+        return BatchBuilder(self._batch_size, 0)
+
+    async def send_batch(self, batch: BatchBuilder, topic: str, *, partition: int) -> asyncio.Future:
+        self.batches += 1
+        records = list(DefaultRecordBatch(batch._build()))
+        self.records.setdefault(partition, []).extend((r.key, r.value, list(r.headers)) for r in records)
+        base = self._offsets[partition]
+        self._offsets[partition] += len(records)
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(RecordMetadata(topic, partition, TopicPartition(topic, partition), base, -1, 0, 0))
+        return future
+
+    async def begin_transaction(self) -> None:
+        pass
+
+    async def commit_transaction(self) -> None:
+        pass
+
+    async def abort_transaction(self) -> None:
+        pass
+
+
+def make_orders(count: int) -> list[OrderEvent]:
+    placed_at = datetime(2025, 1, 2, tzinfo=UTC)
+    return [OrderEvent(order_id=f"order-{i}", total=i * 1.5, placed_at=placed_at) for i in range(count)]
+
+
+class TestSerializePayloads:
+    """Tests for serialize_payloads."""
+
+    def test_models_match_message_serialization(self) -> None:
+        orders = make_orders(3)
+
+        assert serialize_payloads(orders) == [order.model_dump_json().encode() for order in orders]
+
+    def test_plain_values_are_json(self) -> None:
+        values = serialize_payloads([{"a": 1}, [1, 2], "text", {1: "int key"}])
+
+        assert [json.loads(value) for value in values] == [{"a": 1}, [1, 2], "text", {"1": "int key"}]
+
+
+class TestBatchPublisher:
+    """Tests for BatchPublisher."""
+
+    @pytest.mark.asyncio
+    async def test_keyed_records_follow_default_partitioner(self) -> None:
+        stub = StubProducer()
+        keys = [f"customer-{i % 5}" for i in range(20)]
+
+        metadata, report = await BatchPublisher(stub).publish("orders", make_orders(20), keys=keys)
+
+        partitioner = DefaultPartitioner()
+        for key, meta in zip(keys, metadata, strict=True):
+            assert meta.partition == partitioner(key.encode(), [0, 1, 2], [0, 1, 2])
+            assert meta.key == key
+        assert report.messages == 20
+        assert report.record_batches == report.partitions
+
+    @pytest.mark.asyncio
+    async def test_metadata_offsets_match_delivered_records(self) -> None:
+        stub = StubProducer()
+        orders = make_orders(30)
+
+        metadata, _ = await BatchPublisher(stub).publish("orders", orders, headers=[{"source": "test"}] * 30)
+
+        for order, meta in zip(orders, metadata, strict=True):
+            key, value, headers = stub.records[meta.partition][meta.offset]
+            assert key is None
+            assert json.loads(value)["order_id"] == order.order_id
+            assert headers == [("source", b"test")]
+        assert {meta.partition for meta in metadata} == {0, 1, 2}
+
+    @pytest.mark.asyncio
+    async def test_full_batches_are_split(self) -> None:
+        stub = StubProducer(partitions=1, batch_size=1024)
+
+        metadata, report = await BatchPublisher(stub).publish("orders", [{"blob": "x" * 200}] * 20)
+
+        assert [meta.offset for meta in metadata] == list(range(20))
+        assert report.record_batches == stub.batches > 1
+        assert report.bytes > 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_record_gets_own_batch(self) -> None:
+        stub = StubProducer(partitions=1, batch_size=256)
+        payloads = [{"n": 0}, {"blob": "x" * 1024}, {"n": 2}]
+
+        metadata, report = await BatchPublisher(stub).publish("orders", payloads, partition=0)
+
+        assert [meta.offset for meta in metadata] == [0, 1, 2]
+        assert report.record_batches == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_send_settles_batches_in_flight(self) -> None:
+        stub = StubProducer(partitions=1, batch_size=1024)
+        in_flight: list[asyncio.Future] = []
+
+        async def send_batch(batch: BatchBuilder, topic: str, *, partition: int) -> asyncio.Future:
+            if in_flight:
+                raise ConnectionError("broker unavailable")
+            future = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_later(0.01, future.set_exception, ConnectionError("timed out"))
+            in_flight.append(future)
+            return future
+
+        stub.send_batch = send_batch  # type: ignore[method-assign]
+
+        with pytest.raises(ConnectionError, match="broker unavailable"):
+            await BatchPublisher(stub).publish("orders", [{"blob": "x" * 200}] * 20)
+
+        assert len(in_flight) == 1
+        assert in_flight[0].done()
+
+    @pytest.mark.asyncio
+    async def test_stats_accumulate_reports(self) -> None:
+        publisher = BatchPublisher(StubProducer())
+        await publisher.publish("orders", make_orders(5))
+        _, report = await publisher.publish("orders", make_orders(7))
+
+        stats = publisher.get_stats()
+        assert stats.batches == 2
+        assert stats.messages == 12
+        assert stats.last_latency_seconds == report.latency_seconds
+        assert stats.max_latency_seconds >= report.latency_seconds
+
+
+class TestProducerBatches:
+    """Tests for batch sends through the producers and event publisher."""
+
+    @pytest.mark.asyncio
+    async def test_producer_send_batch_uses_key_func(self) -> None:
+        producer = KafkaProducer[OrderEvent](KafkaConfig(), "orders")
+        producer._producer = StubProducer()  # type: ignore[assignment]
+        producer._started = True
+
+        metadata = await producer.send_batch(make_orders(6), key_func=lambda order: order.order_id)
+
+        assert [meta.key for meta in metadata] == [f"order-{i}" for i in range(6)]
+        assert producer.get_batch_stats().messages == 6
+
+    @pytest.mark.asyncio
+    async def test_transaction_send_batch_counts_messages(self) -> None:
+        producer = TransactionalKafkaProducer[OrderEvent](KafkaConfig(), "orders")
+        producer._producer = StubProducer()  # type: ignore[assignment]
+        producer._started = True
+
+        async with producer.transaction() as tx:
+            await tx.send_batch(make_orders(4))
+            assert producer._messages_in_transaction == 4
+
+        assert tx.message_count == 4
+
+    @pytest.mark.asyncio
+    async def test_event_publisher_sends_one_batch(self) -> None:
+        producer = AsyncMock()
+        events: list[DomainEvent[Any]] = [
+            DomainEvent("order_placed", "order", f"order-{i}", order) for i, order in enumerate(make_orders(3))
+        ]
+
+        await KafkaEventPublisher(producer).publish_batch(events, "orders")
+
+        producer.send_batch.assert_awaited_once()
+        kwargs = producer.send_batch.await_args.kwargs
+        assert kwargs["keys"] == ["order-0", "order-1", "order-2"]
+        assert kwargs["headers"][0]["event_type"] == "order_placed"
@@ -4,7 +4,7 @@
 **Requirement: R3 - Generic Kafka Producer/Consumer**
 """
 
-from infrastructure.kafka.config import KafkaConfig
+from infrastructure.kafka.config import KafkaConfig, ProducerProfile, select_compression
 
 
 class TestKafkaConfig:
@@ -95,3 +95,33 @@ class TestKafkaConfig:
 
         assert "security_protocol" not in producer_config
         assert "sasl_mechanism" not in producer_config
+
+    def test_no_compression_maps_to_none(self) -> None:
+        """Test "none" compression is passed to aiokafka as None."""
+        assert KafkaConfig().to_producer_config()["compression_type"] is None
+
+
+class TestProducerProfile:
+    """Tests for producer profiles."""
+
+    def test_latency_profile(self) -> None:
+        """Test latency profile sends immediately without compression."""
+        config = KafkaConfig(compression_type="gzip").with_profile(ProducerProfile.LATENCY)
+
+        assert config.linger_ms == 0
+        assert config.max_batch_size == 16384
+        assert config.compression_type == "none"
+
+    def test_throughput_profile_selects_installed_codec(self) -> None:
+        """Test throughput profile uses the preferred installed codec."""
+        config = KafkaConfig(client_id="orders").with_profile("throughput")
+
+        assert config.linger_ms == 20
+        assert config.max_batch_size == 262144
+        assert config.compression_type == select_compression("zstd", "lz4", "gzip")
+        assert config.client_id == "orders"
+
+    def test_select_compression_falls_back(self) -> None:
+        """Test unknown codecs fall through to the next preference."""
+        assert select_compression("brotli", "gzip") == "gzip"
+        assert select_compression("brotli") == "none"
@@ -0,0 +1,324 @@
+"""Unit tests for the partition-parallel Kafka consumer runtime.
+
+Records are served by an in-memory stand-in for ``AIOKafkaConsumer``.
+
+**Feature: observability-infrastructure**
+**Requirement: R3.3 - Generic Consumer**
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Any
+
+import pytest
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from infrastructure.kafka.config import KafkaConfig
+from infrastructure.kafka.consumer import KafkaConsumer
+from infrastructure.kafka.message import KafkaMessage
+from infrastructure.kafka.runtime import (
+    ConsumerRuntime,
+    ConsumerRuntimeConfig,
+    LaneStrategy,
+    OffsetTracker,
+)
+
+TP0 = TopicPartition("orders", 0)
+TP1 = TopicPartition("orders", 1)
+
+
+def make_record(tp: TopicPartition, offset: int, key: str | None = None, body: bytes | None = None) -> ConsumerRecord:
+    body = json.dumps({"n": offset}).encode() if body is None else body
+    return ConsumerRecord(
+        topic=tp.topic,
+        partition=tp.partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=key.encode() if key else None,
+        value=body,
+        checksum=None,
+        serialized_key_size=-1,
+        serialized_value_size=len(body),
+        headers=[],
+    )
+
+
+class FakeAIOKafkaConsumer:
+    """Serves preloaded records per partition and records pauses and commits."""
+
+    def __init__(self, records: list[ConsumerRecord]) -> None:
+        self._pending: dict[TopicPartition, deque[ConsumerRecord]] = {}
+        for record in records:
+            self._pending.setdefault(TopicPartition(record.topic, record.partition), deque()).append(record)
+        self._highwater = {tp: queue[-1].offset + 1 for tp, queue in self._pending.items()}
+        self._paused: set[TopicPartition] = set()
+        self.pause_calls: list[TopicPartition] = []
+        self.resume_calls: list[TopicPartition] = []
+        self.commits: list[dict[TopicPartition, int]] = []
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self._pending)
+
+    async def getmany(self, timeout_ms: int = 0, max_records: int | None = None) -> dict[TopicPartition, list]:
+        result: dict[TopicPartition, list[ConsumerRecord]] = {}
+        budget = max_records or 1_000_000
+        for tp, queue in self._pending.items():
+            if tp in self._paused:
+                continue
+            while queue and budget:
+                result.setdefault(tp, []).append(queue.popleft())
+                budget -= 1
+        if not result:
+            await asyncio.sleep(timeout_ms / 1000)
+        return result
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        self._paused.update(partitions)
+        self.pause_calls.extend(partitions)
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        self._paused.difference_update(partitions)
+        self.resume_calls.extend(partitions)
+
+    def highwater(self, tp: TopicPartition) -> int | None:
+        return self._highwater.get(tp)
+
+    async def commit(self, offsets: dict[TopicPartition, int]) -> None:
+        self.commits.append(dict(offsets))
+
+
+def committed(fake: FakeAIOKafkaConsumer) -> dict[TopicPartition, int]:
+    positions: dict[TopicPartition, int] = {}
+    for offsets in fake.commits:
+        positions.update(offsets)
+    return positions
+
+
+def deserialize(record: ConsumerRecord) -> KafkaMessage[dict]:
+    consumer = KafkaConsumer[dict](KafkaConfig(enable_auto_commit=False), record.topic, dict)
+    return consumer._deserialize_record(record)
+
+
+def make_config(**overrides: Any) -> ConsumerRuntimeConfig:
+    return ConsumerRuntimeConfig(**{"poll_timeout_ms": 5, "commit_interval_seconds": 0.01, **overrides})
+
+
+async def run_until(runtime: ConsumerRuntime, processed: int) -> None:
+    stop = asyncio.Event()
+    task = asyncio.create_task(runtime.run(stop))
+    for _ in range(500):
+        if runtime.get_stats().processed >= processed:
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(task, 5)
+
+
+class TestOffsetTracker:
+    """Tests for OffsetTracker."""
+
+    def test_position_advances_over_contiguous_prefix(self) -> None:
+        tracker = OffsetTracker()
+        for offset in range(5):
+            tracker.dispatched(TP0, offset)
+
+        tracker.completed(TP0, 1)
+        tracker.completed(TP0, 2)
+        assert tracker.position(TP0) == 0
+        assert tracker.take_commits() == {}
+
+        tracker.completed(TP0, 0)
+        assert tracker.position(TP0) == 3
+        assert tracker.take_commits() == {TP0: 3}
+        assert tracker.take_commits() == {}
+
+    def test_offset_gaps_are_skipped(self) -> None:
+        tracker = OffsetTracker()
+        for offset in (10, 14, 15):
+            tracker.dispatched(TP0, offset)
+
+        tracker.completed(TP0, 14)
+        tracker.completed(TP0, 10)
+
+        assert tracker.position(TP0) == 15
+
+
+class TestConsumerRuntime:
+    """Tests for ConsumerRuntime with a fake aiokafka consumer."""
+
+    def test_config_rejects_zero_lanes(self) -> None:
+        with pytest.raises(ValueError, match="lanes"):
+            ConsumerRuntimeConfig(lanes=0)
+
+    @pytest.mark.asyncio
+    async def test_partitions_run_concurrently_in_order(self) -> None:
+        records = [make_record(tp, offset) for offset in range(5) for tp in (TP0, TP1)]
+        fake = FakeAIOKafkaConsumer(records)
+        seen: dict[int, list[int]] = {0: [], 1: []}
+        active = peak = 0
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            seen[message.metadata.partition].append(message.payload["n"])
+            active -= 1
+
+        runtime = ConsumerRuntime(fake, deserialize, [handle], config=make_config(lanes=4))
+        await run_until(runtime, len(records))
+
+        assert seen == {0: [0, 1, 2, 3, 4], 1: [0, 1, 2, 3, 4]}
+        assert peak == 2
+        assert committed(fake) == {TP0: 5, TP1: 5}
+        stats = runtime.get_stats()
+        assert stats.lag == 0
+        assert stats.in_flight == 0
+        assert stats.handler_calls == 10
+
+    @pytest.mark.asyncio
+    async def test_key_lanes_preserve_per_key_order(self) -> None:
+        records = [make_record(TP0, offset, key=f"user-{offset % 3}") for offset in range(30)]
+        fake = FakeAIOKafkaConsumer(records)
+        seen: dict[str, list[int]] = {}
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            await asyncio.sleep(0.001 * (message.payload["n"] % 4))
+            seen.setdefault(message.key, []).append(message.payload["n"])
+
+        config = make_config(lanes=8, lane_strategy=LaneStrategy.KEY)
+        runtime = ConsumerRuntime(fake, deserialize, [handle], config=config)
+        await run_until(runtime, len(records))
+
+        assert seen == {f"user-{k}": list(range(k, 30, 3)) for k in range(3)}
+        assert runtime._offsets.position(TP0) == 30
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_receives_lane_batches(self) -> None:
+        fake = FakeAIOKafkaConsumer([make_record(TP0, offset) for offset in range(25)])
+        batches: list[list[int]] = []
+
+        async def handle_batch(messages: list[KafkaMessage[dict]]) -> None:
+            batches.append([m.payload["n"] for m in messages])
+
+        runtime = ConsumerRuntime(
+            fake, deserialize, batch_handlers=[handle_batch], config=make_config(max_batch_size=10)
+        )
+        await run_until(runtime, 25)
+
+        assert [n for batch in batches for n in batch] == list(range(25))
+        assert max(len(batch) for batch in batches) == 10
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_committed(self) -> None:
+        fake = FakeAIOKafkaConsumer([make_record(TP0, 0), make_record(TP0, 1, body=b"{"), make_record(TP0, 2)])
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            if message.payload["n"] == 2:
+                raise RuntimeError("boom")
+
+        runtime = ConsumerRuntime(fake, deserialize, [handle], config=make_config())
+        await run_until(runtime, 3)
+
+        assert runtime.get_stats().failed == 2
+        assert committed(fake) == {TP0: 3}
+
+    @pytest.mark.asyncio
+    async def test_saturated_partition_is_paused_and_resumed(self) -> None:
+        fake = FakeAIOKafkaConsumer([make_record(TP0, offset) for offset in range(6)])
+        release = asyncio.Event()
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            await release.wait()
+
+        config = make_config(max_in_flight_per_partition=4, max_poll_records=2)
+        runtime = ConsumerRuntime(fake, deserialize, [handle], config=config)
+        stop = asyncio.Event()
+        task = asyncio.create_task(runtime.run(stop))
+        await asyncio.sleep(0.05)
+
+        stats = runtime.get_stats()
+        assert fake.pause_calls == [TP0]
+        assert stats.paused_partitions == 1
+        assert stats.in_flight == 4
+        assert stats.lag == 6
+
+        release.set()
+        for _ in range(100):
+            if runtime.get_stats().processed == 6:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await asyncio.wait_for(task, 5)
+
+        assert fake.resume_calls == [TP0]
+        assert committed(fake) == {TP0: 6}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_handler_offset_is_not_committed(self) -> None:
+        fake = FakeAIOKafkaConsumer([make_record(TP0, offset) for offset in range(10)])
+        handled: list[int] = []
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            if message.payload["n"] == 2:
+                await asyncio.Event().wait()
+            handled.append(message.payload["n"])
+
+        runtime = ConsumerRuntime(fake, deserialize, [handle], config=make_config(max_batch_size=1))
+        task = asyncio.create_task(runtime.run(asyncio.Event()))
+        for _ in range(100):
+            if runtime.get_stats().processed == 2:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert handled == [0, 1]
+        assert committed(fake) == {TP0: 2}
+
+    @pytest.mark.asyncio
+    async def test_auto_commit_consumers_do_not_commit(self) -> None:
+        fake = FakeAIOKafkaConsumer([make_record(TP0, 0)])
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            pass
+
+        runtime = ConsumerRuntime(fake, deserialize, [handle], config=make_config(), commit_offsets=False)
+        await run_until(runtime, 1)
+
+        assert fake.commits == []
+
+
+class TestKafkaConsumerRun:
+    """Tests for KafkaConsumer.run on the runtime."""
+
+    @pytest.mark.asyncio
+    async def test_run_without_handlers_raises(self) -> None:
+        consumer = KafkaConsumer[dict](KafkaConfig(), "orders", dict)
+
+        with pytest.raises(RuntimeError, match="No handlers"):
+            await consumer.run()
+
+    @pytest.mark.asyncio
+    async def test_run_handles_records_and_commits(self) -> None:
+        consumer = KafkaConsumer[dict](KafkaConfig(enable_auto_commit=False), "orders", dict)
+        fake = FakeAIOKafkaConsumer([make_record(TP0, offset) for offset in range(3)])
+        consumer._consumer = fake  # type: ignore[assignment]
+        consumer._started = True
+        handled: list[int] = []
+        stop = asyncio.Event()
+
+        async def handle(message: KafkaMessage[dict]) -> None:
+            handled.append(message.payload["n"])
+            if len(handled) == 3:
+                stop.set()
+
+        consumer.add_handler(handle)
+        await asyncio.wait_for(consumer.run(stop, make_config()), 5)
+
+        assert handled == [0, 1, 2]
+        assert committed(fake) == {TP0: 3}
+        assert consumer.get_runtime_stats().processed == 3
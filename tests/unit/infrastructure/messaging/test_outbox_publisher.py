@@ -0,0 +1,228 @@
+"""Tests for outbox batch claiming and batch-mode publishing.
+
+**Feature: python-api-base-2025-validation**
+**Validates: Requirements 33.3, 33.4, 33.5**
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from infrastructure.messaging.outbox import (
+    OutboxMessageStatus,
+    OutboxPublisher,
+    OutboxRepository,
+    create_outbox_message,
+)
+
+
+async def fill(repository: OutboxRepository, count: int) -> None:
+    await repository.save_many([create_outbox_message("Order", str(i), "OrderPlaced", {"n": i}) for i in range(count)])
+
+
+class TestClaimBatch:
+    """Tests for OutboxRepository.claim_batch."""
+
+    @pytest.mark.asyncio
+    async def test_claims_are_disjoint(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 10)
+
+        first = await repository.claim_batch("a", limit=6)
+        second = await repository.claim_batch("b", limit=6)
+
+        assert len(first) == 6
+        assert len(second) == 4
+        assert {m.id for m in first}.isdisjoint({m.id for m in second})
+        assert all(m.locked_by == "a" and m.status == OutboxMessageStatus.PROCESSING for m in first)
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 1)
+        (message,) = await repository.claim_batch("a")
+
+        assert await repository.claim_batch("b") == []
+
+        message.locked_until = datetime.now(UTC) - timedelta(seconds=1)
+        (reclaimed,) = await repository.claim_batch("b")
+
+        assert reclaimed.id == message.id
+        assert reclaimed.locked_by == "b"
+
+    @pytest.mark.asyncio
+    async def test_processed_keys_are_not_claimed(self) -> None:
+        repository = OutboxRepository()
+        original = create_outbox_message("Order", "1", "OrderPlaced", {}, idempotency_key="key")
+        duplicate = create_outbox_message("Order", "1", "OrderPlaced", {}, idempotency_key="key")
+        await repository.save(original)
+        await repository.claim_batch("a")
+        await repository.mark_processed_many([original.id], "a")
+        await repository.save(duplicate)
+
+        assert await repository.claim_batch("a") == []
+        assert duplicate.status == OutboxMessageStatus.PUBLISHED
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_within_batch_are_claimed_once(self) -> None:
+        repository = OutboxRepository()
+        first, second = (
+            create_outbox_message("Order", "1", "OrderPlaced", {}, idempotency_key="key") for _ in range(2)
+        )
+        await repository.save_many([first, second])
+
+        claimed = await repository.claim_batch("a")
+
+        assert [m.id for m in claimed] == [first.id]
+        assert second.status == OutboxMessageStatus.PUBLISHED
+
+    @pytest.mark.asyncio
+    async def test_mark_failed_is_fenced_by_lease_owner(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 1)
+        (message,) = await repository.claim_batch("a")
+
+        assert not await repository.mark_failed(message.id, "error", worker_id="b")
+        assert message.status == OutboxMessageStatus.PROCESSING
+        assert await repository.mark_failed(message.id, "error", worker_id="a")
+        assert message.status == OutboxMessageStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_mark_processed_many_is_fenced_by_lease_owner(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 2)
+        claimed = await repository.claim_batch("a")
+
+        assert await repository.mark_processed_many([m.id for m in claimed], "b") == 0
+        assert await repository.mark_processed_many([m.id for m in claimed], "a") == 2
+        assert all(m.status == OutboxMessageStatus.PUBLISHED and m.locked_by is None for m in claimed)
+
+
+class TestBatchPublisher:
+    """Tests for OutboxPublisher batch mode."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_batch_with_bounded_concurrency(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 20)
+        active = 0
+        peak = 0
+
+        async def publish(event: dict[str, Any]) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+        publisher = OutboxPublisher(repository, publish, batch_mode=True, concurrency=4)
+
+        assert await publisher.publish_pending() == 20
+        assert peak == 4
+        assert publisher.published_count == 20
+        assert await repository.get_pending() == []
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_scheduled_for_retry(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 3)
+
+        async def publish(event: dict[str, Any]) -> None:
+            if event["aggregate_id"] == "1":
+                raise RuntimeError("broker down")
+
+        publisher = OutboxPublisher(repository, publish, batch_mode=True)
+
+        assert await publisher.publish_batch() == 2
+        assert publisher.failed_count == 1
+        failed = [m for m in repository._messages.values() if m.status == OutboxMessageStatus.FAILED]
+        assert len(failed) == 1
+        assert failed[0].locked_by is None
+        assert failed[0].next_retry_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failure_after_lease_loss_is_not_recorded(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 1)
+
+        async def publish(event: dict[str, Any]) -> None:
+            (message,) = repository._messages.values()
+            message.locked_by = "b"
+            raise RuntimeError("broker down")
+
+        publisher = OutboxPublisher(repository, publish, batch_mode=True, worker_id="a")
+
+        assert await publisher.publish_batch() == 0
+        assert publisher.failed_count == 0
+        (message,) = repository._messages.values()
+        assert message.status == OutboxMessageStatus.PROCESSING
+        assert message.retry_count == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_publishers_do_not_double_publish(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 250)
+        seen: list[str] = []
+
+        async def publish(event: dict[str, Any]) -> None:
+            await asyncio.sleep(0)
+            seen.append(event["id"])
+
+        publishers = [
+            OutboxPublisher(repository, publish, batch_mode=True, batch_size=20, worker_id=f"w{i}") for i in range(3)
+        ]
+        while await repository.get_pending(limit=1):
+            await asyncio.gather(*(p.publish_pending() for p in publishers))
+
+        assert len(seen) == len(set(seen)) == 250
+
+    @pytest.mark.asyncio
+    async def test_poll_loop_drains_backlog_without_sleeping(self) -> None:
+        repository = OutboxRepository()
+        await fill(repository, 50)
+        publisher = OutboxPublisher(repository, lambda event: None, batch_mode=True, batch_size=10, poll_interval=60)
+
+        await publisher.start()
+        try:
+            for _ in range(100):
+                if publisher.published_count == 50:
+                    break
+                await asyncio.sleep(0)
+        finally:
+            await publisher.stop()
+
+        assert publisher.published_count == 50
+
+    @pytest.mark.asyncio
+    async def test_legacy_mode_calls_mark_failed_without_worker_id(self) -> None:
+        class LegacyRepository(OutboxRepository):
+            async def mark_failed(  # type: ignore[override]
+                self, message_id: Any, error: str, next_retry: datetime | None = None
+            ) -> bool:
+                return await super().mark_failed(message_id, error, next_retry)
+
+        repository = LegacyRepository()
+        await fill(repository, 1)
+
+        async def publish(event: dict[str, Any]) -> None:
+            raise RuntimeError("broker down")
+
+        publisher = OutboxPublisher(repository, publish)
+
+        assert await publisher.publish_pending() == 0
+        assert publisher.failed_count == 1
+        (message,) = repository._messages.values()
+        assert message.status == OutboxMessageStatus.FAILED
+
+    def test_batch_mode_requires_claiming_repository(self) -> None:
+        class LegacyRepository:
+            pass
+
+        with pytest.raises(TypeError):
+            OutboxPublisher(LegacyRepository(), batch_mode=True)  # type: ignore[arg-type]
+
+    def test_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            OutboxPublisher(OutboxRepository(), concurrency=0)
@@ -342,6 +342,16 @@ class TestAnomalyDetector:
         assert stats["min"] == 1.0
         assert stats["max"] == 10.0
 
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    @pytest.mark.asyncio
+    async def test_non_finite_values_are_dropped(self, value: float) -> None:
+        """Test NaN and infinite samples are ignored."""
+        detector = AnomalyDetector()
+        await detector.record("test", 1.0)
+
+        assert await detector.record("test", value) is None
+        assert detector.get_statistics("test")["count"] == 1
+
     def test_determine_severity_critical(self) -> None:
         """Test critical severity determination."""
         config = AnomalyConfig(critical_threshold=3.0)
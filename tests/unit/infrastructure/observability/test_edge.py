@@ -0,0 +1,195 @@
+"""Tests for the fused edge middleware.
+
+**Feature: observability-infrastructure**
+**Requirement: R1, R2 - Structured Logging**
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from infrastructure.observability.edge import (
+    CorrelationPlugin,
+    EdgeContext,
+    EdgeMiddleware,
+    RouteSampler,
+    RouteSampling,
+    get_edge_context,
+)
+from infrastructure.prometheus.middleware import PrometheusPlugin
+
+
+def http_scope(path: str = "/api/items", headers: list[tuple[bytes, bytes]] | None = None) -> dict[str, Any]:
+    """Build a minimal HTTP ASGI scope."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+        "client": ("10.0.0.1", 5000),
+    }
+
+
+def respond(status: int) -> Any:
+    """ASGI app sending an empty response with the given status."""
+
+    async def app(scope: dict, receive: object, send: Any) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"2")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return app
+
+
+class RecordingPlugin:
+    """Plugin recording hook calls."""
+
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    def on_request(self, ctx: EdgeContext) -> None:
+        self.calls.append(f"{self.name}.request")
+        ctx.response_headers[f"X-{self.name}"] = "1"
+        ctx.log_fields[self.name] = True
+
+    def on_complete(self, ctx: EdgeContext) -> None:
+        self.calls.append(f"{self.name}.complete:{ctx.status_code}")
+
+
+class TestRouteSampler:
+    """Tests for RouteSampler."""
+
+    def test_exact_then_longest_prefix_then_default(self) -> None:
+        sampler = RouteSampler(
+            {
+                "/health": RouteSampling(log_rate=0.0),
+                "/api/*": RouteSampling(log_rate=0.5),
+                "/api/hot/*": RouteSampling(log_rate=0.1),
+            },
+            default=RouteSampling(log_rate=0.9),
+        )
+
+        assert sampler.rates("/health").log_rate == 0.0
+        assert sampler.rates("/api/items").log_rate == 0.5
+        assert sampler.rates("/api/hot/items").log_rate == 0.1
+        assert sampler.rates("/other").log_rate == 0.9
+
+    def test_rejects_rates_outside_unit_interval(self) -> None:
+        with pytest.raises(ValueError):
+            RouteSampling(log_rate=1.5)
+
+
+class TestEdgeMiddleware:
+    """Tests for EdgeMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_single_log_record_with_plugin_fields_and_headers(self) -> None:
+        calls: list[str] = []
+        middleware = EdgeMiddleware(respond(200), [RecordingPlugin("a", calls), RecordingPlugin("b", calls)])
+        send = AsyncMock()
+
+        with capture_logs() as logs:
+            await middleware(http_scope(), AsyncMock(), send)
+
+        assert calls == ["a.request", "b.request", "b.complete:200", "a.complete:200"]
+        headers = dict(send.call_args_list[0].args[0]["headers"])
+        assert headers[b"x-a"] == headers[b"x-b"] == b"1"
+        assert len(logs) == 1
+        assert logs[0]["event"] == "request_completed"
+        assert logs[0]["status_code"] == 200
+        assert logs[0]["response_size"] == 2
+        assert logs[0]["a"] is logs[0]["b"] is True
+
+    @pytest.mark.parametrize("content_length", [b"abc", b"-1", None])
+    @pytest.mark.asyncio
+    async def test_unusable_content_length_falls_back_to_body_bytes(self, content_length: bytes | None) -> None:
+        async def app(scope: dict, receive: object, send: Any) -> None:
+            headers = [] if content_length is None else [(b"content-length", content_length)]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"abc", "more_body": True})
+            await send({"type": "http.response.body", "body": b"de"})
+
+        with capture_logs() as logs:
+            await EdgeMiddleware(app)(http_scope(), AsyncMock(), AsyncMock())
+
+        assert logs[0]["status_code"] == 200
+        assert logs[0]["response_size"] == 5
+
+    @pytest.mark.asyncio
+    async def test_unsampled_request_is_not_logged_unless_it_fails(self) -> None:
+        sampling = {"/api/*": RouteSampling(log_rate=0.5)}
+        ok = EdgeMiddleware(respond(200), sampling=sampling, random_func=lambda: 0.9)
+        failing = EdgeMiddleware(respond(503), sampling=sampling, random_func=lambda: 0.9)
+
+        with capture_logs() as logs:
+            await ok(http_scope(), AsyncMock(), AsyncMock())
+            await failing(http_scope(), AsyncMock(), AsyncMock())
+
+        assert [(log["status_code"], log["log_level"]) for log in logs] == [(503, "error")]
+
+    @pytest.mark.asyncio
+    async def test_exception_is_logged_and_plugins_complete(self) -> None:
+        calls: list[str] = []
+        middleware = EdgeMiddleware(AsyncMock(side_effect=ValueError("boom")), [RecordingPlugin("a", calls)])
+
+        with capture_logs() as logs, pytest.raises(ValueError):
+            await middleware(http_scope(), AsyncMock(), AsyncMock())
+
+        assert calls == ["a.request", "a.complete:500"]
+        assert logs[0]["error_type"] == "ValueError"
+        assert get_edge_context() is None
+
+    @pytest.mark.asyncio
+    async def test_edge_context_is_visible_to_app(self) -> None:
+        seen: list[EdgeContext | None] = []
+
+        async def app(scope: dict, receive: object, send: Any) -> None:
+            seen.append(get_edge_context())
+            await respond(204)(scope, receive, send)
+
+        await EdgeMiddleware(app, log_event=None)(http_scope(), AsyncMock(), AsyncMock())
+
+        assert seen[0] is not None
+        assert seen[0].path == "/api/items"
+
+    @pytest.mark.asyncio
+    async def test_correlation_plugin_honours_incoming_header(self) -> None:
+        middleware = EdgeMiddleware(respond(200), [CorrelationPlugin()])
+        send = AsyncMock()
+        scope = http_scope(headers=[(b"x-correlation-id", b"corr-123")])
+
+        with capture_logs():
+            await middleware(scope, AsyncMock(), send)
+
+        headers = dict(send.call_args_list[0].args[0]["headers"])
+        assert headers[b"x-correlation-id"] == b"corr-123"
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_weighted_by_sampling_rate(self) -> None:
+        registry = MagicMock()
+        counter = registry.counter.return_value
+        middleware = EdgeMiddleware(
+            respond(200),
+            [PrometheusPlugin(registry)],
+            default_sampling=RouteSampling(metrics_rate=0.25),
+            log_event=None,
+            random_func=iter([0.1, 0.9]).__next__,
+        )
+
+        await middleware(http_scope(), AsyncMock(), AsyncMock())
+        await middleware(http_scope(), AsyncMock(), AsyncMock())
+
+        counter.labels.assert_called_once_with(method="GET", endpoint="/api/items", status="200")
+        counter.labels.return_value.inc.assert_called_once_with(4.0)
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self) -> None:
+        app = AsyncMock()
+        scope, receive, send = {"type": "lifespan"}, AsyncMock(), AsyncMock()
+
+        await EdgeMiddleware(app)(scope, receive, send)
+
+        app.assert_called_once_with(scope, receive, send)
@@ -0,0 +1,285 @@
+"""Unit tests for the Elasticsearch log shipping pipeline.
+
+Bulk requests are sent to a local stub HTTP server.
+
+**Feature: observability-infrastructure**
+**Requirement: R1.3 - Ship logs to Elasticsearch with buffering**
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from infrastructure.observability.elasticsearch_buffer import (
+    BulkIndexer,
+    FallbackWriter,
+    LogBuffer,
+    OverflowPolicy,
+)
+from infrastructure.observability.elasticsearch_config import ElasticsearchConfig
+from infrastructure.observability.elasticsearch_shipping import LogShipper
+
+
+class StubBulkServer(ThreadingHTTPServer):
+    """Stub ``_bulk`` endpoint recording decoded request bodies."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubBulkHandler)
+        self.bodies: list[list[dict[str, Any]]] = []
+        self.encodings: list[str | None] = []
+        self.failures = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def documents(self) -> list[dict[str, Any]]:
+        return [line for body in self.bodies for line in body[1::2]]
+
+
+class StubBulkHandler(BaseHTTPRequestHandler):
+    server: StubBulkServer
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            self._respond(503, {"error": "unavailable"})
+            return
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        self.server.encodings.append(encoding)
+        self.server.bodies.append([json.loads(line) for line in body.decode().splitlines()])
+        self._respond(200, {"errors": False, "items": []})
+
+    def _respond(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[StubBulkServer]:
+    server = StubBulkServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_shipper(server: StubBulkServer, spool: Path, **overrides: Any) -> tuple[LogShipper, LogBuffer]:
+    config = ElasticsearchConfig(
+        hosts=[server.url],
+        batch_size=10,
+        flush_interval_seconds=0.05,
+        retry_backoff_seconds=0.01,
+        **overrides,
+    )
+    buffer = LogBuffer(config.batch_size, config.flush_interval_seconds, capacity=1_000)
+    shipper = LogShipper(config, buffer, BulkIndexer("logs-test"), FallbackWriter(spool))
+    return shipper, buffer
+
+
+class TestLogBuffer:
+    """Tests for LogBuffer overflow policies."""
+
+    def test_drop_oldest_keeps_newest_events(self) -> None:
+        buffer = LogBuffer(batch_size=100, capacity=3)
+        for i in range(5):
+            buffer.add({"n": i})
+
+        assert [e["n"] for e in buffer.take_all()] == [2, 3, 4]
+        assert buffer.dropped == 2
+
+    def test_drop_newest_rejects_new_events(self) -> None:
+        buffer = LogBuffer(batch_size=100, capacity=3, overflow=OverflowPolicy.DROP_NEWEST)
+        for i in range(5):
+            buffer.add({"n": i})
+
+        assert [e["n"] for e in buffer.take_all()] == [0, 1, 2]
+        assert buffer.dropped == 2
+
+    def test_sample_keeps_share_of_events_once_half_full(self) -> None:
+        draws = iter([0.05, 0.5, 0.05, 0.5])
+        buffer = LogBuffer(
+            batch_size=100,
+            capacity=10,
+            overflow=OverflowPolicy.SAMPLE,
+            sample_rate=0.1,
+            random_func=lambda: next(draws),
+        )
+        for i in range(9):
+            buffer.add({"n": i})
+
+        assert [e["n"] for e in buffer.take_all()] == [0, 1, 2, 3, 4, 5, 7]
+        assert buffer.dropped == 2
+
+    def test_add_reports_full_batch(self) -> None:
+        buffer = LogBuffer(batch_size=2)
+
+        assert buffer.add({"n": 0}) is False
+        assert buffer.add({"n": 1}) is True
+        assert buffer.take(1) == [{"n": 0}]
+        assert len(buffer) == 1
+
+
+class TestBulkEncoding:
+    """Tests for bulk body encoding and spooling."""
+
+    def test_encode_produces_gzip_ndjson(self) -> None:
+        body = BulkIndexer("logs-test").encode([{"message": "a"}, {"message": "b"}])
+
+        lines = gzip.decompress(body).decode().split("\n")
+        assert lines[-1] == ""
+        assert json.loads(lines[0])["index"]["_index"].startswith("logs-test-")
+        assert [json.loads(line) for line in lines[1:-1:2]] == [{"message": "a"}, {"message": "b"}]
+
+    @pytest.mark.asyncio
+    async def test_fallback_round_trip(self, tmp_path: Path) -> None:
+        writer = FallbackWriter(tmp_path / "spool.log")
+
+        assert await writer.write([{"n": 0}, {"n": 1}]) is True
+        batch = await writer.read_batch(10)
+        assert batch is not None
+        assert batch.events == [{"n": 0}, {"n": 1}]
+        assert writer.has_spooled()
+
+        assert await writer.acknowledge(batch) is True
+        assert not writer.has_spooled()
+        assert await writer.read_batch(10) is None
+
+    @pytest.mark.asyncio
+    async def test_fallback_replays_in_acknowledged_batches(self, tmp_path: Path) -> None:
+        writer = FallbackWriter(tmp_path / "spool.log")
+        await writer.write([{"n": i} for i in range(5)])
+
+        first = await writer.read_batch(2)
+        assert first is not None
+        await writer.acknowledge(first)
+        unacknowledged = await writer.read_batch(2)
+        await writer.write([{"n": 5}])
+
+        restarted = FallbackWriter(tmp_path / "spool.log")
+        batches = []
+        while (batch := await restarted.read_batch(2)) is not None:
+            batches.append([event["n"] for event in batch.events])
+            await restarted.acknowledge(batch)
+
+        assert unacknowledged is not None
+        assert [event["n"] for event in unacknowledged.events] == [2, 3]
+        assert batches == [[2, 3], [4], [5]]
+        assert not restarted.has_spooled()
+
+    @pytest.mark.asyncio
+    async def test_fallback_drops_events_when_full(self, tmp_path: Path) -> None:
+        writer = FallbackWriter(tmp_path / "spool.log", max_bytes=1)
+        await writer.write([{"n": 0}])
+
+        assert await writer.write([{"n": 1}]) is False
+        batch = await writer.read_batch(10)
+        assert batch is not None
+        assert batch.events == [{"n": 0}]
+
+
+class TestLogShipper:
+    """Tests for LogShipper against a stub bulk endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_ships_all_events_compressed(self, server: StubBulkServer, tmp_path: Path) -> None:
+        shipper, buffer = make_shipper(server, tmp_path / "spool.log")
+        for i in range(25):
+            buffer.add({"n": i})
+
+        await shipper.flush()
+        await shipper.close()
+
+        assert sorted(doc["n"] for doc in server.documents()) == list(range(25))
+        assert len(server.bodies) == 3
+        assert server.encodings == ["gzip"] * 3
+        stats = shipper.get_stats()
+        assert stats.shipped_events == 25
+        assert stats.shipped_bytes > 0
+        assert stats.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_ships_on_notify(self, server: StubBulkServer, tmp_path: Path) -> None:
+        shipper, buffer = make_shipper(server, tmp_path / "spool.log")
+        shipper.start()
+        for i in range(10):
+            buffer.add({"n": i})
+        shipper.notify()
+
+        for _ in range(100):
+            if shipper.get_stats().shipped_events == 10:
+                break
+            await asyncio.sleep(0.01)
+        await shipper.close()
+
+        assert len(server.documents()) == 10
+
+    @pytest.mark.asyncio
+    async def test_retries_unavailable_endpoint(self, server: StubBulkServer, tmp_path: Path) -> None:
+        server.failures = 2
+        shipper, buffer = make_shipper(server, tmp_path / "spool.log", max_retries=3)
+        buffer.add({"n": 0})
+
+        await shipper.close()
+
+        assert server.documents() == [{"n": 0}]
+        assert shipper.get_stats().retries == 2
+
+    @pytest.mark.asyncio
+    async def test_spools_and_replays_after_recovery(self, server: StubBulkServer, tmp_path: Path) -> None:
+        spool = tmp_path / "spool.log"
+        server.failures = 1
+        shipper, buffer = make_shipper(server, spool, max_retries=0)
+        for i in range(3):
+            buffer.add({"n": i})
+
+        await shipper.flush()
+        assert spool.exists()
+        assert server.documents() == []
+
+        await shipper.replay_spool()
+        await shipper.close()
+
+        assert [doc["n"] for doc in server.documents()] == [0, 1, 2]
+        assert not spool.exists()
+        assert list(tmp_path.iterdir()) == []
+        stats = shipper.get_stats()
+        assert stats.failed_requests == 1
+        assert stats.spooled_events == stats.replayed_events == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_replay_leaves_spool_intact(self, server: StubBulkServer, tmp_path: Path) -> None:
+        spool = tmp_path / "spool.log"
+        shipper, _ = make_shipper(server, spool, max_retries=0)
+        await FallbackWriter(spool).write([{"n": i} for i in range(25)])
+        server.failures = 1
+
+        await shipper.replay_spool()
+        assert server.documents() == []
+        assert shipper.get_stats().replayed_events == 0
+
+        await shipper.replay_spool()
+        await shipper.close()
+
+        assert [doc["n"] for doc in server.documents()] == list(range(25))
+        assert [len(body) // 2 for body in server.bodies] == [10, 10, 5]
+        assert shipper.get_stats().replayed_events == 25
+        assert not FallbackWriter(spool).has_spooled()
@@ -0,0 +1,132 @@
+"""Tests for streaming statistics.
+
+**Feature: api-architecture-analysis**
+**Validates: Requirements 7.3**
+"""
+
+import random
+
+import pytest
+
+from infrastructure.observability.anomaly import StatisticalAnalyzer
+from infrastructure.observability.streaming_stats import QuantileSketch, RollingWindow, TrendWindow
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        rng = random.Random(1)
+        values = [rng.lognormvariate(3, 1) for _ in range(5_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = StatisticalAnalyzer.percentile(values, q)
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_handles_negative_and_zero_values(self) -> None:
+        sketch = QuantileSketch()
+        for value in (-10.0, -1.0, 0.0, 1.0, 10.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0.0) == pytest.approx(-10.0, rel=0.01)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+
+    def test_remove_and_merge(self) -> None:
+        left, right = QuantileSketch(), QuantileSketch()
+        for value in range(1, 51):
+            left.add(float(value))
+            right.add(float(value + 50))
+        left.merge(right)
+        for value in range(1, 51):
+            left.remove(float(value))
+
+        assert len(left) == 50
+        assert left.quantile(0.0) == pytest.approx(51.0, rel=0.01)
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.05))
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_rejects_non_finite_values(self, value: float) -> None:
+        sketch = QuantileSketch()
+        sketch.add(1.0)
+
+        with pytest.raises(ValueError, match="non-finite"):
+            sketch.add(value)
+
+        assert len(sketch) == 1
+        assert sketch.quantile(0.5) == pytest.approx(1.0, rel=0.01)
+
+
+class TestRollingWindow:
+    """Tests for RollingWindow."""
+
+    def test_matches_exact_statistics_after_evictions(self) -> None:
+        rng = random.Random(2)
+        window = RollingWindow(capacity=100, max_age_seconds=3600)
+        values = [rng.uniform(-50, 150) for _ in range(1_000)]
+        for i, value in enumerate(values):
+            window.add(value, float(i))
+
+        recent = values[-100:]
+        assert len(window) == 100
+        assert window.mean == pytest.approx(StatisticalAnalyzer.mean(recent))
+        assert window.std_dev == pytest.approx(StatisticalAnalyzer.std_dev(recent))
+        assert window.min == min(recent)
+        assert window.max == max(recent)
+
+    def test_expire_drops_old_samples(self) -> None:
+        window = RollingWindow(capacity=100, max_age_seconds=10)
+        for t in range(20):
+            window.add(float(t), float(t))
+
+        window.expire(now=25.0)
+
+        assert len(window) == 4
+        assert window.min == 16.0
+        assert window.mean == 17.5
+
+        window.expire(now=100.0)
+        assert len(window) == 0
+        assert window.std_dev == 0.0
+        assert window.quantile(0.5) == 0.0
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_value_leaves_full_window_unchanged(self, value: float) -> None:
+        window = RollingWindow(capacity=3, max_age_seconds=3600)
+        for t in range(3):
+            window.add(float(t), float(t))
+
+        with pytest.raises(ValueError, match="non-finite"):
+            window.add(value, 3.0)
+
+        assert len(window) == 3
+        assert window.min == 0.0
+        assert window.mean == 1.0
+
+
+class TestTrendWindow:
+    """Tests for TrendWindow."""
+
+    def test_slope_matches_linear_regression(self) -> None:
+        rng = random.Random(3)
+        trend = TrendWindow(size=10)
+        values = [i * 0.5 + rng.gauss(0, 1) for i in range(2_000)]
+        for value in values:
+            trend.add(value)
+
+        assert trend.is_full
+        assert trend.slope == pytest.approx(StatisticalAnalyzer.linear_regression_slope(values[-10:]))
+
+    def test_partial_window(self) -> None:
+        trend = TrendWindow(size=10)
+        for value in (1.0, 3.0, 5.0):
+            trend.add(value)
+
+        assert not trend.is_full
+        assert trend.slope == pytest.approx(2.0)
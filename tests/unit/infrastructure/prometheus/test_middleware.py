@@ -86,41 +86,47 @@ class TestPrometheusMiddlewareGetEndpoint:
         assert middleware._get_endpoint(request) == "/api/users"
 
 
-class TestPrometheusMiddlewareDispatch:
-    """Tests for dispatch method."""
+def http_scope(path: str, method: str = "GET") -> dict:
+    """Build a minimal HTTP ASGI scope."""
+    return {"type": "http", "method": method, "path": path, "query_string": b"", "headers": []}
+
+
+async def ok_app(scope: dict, receive: object, send: AsyncMock) -> None:
+    """ASGI app sending an empty 200 response."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+class TestPrometheusMiddlewareCall:
+    """Tests for ASGI request handling."""
 
     @pytest.mark.asyncio
-    async def test_dispatch_skip_metrics_path(self) -> None:
-        """Test dispatch skips metrics path."""
-        app = MagicMock()
+    async def test_call_skip_metrics_path(self) -> None:
+        """Test metrics path passes through without metrics."""
+        app = AsyncMock()
         mock_registry = MagicMock()
         middleware = PrometheusMiddleware(app, registry=mock_registry)
+        scope, receive, send = http_scope("/metrics"), AsyncMock(), AsyncMock()
 
-        request = MagicMock()
-        request.url.path = "/metrics"
+        await middleware(scope, receive, send)
 
-        call_next = AsyncMock(return_value=MagicMock())
-        await middleware.dispatch(request, call_next)
-        call_next.assert_called_once_with(request)
+        app.assert_called_once_with(scope, receive, send)
+        mock_registry.counter.return_value.labels.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_dispatch_skip_health_path(self) -> None:
-        """Test dispatch skips health path."""
-        app = MagicMock()
-        mock_registry = MagicMock()
-        middleware = PrometheusMiddleware(app, registry=mock_registry)
+    async def test_call_skip_health_path(self) -> None:
+        """Test health path passes through without metrics."""
+        app = AsyncMock()
+        middleware = PrometheusMiddleware(app, registry=MagicMock())
+        scope, receive, send = http_scope("/health"), AsyncMock(), AsyncMock()
 
-        request = MagicMock()
-        request.url.path = "/health"
+        await middleware(scope, receive, send)
 
-        call_next = AsyncMock(return_value=MagicMock())
-        await middleware.dispatch(request, call_next)
-        call_next.assert_called_once_with(request)
+        app.assert_called_once_with(scope, receive, send)
 
     @pytest.mark.asyncio
-    async def test_dispatch_records_metrics(self) -> None:
-        """Test dispatch records metrics for normal request."""
-        app = MagicMock()
+    async def test_call_records_metrics(self) -> None:
+        """Test metrics are recorded with the response status."""
         mock_registry = MagicMock()
         mock_counter = MagicMock()
         mock_histogram = MagicMock()
@@ -129,48 +135,31 @@ class TestPrometheusMiddlewareDispatch:
         mock_registry.histogram.return_value = mock_histogram
         mock_registry.gauge.return_value = mock_gauge
 
-        middleware = PrometheusMiddleware(app, registry=mock_registry)
+        middleware = PrometheusMiddleware(ok_app, registry=mock_registry)
+        send = AsyncMock()
 
-        request = MagicMock()
-        request.url.path = "/api/users"
-        request.method = "GET"
-        request.scope = {}
-
-        response = MagicMock()
-        response.status_code = 200
-        call_next = AsyncMock(return_value=response)
+        await middleware(http_scope("/api/users"), AsyncMock(), send)
 
-        result = await middleware.dispatch(request, call_next)
-
-        assert result is response
-        mock_gauge.labels.assert_called()
+        assert send.call_args_list[0].args[0]["status"] == 200
+        mock_gauge.labels.assert_called_with(method="GET", endpoint="/api/users")
         mock_histogram.labels.assert_called()
-        mock_counter.labels.assert_called()
+        mock_counter.labels.assert_called_once_with(method="GET", endpoint="/api/users", status="200")
 
     @pytest.mark.asyncio
-    async def test_dispatch_handles_exception(self) -> None:
-        """Test dispatch handles exception and records 500 status."""
-        app = MagicMock()
+    async def test_call_handles_exception(self) -> None:
+        """Test exception records 500 status and is re-raised."""
         mock_registry = MagicMock()
         mock_counter = MagicMock()
-        mock_histogram = MagicMock()
         mock_gauge = MagicMock()
         mock_registry.counter.return_value = mock_counter
-        mock_registry.histogram.return_value = mock_histogram
         mock_registry.gauge.return_value = mock_gauge
 
+        app = AsyncMock(side_effect=ValueError("test error"))
         middleware = PrometheusMiddleware(app, registry=mock_registry)
 
-        request = MagicMock()
-        request.url.path = "/api/users"
-        request.method = "GET"
-        request.scope = {}
-
-        call_next = AsyncMock(side_effect=ValueError("test error"))
-
         with pytest.raises(ValueError):
-            await middleware.dispatch(request, call_next)
+            await middleware(http_scope("/api/users"), AsyncMock(), AsyncMock())
 
         # Metrics should still be recorded
-        mock_gauge.labels.assert_called()
-        mock_counter.labels.assert_called()
+        mock_gauge.labels.return_value.dec.assert_called_once()
+        mock_counter.labels.assert_called_once_with(method="GET", endpoint="/api/users", status="500")
@@ -0,0 +1,114 @@
+"""Tests for compiled RBAC permission bitsets.
+
+**Feature: enterprise-generics-2025**
+**Requirement: R14.2 - Generic_RBAC[TUser].has_permission()**
+"""
+
+from enum import Enum
+
+from infrastructure.rbac.checker import RBAC
+from infrastructure.rbac.compiled import PermissionIndex, PermissionValues, RoleMaskCache
+from infrastructure.rbac.permission import Permission
+from infrastructure.rbac.role import RoleRegistry
+
+
+class Resource(Enum):
+    """Test resource enum."""
+
+    POST = "post"
+
+
+class Action(Enum):
+    """Test action enum."""
+
+    READ = "read"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class User:
+    """User with roles."""
+
+    def __init__(self, roles: list[str]) -> None:
+        self.roles = roles
+
+
+READ = Permission(Resource.POST, Action.READ)
+UPDATE = Permission(Resource.POST, Action.UPDATE)
+DELETE = Permission(Resource.POST, Action.DELETE)
+
+
+class TestPermissionIndex:
+    """Tests for PermissionIndex."""
+
+    def test_assigns_distinct_bits(self) -> None:
+        index = PermissionIndex(["read", "write"])
+
+        assert index.bit("read") == 1
+        assert index.bit("write") == 2
+        assert index.bit("delete") == 4
+        assert len(index) == 3
+
+    def test_mask_round_trips(self) -> None:
+        index = PermissionIndex(["read", "write", "delete"])
+
+        assert index.permissions(index.mask(["read", "delete"])) == ["read", "delete"]
+        assert repr(PermissionValues(index, index.mask(["write"]))) == "['write']"
+
+
+class TestRoleMaskCache:
+    """Tests for RoleMaskCache."""
+
+    def test_memoizes_until_invalidated(self) -> None:
+        index: PermissionIndex[str] = PermissionIndex()
+        roles = {"viewer": {"read"}, "editor": {"read", "write"}}
+        calls: list[str] = []
+
+        def resolve(name: str) -> set[str] | None:
+            calls.append(name)
+            return roles.get(name)
+
+        cache = RoleMaskCache(index, resolve)
+        mask = cache.mask(["viewer", "unknown"])
+        cache.mask(["viewer", "unknown"])
+
+        assert calls == ["viewer", "unknown"]
+        assert index.permissions(mask) == ["read"]
+
+        roles["viewer"] = {"read", "write"}
+        cache.invalidate()
+
+        assert index.permissions(cache.mask(["viewer", "unknown"])) == ["read", "write"]
+
+    def test_resets_when_full(self) -> None:
+        cache = RoleMaskCache(PermissionIndex(), lambda name: {name}, max_entries=2)
+        for name in ("a", "b", "c"):
+            cache.mask([name])
+
+        assert len(cache) == 1
+
+
+class TestCompiledRBAC:
+    """Tests for RBAC recompiling masks when roles change."""
+
+    def test_inherited_permissions_are_flattened(self) -> None:
+        registry: RoleRegistry[Resource, Action] = RoleRegistry()
+        registry.create_role("viewer", permissions={READ})
+        registry.create_role("editor", permissions={UPDATE}, parent="viewer")
+        rbac: RBAC[User, Resource, Action] = RBAC(registry)
+
+        assert rbac.has_permission(User(["editor"]), READ)
+        assert not rbac.has_permission(User(["editor"]), DELETE)
+
+    def test_role_changes_invalidate_masks(self) -> None:
+        registry: RoleRegistry[Resource, Action] = RoleRegistry()
+        viewer = registry.create_role("viewer", permissions={READ})
+        rbac: RBAC[User, Resource, Action] = RBAC(registry)
+        user = User(["viewer"])
+        assert not rbac.has_permission(user, UPDATE)
+
+        viewer.add_permission(UPDATE)
+        assert rbac.has_permission(user, UPDATE)
+
+        registry.create_role("viewer", permissions=set())
+        assert not rbac.has_permission(user, READ)
@@ -0,0 +1,173 @@
+"""Unit tests for partition-grouped ScyllaDB bulk writes.
+
+**Feature: observability-infrastructure**
+**Requirement: R4.3 - Generic Repository**
+"""
+
+import asyncio
+from typing import Any, ClassVar
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.scylladb.bulk import BulkWriteConfig, BulkWriter
+from infrastructure.scylladb.entity import ScyllaDBEntity
+from infrastructure.scylladb.repository import ScyllaDBRepository
+
+FAST = BulkWriteConfig(retry_backoff_seconds=0)
+
+
+class EventEntity(ScyllaDBEntity):
+    """Entity partitioned by device."""
+
+    __table_name__: ClassVar[str] = "events"
+    __primary_key__: ClassVar[list[str]] = ["device_id"]
+    __clustering_key__: ClassVar[list[str]] = ["id"]
+
+    device_id: str
+    value: int
+
+
+class RecordingClient:
+    """Client recording single statements and batches."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.single: list[tuple[Any, ...]] = []
+        self.batches: list[list[tuple[Any, ...]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prepare = AsyncMock(side_effect=lambda query: MagicMock(query=query))
+
+    async def execute(self, query: Any, parameters: tuple[Any, ...]) -> list[Any]:
+        await self._request()
+        self.single.append(parameters)
+        return []
+
+    async def execute_batch(self, statements: list[tuple[Any, tuple[Any, ...]]], batch_type: str) -> None:
+        assert batch_type == "UNLOGGED"
+        await self._request()
+        self.batches.append([params for _, params in statements])
+
+    async def _request(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if self.failures:
+            self.failures -= 1
+            raise TimeoutError("write timeout")
+
+
+def statements(keys: list[str]) -> list[tuple[Any, tuple[Any, ...]]]:
+    return [("INSERT", (key, n)) for n, key in enumerate(keys)]
+
+
+class TestBulkWriter:
+    """Tests for BulkWriter."""
+
+    @pytest.mark.asyncio
+    async def test_batches_only_share_a_partition(self) -> None:
+        client = RecordingClient()
+        keys = ["a", "b", "a", "c", "a", "b"]
+
+        result = await BulkWriter(client, FAST).write(keys, statements(keys), keys)  # type: ignore[arg-type]
+
+        assert result.all_succeeded
+        assert sorted(len({params[0] for params in batch}) for batch in client.batches) == [1, 1]
+        assert client.single == [("c", 3)]
+        assert result.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_large_partitions_are_split(self) -> None:
+        client = RecordingClient()
+        keys = ["a"] * 7
+
+        await BulkWriter(client, BulkWriteConfig(max_batch_rows=3)).write(keys, statements(keys), keys)  # type: ignore[arg-type]
+
+        assert [len(batch) for batch in client.batches] == [3, 3]
+        assert len(client.single) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        client = RecordingClient()
+        keys = [f"k{i}" for i in range(50)]
+
+        await BulkWriter(client, BulkWriteConfig(concurrency=4)).write(keys, statements(keys), keys)  # type: ignore[arg-type]
+
+        assert client.max_in_flight == 4
+        assert len(client.single) == 50
+
+    @pytest.mark.asyncio
+    async def test_failed_group_is_retried(self) -> None:
+        client = RecordingClient(failures=2)
+
+        result = await BulkWriter(client, FAST).write(["x"], statements(["a"]), ["a"])  # type: ignore[arg-type]
+
+        assert result.rows[0].success
+        assert result.rows[0].attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_are_reported_per_row(self) -> None:
+        client = RecordingClient(failures=3)
+        keys = ["a", "a", "b"]
+
+        result = await BulkWriter(client, BulkWriteConfig(concurrency=1, retry_backoff_seconds=0)).write(
+            ["r0", "r1", "r2"],
+            statements(keys),
+            keys,  # type: ignore[arg-type]
+        )
+
+        assert [row.success for row in result.rows] == [False, False, True]
+        assert [item for item, _ in result.failed] == ["r0", "r1"]
+        assert isinstance(result.rows[0].error, TimeoutError)
+        assert result.succeeded == ["r2"]
+
+    def test_config_rejects_empty_window(self) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            BulkWriteConfig(concurrency=0)
+
+
+class TestRepositoryBulk:
+    """Tests for ScyllaDBRepository bulk operations."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_prepares_once_and_groups_by_partition(self) -> None:
+        client = RecordingClient()
+        repository = ScyllaDBRepository[EventEntity](client, EventEntity, FAST)  # type: ignore[arg-type]
+        events = [EventEntity(device_id=f"d{i % 3}", value=i) for i in range(9)]
+
+        result = await repository.bulk_create(events)
+
+        assert result.succeeded == events
+        client.prepare.assert_awaited_once()
+        assert len(client.batches) == 3
+        assert not client.single
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_reports_each_id(self) -> None:
+        client = RecordingClient()
+        repository = ScyllaDBRepository[EventEntity](client, EventEntity, FAST)  # type: ignore[arg-type]
+        ids = [uuid4() for _ in range(4)]
+
+        result = await repository.bulk_delete(ids)
+
+        assert result.succeeded == ids
+        assert client.single == [(id,) for id in ids]
+        assert (await repository.bulk_delete([])).rows == []
+
+    @pytest.mark.asyncio
+    async def test_prepared_statements_use_bind_markers(self) -> None:
+        client = RecordingClient()
+        repository = ScyllaDBRepository[EventEntity](client, EventEntity, FAST)  # type: ignore[arg-type]
+        event = EventEntity(device_id="d0", value=1)
+
+        await repository.bulk_create([event])
+        await repository.bulk_delete([uuid4()])
+
+        insert, delete = (call.args[0] for call in client.prepare.await_args_list)
+        columns = ", ".join(event.to_dict())
+        markers = ", ".join("?" * len(event.to_dict()))
+        assert insert == f"INSERT INTO events ({columns}) VALUES ({markers})"
+        assert delete == "DELETE FROM events WHERE device_id = ?"
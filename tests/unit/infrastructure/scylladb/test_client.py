@@ -0,0 +1,142 @@
+"""Unit tests for the ScyllaDB client's asyncio bridge.
+
+A fake session answers ``execute_async`` with response futures that
+complete on a separate thread, as the driver's I/O thread does.
+
+**Feature: observability-infrastructure**
+**Requirement: R4.1 - Client Wrapper**
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from infrastructure.errors import DatabaseError
+from infrastructure.scylladb.aio import ResultPage, bridge
+from infrastructure.scylladb.client import ScyllaDBClient
+from infrastructure.scylladb.config import ScyllaDBConfig
+
+
+class FakeResponseFuture:
+    """Response future completed from a background thread."""
+
+    def __init__(self, rows: list[Any] | None, paging_state: bytes | None = None, error: Exception | None = None):
+        self._rows = rows
+        self._paging_state = paging_state
+        self._error = error
+
+    @property
+    def has_more_pages(self) -> bool:
+        return self._paging_state is not None
+
+    def add_callbacks(self, callback: Any, errback: Any) -> None:
+        def complete() -> None:
+            if self._error is not None:
+                errback(self._error)
+            else:
+                callback(self._rows)
+
+        threading.Timer(0.001, complete).start()
+
+
+class FakeSession:
+    """Session serving ``rows`` in pages of ``page_size``."""
+
+    def __init__(self, rows: list[Any], page_size: int = 3) -> None:
+        self.rows = rows
+        self.page_size = page_size
+        self.requests: list[bytes | None] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def execute_async(self, query: Any, parameters: Any = None, **kwargs: Any) -> FakeResponseFuture:
+        paging_state = kwargs.get("paging_state")
+        self.requests.append(paging_state)
+        start = int(paging_state or b"0")
+        end = start + self.page_size
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        future = FakeResponseFuture(self.rows[start:end], str(end).encode() if end < len(self.rows) else None)
+        original = future.add_callbacks
+
+        def add_callbacks(callback: Any, errback: Any) -> None:
+            def done(rows: Any) -> None:
+                self.in_flight -= 1
+                callback(rows)
+
+            original(done, errback)
+
+        future.add_callbacks = add_callbacks  # type: ignore[method-assign]
+        return future
+
+
+def connected(session: FakeSession, **config: Any) -> ScyllaDBClient:
+    client = ScyllaDBClient(ScyllaDBConfig(**config))
+    client._session = session  # type: ignore[assignment]
+    return client
+
+
+class TestBridge:
+    """Tests for bridge."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_page_from_driver_thread(self) -> None:
+        page = await bridge(FakeResponseFuture([1, 2], paging_state=b"2"))
+
+        assert page == ResultPage([1, 2], b"2")
+        assert page.has_more
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_empty_last_page(self) -> None:
+        page = await bridge(FakeResponseFuture(None))
+
+        assert page.rows == []
+        assert not page.has_more
+
+    @pytest.mark.asyncio
+    async def test_driver_error_is_raised(self) -> None:
+        with pytest.raises(TimeoutError):
+            await bridge(FakeResponseFuture(None, error=TimeoutError("read timeout")))
+
+
+class TestScyllaDBClient:
+    """Tests for ScyllaDBClient query execution."""
+
+    @pytest.mark.asyncio
+    async def test_execute_follows_paging_state(self) -> None:
+        session = FakeSession(list(range(8)))
+
+        rows = await connected(session).execute("SELECT * FROM t")
+
+        assert rows == list(range(8))
+        assert session.requests == [None, b"3", b"6"]
+
+    @pytest.mark.asyncio
+    async def test_iterate_fetches_pages_lazily(self) -> None:
+        session = FakeSession(list(range(8)))
+        rows = []
+
+        async for row in connected(session).iterate("SELECT * FROM t"):
+            rows.append(row)
+            if len(rows) == 2:
+                break
+
+        assert rows == [0, 1]
+        assert session.requests == [None]
+
+    @pytest.mark.asyncio
+    async def test_limiter_caps_requests_in_flight(self) -> None:
+        session = FakeSession(list(range(2)))
+        client = connected(session, max_concurrent_requests=2)
+
+        results = await asyncio.gather(*(client.execute("SELECT * FROM t") for _ in range(10)))
+
+        assert all(rows == [0, 1] for rows in results)
+        assert session.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_requires_connection(self) -> None:
+        with pytest.raises(DatabaseError, match="not connected"):
+            await ScyllaDBClient(ScyllaDBConfig()).execute("SELECT * FROM t")
@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -19,6 +19,9 @@ from infrastructure.scylladb.repository import (
     _validate_identifier,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 
 class UserEntity(ScyllaDBEntity):
     """Entity for repository tests."""
@@ -30,6 +33,25 @@ class UserEntity(ScyllaDBEntity):
     email: str
 
 
+def user_row(name: str) -> MagicMock:
+    """Build a driver-like row for a user."""
+    row = MagicMock()
+    row._asdict.return_value = {
+        "id": uuid4(),
+        "name": name,
+        "email": f"{name.lower()}@example.com",
+        "created_at": datetime.now(UTC),
+        "updated_at": datetime.now(UTC),
+    }
+    return row
+
+
+async def rows_of(rows: list[MagicMock]) -> AsyncIterator[MagicMock]:
+    """Stand-in for ``ScyllaDBClient.iterate``."""
+    for row in rows:
+        yield row
+
+
 class TestValidateIdentifier:
     """Tests for CQL identifier validation - security critical."""
 
@@ -146,14 +168,35 @@ class TestScyllaDBRepository:
     @pytest.mark.asyncio
     async def test_find_all_with_limit(self, repository: ScyllaDBRepository, mock_client: MagicMock) -> None:
         """Find all should respect limit parameter."""
-        mock_client.execute = AsyncMock(return_value=[])
+        mock_client.iterate = MagicMock(return_value=rows_of([]))
 
         await repository.find_all(limit=50)
 
         mock_client.prepare.assert_called()
-        call_args = mock_client.execute.call_args
+        call_args = mock_client.iterate.call_args
         assert 50 in call_args[0][1]
 
+    @pytest.mark.asyncio
+    async def test_find_by_reads_rows_through_iterator(
+        self, repository: ScyllaDBRepository, mock_client: MagicMock
+    ) -> None:
+        """Find by should map every row the paged iterator yields."""
+        mock_client.iterate = MagicMock(return_value=rows_of([user_row("Ann"), user_row("Bob")]))
+
+        result = await repository.find_by("name", "x", limit=10)
+
+        assert [user.name for user in result] == ["Ann", "Bob"]
+        assert mock_client.iterate.call_args[0][1] == ("x", 10)
+
+    @pytest.mark.asyncio
+    async def test_stream_all_yields_entities(self, repository: ScyllaDBRepository, mock_client: MagicMock) -> None:
+        """Stream all should yield entities without a limit."""
+        mock_client.iterate = MagicMock(return_value=rows_of([user_row("Ann")]))
+
+        result = [user async for user in repository.stream_all()]
+
+        assert [user.name for user in result] == ["Ann"]
+
     @pytest.mark.asyncio
     async def test_count_entities(self, repository: ScyllaDBRepository, mock_client: MagicMock) -> None:
         """Count should return entity count."""
@@ -247,6 +247,24 @@ class TestRBACService:
         with pytest.raises(AuthorizationError):
             service.require_permission(user, Permission.WRITE)
 
+    def test_add_role_recompiles_permissions(self) -> None:
+        """Test replacing a role takes effect for cached role combinations."""
+        service = RBACService()
+        user = RBACUser(id="user1", roles=["viewer"])
+        assert not service.check_permission(user, Permission.WRITE)
+
+        service.add_role(Role(name="viewer", permissions=frozenset([Permission.READ, Permission.WRITE])))
+
+        assert service.check_permission(user, Permission.WRITE)
+
+    def test_scopes_grant_permissions(self) -> None:
+        """Test valid scopes add permissions and unknown scopes are ignored."""
+        service = RBACService()
+        user = RBACUser(id="user1", roles=["viewer"], scopes=["export_data", "not-a-permission"])
+
+        assert service.check_all_permissions(user, [Permission.READ, Permission.EXPORT_DATA])
+        assert not service.check_any_permission(user, [Permission.DELETE, Permission.ADMIN])
+
 
 class TestGetRBACService:
     """Tests for get_rbac_service function."""
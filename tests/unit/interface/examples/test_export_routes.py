@@ -0,0 +1,105 @@
+"""Unit tests for the streaming item export route.
+
+**Feature: application-common-integration**
+**Validates: Requirements 7.1, 7.2, 7.3**
+"""
+
+import asyncio
+import hashlib
+import json
+from decimal import Decimal
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from application.examples import ExportFormat, ItemExampleExportService
+from core.base.patterns.pagination import CursorPage
+from domain.examples.item.entity import ItemExample, Money
+from interface.v1.examples.dependencies import get_item_export_service
+from interface.v1.examples.export_routes import ExportStreamingResponse
+from interface.v1.examples.router import router
+
+
+class PagedRepository:
+    """Repository serving all items as keyset pages."""
+
+    def __init__(self, count: int) -> None:
+        self.items = [
+            ItemExample.create(
+                name=f"Item {i}",
+                description="",
+                sku=f"SKU-{i}",
+                price=Money(Decimal("1.00"), "BRL"),
+                quantity=1,
+                category="Tools",
+                tags=[],
+                created_by="user-1",
+            )
+            for i in range(count)
+        ]
+
+    async def get_page(self, cursor: str | None = None, page_size: int = 20, **filters: str) -> CursorPage:
+        start = int(cursor or 0)
+        end = min(start + page_size, len(self.items))
+        has_more = end < len(self.items)
+        return CursorPage(self.items[start:end], str(end) if has_more else None, cursor, has_more)
+
+
+def make_client(count: int) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_item_export_service] = lambda: ItemExampleExportService(PagedRepository(count))
+    return TestClient(app)
+
+
+class TestExportRoute:
+    """Tests for GET /examples/items/export."""
+
+    def test_streams_jsonl_with_checksum_trailer(self) -> None:
+        response = make_client(5).get("/examples/items/export", params={"format": "jsonl", "chunk_size": 2})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-disposition"] == 'attachment; filename="items.jsonl"'
+        assert len(response.content.splitlines()) == 5
+        trailers = dict(response.extensions["http.response.trailers"])
+        assert trailers[b"x-export-checksum"] == hashlib.sha256(response.content).hexdigest()[:16].encode()
+        assert trailers[b"x-export-record-count"] == b"5"
+
+    def test_streams_csv(self) -> None:
+        response = make_client(3).get("/examples/items/export", params={"format": "csv"})
+
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.text.splitlines()[0].startswith("id,name,description")
+        assert len(response.text.splitlines()) == 4
+
+    def test_json_body_and_metadata_share_timestamp(self) -> None:
+        stream = ItemExampleExportService(PagedRepository(3)).stream(ExportFormat.JSON, chunk_size=2)
+
+        async def collect() -> bytes:
+            return b"".join([chunk async for chunk in stream])
+
+        body = json.loads(asyncio.run(collect()))
+
+        assert stream.metadata is not None
+        assert body["export_timestamp"] == stream.metadata.export_timestamp.isoformat()
+        assert body["record_count"] == len(body["data"]) == 3
+
+    def test_without_trailer_support_body_is_plain(self) -> None:
+        stream = ItemExampleExportService(PagedRepository(2)).stream(ExportFormat.JSONL)
+        response = ExportStreamingResponse(stream, "items.jsonl")
+        messages: list[dict[str, Any]] = []
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            messages.append(message)
+
+        asyncio.run(response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send))
+
+        assert [message["type"] for message in messages][-1] == "http.response.body"
+        assert b"trailer" not in dict(messages[0]["headers"])
+        assert stream.metadata is not None
+        assert stream.metadata.record_count == 2
@@ -144,96 +144,104 @@ class TestCircuitBreakerBehavior:
         assert circuit._can_execute() is True
 
 
+def http_scope(headers: dict[str, str] | None = None, path: str = "/test") -> dict:
+    """Build a minimal HTTP ASGI scope."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+
+
+def respond_with(status: int) -> AsyncMock:
+    """Create an ASGI app mock that sends an empty response."""
+
+    async def app(scope: dict, receive: object, send: AsyncMock) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return AsyncMock(side_effect=app)
+
+
+def sent_status(send: AsyncMock) -> int:
+    """Get the status code from the first message sent."""
+    return send.call_args_list[0].args[0]["status"]
+
+
 class TestMiddlewareDispatch:
-    """Tests for middleware dispatch behavior."""
+    """Tests for middleware request handling."""
 
     @pytest.mark.asyncio
     async def test_bypasses_when_disabled(self) -> None:
         """Test that middleware is bypassed when disabled."""
-        app = MagicMock()
+        app = respond_with(200)
         config = ResilienceConfig(enabled=False)
         middleware = ResilienceMiddleware(app, config=config)
+        scope, receive, send = http_scope(), AsyncMock(), AsyncMock()
 
-        request = MagicMock()
-        request.headers = {}
-        expected_response = MagicMock()
-        call_next = AsyncMock(return_value=expected_response)
+        with patch.object(middleware._circuit, "_record_success") as mock_success:
+            await middleware(scope, receive, send)
 
-        response = await middleware.dispatch(request, call_next)
+        app.assert_called_once_with(scope, receive, send)
+        mock_success.assert_not_called()
 
-        assert response == expected_response
-        call_next.assert_called_once_with(request)
+    @pytest.mark.asyncio
+    async def test_bypasses_non_http_scope(self) -> None:
+        """Test that lifespan and websocket scopes pass straight through."""
+        app = AsyncMock()
+        middleware = ResilienceMiddleware(app)
+        scope, receive, send = {"type": "lifespan"}, AsyncMock(), AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        app.assert_called_once_with(scope, receive, send)
 
     @pytest.mark.asyncio
     async def test_records_success_on_2xx(self) -> None:
         """Test that success is recorded for 2xx responses."""
-        app = MagicMock()
-        config = ResilienceConfig()
-        middleware = ResilienceMiddleware(app, config=config)
-
-        request = MagicMock()
-        request.headers = {}
-        response = MagicMock()
-        response.status_code = 200
-        call_next = AsyncMock(return_value=response)
+        middleware = ResilienceMiddleware(respond_with(200), config=ResilienceConfig())
+        send = AsyncMock()
 
         with patch.object(middleware._circuit, "_record_success") as mock_success:
-            await middleware.dispatch(request, call_next)
+            await middleware(http_scope(), AsyncMock(), send)
             mock_success.assert_called_once()
 
+        assert sent_status(send) == 200
+
     @pytest.mark.asyncio
     async def test_records_failure_on_5xx(self) -> None:
         """Test that failure is recorded for 5xx responses."""
-        app = MagicMock()
-        config = ResilienceConfig()
-        middleware = ResilienceMiddleware(app, config=config)
-
-        request = MagicMock()
-        request.headers = {}
-        response = MagicMock()
-        response.status_code = 500
-        call_next = AsyncMock(return_value=response)
+        middleware = ResilienceMiddleware(respond_with(500), config=ResilienceConfig())
 
         with patch.object(middleware._circuit, "_record_failure") as mock_failure:
-            await middleware.dispatch(request, call_next)
+            await middleware(http_scope(), AsyncMock(), AsyncMock())
             mock_failure.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_returns_503_when_circuit_open(self) -> None:
         """Test that 503 is returned when circuit is open."""
-        app = MagicMock()
-        config = ResilienceConfig()
-        middleware = ResilienceMiddleware(app, config=config)
-
-        request = MagicMock()
-        request.url = MagicMock()
-        request.url.path = "/test"
-        request.headers = {}
-        call_next = AsyncMock()
+        app = AsyncMock()
+        middleware = ResilienceMiddleware(app, config=ResilienceConfig())
+        send = AsyncMock()
 
         with patch.object(middleware._circuit, "_can_execute", return_value=False):
             with patch.object(resilience_module, "logger"):
-                response = await middleware.dispatch(request, call_next)
+                await middleware(http_scope(), AsyncMock(), send)
 
-        assert response.status_code == 503
-        call_next.assert_not_called()
+        assert sent_status(send) == 503
+        app.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_records_failure_on_exception(self) -> None:
         """Test that failure is recorded when exception is raised."""
-        app = MagicMock()
-        config = ResilienceConfig()
-        middleware = ResilienceMiddleware(app, config=config)
-
-        request = MagicMock()
-        request.url = MagicMock()
-        request.url.path = "/test"
-        request.headers = {}
-        call_next = AsyncMock(side_effect=ValueError("Test error"))
+        app = AsyncMock(side_effect=ValueError("Test error"))
+        middleware = ResilienceMiddleware(app, config=ResilienceConfig())
 
         with patch.object(middleware._circuit, "_record_failure") as mock_failure:
             with patch.object(resilience_module, "logger"), pytest.raises(ValueError):
-                await middleware.dispatch(request, call_next)
+                await middleware(http_scope(), AsyncMock(), AsyncMock())
 
             mock_failure.assert_called_once()
 
@@ -244,19 +252,12 @@ class TestLogging:
     @pytest.mark.asyncio
     async def test_logs_circuit_open_with_correlation_id(self) -> None:
         """Test that circuit open is logged with correlation ID."""
-        app = MagicMock()
-        config = ResilienceConfig()
-        middleware = ResilienceMiddleware(app, config=config)
-
-        request = MagicMock()
-        request.url = MagicMock()
-        request.url.path = "/test"
-        request.headers = {"X-Request-ID": "test-correlation-123"}
-        call_next = AsyncMock()
+        middleware = ResilienceMiddleware(AsyncMock(), config=ResilienceConfig())
+        scope = http_scope({"X-Request-ID": "test-correlation-123"})
 
         with patch.object(middleware._circuit, "_can_execute", return_value=False):
             with patch.object(resilience_module, "logger") as mock_logger:
-                await middleware.dispatch(request, call_next)
+                await middleware(scope, AsyncMock(), AsyncMock())
 
                 mock_logger.warning.assert_called_once()
                 call_kwargs = mock_logger.warning.call_args[1]
@@ -265,19 +266,13 @@ class TestLogging:
     @pytest.mark.asyncio
     async def test_logs_request_failure_with_correlation_id(self) -> None:
         """Test that request failures are logged with correlation ID."""
-        app = MagicMock()
-        config = ResilienceConfig()
-        middleware = ResilienceMiddleware(app, config=config)
-
-        request = MagicMock()
-        request.url = MagicMock()
-        request.url.path = "/test"
-        request.headers = {"X-Correlation-ID": "corr-456"}
-        call_next = AsyncMock(side_effect=ValueError("Test error"))
+        app = AsyncMock(side_effect=ValueError("Test error"))
+        middleware = ResilienceMiddleware(app, config=ResilienceConfig())
+        scope = http_scope({"X-Correlation-ID": "corr-456"})
 
         with patch.object(resilience_module, "logger") as mock_logger:
             with pytest.raises(ValueError):
-                await middleware.dispatch(request, call_next)
+                await middleware(scope, AsyncMock(), AsyncMock())
 
             # The code uses logger.exception, not logger.error
             mock_logger.exception.assert_called_once()